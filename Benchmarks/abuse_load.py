@@ -0,0 +1,175 @@
+"""
+Kötüye kullanım (flood) senaryosu
+
+Normal oyuncular sürekli oyun oynarken bazı client'lar mümkün olan en hızlı
+şekilde geçersiz hamle ve bozuk mesaj gönderir. Normal oyuncuların hamle
+gecikmesi (move -> game_state) rate limit açık ve kapalı ölçülür.
+
+Kullanım:
+    python -m Benchmarks.abuse_load --rooms 50 --abusers 10 --duration 5
+    python -m Benchmarks.abuse_load --rooms 50 --abusers 10 --duration 5 --no-limit
+"""
+import argparse
+import asyncio
+import json
+import logging
+import random
+import statistics
+import time
+
+import websockets
+
+from Network.websocket_server import GameServer
+
+
+async def normal_player(url, name, stop_event, latencies, think_time):
+    join = json.dumps({
+        "type": "player_join",
+        "data": {"player": {"id": name, "symbol": "X", "name": name}}
+    })
+    # GameClient gibi: her oyun için yeni bağlantı
+    while not stop_event.is_set():
+        async with websockets.connect(url, max_size=None) as ws:
+            await ws.recv()  # welcome
+            await ws.send(join)
+
+            symbol = None
+            sent_at = None
+            while not stop_event.is_set():
+                message = json.loads(await ws.recv())
+                message_type = message["type"]
+                data = message["data"]
+
+                if message_type == "waiting":
+                    symbol = data["your_symbol"]
+
+                elif message_type == "game_state":
+                    if sent_at is not None:
+                        latencies.append(time.perf_counter() - sent_at)
+                        sent_at = None
+                    if data["current_player"] == symbol and not data["is_game_over"]:
+                        await asyncio.sleep(think_time)
+                        board = data["board"]
+                        empty = [(r, c) for r in range(3) for c in range(3) if board[r][c] is None]
+                        row, col = random.choice(empty)
+                        sent_at = time.perf_counter()
+                        await ws.send(json.dumps({"type": "move", "data": {"row": row, "col": col}}))
+
+                elif message_type == "game_end":
+                    break
+
+
+async def abuser(url, stop_event, counters, abuse_rate):
+    try:
+        async with websockets.connect(url, max_size=None) as ws:
+            await ws.recv()  # welcome
+
+            async def drain():
+                try:
+                    async for _ in ws:
+                        counters["replies"] += 1
+                except websockets.exceptions.ConnectionClosed:
+                    pass
+            reader = asyncio.create_task(drain())
+
+            frames = [
+                json.dumps({"type": "move", "data": {"row": 9, "col": 9}}),
+                json.dumps({"type": "move", "data": {"row": 0, "col": 0}}),
+                "{bozuk json",
+            ]
+            # abuse_rate mesaj/s hızında 10 ms'lik partiler halinde gönder
+            batch = max(1, int(abuse_rate / 100))
+            i = 0
+            while not stop_event.is_set() and not reader.done():
+                for _ in range(batch):
+                    await ws.send(frames[i % len(frames)])
+                    i += 1
+                counters["sent"] += batch
+                await asyncio.sleep(0.01)
+            reader.cancel()
+    except websockets.exceptions.ConnectionClosed:
+        pass
+
+
+class FloodCounter(logging.Handler):
+    """Server'ın flood nedeniyle kapattığı bağlantıları say"""
+
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.count = 0
+
+    def emit(self, record):
+        if "flood" in record.getMessage():
+            self.count += 1
+
+
+async def run(args):
+    flood_counter = FloodCounter()
+    server_logger = logging.getLogger("Network.websocket_server")
+    server_logger.setLevel(logging.WARNING)
+    server_logger.propagate = False
+    server_logger.addHandler(flood_counter)
+
+    server = GameServer(
+        "localhost", args.port,
+        message_rate=None if args.no_limit else args.message_rate,
+        message_burst=args.message_burst,
+        connection_rate=None
+    )
+    server_task = asyncio.create_task(server.start_server())
+    await asyncio.sleep(0.3)
+    url = f"ws://localhost:{args.port}"
+
+    stop_event = asyncio.Event()
+    latencies = []
+    counters = {"sent": 0, "replies": 0}
+
+    players = []
+    for i in range(args.rooms * 2):
+        players.append(asyncio.create_task(
+            normal_player(url, f"p{i}", stop_event, latencies, args.think_time)))
+        await asyncio.sleep(0.001)
+    await asyncio.sleep(0.5)
+
+    abusers = [asyncio.create_task(abuser(url, stop_event, counters, args.abuse_rate)) for _ in range(args.abusers)]
+
+    await asyncio.sleep(args.duration)
+    stop_event.set()
+    await asyncio.wait(players + abusers, timeout=3)
+    for task in players + abusers:
+        task.cancel()
+
+    latencies.sort()
+    mode = "KAPALI" if args.no_limit else f"{args.message_rate:g}/s, burst {args.message_burst}"
+    print(f"Rate limit: {mode}")
+    print(f"Normal oyuncu: {args.rooms * 2}, saldırgan: {args.abusers} x {args.abuse_rate:g} msg/s, süre: {args.duration}s")
+    if latencies:
+        print(f"Hamle: {len(latencies)}, p50: {statistics.median(latencies) * 1000:.2f} ms, "
+              f"p99: {latencies[max(0, int(len(latencies) * 0.99) - 1)] * 1000:.2f} ms")
+    print(f"Saldırgan frame: {counters['sent']}, aldıkları yanıt: {counters['replies']}, "
+          f"server'ın kapattığı: {flood_counter.count}")
+
+    server.drain_timeout = 0
+    server.request_shutdown()
+    await server_task
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Flood senaryosu")
+    parser.add_argument("--port", type=int, default=8793)
+    parser.add_argument("--rooms", type=int, default=50)
+    parser.add_argument("--abusers", type=int, default=10)
+    parser.add_argument("--abuse-rate", type=float, default=1000.0,
+                        help="Saldırgan başına saniyedeki mesaj (aynı çekirdekte client maliyetini sınırlamak için)")
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--think-time", type=float, default=0.05, help="Normal oyuncunun hamle öncesi bekleme süresi")
+    parser.add_argument("--message-rate", type=float, default=20.0)
+    parser.add_argument("--message-burst", type=int, default=40)
+    parser.add_argument("--no-limit", action="store_true", help="Rate limit'i kapat (karşılaştırma için)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
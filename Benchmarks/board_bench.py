@@ -0,0 +1,79 @@
+"""
+GameBoard hamle maliyeti benchmark'ı
+
+Aynı rastgele oyunlar iki şekilde oynanır:
+- legacy: Zobrist hash'i olmayan eski make_move (karşılaştırma için burada kopyası var)
+- GameBoard.make_move: 8 simetri hash'ini artımlı güncelleyen güncel hali
+
+Board oluşturma süresi ölçüme dahil değildir.
+
+Kullanım:
+    python -m Benchmarks.board_bench --games 100000
+"""
+import argparse
+import random
+import time
+
+from Game.board import GameBoard
+
+
+def legacy_make_move(board, row, col, player):
+    """Hash eklenmeden önceki GameBoard.make_move"""
+    move_validation = board.is_valid_move(row, col)
+
+    if move_validation:
+        board.board[row][col] = player
+        board.player_product[player] *= board.products[row][col]
+        return True
+    else:
+        return False
+
+
+def random_games(count, seed=1):
+    rng = random.Random(seed)
+    games = []
+    for _ in range(count):
+        cells = list(range(9))
+        rng.shuffle(cells)
+        games.append([(cell // 3, cell % 3, "X" if idx % 2 == 0 else "O") for idx, cell in enumerate(cells)])
+    return games
+
+
+def measure(games, make_move):
+    boards = [GameBoard() for _ in games]
+    started = time.perf_counter()
+    for board, moves in zip(boards, games):
+        for row, col, player in moves:
+            make_move(board, row, col, player)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="make_move overhead benchmark")
+    parser.add_argument("--games", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    games = random_games(args.games)
+    moves = args.games * 9
+
+    legacy = min(measure(games, legacy_make_move) for _ in range(args.repeat))
+    hashed = min(measure(games, GameBoard.make_move) for _ in range(args.repeat))
+
+    board = GameBoard()
+    for row, col, player in games[0][:5]:
+        board.make_move(row, col, player)
+    started = time.perf_counter()
+    for _ in range(moves):
+        board.canonical_hash()
+    canonical = time.perf_counter() - started
+
+    print(f"Hamle: {moves} ({args.games} oyun x 9), en iyi {args.repeat} tekrar")
+    print(f"make_move (hash'siz):       {legacy / moves * 1e9:7.0f} ns/hamle")
+    print(f"make_move (Zobrist, 8 sim): {hashed / moves * 1e9:7.0f} ns/hamle "
+          f"(+{(hashed - legacy) / moves * 1e9:.0f} ns, {(hashed / legacy - 1) * 100:+.0f}%)")
+    print(f"canonical_hash():           {canonical / moves * 1e9:7.0f} ns/çağrı")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Heartbeat üzerinden saat senkronizasyonu ve RTT tahmini testi
+
+1) Gerçek server: client'lar gecikme ekleyen TCP proxy (her yönde sabit
+   gecikme) üzerinden bağlanır, oyuna katılır ve sabit aralıkla heartbeat
+   gönderir. Ölçülen:
+   - client ve server tarafındaki yumuşatılmış RTT (beklenen: 2 x gecikme)
+   - saat farkı (aynı makine: ~0)
+   - oyun saatine aktarılan gecikme telafisi (GameClock.lag)
+   - mesaj sayısı: her heartbeat'e tek cevap, ölçüm için ek mesaj yok
+2) Simülasyon: client saati kaydırılmış, gidiş yolunda rastgele kuyruk
+   gecikmesi var. Son ölçümün saat farkı ile en küçük RTT'li ölçümün
+   (ClockSync) saat farkı hatası karşılaştırılır.
+
+Kullanım:
+    python -m Benchmarks.clock_sync_bench --delays 0 25 50 --clients 20
+"""
+import argparse
+import asyncio
+import contextlib
+import logging
+import os
+import random
+import statistics
+
+from Benchmarks.prediction_latency import LatencyProxy
+from Game.player import Player
+from Network.websocket_client import GameClient
+from Network.websocket_server import GameServer
+from Utils.clock_sync import ClockSync, ntp_sample
+
+
+async def heartbeat_client(url, name, interval, duration, counts):
+    """
+    Oyuna katılır, süre boyunca heartbeat gönderir ve gelen mesajları sayar
+
+    Returns:
+        GameClient: Ölçümleri (clock_sync) içeren client
+    """
+    client = GameClient(url, predict=False)
+    await client.connect()
+    await client.send_player_join(Player(player_id=name, symbol="X", name=name))
+
+    async def reader():
+        while True:
+            message = await client.listen_for_updates()
+            if message is None:
+                return
+            parsed = client.handle_server_message(message)
+            if parsed and parsed["type"] == "heartbeat":
+                counts["replies"] += 1
+
+    async def sender():
+        while True:
+            if await client.send_heartbeat():
+                counts["heartbeats"] += 1
+            await asyncio.sleep(interval)
+
+    tasks = [asyncio.create_task(reader()), asyncio.create_task(sender())]
+    await asyncio.sleep(duration)
+    tasks[1].cancel()
+    await asyncio.sleep(interval)  # Son cevap gelsin
+    return client, tasks[0]
+
+
+async def run_config(server, server_port, proxy_port, delay, args):
+    proxy = LatencyProxy(server_port, delay)
+    await proxy.start(proxy_port)
+    url = f"ws://localhost:{proxy_port}"
+    counts = {"heartbeats": 0, "replies": 0}
+    server.clock_sync.clear()
+    results = await asyncio.gather(*(
+        heartbeat_client(url, f"c{delay}_{idx}", args.interval, args.duration, counts)
+        for idx in range(args.clients)))
+
+    client_rtt = [client.clock_sync.srtt for client, _ in results if client.clock_sync.srtt is not None]
+    offsets = [abs(client.clock_sync.offset) for client, _ in results if client.clock_sync.offset is not None]
+    server_rtt = [sync.srtt for sync in server.clock_sync.values() if sync.srtt is not None]
+    rooms = set(server.player_rooms.values())
+    lags = [lag for room in rooms if room.game and room.game.clock for lag in room.game.clock.lag.values()]
+    for client, reader in results:
+        await client.disconnect()
+        reader.cancel()
+    await proxy.close()
+    return client_rtt, server_rtt, offsets, lags, counts
+
+
+def simulate(skew, base_delay, jitter, samples, seed=1):
+    """
+    Kaydırılmış client saati ve gidiş yolunda kuyruk gecikmesi ile saat farkı tahmini
+
+    Returns:
+        tuple: (son ölçüm hataları, ClockSync hataları) saniye
+    """
+    rng = random.Random(seed)
+    sync = ClockSync()
+    naive_errors, filtered_errors = [], []
+    now = 1000.0  # Server saati
+    for _ in range(samples):
+        up = base_delay + rng.expovariate(1 / jitter)  # Kuyrukta bekleme: sadece gidişte
+        down = base_delay
+        t0 = now - skew  # Client saati = server saati - skew
+        t1 = now + up
+        t2 = t1 + 0.0005
+        t3 = t2 + down - skew
+        rtt, offset = ntp_sample(t0, t1, t2, t3)
+        sync.add_sample(rtt, offset)
+        naive_errors.append(abs(offset - skew))
+        filtered_errors.append(abs(sync.offset - skew))
+        now += 1.0
+    return naive_errors, filtered_errors
+
+
+def ms(values, func=statistics.median):
+    return f"{func(values) * 1000:7.2f} ms" if values else "      -"
+
+
+async def run(args):
+    server = GameServer("localhost", args.port, message_rate=None, connection_rate=None, turn_time=60.0)
+    server_task = asyncio.create_task(server.start_server())
+    await asyncio.sleep(0.3)
+
+    print(f"Heartbeat RTT tahmini: {args.clients} client, {args.interval * 1000:.0f} ms aralık, "
+          f"{args.duration:.1f}s (p50):")
+    print(f"  {'gerçek RTT':>10} {'client srtt':>12} {'server srtt':>12} {'|offset|':>11} "
+          f"{'saat telafisi':>14} {'heartbeat':>10} {'cevap':>6}")
+    proxy_port = args.port + 1
+    rows = []
+    with contextlib.redirect_stdout(open(os.devnull, "w")) as devnull:
+        for delay in args.delays:
+            rows.append((delay, await run_config(server, args.port, proxy_port, delay / 1000, args)))
+            proxy_port += 1
+        devnull.close()
+    for delay, (client_rtt, server_rtt, offsets, lags, counts) in rows:
+        print(f"  {delay * 2:7d} ms {ms(client_rtt):>12} {ms(server_rtt):>12} {ms(offsets):>11} "
+              f"{ms(lags):>14} {counts['heartbeats']:>10} {counts['replies']:>6}")
+        assert counts["replies"] == counts["heartbeats"], "Her heartbeat'e tek cevap bekleniyordu"
+        assert abs(statistics.median(client_rtt) - delay * 2 / 1000) < 0.01 + delay / 1000 * 0.2
+    summary = server.stats.summary(len(server.clients), 0)["rtt_ms"]
+    print(f"  Server özeti: RTT p50 <= {summary['p50']} ms, p99 <= {summary['p99']} ms "
+          f"({summary['samples']} ölçüm)")
+
+    naive, filtered = simulate(args.skew, 0.010, 0.020, 200)
+    print(f"Saat farkı (simülasyon: client saati {args.skew:+.1f}s, tek yön 10 ms + ~20 ms kuyruk):")
+    print(f"  son ölçüm   : hata p50 {ms(naive)}, max {ms(naive, max)}")
+    print(f"  min-RTT süzgeci: hata p50 {ms(filtered)}, max {ms(filtered[ClockSync.WINDOW:], max)}")
+
+    server.request_shutdown()
+    await server_task
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Heartbeat saat senkronizasyonu testi")
+    parser.add_argument("--delays", type=int, nargs="+", default=[0, 25, 50], help="Tek yön gecikme (ms)")
+    parser.add_argument("--clients", type=int, default=20)
+    parser.add_argument("--interval", type=float, default=0.1, help="Heartbeat aralığı (saniye)")
+    parser.add_argument("--duration", type=float, default=2.0)
+    parser.add_argument("--skew", type=float, default=1.5, help="Simülasyonda client saat kayması (saniye)")
+    parser.add_argument("--port", type=int, default=8870)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
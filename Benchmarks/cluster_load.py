@@ -0,0 +1,245 @@
+"""
+Cluster (broker) yük testi
+
+1. Broker throughput: bir node diğerinin topic'ine N mesaj (game_state
+   büyüklüğünde) yayınlar, hepsi karşı node'un handler'ına ulaşana kadar geçen süre.
+   LocalBroker (process içi) ve TcpBroker (ayrı process'te BrokerServer) için.
+2. Hamle gecikmesi: hamleyi gönderen oyuncudan rakibin yeni game_state'i
+   almasına kadar geçen süre. Server'lar ayrı process'lerdir (python -m server):
+   - tek server, broker yok (referans)
+   - 2 node + TCP broker, iki oyuncu aynı node'da
+   - 2 node + TCP broker, oyuncular farklı node'larda (hamle broker'dan iki kez geçer)
+   Ayrıca aynı process'te LocalBroker ile 2 node (client'larla aynı CPU'yu paylaşır).
+
+Kullanım:
+    python -m Benchmarks.cluster_load --messages 200000 --games 100 --rounds 5
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import websockets
+
+from Game.player import Player
+from Network.broker import BrokerHub, LocalBroker, TcpBroker
+from Network.websocket_server import GameServer
+from Utils.protocol import GameProtocol
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# X kazanır: X (0,0) (0,1) (0,2) - O (1,0) (1,1)
+MOVES = {"X": [(0, 0), (0, 1), (0, 2)], "O": [(1, 0), (1, 1)]}
+
+
+def spawn(args):
+    return subprocess.Popen([sys.executable, "-m"] + args, cwd=ROOT)
+
+
+async def wait_for_port(port, websocket=True):
+    for _ in range(100):
+        try:
+            if websocket:
+                async with websockets.connect(f"ws://localhost:{port}"):
+                    return
+            else:
+                _, writer = await asyncio.open_connection("localhost", port)
+                writer.close()
+                return
+        except OSError:
+            await asyncio.sleep(0.1)
+    raise RuntimeError(f"Port {port} açılmadı")
+
+
+async def broker_throughput(make_broker, messages, payload):
+    """
+    Node A'dan node B'ye N mesaj; B'nin handler'ı hepsini alana kadar geçen süre
+    """
+    sender, receiver = make_broker(), make_broker()
+    await sender.connect()
+    await receiver.connect()
+    received = [0]
+    done = asyncio.Event()
+
+    async def handler(message):
+        received[0] += 1
+        if received[0] == messages:
+            done.set()
+
+    await receiver.subscribe("bench", handler)
+    await receiver.cancel_match("sync")  # Round-trip: abonelik broker'a ulaştı
+    started = time.perf_counter()
+    for idx in range(messages):
+        sender.publish("bench", payload)
+        if idx % 1000 == 999:
+            await asyncio.sleep(0)  # Yazma tamponunu boşalt
+    await done.wait()
+    elapsed = time.perf_counter() - started
+    await sender.close()
+    await receiver.close()
+    return messages / elapsed
+
+
+class GamePlayer:
+    """
+    Bir oyunun oyuncusu: sırası gelince hamle yapar, rakibin hamlesinin
+    kendisine ulaşma süresini ölçer
+    """
+
+    def __init__(self, url, name, sent, latencies):
+        self.url = url
+        self.name = name
+        self.sent = sent  # {(room_id, move_count) : gönderilme zamanı}
+        self.latencies = latencies
+        self.ws = None
+        self.symbol = None
+        self.room_id = None
+
+    async def connect(self):
+        self.ws = await websockets.connect(self.url)
+        await self.ws.recv()  # welcome
+
+    async def join(self):
+        await self.ws.send(GameProtocol.serialize_player_join(Player(player_id=self.name, symbol="X", name=self.name)))
+        while True:
+            message = json.loads(await self.ws.recv())
+            if message["type"] == "waiting":
+                self.symbol = message["data"]["your_symbol"]
+                self.room_id = message["data"]["room_id"]
+                return
+
+    async def play(self):
+        moves = list(MOVES[self.symbol])
+        while True:
+            message = json.loads(await self.ws.recv())
+            if message["type"] == "game_end":
+                return
+            if message["type"] != "game_state":
+                continue
+            state = message["data"]
+            sent_at = self.sent.pop((self.room_id, state["move_count"]), None)
+            if sent_at is not None and state["current_player"] == self.symbol:
+                self.latencies.append(time.perf_counter() - sent_at)
+            if state["current_player"] == self.symbol and not state["is_game_over"] and moves:
+                row, col = moves.pop(0)
+                self.sent[(self.room_id, state["move_count"] + 1)] = time.perf_counter()
+                await self.ws.send(json.dumps({"type": "move", "data": {"row": row, "col": col}}))
+
+
+async def move_latency(x_urls, o_urls, games, rounds):
+    """
+    Her turda `games` oyun sırayla eşleştirilir, sonra hepsi eşzamanlı oynanır
+
+    Args:
+        x_urls / o_urls (list): X ve O oyuncularının bağlanacağı node'lar (oyun başına sırayla)
+
+    Returns:
+        tuple: (gecikmeler [s], saniyedeki hamle)
+    """
+    sent = {}
+    latencies = []
+    pairs = []
+    for idx in range(games):
+        x = GamePlayer(x_urls[idx % len(x_urls)], f"x{idx}", sent, latencies)
+        o = GamePlayer(o_urls[idx % len(o_urls)], f"o{idx}", sent, latencies)
+        await x.connect()
+        await o.connect()
+        pairs.append((x, o))
+
+    play_time = 0.0
+    for _ in range(rounds):
+        # Cluster kuyruğu FIFO: X'in beklemeye geçtiğini görmeden O katılmaz
+        for x, o in pairs:
+            await x.join()
+            await o.join()
+            assert x.room_id == o.room_id and x.symbol == "X", "Eşleşme beklenenden farklı"
+        started = time.perf_counter()
+        await asyncio.gather(*(player.play() for pair in pairs for player in pair))
+        play_time += time.perf_counter() - started
+
+    for pair in pairs:
+        for player in pair:
+            await player.ws.close()
+    moves = games * rounds * 5
+    return latencies, moves / play_time
+
+
+def report(label, latencies, moves_per_second):
+    latencies = sorted(latencies)
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000
+    print(f"  {label}: p50 {p50:.2f} ms, p99 {p99:.2f} ms, {moves_per_second:.0f} hamle/s")
+
+
+async def run(args):
+    payload = json.dumps({"type": "game_state", "data": {
+        "board": [["X", "O", None], [None, "X", None], [None, None, "O"]],
+        "current_player": "X", "move_count": 4, "is_game_over": False, "winner": None,
+        "players": {"player1": {"id": "p1", "name": "p1", "symbol": "X"},
+                    "player2": {"id": "p2", "name": "p2", "symbol": "O"}}}})
+    print(f"Broker throughput ({args.messages} mesaj, {len(payload)} byte):")
+    hub = BrokerHub()
+    rate = await broker_throughput(lambda: LocalBroker(hub), args.messages, payload)
+    print(f"  LocalBroker: {rate:,.0f} mesaj/s")
+
+    broker_port = args.port
+    processes = [spawn(["Network.broker", "--port", str(broker_port)])]
+    try:
+        await wait_for_port(broker_port, websocket=False)
+        rate = await broker_throughput(lambda: TcpBroker("localhost", broker_port), args.messages, payload)
+        print(f"  TcpBroker (ayrı process): {rate:,.0f} mesaj/s")
+
+        print(f"Hamle gecikmesi ({args.games} eşzamanlı oyun x {args.rounds} tur, rakibe ulaşma süresi):")
+        common = ["--message-rate", "0", "--connection-rate", "0", "--log-level", "WARNING"]
+        single_port = args.port + 1
+        node_ports = [args.port + 2, args.port + 3]
+        processes.append(spawn(["server", "--port", str(single_port)] + common))
+        for port in node_ports:
+            processes.append(spawn(["server", "--port", str(port), "--broker", f"tcp://localhost:{broker_port}"]
+                                   + common))
+        for port in [single_port] + node_ports:
+            await wait_for_port(port)
+
+        single = [f"ws://localhost:{single_port}"]
+        nodes = [f"ws://localhost:{port}" for port in node_ports]
+        report("Tek server", *await move_latency(single, single, args.games, args.rounds))
+        report("Cluster, aynı node", *await move_latency(nodes, nodes, args.games, args.rounds))
+        report("Cluster, farklı node", *await move_latency(nodes, nodes[::-1], args.games, args.rounds))
+    finally:
+        # Önce node'lar, sonra broker
+        for process in reversed(processes):
+            process.terminate()
+            process.wait(timeout=30)
+
+    # Process içi: iki node ve client'lar aynı event loop'ta
+    hub = BrokerHub()
+    local_ports = [args.port + 4, args.port + 5]
+    servers = [GameServer("localhost", port, message_rate=None, connection_rate=None, broker=LocalBroker(hub))
+               for port in local_ports]
+    tasks = [asyncio.create_task(server.start_server()) for server in servers]
+    for port in local_ports:
+        await wait_for_port(port)
+    nodes = [f"ws://localhost:{port}" for port in local_ports]
+    report("LocalBroker, farklı node (aynı process)", *await move_latency(nodes, nodes[::-1], args.games, args.rounds))
+    for server in servers:
+        server.request_shutdown()
+    await asyncio.gather(*tasks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cluster (broker) yük testi")
+    parser.add_argument("--messages", type=int, default=200000, help="Throughput testindeki mesaj sayısı")
+    parser.add_argument("--games", type=int, default=100, help="Eşzamanlı oyun sayısı")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8800, help="Broker portu; server'lar sonraki portları kullanır")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Operatör dashboard'u yük senaryosu
+
+Server'da N adet room oluşturulur (socket'siz, koltuklar rezerve edilmiş),
+saniyede M hamle rastgele room'lara uygulanır ve gerçek bir websocket
+üzerinden Dashboard admin kanalına abone olur.
+
+Ölçülen:
+- Özet üretme süresi (artımlı sayaçlar) ve karşılaştırma için tüm room'ları
+  tarayan naif özetin süresi
+- Event loop gecikmesi (10 ms'lik bir ticker'ın gecikmesi)
+- Dashboard'un çizdiği frame sayısı ve özet boyutu
+
+Kullanım:
+    python -m Benchmarks.dashboard_load --rooms 100000 --moves-per-sec 5000 --duration 5
+"""
+import argparse
+import asyncio
+import io
+import logging
+import random
+import statistics
+import time
+
+from Game.game_logic import Game
+from Game.player import Player
+from Network.websocket_server import GameServer, Status
+from UI.dashboard import Dashboard
+from UI.terminal_ui import TerminalUI
+from Utils.board_renderer import BoardRenderer
+from Utils.protocol import GameProtocol
+
+
+def populate(server, count):
+    rooms = []
+    for i in range(count):
+        room = server.create_game_room()
+        players = [Player(f"a{i}", "X", f"a{i}"), Player(f"b{i}", "O", f"b{i}")]
+        for player in players:
+            room.reserve_seat({"id": player.player_id, "name": player.name, "symbol": player.symbol})
+        room.game = Game(players[0], players[1])
+        room.status = Status.IN_PROGRESS
+        rooms.append(room)
+    server.waiting_room = None
+    return rooms
+
+
+def naive_summary(server):
+    """Karşılaştırma: her frame'de tüm room'ları tarayan özet"""
+    counts = {}
+    for room in server.game_rooms.values():
+        counts[room.status.name] = counts.get(room.status.name, 0) + 1
+    busiest = sorted(
+        (room for room in server.game_rooms.values() if room.game),
+        key=lambda room: room.game.move_count, reverse=True)[:12]
+    return counts, busiest
+
+
+async def move_generator(server, rooms, moves_per_sec, stop_event):
+    rng = random.Random(1)
+    # Trafik bir "sıcak" alt kümede yoğunlaşır, geri kalanı seyrek oynar
+    hot = rooms[:max(1, len(rooms) // 100)]
+    batch = max(1, int(moves_per_sec / 100))
+    while not stop_event.is_set():
+        for _ in range(batch):
+            room = rng.choice(hot) if rng.random() < 0.5 else rng.choice(rooms)
+            game = room.game
+            if room.status != Status.IN_PROGRESS:
+                # Biten oyunu yeniden başlat ki trafik sürsün
+                room.game = game = Game(game.player1, game.player2)
+                room.status = Status.IN_PROGRESS
+            board = game.game_board.board
+            empty = [(r, c) for r in range(3) for c in range(3) if board[r][c] is None]
+            row, col = rng.choice(empty)
+            player = game.player1 if game.current_player == "X" else game.player2
+            success, _, game_state = game.process_move(player, row, col)
+            if success:
+                server.stats.record_move(room)
+                if game_state["is_game_over"]:
+                    room.status = Status.FINISHED
+        await asyncio.sleep(0.01)
+
+
+async def lag_probe(lags, stop_event, interval=0.01):
+    loop = asyncio.get_running_loop()
+    while not stop_event.is_set():
+        started = loop.time()
+        await asyncio.sleep(interval)
+        lags.append(loop.time() - started - interval)
+
+
+async def run(args):
+    logging.getLogger("Network.websocket_server").setLevel(logging.ERROR)
+    server = GameServer("localhost", args.port, connection_rate=None,
+                        summary_interval=args.summary_interval)
+
+    started = time.perf_counter()
+    rooms = populate(server, args.rooms)
+    populate_time = time.perf_counter() - started
+
+    # Özet süresini ölç
+    summary_times = []
+    summary_sizes = []
+    original_summary = server.stats.summary
+
+    def timed_summary(*a, **kw):
+        t0 = time.perf_counter()
+        result = original_summary(*a, **kw)
+        summary_times.append(time.perf_counter() - t0)
+        summary_sizes.append(len(GameProtocol.serialize_server_summary(result)))
+        return result
+    server.stats.summary = timed_summary
+
+    server_task = asyncio.create_task(server.start_server())
+    await asyncio.sleep(0.3)
+
+    ui = TerminalUI()
+    ui.renderer = BoardRenderer(stream=io.StringIO(), diff=True)
+    dashboard = Dashboard(f"ws://localhost:{args.port}", fps=args.fps, ui=ui)
+    dashboard_task = asyncio.create_task(dashboard.run())
+
+    stop_event = asyncio.Event()
+    lags = []
+    tasks = [
+        asyncio.create_task(move_generator(server, rooms, args.moves_per_sec, stop_event)),
+        asyncio.create_task(lag_probe(lags, stop_event)),
+    ]
+    await asyncio.sleep(args.duration)
+    stop_event.set()
+    await asyncio.gather(*tasks)
+
+    # Naif tarama ile karşılaştır
+    naive_times = []
+    for _ in range(5):
+        t0 = time.perf_counter()
+        naive_summary(server)
+        naive_times.append(time.perf_counter() - t0)
+
+    print(f"Room: {args.rooms} (oluşturma {populate_time:.1f}s), hedef {args.moves_per_sec} hamle/s, "
+          f"süre {args.duration}s")
+    print(f"Toplam hamle: {server.stats.total_moves}, son throughput: {server.stats.moves_per_sec:.0f}/s")
+    print(f"Room sayıları (artımlı): {dict(server.stats.status_counts)}")
+    print(f"Artımlı özet: {len(summary_times)} kez, p50 {statistics.median(summary_times) * 1000:.2f} ms, "
+          f"max {max(summary_times) * 1000:.2f} ms, boyut {statistics.median(summary_sizes):.0f} byte")
+    print(f"Naif tarama (tüm room'lar): p50 {statistics.median(naive_times) * 1000:.1f} ms")
+    lags.sort()
+    print(f"Event loop gecikmesi: p50 {statistics.median(lags) * 1000:.2f} ms, "
+          f"p99 {lags[int(len(lags) * 0.99) - 1] * 1000:.2f} ms, max {lags[-1] * 1000:.2f} ms")
+    print(f"Dashboard frame: {dashboard.frames} ({dashboard.frames / args.duration:.1f}/s, hedef {args.fps:g}/s)")
+
+    await dashboard.client.disconnect()
+    dashboard_task.cancel()
+    server.drain_timeout = 0
+    server.request_shutdown()
+    await server_task
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dashboard yük senaryosu")
+    parser.add_argument("--port", type=int, default=8797)
+    parser.add_argument("--rooms", type=int, default=100000)
+    parser.add_argument("--moves-per-sec", type=int, default=5000)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--fps", type=float, default=4.0)
+    parser.add_argument("--summary-interval", type=float, default=0.25)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
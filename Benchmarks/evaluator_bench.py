@@ -0,0 +1,171 @@
+"""
+ThreatEvaluator benchmark'ı
+
+15x15 (5'li) board'da rastgele oyunlar (hamleler aday komşuluktan seçilir).
+Her hamleden sonra pozisyon değerlendirilir:
+- tam tarama: tüm pencereler baştan sayılır (karşılaştırma için burada)
+- artımlı: ThreatEvaluator.make_move + evaluate
+Ayrıca bir arama düğümündeki gibi make/evaluate/unmake döngüsü ölçülür.
+
+Doğruluk: her hamlede artımlı pattern sayıları ve skorlar tam taramayla,
+geri almadan sonra da önceki değerlerle aynı olmalı. 3x3 için üretilen
+çizgiler GameBoard.winning_patterns ile aynı olmalı.
+
+Kullanım:
+    python -m Benchmarks.evaluator_bench --games 200 --size 15 --k 5
+"""
+import argparse
+import random
+import time
+
+from Game.board import GameBoard
+from Game.evaluator import ThreatEvaluator, line_table
+
+
+def full_scan(evaluator):
+    """
+    Artımlı güncelleme olmadan değerlendirme: tüm pencereler tek tek sayılır
+
+    Returns:
+        tuple: (patterns, scores) ThreatEvaluator ile aynı formatta
+    """
+    k = evaluator.k
+    weights = evaluator.weights
+    cells = evaluator.cells
+    patterns = ([0] * (k + 1), [0] * (k + 1))
+    scores = [0, 0]
+    for line in evaluator.lines:
+        counts = [0, 0]
+        for cell in line:
+            owner = cells[cell]
+            if owner is not None:
+                counts[owner] += 1
+        for p in (0, 1):
+            if counts[p] and not counts[p ^ 1]:
+                patterns[p][counts[p]] += 1
+                scores[p] += weights[counts[p]]
+    return patterns, scores
+
+
+def random_games(count, size, k, seed=1):
+    """Oyun bitene (K'lı sıra) ya da board dolana kadar aday hamlelerden rastgele oyunlar"""
+    rng = random.Random(seed)
+    evaluator = ThreatEvaluator(size, k)
+    games = []
+    for _ in range(count):
+        moves = []
+        player = "X"
+        while evaluator.winner() is None and len(moves) < size * size:
+            row, col = rng.choice(evaluator.candidate_moves())
+            evaluator.make_move(row, col, player)
+            moves.append((row, col, player))
+            player = "O" if player == "X" else "X"
+        while evaluator.unmake_move():
+            pass
+        games.append(moves)
+    return games
+
+
+def check(games, size, k):
+    evaluator = ThreatEvaluator(size, k)
+    for moves in games:
+        history = []
+        for row, col, player in moves:
+            history.append(([list(p) for p in evaluator.patterns], list(evaluator.scores), set(evaluator.candidates)))
+            evaluator.make_move(row, col, player)
+            patterns, scores = full_scan(evaluator)
+            assert evaluator.patterns == patterns, "Pattern sayıları farklı"
+            assert evaluator.scores == scores, "Skor farklı"
+            near = {cell for cell in range(size * size) if evaluator.cells[cell] is None and any(
+                evaluator.cells[n] is not None for n in evaluator.neighbors[cell])}
+            assert evaluator.candidates == near, "Aday hamleler farklı"
+        while history:
+            evaluator.unmake_move()
+            patterns, scores, candidates = history.pop()
+            assert [list(p) for p in evaluator.patterns] == patterns, "Geri alma farklı"
+            assert evaluator.scores == scores and evaluator.candidates == candidates, "Geri alma farklı"
+
+
+def measure_full(games, size, k):
+    evaluator = ThreatEvaluator(size, k)
+    evaluations = 0
+    elapsed = 0.0
+    for moves in games:
+        cells = evaluator.cells
+        for row, col, player in moves:
+            cells[row * size + col] = 0 if player == "X" else 1
+            started = time.perf_counter()
+            full_scan(evaluator)
+            elapsed += time.perf_counter() - started
+            evaluations += 1
+        evaluator.cells = [None] * (size * size)
+    return evaluations / elapsed
+
+
+def measure_incremental(games, size, k):
+    evaluator = ThreatEvaluator(size, k)
+    evaluations = 0
+    started = time.perf_counter()
+    for moves in games:
+        for row, col, player in moves:
+            evaluator.make_move(row, col, player)
+            evaluator.evaluate(player)
+            evaluations += 1
+        while evaluator.unmake_move():
+            pass
+    return evaluations / (time.perf_counter() - started)
+
+
+def measure_search_node(games, size, k, positions):
+    """Oyun ortasındaki pozisyonlarda her aday için make + evaluate + unmake"""
+    evaluator = ThreatEvaluator(size, k)
+    evaluations = 0
+    elapsed = 0.0
+    for moves in games[:positions]:
+        middle = moves[:len(moves) // 2]
+        for row, col, player in middle:
+            evaluator.make_move(row, col, player)
+        player = "O" if len(middle) % 2 else "X"
+        started = time.perf_counter()
+        evaluations += len(evaluator.ranked_moves(player))
+        elapsed += time.perf_counter() - started
+        while evaluator.unmake_move():
+            pass
+    return evaluations / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ThreatEvaluator benchmark")
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--size", type=int, default=15)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    board = GameBoard()
+    lines, _ = line_table(3, 3)
+    generated = []
+    for line in lines:
+        product = 1
+        for cell in line:
+            product *= board.products[cell // 3][cell % 3]
+        generated.append(product)
+    assert sorted(generated) == sorted(board.winning_patterns), "3x3 çizgileri winning_patterns'tan farklı"
+
+    games = random_games(args.games, args.size, args.k)
+    lines, _ = line_table(args.size, args.k)
+    moves = sum(len(game) for game in games)
+    check(games[:20], args.size, args.k)
+    print(f"{args.size}x{args.size} ({args.k}'li), {len(lines)} pencere, {args.games} oyun, "
+          f"{moves} hamle (ortalama {moves / args.games:.0f}); doğruluk kontrolü geçti")
+
+    full = max(measure_full(games, args.size, args.k) for _ in range(args.repeat))
+    incremental = max(measure_incremental(games, args.size, args.k) for _ in range(args.repeat))
+    node = max(measure_search_node(games, args.size, args.k, 50) for _ in range(args.repeat))
+    print(f"  tam tarama:                  {full:10,.0f} değerlendirme/s")
+    print(f"  artımlı (make + evaluate):   {incremental:10,.0f} değerlendirme/s ({incremental / full:.0f}x)")
+    print(f"  arama düğümü (make + evaluate + unmake, aday başına): {node:,.0f} /s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+Olay kaydı (EventStore) yük testi
+
+1. Sadece store: N oyunun olayları (2 katılım, başlangıç, bitiş) EventStore'a
+   verilir; toplu yazma, her olayı ayrı commit eden naif yazma ile karşılaştırılır
+   (ikisi de synchronous=FULL, yani commit başına bir fsync)
+2. Server yük altında: aynı process'te --event-db ile bir GameServer çalışır,
+   C eşzamanlı bot çifti sürekli oyun oynar (her oyun yeni bağlantı).
+   Ölçülen: saniyede biten ve kalıcı hale gelen oyun, transaction (fsync)
+   başına oyun ve event loop gecikmesi (10 ms'lik ticker)
+
+Kullanım:
+    python -m Benchmarks.event_store_load --games 20000 --pairs 50 --duration 10
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import statistics
+import tempfile
+import time
+import uuid
+
+import websockets
+
+from Network.websocket_server import GameServer
+from Utils.event_store import EventStore, SCHEMA, UPSERT_PLAYER, INSERT_GAME, END_GAME
+
+# X kazanır: X (0,0) (0,1) (0,2) - O (1,0) (1,1)
+MOVES = {"X": [(0, 0), (0, 1), (0, 2)], "O": [(1, 0), (1, 1)]}
+FINAL_MOVES = [0, 3, 1, 4, 2]
+
+
+def fresh_path(workdir, name):
+    path = os.path.join(workdir, name)
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    return path
+
+
+async def store_only(path, games):
+    store = EventStore(path)
+    store.start()
+    started = time.perf_counter()
+    for idx in range(games):
+        game_id = uuid.uuid4().hex
+        store.record_player_join(f"a{idx}", f"a{idx}")
+        store.record_player_join(f"b{idx}", f"b{idx}")
+        store.record_game_start(game_id, idx, f"a{idx}", f"b{idx}")
+        store.record_game_end(game_id, idx, f"a{idx}", f"b{idx}", "X", FINAL_MOVES)
+        if idx % 100 == 0:
+            await asyncio.sleep(0)  # Üretici event loop'u bırakır, writer çalışabilir
+    await store.close()
+    return time.perf_counter() - started, store.batches_written
+
+
+def naive(path, games):
+    """Karşılaştırma: her olay kendi transaction'ında"""
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=FULL")
+    for statement in SCHEMA:
+        conn.execute(statement)
+    started = time.perf_counter()
+    for idx in range(games):
+        game_id = uuid.uuid4().hex
+        now = time.time()
+        for sql, params in (
+                (UPSERT_PLAYER, (f"a{idx}", f"a{idx}", now, now)),
+                (UPSERT_PLAYER, (f"b{idx}", f"b{idx}", now, now)),
+                (INSERT_GAME, (game_id, idx, f"a{idx}", f"b{idx}", now)),
+                (END_GAME, (game_id, idx, f"a{idx}", f"b{idx}", now, "X", None, 5, 0))):
+            with conn:
+                conn.execute(sql, params)
+    elapsed = time.perf_counter() - started
+    conn.close()
+    return elapsed
+
+
+async def player_bot(url, name):
+    async with websockets.connect(url) as ws:
+        await ws.recv()  # welcome
+        await ws.send(json.dumps({
+            "type": "player_join",
+            "data": {"player": {"id": name, "symbol": "X", "name": name}}
+        }))
+        symbol = None
+        moves = None
+        while True:
+            message = json.loads(await ws.recv())
+            data = message["data"]
+            if message["type"] == "waiting":
+                symbol = data["your_symbol"]
+                moves = list(MOVES[symbol])
+            elif message["type"] == "game_state":
+                if data["current_player"] == symbol and not data["is_game_over"] and moves:
+                    row, col = moves.pop(0)
+                    await ws.send(json.dumps({"type": "move", "data": {"row": row, "col": col}}))
+            elif message["type"] == "game_end":
+                return
+
+
+async def pair_loop(url, pair, stop_event, finished):
+    while not stop_event.is_set():
+        first = asyncio.create_task(player_bot(url, f"p{pair}a"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(player_bot(url, f"p{pair}b"))
+        await asyncio.gather(first, second)
+        finished[0] += 1
+
+
+async def lag_monitor(stop_event, lags, interval=0.01):
+    while not stop_event.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - started - interval)
+
+
+async def under_load(path, port, pairs, duration):
+    server = GameServer("localhost", port, connection_rate=None, message_rate=None, event_db_path=path)
+    server_task = asyncio.create_task(server.start_server())
+    await asyncio.sleep(0.3)
+    url = f"ws://localhost:{port}"
+
+    stop_event = asyncio.Event()
+    finished = [0]
+    lags = []
+    monitor = asyncio.create_task(lag_monitor(stop_event, lags))
+    started = time.perf_counter()
+    loops = [asyncio.create_task(pair_loop(url, pair, stop_event, finished)) for pair in range(pairs)]
+    await asyncio.sleep(duration)
+    stop_event.set()
+    await asyncio.gather(*loops)
+    elapsed = time.perf_counter() - started
+    await monitor
+
+    store = server.event_store
+    persisted_before_close = await store.finished_games() if store else 0
+    batches = store.batches_written if store else 0
+    events = store.events_written if store else 0
+    server.drain_timeout = 0
+    server.request_shutdown()
+    await server_task
+
+    persisted = 0
+    if path:
+        conn = sqlite3.connect(path)
+        persisted = conn.execute("SELECT COUNT(*) FROM games WHERE ended_at IS NOT NULL").fetchone()[0]
+        conn.close()
+    return elapsed, finished[0], persisted_before_close, persisted, batches, events, lags
+
+
+async def run(args):
+    workdir = args.dir or tempfile.mkdtemp(prefix="tttevents-")
+    os.makedirs(workdir, exist_ok=True)
+
+    # 1. Sadece store
+    elapsed, batches = await store_only(fresh_path(workdir, "store.db"), args.games)
+    print(f"Toplu yazma: {args.games} oyun ({args.games * 4} olay), {elapsed:.2f}s, "
+          f"{args.games / elapsed:.0f} oyun/s, {batches} transaction "
+          f"({args.games / batches:.0f} oyun/fsync)")
+    naive_games = max(1, args.games // 20)
+    naive_elapsed = naive(fresh_path(workdir, "naive.db"), naive_games)
+    print(f"Olay başına commit: {naive_games} oyun, {naive_elapsed:.2f}s, "
+          f"{naive_games / naive_elapsed:.0f} oyun/s ({naive_games * 4} transaction)")
+
+    # 2. Server yük altında; karşılaştırma için önce kayıtsız
+    elapsed, finished, _, _, _, _, lags = await under_load(None, args.port, args.pairs, args.duration)
+    lags.sort()
+    print(f"Server, kayıt yok: {args.pairs} çift, {elapsed:.1f}s, {finished} oyun bitti "
+          f"({finished / elapsed:.0f} oyun/s)")
+    print(f"  Event loop gecikmesi p50: {statistics.median(lags) * 1000:.2f} ms, "
+          f"p99: {lags[int(len(lags) * 0.99) - 1] * 1000:.2f} ms, max: {lags[-1] * 1000:.2f} ms")
+
+    elapsed, finished, persisted_live, persisted, batches, events, lags = await under_load(
+        fresh_path(workdir, "server.db"), args.port + 1, args.pairs, args.duration)
+    lags.sort()
+    print(f"Server, --event-db: {args.pairs} çift, {elapsed:.1f}s, {finished} oyun bitti "
+          f"({finished / elapsed:.0f} oyun/s)")
+    print(f"  Kalıcı: kapanıştan önce {persisted_live}, kapanışta {persisted} oyun "
+          f"({persisted / elapsed:.0f} oyun/s); {batches} transaction, "
+          f"{events / max(1, batches):.0f} olay/transaction")
+    print(f"  Event loop gecikmesi p50: {statistics.median(lags) * 1000:.2f} ms, "
+          f"p99: {lags[int(len(lags) * 0.99) - 1] * 1000:.2f} ms, max: {lags[-1] * 1000:.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Olay kaydı yük testi")
+    parser.add_argument("--games", type=int, default=20000, help="Sadece-store testindeki oyun sayısı")
+    parser.add_argument("--pairs", type=int, default=50, help="Eşzamanlı oynayan bot çifti")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--port", type=int, default=8791)
+    parser.add_argument("--dir", default=None, help="Veritabanlarının yazılacağı dizin")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
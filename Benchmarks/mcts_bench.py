@@ -0,0 +1,236 @@
+"""
+MCTS bot benchmark
+
+1. Tek çekirdekte saniyedeki playout: 3x3, 9x9 (5'li), 15x15 (5'li) board'lar,
+   boş ve oyun ortası pozisyonlarda
+2. Root paralelliği ölçekleme eğrisi: 1..N worker process, aynı süre bütçesi,
+   toplam playout ve worker başına playout
+3. Oyun gücü kontrolü (3x3): bot rastgele oynayan rakibe karşı hiç kaybetmemeli
+4. Event loop: server bota karşı oyunlarda düşünürken, aynı server'daki
+   oyuncu-oyuncu oyunlarının hamle gecikmesi ve event loop gecikmesi
+
+Kullanım:
+    python -m Benchmarks.mcts_bench --budget 1.0 --max-workers 4
+"""
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import websockets
+
+from Game.mcts import MCTSBot, X, search, win_masks
+from Game.player import Player
+from Network.websocket_server import GameServer
+from Utils.protocol import GameProtocol
+
+BOARDS = ((3, 3), (9, 5), (15, 5))
+
+
+def midgame(size, stones, seed):
+    """Rastgele ama henüz bitmemiş bir oyun ortası pozisyonu"""
+    rng = random.Random(seed)
+    masks = win_masks(size, min(size, 5))
+    while True:
+        x_bits = o_bits = 0
+        finished = False
+        for idx, cell in enumerate(rng.sample(range(size * size), stones)):
+            if idx % 2 == 0:
+                x_bits |= 1 << cell
+                bits = x_bits
+            else:
+                o_bits |= 1 << cell
+                bits = o_bits
+            if any(bits & mask == mask for mask in masks[cell]):
+                finished = True
+                break
+        if not finished:
+            return x_bits, o_bits
+
+
+def single_core(budget):
+    print(f"Tek çekirdek, {budget:.1f}s bütçe:")
+    for size, k in BOARDS:
+        _, empty = search(size, k, 0, 0, X, budget, seed=1)
+        stones = 4 if size == 3 else size * 2
+        x_bits, o_bits = midgame(size, stones, seed=size)
+        _, middle = search(size, k, x_bits, o_bits, X, budget, seed=1)
+        print(f"  {size}x{size} ({k}'li): boş board {empty / budget:,.0f} playout/s, "
+              f"oyun ortası ({stones} taş) {middle / budget:,.0f} playout/s")
+
+
+def scaling(budget, max_workers):
+    size, k = 15, 5
+    print(f"Root paralelliği, {size}x{size} boş board, hamle başına {budget:.1f}s "
+          f"(CPU: {os.cpu_count()}):")
+    base = None
+    context = multiprocessing.get_context("spawn")
+    workers = 1
+    while workers <= max_workers:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            # Process'leri ısıt (spawn + import süresi ölçüme girmesin)
+            list(pool.map(search, *zip(*[(3, 3, 0, 0, X, 0.01)] * workers)))
+            bot = MCTSBot(budget, parallelism=workers, executor=pool, k=k)
+            board = [[None] * size for _ in range(size)]
+            started = time.perf_counter()
+            bot.choose_move(board, "X")
+            elapsed = time.perf_counter() - started
+        rate = bot.playouts / elapsed
+        base = base or rate
+        print(f"  {workers} worker: {rate:,.0f} playout/s toplam, {rate / workers:,.0f} / worker, "
+              f"hızlanma {rate / base:.2f}x (hamle süresi {elapsed:.2f}s)")
+        workers *= 2
+
+
+def strength(games, budget):
+    """3x3: bot (X veya O) rastgele oyuncuya karşı"""
+    rng = random.Random(7)
+    bot = MCTSBot(budget)
+    results = {"bot": 0, "rastgele": 0, "berabere": 0}
+    masks = win_masks(3, 3)
+    for game in range(games):
+        bot_symbol = "X" if game % 2 == 0 else "O"
+        board = [[None] * 3 for _ in range(3)]
+        bits = {"X": 0, "O": 0}
+        turn = "X"
+        winner = None
+        for _ in range(9):
+            if turn == bot_symbol:
+                row, col = bot.choose_move(board, turn)
+            else:
+                row, col = rng.choice([(r, c) for r in range(3) for c in range(3) if board[r][c] is None])
+            board[row][col] = turn
+            cell = row * 3 + col
+            bits[turn] |= 1 << cell
+            if any(bits[turn] & mask == mask for mask in masks[cell]):
+                winner = turn
+                break
+            turn = "O" if turn == "X" else "X"
+        if winner is None:
+            results["berabere"] += 1
+        elif winner == bot_symbol:
+            results["bot"] += 1
+        else:
+            results["rastgele"] += 1
+    print(f"3x3 oyun gücü ({games} oyun, {budget}s/hamle, rastgele rakip): {results}")
+    assert results["rastgele"] == 0, "Bot rastgele oyuncuya kaybetti"
+
+
+async def loop_responsiveness(args):
+    """
+    Bot oyunları düşünürken oyuncu-oyuncu oyunlarının hamle gecikmesi
+    """
+    port = args.port
+    server = GameServer("localhost", port, message_rate=None, connection_rate=None,
+                        bot_time=args.bot_time, bot_workers=args.bot_workers)
+    server_task = asyncio.create_task(server.start_server())
+    await asyncio.sleep(0.3)
+    url = f"ws://localhost:{port}"
+
+    lags = []
+    stop = asyncio.Event()
+
+    async def lag_probe():
+        while not stop.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(0.01)
+            lags.append(time.perf_counter() - started - 0.01)
+
+    async def recv_type(ws, message_type):
+        while True:
+            message = json.loads(await ws.recv())
+            if message["type"] == message_type:
+                return message["data"]
+
+    async def bot_game(idx):
+        async with websockets.connect(url) as ws:
+            await ws.recv()
+            await ws.send(GameProtocol.serialize_player_join(
+                Player(f"h{idx}", "X", f"h{idx}"), opponent="bot"))
+            while True:
+                message = json.loads(await ws.recv())
+                if message["type"] == "game_end":
+                    return message["data"]["winner"]
+                if message["type"] == "game_state":
+                    state = message["data"]
+                    if state["current_player"] == "X" and not state["is_game_over"]:
+                        empty = [(r, c) for r in range(3) for c in range(3) if state["board"][r][c] is None]
+                        row, col = random.choice(empty)
+                        await ws.send(json.dumps({"type": "move", "data": {"row": row, "col": col}}))
+
+    async def human_game(idx, latencies):
+        x = await websockets.connect(url)
+        o = await websockets.connect(url)
+        await x.recv()
+        await o.recv()
+        await x.send(GameProtocol.serialize_player_join(Player(f"x{idx}", "X", f"x{idx}")))
+        await recv_type(x, "waiting")
+        await o.send(GameProtocol.serialize_player_join(Player(f"o{idx}", "X", f"o{idx}")))
+        await recv_type(o, "waiting")
+        await recv_type(x, "game_state")
+        await recv_type(o, "game_state")
+        moves = [(x, o, 0, 0), (o, x, 1, 0), (x, o, 0, 1), (o, x, 1, 1), (x, o, 0, 2)]
+        for mover, other, row, col in moves:
+            started = time.perf_counter()
+            await mover.send(json.dumps({"type": "move", "data": {"row": row, "col": col}}))
+            await recv_type(other, "game_state")
+            latencies.append(time.perf_counter() - started)
+            await asyncio.sleep(0.05)
+        await x.close()
+        await o.close()
+
+    probe = asyncio.create_task(lag_probe())
+    started = time.perf_counter()
+    bot_games = [asyncio.create_task(bot_game(idx)) for idx in range(args.bot_games)]
+    latencies = []
+    humans = 0
+    while not all(task.done() for task in bot_games):
+        await human_game(humans, latencies)
+        humans += 1
+    winners = [task.result() for task in bot_games]
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await probe
+
+    latencies.sort()
+    lags.sort()
+    print(f"Server: {args.bot_games} bot oyunu ({args.bot_time}s/hamle, {server.bot_workers} worker) "
+          f"{elapsed:.1f}s sürdü, bot kazandı/berabere: "
+          f"{sum(1 for w in winners if w == 'O')}/{sum(1 for w in winners if w == 'tie')}")
+    print(f"  Aynı anda {humans} oyuncu-oyuncu oyunu: hamle gecikmesi p50 "
+          f"{statistics.median(latencies) * 1000:.2f} ms, en fazla {latencies[-1] * 1000:.2f} ms")
+    print(f"  Event loop gecikmesi p50 {statistics.median(lags) * 1000:.2f} ms, "
+          f"p99 {lags[int(len(lags) * 0.99)] * 1000:.2f} ms, en fazla {lags[-1] * 1000:.2f} ms "
+          f"(arama loop'ta yapılsaydı her bot hamlesi loop'u {args.bot_time * 1000:.0f} ms bloklardı)")
+    assert all(winner in ("O", "tie") for winner in winners), "Bot rastgele oyuncuya kaybetti"
+
+    server.request_shutdown()
+    await server_task
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MCTS bot benchmark")
+    parser.add_argument("--budget", type=float, default=1.0, help="Playout ölçümü için süre (saniye)")
+    parser.add_argument("--max-workers", type=int, default=4)
+    parser.add_argument("--strength-games", type=int, default=20)
+    parser.add_argument("--bot-games", type=int, default=8)
+    parser.add_argument("--bot-time", type=float, default=0.3)
+    parser.add_argument("--bot-workers", type=int, default=None)
+    parser.add_argument("--port", type=int, default=8810)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    single_core(args.budget)
+    scaling(args.budget, args.max_workers)
+    strength(args.strength_games, 0.05)
+    asyncio.run(loop_responsiveness(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Bellek muhasebesi testi: room / bağlantı başına boyut ve büyüme farkları
+
+Server aynı process'te çalışır (tracemalloc açık), profilleme socket'i
+açılır. Oyuncu çiftleri gerçek websocket bağlantısıyla oyun oynayıp çıkar.
+Her turdan sonra socket'e "memory" komutu gönderilir ve yazılan JSON
+raporu okunur: room sayısı, bitmiş/bağlantısız (stale) room'lar, room ve
+bağlantı başına ortalama boyut, büyüyen sınıflar ve tracemalloc'un en çok
+büyüyen ayırma yerleri yazdırılır. Oyunu biten room'lar server'dan
+silindiği için turlar arasında room sayısı ve GameRoom/Game/GameBoard
+nesneleri büyümemelidir.
+
+Kullanım:
+    python -m Benchmarks.memory_diag_bench --games 200 --rounds 3
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import tempfile
+
+import websockets
+
+from Game.player import Player
+from Network.websocket_server import GameServer
+from Utils.protocol import GameProtocol
+
+# X kazanır: X (0,0) (0,1) (0,2) - O (1,0) (1,1)
+MOVES = {"X": [(0, 0), (0, 1), (0, 2)], "O": [(1, 0), (1, 1)]}
+
+
+async def player(url, name):
+    """
+    Tek oyun oynar ve bağlantıyı kapatır
+    """
+    async with websockets.connect(url) as ws:
+        await ws.recv()  # welcome
+        await ws.send(GameProtocol.serialize_player_join(Player(player_id=name, symbol="X", name=name)))
+        symbol = None
+        moves = None
+        while True:
+            message = json.loads(await ws.recv())
+            data = message["data"]
+            if message["type"] == "waiting":
+                symbol = data["your_symbol"]
+                moves = list(MOVES[symbol])
+            elif message["type"] == "game_state":
+                if data["current_player"] == symbol and not data["is_game_over"] and moves:
+                    row, col = moves.pop(0)
+                    await ws.send(json.dumps({"type": "move", "data": {"row": row, "col": col}}))
+            elif message["type"] == "game_end":
+                break
+
+
+async def command(socket_path, line):
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    writer.write((line + "\n").encode())
+    await writer.drain()
+    reply = (await reader.readline()).decode().strip()
+    writer.close()
+    return reply
+
+
+async def memory_report(socket_path):
+    reply = await command(socket_path, "memory")
+    assert reply.startswith("ok "), reply
+    with open(reply.split()[1], encoding="utf-8") as f:
+        return reply, json.load(f)
+
+
+def short_path(where):
+    path, line = where.rsplit(":", 1)
+    parts = path.split(os.sep)
+    return f"{os.sep.join(parts[-2:])}:{line}"
+
+
+async def run(args):
+    output_dir = tempfile.mkdtemp(prefix="memory-")
+    socket_path = os.path.join(output_dir, "control.sock")
+    server = GameServer("localhost", args.port, message_rate=None, connection_rate=None,
+                        profile_dir=output_dir, profile_socket=socket_path)
+    server.diagnostics.start_tracing()
+    server_task = asyncio.create_task(server.start_server())
+    await asyncio.sleep(0.3)
+    url = f"ws://localhost:{args.port}"
+
+    # Boş server: karşılaştırma noktası
+    reply, report = await memory_report(socket_path)
+    print(f"Başlangıç: {reply.split(' ', 2)[2]} ({report['elapsed_ms']} ms)")
+    open_clients = []
+    for round_idx in range(1, args.rounds + 1):
+        for idx in range(0, args.games, args.batch):
+            batch = range(idx, min(idx + args.batch, args.games))
+            await asyncio.gather(*(asyncio.gather(player(url, f"x{round_idx}-{game}"),
+                                                  player(url, f"o{round_idx}-{game}"))
+                                   for game in batch))
+        # Açık kalan birkaç bağlantı: bağlantı başına boyut ölçülsün
+        for idx in range(args.connections - len(open_clients)):
+            ws = await websockets.connect(url)
+            await ws.recv()
+            open_clients.append(ws)
+        await asyncio.sleep(0.2)
+
+        reply, report = await memory_report(socket_path)
+        rooms = report["rooms"]
+        connections = report["connections"]
+        growth = report["growth"]
+        print(f"\nTur {round_idx}: +{args.games} oyun ({report['elapsed_ms']} ms, {reply.split()[1]})")
+        print(f"  room: {rooms['count']} ({rooms['by_status']}), stale {rooms['stale']}, "
+              f"~{rooms['avg_bytes']} B / {rooms['avg_objects']} nesne per room, toplam ~{rooms['est_total_bytes']} B")
+        print(f"  bağlantı: {connections['count']}, ~{connections['avg_bytes']} B / "
+              f"{connections['avg_objects']} nesne per bağlantı")
+        print(f"  büyüme ({growth['seconds']}s): room {growth['rooms']:+d}, room bytes {growth['room_bytes']:+d}, "
+              f"bağlantı {growth['connections']:+d}")
+        for name, delta in list(growth["objects"].items())[:6]:
+            print(f"    {delta:+6d}  {name}")
+        if "allocators" in growth:
+            print("  tracemalloc büyüme (ilk 5):")
+            for item in growth["allocators"][:5]:
+                print(f"    {item['bytes']:+9d} B {item['blocks']:+6d} blok  {short_path(item['where'])}")
+        # Biten room'lar silinir; sadece bekleme odası kalabilir
+        assert growth["rooms"] <= 1, "Biten room'lar birikmemeli"
+        assert growth["objects"].get("Network.websocket_server.GameRoom", 0) <= 1
+
+    print("\nEn çok tutan ayırma yerleri (ilk 5):")
+    for item in report["tracemalloc"]["top"][:5]:
+        print(f"  {item['bytes']:9d} B {item['blocks']:6d} blok  {short_path(item['where'])}")
+    bad = await command(socket_path, "memory now")
+    assert bad.startswith("error "), bad
+
+    for ws in open_clients:
+        await ws.close()
+    server.request_shutdown()
+    await server_task
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bellek muhasebesi testi")
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--batch", type=int, default=20)
+    parser.add_argument("--connections", type=int, default=10)
+    parser.add_argument("--port", type=int, default=8900)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
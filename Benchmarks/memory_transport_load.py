@@ -0,0 +1,244 @@
+"""
+Bellek içi transport ile büyük ölçekli simülasyon
+
+Server ve tüm oyuncular aynı process'te, socket'siz (MemoryTransport)
+bağlantılarla çalışır:
+1. Doğruluk: iki GameClient gecikmeli, jitter'lı ve kayıplı bağlantı
+   üzerinden oyun oynar; hamle gönderimi -> game_state süresi ölçülür.
+2. Ölçek: toplam --players oyuncu, aynı anda en fazla --concurrency bağlantı.
+   Her oyuncu bağlanır, eşleşir, oyunu oynar ve çıkar. Bağlantı/s, oyun/s,
+   hamle/s ve process'in en yüksek RSS'i yazdırılır.
+3. Karşılaştırma: aynı senaryo --compare oyuncuyla (aynı anda en fazla
+   --compare-concurrency bağlantı) gerçek websocket (localhost TCP) ve
+   bellek içi transport üzerinden.
+--profile ile ölçek aşaması SamplingProfiler'la örneklenir, en çok CPU
+harcayan server fonksiyonları (kendi süresi) yazdırılır.
+
+Kullanım:
+    python -m Benchmarks.memory_transport_load --players 200000 --concurrency 20000
+    python -m Benchmarks.memory_transport_load --players 1000000 --concurrency 20000 --compare 0
+"""
+import argparse
+import asyncio
+import contextlib
+import itertools
+import json
+import logging
+import os
+import resource
+import statistics
+import time
+
+from Game.player import Player
+from Network.transport import MemoryTransport, WebSocketTransport
+from Network.websocket_client import GameClient
+from Network.websocket_server import GameServer
+from Utils.profiler import SamplingProfiler
+from Utils.protocol import GameProtocol
+
+# X kazanır: X (0,0) (0,1) (0,2) - O (1,0) (1,1)
+MOVES = {"X": [(0, 0), (0, 1), (0, 2)], "O": [(1, 0), (1, 1)]}
+SERVER_FILES = ("websocket_server.py", "game_logic.py", "board.py", "protocol.py", "validator.py",
+                "clock.py", "rating.py", "server_stats.py", "rate_limiter.py")
+
+
+def make_server(transport, port):
+    return GameServer("sim" if isinstance(transport, MemoryTransport) else "localhost", port,
+                      message_rate=None, connection_rate=None, drain_timeout=0.1, transport=transport)
+
+
+async def client_player(url, name, transport, latencies):
+    """
+    GameClient ile tek oyun: kendi hamlesinin server'dan dönme süresini kaydeder
+
+    Returns:
+        str: GAME_END'deki kazanan (oyun bitmeden bağlantı kapandıysa None)
+    """
+    client = GameClient(url, predict=False, transport=transport)
+    await client.connect()
+    player = Player(player_id=name, symbol="X", name=name)
+    await client.send_player_join(player)
+    moves = None
+    sent = None
+    winner = None
+    while True:
+        message = await client.listen_for_updates()
+        if message is None:
+            break
+        parsed = client.handle_server_message(message)
+        if not parsed:
+            continue
+        if parsed["type"] == "waiting":
+            player.symbol = client.player_symbol
+            moves = list(MOVES[player.symbol])
+        elif parsed["type"] == "game_state":
+            if sent and parsed["data"]["board"][sent[0]][sent[1]] == player.symbol:
+                latencies.append(time.perf_counter() - sent[2])
+                sent = None
+            if client.is_my_turn() and moves:
+                row, col = moves.pop(0)
+                sent = (row, col, time.perf_counter())
+                await client.send_move(player, row, col)
+        elif parsed["type"] == "game_end":
+            winner = parsed["data"].get("winner")
+            break
+    await client.disconnect()
+    return winner
+
+
+async def correctness(args):
+    transport = MemoryTransport(latency=args.latency, jitter=args.jitter, loss=args.loss, seed=1)
+    server = make_server(transport, 1)
+    server_task = asyncio.create_task(server.start_server())
+    await asyncio.sleep(0.05)
+    latencies = []
+    winners = []
+    with contextlib.redirect_stdout(open(os.devnull, "w")) as devnull:
+        for idx in range(args.games):
+            winners.extend(await asyncio.gather(
+                client_player("ws://sim:1", f"x{idx}", transport, latencies),
+                client_player("ws://sim:1", f"o{idx}", transport, latencies)))
+        devnull.close()
+    server.request_shutdown()
+    await server_task
+    # Biten room'lar server'da tutulmaz; sonuç iki oyuncunun GAME_END'inden okunur
+    finished = sum(1 for idx in range(0, len(winners), 2) if winners[idx] == winners[idx + 1] == "X")
+    values = sorted(latencies)
+    print(f"Doğruluk: {args.games} oyun (GameClient), gecikme {args.latency * 1000:g}ms "
+          f"+ jitter {args.jitter * 1000:g}ms, kayıp %{args.loss * 100:g}")
+    print(f"  X kazandı: {finished}/{args.games}, {len(values)} hamle, hamle -> game_state "
+          f"p50 {statistics.median(values) * 1000:.1f}ms, max {values[-1] * 1000:.1f}ms, "
+          f"{transport.retransmits}/{transport.frames} frame yeniden iletildi")
+    assert finished == args.games, "Oyunlar tamamlanmadı"
+
+
+async def player(url, name, transport):
+    """
+    Hafif oyuncu: bağlanır, eşleşir, hamlelerini yapar ve çıkar
+
+    Returns:
+        int: Yapılan hamle sayısı
+    """
+    ws = await transport.connect(url)
+    try:
+        await ws.recv()  # welcome
+        await ws.send(GameProtocol.serialize_player_join(Player(player_id=name, symbol="X", name=name)))
+        symbol = None
+        moves = None
+        played = 0
+        while True:
+            message = json.loads(await ws.recv())
+            data = message["data"]
+            if message["type"] == "waiting":
+                symbol = data["your_symbol"]
+                moves = list(MOVES[symbol])
+            elif message["type"] == "game_state":
+                if data["current_player"] == symbol and not data["is_game_over"] and moves:
+                    row, col = moves.pop(0)
+                    await ws.send(json.dumps({"type": "move", "data": {"row": row, "col": col}}))
+                    played += 1
+            elif message["type"] == "game_end":
+                return played
+    finally:
+        await ws.close()
+
+
+async def scale(transport, port, players, concurrency, profile=False):
+    """
+    Toplam `players` oyuncu, aynı anda en fazla `concurrency` bağlantı
+
+    Returns:
+        dict: Süre, hamle sayısı, room sayısı ve (profile ise) profiler
+    """
+    server = make_server(transport, port)
+    server_task = asyncio.create_task(server.start_server())
+    await asyncio.sleep(0.3)
+    url = f"ws://{server.host}:{port}"
+    counter = itertools.count()
+    moves = 0
+
+    async def worker():
+        nonlocal moves
+        while (idx := next(counter)) < players:
+            played = await player(url, f"p{idx}", transport)
+            moves += played
+
+    profiler = SamplingProfiler(interval=0.001) if profile else None
+    started = time.perf_counter()
+    if profiler:
+        profiler.start()
+    try:
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, players))))
+    finally:
+        if profiler:
+            profiler.stop()
+    elapsed = time.perf_counter() - started
+    server.request_shutdown()
+    await server_task
+    return {"elapsed": elapsed, "moves": moves, "rooms": len(server.game_rooms), "profiler": profiler}
+
+
+def report(label, players, result):
+    elapsed = result["elapsed"]
+    print(f"  {label:<22} {players:>8} oyuncu {elapsed:7.1f}s  {players / elapsed:8.0f} bağlantı/s "
+          f"{players / 2 / elapsed:7.0f} oyun/s {result['moves'] / elapsed:8.0f} hamle/s")
+
+
+def hot_spots(profiler, top=12):
+    """
+    Server dosyalarındaki fonksiyonların kendi (yaprak) örnek sayısı
+    """
+    leaves = {}
+    for stack, count in profiler.stacks.items():
+        for label in reversed(stack):
+            # En içteki server frame'i: kütüphane çağrıları (json, asyncio) onu çağırana yazılır
+            if any(f"({name}:" in label for name in SERVER_FILES):
+                leaves[label] = leaves.get(label, 0) + count
+                break
+    total = profiler.samples or 1
+    print(f"  Server hot spot'ları ({profiler.samples} örnek, çağırdığı kütüphane kodu dahil):")
+    for label, count in sorted(leaves.items(), key=lambda item: -item[1])[:top]:
+        print(f"    {count / total * 100:5.1f}%  {label}")
+    print(f"    {sum(leaves.values()) / total * 100:5.1f}%  toplam server (kalanı oyuncu simülasyonu ve loop)")
+
+
+async def run(args):
+    await correctness(args)
+
+    print(f"\nÖlçek: MemoryTransport, aynı anda {args.concurrency} bağlantı")
+    result = await scale(MemoryTransport(), 2, args.players, args.concurrency, args.profile)
+    report("bellek içi", args.players, result)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"  en yüksek RSS {peak / 1024:.0f} MB, server'da {result['rooms']} room")
+    if result["profiler"]:
+        hot_spots(result["profiler"])
+
+    if args.compare:
+        concurrency = min(args.compare_concurrency, args.compare)
+        print(f"\nKarşılaştırma: {args.compare} oyuncu, aynı anda {concurrency} bağlantı")
+        for label, transport in (("websocket (localhost)", WebSocketTransport()), ("bellek içi", MemoryTransport())):
+            port = args.port if isinstance(transport, WebSocketTransport) else 3
+            report(label, args.compare, await scale(transport, port, args.compare, concurrency))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bellek içi transport ile ölçek testi")
+    parser.add_argument("--players", type=int, default=200000)
+    parser.add_argument("--concurrency", type=int, default=20000)
+    parser.add_argument("--games", type=int, default=20, help="Doğruluk aşamasındaki oyun sayısı")
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--jitter", type=float, default=0.005)
+    parser.add_argument("--loss", type=float, default=0.01)
+    parser.add_argument("--compare", type=int, default=4000)
+    parser.add_argument("--compare-concurrency", type=int, default=200)
+    parser.add_argument("--profile", action="store_true")
+    parser.add_argument("--port", type=int, default=8910)
+    args = parser.parse_args()
+    if args.players % 2:
+        parser.error("--players çift olmalı")
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
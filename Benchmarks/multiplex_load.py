@@ -0,0 +1,181 @@
+"""
+Multiplexed oturum yük testi
+
+Server ayrı bir process olarak (python -m server) başlatılır; N eşzamanlı oyun
+iki şekilde kurulur, her biri için yeni bir server process'i kullanılır:
+1. Oyuncu başına bir websocket (2N bağlantı)
+2. Multiplexed: C bağlantı, her bağlantıda 2N / C oturum (MultiplexClient)
+
+Ölçülen:
+- Tüm oyunlar başlamış ve ilk hamleyi beklerken server'ın RSS artışı (oyun başına)
+- Tüm oyunların oynanma süresi (oyun/s)
+
+Kullanım:
+    python -m Benchmarks.multiplex_load --games 1000 --connections 8
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+import websockets
+
+from Game.player import Player
+from Network.multiplex_client import MultiplexClient
+from Utils.protocol import GameProtocol
+
+# X kazanır: X (0,0) (0,1) (0,2) - O (1,0) (1,1)
+MOVES = {"X": [(0, 0), (0, 1), (0, 2)], "O": [(1, 0), (1, 1)]}
+
+
+def rss_kb(pid):
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+async def start_server(port, max_sessions):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    process = subprocess.Popen(
+        [sys.executable, "-m", "server", "--port", str(port), "--message-rate", "0",
+         "--connection-rate", "0", "--log-level", "WARNING", "--max-sessions", str(max_sessions)],
+        cwd=root)
+    for _ in range(100):
+        try:
+            async with websockets.connect(f"ws://localhost:{port}"):
+                return process
+        except OSError:
+            await asyncio.sleep(0.1)
+    process.kill()
+    raise RuntimeError("Server başlamadı")
+
+
+async def socket_player(url, name, started, go):
+    """Oyuncu başına ayrı websocket"""
+    async with websockets.connect(url) as ws:
+        await ws.recv()  # welcome
+        await ws.send(GameProtocol.serialize_player_join(Player(player_id=name, symbol="X", name=name)))
+        symbol = None
+        moves = None
+        first_state = True
+        while True:
+            message = json.loads(await ws.recv())
+            data = message["data"]
+            if message["type"] == "waiting":
+                symbol = data["your_symbol"]
+                moves = list(MOVES[symbol])
+            elif message["type"] == "game_state":
+                if first_state:
+                    first_state = False
+                    started[0] += 1
+                    await go.wait()
+                if data["current_player"] == symbol and not data["is_game_over"] and moves:
+                    row, col = moves.pop(0)
+                    await ws.send(json.dumps({"type": "move", "data": {"row": row, "col": col}}))
+            elif message["type"] == "game_end":
+                return
+
+
+async def session_player(client, name, started, go):
+    """Multiplexed bağlantıda bir oturum"""
+    session = client.open_session()
+    symbol = await session.join(Player(player_id=name, symbol="X", name=name))
+    moves = list(MOVES[symbol])
+    # İlk game_state oyunun başladığını gösterir
+    while session.game_state is None:
+        await session.recv()
+    started[0] += 1
+    await go.wait()
+    state = session.game_state
+    if state["current_player"] != symbol:
+        state = await session.wait_for_turn()
+    while state is not None and moves:
+        row, col = moves.pop(0)
+        await session.move(row, col)
+        state = await session.wait_for_turn()
+    while session.result is None:
+        if await session.recv() is None:
+            break
+    await session.close()
+
+
+async def run_mode(args, port, multiplexed):
+    process = await start_server(port, args.max_sessions)
+    try:
+        url = f"ws://localhost:{port}"
+        await asyncio.sleep(0.5)
+        idle_rss = rss_kb(process.pid)
+        started = [0]
+        go = asyncio.Event()
+        players = args.games * 2
+        tasks = []
+        clients = []
+
+        setup_started = time.perf_counter()
+        if multiplexed:
+            for _ in range(args.connections):
+                client = MultiplexClient(url)
+                assert await client.connect()
+                await client.unrouted.get()  # welcome
+                clients.append(client)
+            for idx in range(players):
+                tasks.append(asyncio.create_task(
+                    session_player(clients[idx % len(clients)], f"p{idx}", started, go)))
+                await asyncio.sleep(0)
+        else:
+            for idx in range(players):
+                tasks.append(asyncio.create_task(socket_player(url, f"p{idx}", started, go)))
+                await asyncio.sleep(0)
+        while started[0] < players:
+            await asyncio.sleep(0.05)
+        setup_time = time.perf_counter() - setup_started
+        await asyncio.sleep(0.5)
+        loaded_rss = rss_kb(process.pid)
+
+        play_started = time.perf_counter()
+        go.set()
+        await asyncio.gather(*tasks)
+        play_time = time.perf_counter() - play_started
+        for client in clients:
+            await client.close()
+        connections = len(clients) if multiplexed else players
+        return {
+            "connections": connections,
+            "games_per_connection": args.games / connections,
+            "setup": setup_time,
+            "play": play_time,
+            "rss_per_game": (loaded_rss - idle_rss) / args.games,
+            "rss": loaded_rss - idle_rss
+        }
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+async def run(args):
+    for label, multiplexed, port in (("Bağlantı başına oyuncu", False, args.port),
+                                     ("Multiplexed", True, args.port + 1)):
+        result = await run_mode(args, port, multiplexed)
+        print(f"{label}: {result['connections']} bağlantı, {result['games_per_connection']:.1f} oyun/bağlantı")
+        print(f"  Kurulum: {result['setup']:.2f}s, oynama: {result['play']:.2f}s "
+              f"({args.games / result['play']:.0f} oyun/s)")
+        print(f"  Server RSS artışı: {result['rss'] / 1024:.1f} MB, {result['rss_per_game']:.1f} KB/oyun")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multiplexed oturum yük testi")
+    parser.add_argument("--games", type=int, default=1000, help="Eşzamanlı oyun sayısı")
+    parser.add_argument("--connections", type=int, default=8, help="Multiplexed modda bağlantı sayısı")
+    parser.add_argument("--max-sessions", type=int, default=256)
+    parser.add_argument("--port", type=int, default=8792)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Açılış kitabı indexer'ı ve sorgu benchmark'ı
+
+Tüm oyun ağacındaki 255168 farklı oyun bir kez üretilir, log bunlardan
+rastgele seçilerek yazılır (server'ın --game-log formatı). Sonra:
+1. Tüm log indekslenir (games/s)
+2. Log'a yeni oyunlar eklenir ve kitap artımlı güncellenir
+3. Memory-mapped kitapta lookup ve popular_replies süreleri ölçülür
+
+Kullanım:
+    python -m Benchmarks.opening_book_bench --games 10000000 --append 1000000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from array import array
+
+from Game.board import GameBoard
+from Game.opening_book import OpeningBookBuilder, OpeningBook
+from Utils.game_log import encode_game
+
+
+def all_games():
+    """Tüm olası oyunlar (kayıt olarak), tek board üzerinde make/unmake ile"""
+    records = []
+    board = GameBoard()
+
+    def walk(player, opponent):
+        for cell in range(9):
+            if not board.make_move(cell // 3, cell % 3, player):
+                continue
+            if board.check_winner()["state"]:
+                records.append(encode_game(board.move_stack, player))
+            elif board.move_count == 9:
+                records.append(encode_game(board.move_stack, "tie"))
+            else:
+                walk(opponent, player)
+            board.unmake_move()
+
+    walk("X", "O")
+    return records
+
+
+def write_log(path, records, count, seed, chunk=1 << 20):
+    rng = random.Random(seed)
+    with open(path, "ab") as f:
+        written = 0
+        while written < count:
+            size = min(chunk, count - written)
+            data = array("Q", rng.choices(records, k=size))
+            if sys.byteorder != "little":
+                data.byteswap()
+            f.write(data.tobytes())
+            written += size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Açılış kitabı benchmark'ı")
+    parser.add_argument("--games", type=int, default=10_000_000)
+    parser.add_argument("--append", type=int, default=1_000_000, help="Artımlı güncelleme için eklenen oyun")
+    parser.add_argument("--queries", type=int, default=100000)
+    parser.add_argument("--dir", default=None, help="Log ve kitap dosyalarının yazılacağı dizin")
+    args = parser.parse_args()
+
+    workdir = args.dir or tempfile.mkdtemp(prefix="tttbook-")
+    os.makedirs(workdir, exist_ok=True)
+    log_path = os.path.join(workdir, "games.log")
+    book_path = os.path.join(workdir, "book.bin")
+    for path in (log_path, book_path):
+        if os.path.exists(path):
+            os.remove(path)
+
+    records = all_games()
+    started = time.perf_counter()
+    write_log(log_path, records, args.games, seed=1)
+    print(f"Farklı oyun: {len(records)}; log: {args.games} oyun, "
+          f"{os.path.getsize(log_path) / 1e6:.0f} MB ({time.perf_counter() - started:.1f}s yazma)")
+
+    # 1. Tam indeksleme
+    builder = OpeningBookBuilder()
+    started = time.perf_counter()
+    added = builder.add_log(log_path)
+    positions = builder.save(book_path)
+    elapsed = time.perf_counter() - started
+    print(f"Tam indeksleme: {added} oyun, {elapsed:.1f}s ({added / elapsed / 1e6:.2f}M oyun/s), "
+          f"{positions} pozisyon, kitap {os.path.getsize(book_path)} byte")
+
+    # 2. Artımlı güncelleme: sadece yeni kayıtlar okunur
+    write_log(log_path, records, args.append, seed=2)
+    builder = OpeningBookBuilder()
+    started = time.perf_counter()
+    builder.load(book_path)
+    added = builder.add_log(log_path)
+    builder.save(book_path)
+    elapsed = time.perf_counter() - started
+    print(f"Artımlı güncelleme: {added} yeni oyun, {elapsed:.2f}s, toplam {builder.games}")
+
+    # 3. Sorgular
+    started = time.perf_counter()
+    book = OpeningBook(book_path)
+    load_time = time.perf_counter() - started
+    assert book.games == args.games + args.append
+
+    probe = GameBoard()
+    rng = random.Random(3)
+    positions = []
+    for _ in range(1000):
+        cells = list(range(9))
+        rng.shuffle(cells)
+        for ply, cell in enumerate(cells[:rng.randrange(6)]):
+            probe.make_move(cell // 3, cell % 3, "X" if ply % 2 == 0 else "O")
+        positions.append(([row[:] for row in probe.board], probe.canonical_hash()))
+        while probe.move_count:
+            probe.unmake_move()
+
+    started = time.perf_counter()
+    for idx in range(args.queries):
+        book.lookup(positions[idx % len(positions)][1])
+    lookup_time = (time.perf_counter() - started) / args.queries
+
+    replies_queries = args.queries // 10
+    started = time.perf_counter()
+    for idx in range(replies_queries):
+        book.popular_replies(positions[idx % len(positions)][0])
+    replies_time = (time.perf_counter() - started) / replies_queries
+
+    print(f"Kitap açma (mmap): {load_time * 1000:.2f} ms")
+    print(f"lookup(): {lookup_time * 1e6:.2f} µs, popular_replies(): {replies_time * 1e6:.1f} µs")
+    first = book.popular_replies([[None] * 3 for _ in range(3)], limit=3)
+    print("Boş board, en popüler ilk hamleler: " + ", ".join(
+        f"({reply['row']},{reply['col']}) {reply['games']}" for reply in first))
+    book.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+Giden frame toplama (outbound coalescing) yük testi
+
+Server ayrı bir process'te çalışır (bu modül --serve ile); server'ın client
+socket'lerine yaptığı send() syscall'ları sayılır (asyncio transport'unun
+socket'e yazdığı yerlerde). multiplex_load'daki oyuncularla N eşzamanlı oyun
+oynanır, her mod için yeni bir server process'i:
+- frame'ler tek tek (--no-coalesce, önceki davranış)
+- loop turu sonunda toplu (varsayılan, flush_delay = 0)
+- flush_delay ile (ör. 2 ms)
+Hem oyuncu başına bağlantı hem multiplexed bağlantılar için ölçülür.
+
+Kullanım:
+    python -m Benchmarks.outbound_load --games 1000 --connections 8 --delay 0.002
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import signal
+import sys
+import time
+
+import websockets
+
+from Benchmarks.multiplex_load import socket_player, session_player
+from Network.multiplex_client import MultiplexClient
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def count_sends(counter):
+    """
+    Server'ın client bağlantılarında socket.send çağrılarını say
+    (boş tamponlu write hemen gönderir, dolu tamponu _write_ready gönderir)
+    """
+    from asyncio.selector_events import _SelectorSocketTransport
+    from websockets.asyncio.server import ServerConnection
+
+    write = _SelectorSocketTransport.write
+    write_ready = _SelectorSocketTransport._write_ready
+
+    def counted_write(self, data):
+        if data and not self._buffer and not self._conn_lost and isinstance(self._protocol, ServerConnection):
+            counter["sends"] += 1
+            counter["bytes"] += len(data)
+        return write(self, data)
+
+    def counted_write_ready(self):
+        if isinstance(self._protocol, ServerConnection):
+            counter["sends"] += 1
+        return write_ready(self)
+
+    _SelectorSocketTransport.write = counted_write
+    _SelectorSocketTransport._write_ready = counted_write_ready
+
+
+async def serve(args):
+    """
+    Alt process: sayaçlı server. SIGUSR1'de sayaçları stdout'a yazar
+    """
+    from Network.websocket_server import GameServer
+
+    counter = {"sends": 0, "bytes": 0}
+    count_sends(counter)
+    flush_delay = None if args.delay < 0 else args.delay
+    server = GameServer("localhost", args.port, message_rate=None, connection_rate=None,
+                        max_sessions=args.max_sessions, flush_delay=flush_delay)
+
+    def report():
+        stats = dict(counter)
+        if server.outbound:
+            stats["frames"] = server.outbound.frames
+            stats["writes"] = server.outbound.writes
+        sys.stdout.write(json.dumps(stats) + "\n")
+        sys.stdout.flush()
+
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(signal.SIGUSR1, report)
+    loop.add_signal_handler(signal.SIGTERM, server.request_shutdown)
+    await server.start_server()
+
+
+async def snapshot(process):
+    process.send_signal(signal.SIGUSR1)
+    return json.loads(await process.stdout.readline())
+
+
+async def run_mode(args, port, delay, multiplexed):
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-m", "Benchmarks.outbound_load", "--serve", "--port", str(port),
+        "--delay", str(delay), "--max-sessions", str(args.max_sessions),
+        cwd=ROOT, stdout=asyncio.subprocess.PIPE)
+    try:
+        url = f"ws://localhost:{port}"
+        for _ in range(100):
+            try:
+                async with websockets.connect(url):
+                    break
+            except OSError:
+                await asyncio.sleep(0.1)
+
+        started = [0]
+        go = asyncio.Event()
+        players = args.games * 2
+        clients = []
+        tasks = []
+        if multiplexed:
+            for _ in range(args.connections):
+                client = MultiplexClient(url)
+                assert await client.connect()
+                await client.unrouted.get()  # welcome
+                clients.append(client)
+            for idx in range(players):
+                tasks.append(asyncio.create_task(
+                    session_player(clients[idx % len(clients)], f"p{idx}", started, go)))
+                await asyncio.sleep(0)
+        else:
+            for idx in range(players):
+                tasks.append(asyncio.create_task(socket_player(url, f"p{idx}", started, go)))
+                await asyncio.sleep(0)
+        while started[0] < players:
+            await asyncio.sleep(0.05)
+        await asyncio.sleep(0.2)
+
+        before = await snapshot(process)
+        play_started = time.perf_counter()
+        go.set()
+        await asyncio.gather(*tasks)
+        play_time = time.perf_counter() - play_started
+        after = await snapshot(process)
+        for client in clients:
+            await client.close()
+        stats = {key: after[key] - before.get(key, 0) for key in after}
+        stats["play"] = play_time
+        return stats
+    finally:
+        process.terminate()
+        await process.wait()
+
+
+async def run(args):
+    modes = [("tek tek", -1), ("loop turu", 0.0)]
+    if args.delay > 0:
+        modes.append((f"flush_delay {args.delay * 1000:g} ms", args.delay))
+    port = args.port
+    for label, multiplexed in (("Oyuncu başına bağlantı", False), (f"Multiplexed ({args.connections} bağlantı)", True)):
+        print(f"{label}, {args.games} eşzamanlı oyun (oyun başına 5 hamle):")
+        baseline = None
+        for mode, delay in modes:
+            stats = await run_mode(args, port, delay, multiplexed)
+            port += 1
+            rate = args.games / stats["play"]
+            baseline = baseline or stats
+            line = (f"  {mode:<18} {stats['sends']:7d} send() ({stats['sends'] / (args.games * 5):.2f}/hamle), "
+                    f"{rate:6.0f} oyun/s")
+            if stats is not baseline:
+                line += (f"  syscall {stats['sends'] / baseline['sends'] - 1:+.0%}, "
+                         f"throughput {rate / (args.games / baseline['play']) - 1:+.0%}")
+            if "frames" in stats:
+                line += f"  [{stats['frames'] / max(1, stats['writes']):.1f} frame/yazma]"
+            print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Giden frame toplama yük testi")
+    parser.add_argument("--games", type=int, default=1000, help="Eşzamanlı oyun sayısı")
+    parser.add_argument("--connections", type=int, default=8, help="Multiplexed modda bağlantı sayısı")
+    parser.add_argument("--max-sessions", type=int, default=1024)
+    parser.add_argument("--delay", type=float, default=0.002, help="flush_delay (saniye); --serve'de < 0 = kapalı")
+    parser.add_argument("--port", type=int, default=8820)
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(serve(args) if args.serve else run(args))
+
+
+if __name__ == "__main__":
+    main()
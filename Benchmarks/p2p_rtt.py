@@ -0,0 +1,142 @@
+"""
+P2P (UDP) ve WebSocket (server üzerinden) hamle gecikmesi karşılaştırması
+
+Aynı makinede (loopback) iki oyuncu rastgele hamlelerle oyun oynar.
+Ölçülen: hamlenin gönderilmesinden rakibin uygulamasına ulaşmasına kadar
+geçen süre. P2P tarafında ayrıca ACK RTT'si ve simüle edilmiş paket kaybında
+retransmit sayısı raporlanır.
+
+Kullanım:
+    python -m Benchmarks.p2p_rtt --games 200 --loss 0 0.05 0.2
+"""
+import argparse
+import asyncio
+import json
+import logging
+import random
+import statistics
+import time
+
+import websockets
+
+from Game.board import GameBoard
+from Network.p2p_transport import create_host, create_client
+from Network.websocket_server import GameServer
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[max(0, int(len(values) * fraction) - 1)]
+
+
+def report(label, latencies, extra=""):
+    print(f"{label:<22} hamle: {len(latencies):>5}  p50: {statistics.median(latencies) * 1000:7.3f} ms  "
+          f"p99: {percentile(latencies, 0.99) * 1000:8.3f} ms  max: {max(latencies) * 1000:8.3f} ms{extra}")
+
+
+async def p2p_run(args, loss_rate):
+    host = await create_host("host", "127.0.0.1", args.port, loss_rate=loss_rate)
+    client = await create_client("client", "127.0.0.1", args.port, loss_rate=loss_rate)
+    if not (await host.wait_connected(5) and await client.wait_connected(5)):
+        raise RuntimeError("P2P handshake başarısız")
+
+    rng = random.Random(1)
+    latencies = []
+    for _ in range(args.games):
+        board = GameBoard()
+        mover, other = host, client
+        while True:
+            empty = [(r, c) for r in range(3) for c in range(3) if board.board[r][c] is None]
+            row, col = rng.choice(empty)
+            board.make_move(row, col, "X" if mover is host else "O")
+            started = time.perf_counter()
+            mover.send_move(row, col)
+            event, move = await other.receive()
+            latencies.append(time.perf_counter() - started)
+            assert event == "move" and move == (row, col)
+            if board.check_winner()["state"] or board.is_board_full():
+                break
+            mover, other = other, mover
+
+    await host.flush()
+    await client.flush()
+    rtts = host.rtt_samples + client.rtt_samples
+    retransmits = host.retransmits + client.retransmits
+    host.close()
+    client.close()
+    return latencies, rtts, retransmits
+
+
+async def websocket_player(url, name, latencies, sent_at, games):
+    join = json.dumps({"type": "player_join", "data": {"player": {"id": name, "symbol": "X", "name": name}}})
+    rng = random.Random(name)
+    for _ in range(games):
+        # GameClient gibi: her oyun için yeni bağlantı
+        async with websockets.connect(url) as ws:
+            await ws.recv()  # welcome
+            await ws.send(join)
+            symbol = None
+            while True:
+                message = json.loads(await ws.recv())
+                message_type = message["type"]
+                data = message["data"]
+                if message_type == "waiting":
+                    symbol = data["your_symbol"]
+                elif message_type == "game_state":
+                    if data["current_player"] == symbol and not data["is_game_over"]:
+                        # Rakibin hamlesi bize ulaştı
+                        if sent_at[0] is not None:
+                            latencies.append(time.perf_counter() - sent_at[0])
+                            sent_at[0] = None
+                        board = data["board"]
+                        empty = [(r, c) for r in range(3) for c in range(3) if board[r][c] is None]
+                        row, col = rng.choice(empty)
+                        sent_at[0] = time.perf_counter()
+                        await ws.send(json.dumps({"type": "move", "data": {"row": row, "col": col}}))
+                elif message_type == "game_end":
+                    if sent_at[0] is not None:
+                        latencies.append(time.perf_counter() - sent_at[0])
+                        sent_at[0] = None
+                    break
+        await asyncio.sleep(0.01)
+
+
+async def websocket_run(args):
+    logging.getLogger("Network.websocket_server").setLevel(logging.ERROR)
+    server = GameServer("localhost", args.port + 1, connection_rate=None)
+    server_task = asyncio.create_task(server.start_server())
+    await asyncio.sleep(0.3)
+    url = f"ws://localhost:{args.port + 1}"
+
+    latencies = []
+    sent_at = [None]  # Aynı anda sadece bir oyun oynanır, hamleler sırayla
+    first = asyncio.create_task(websocket_player(url, "p1", latencies, sent_at, args.games))
+    await asyncio.sleep(0.05)
+    second = asyncio.create_task(websocket_player(url, "p2", latencies, sent_at, args.games))
+    await asyncio.gather(first, second)
+
+    server.drain_timeout = 0
+    server.request_shutdown()
+    await server_task
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="P2P vs WebSocket hamle gecikmesi")
+    parser.add_argument("--port", type=int, default=8796)
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--loss", type=float, nargs="+", default=[0.0, 0.05, 0.2],
+                        help="Simüle edilen paket kaybı oranları (P2P)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    for loss_rate in args.loss:
+        latencies, rtts, retransmits = asyncio.run(p2p_run(args, loss_rate))
+        extra = f"  ACK RTT p50: {statistics.median(rtts) * 1000:.3f} ms  retransmit: {retransmits}"
+        report(f"P2P UDP, kayıp %{loss_rate * 100:g}", latencies, extra)
+
+    report("WebSocket (server)", asyncio.run(websocket_run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""
+Client tarafı hamle tahmini (optimistic move) gecikme testi
+
+Client'lar server'a gecikme ekleyen bir TCP proxy üzerinden bağlanır (her
+yönde sabit gecikme). GameClient'larla iki oyuncu oyun oynar; her kendi
+hamlemiz için ölçülen:
+- algılanan gecikme: hamlenin gönderilmesinden kullanıcının gördüğü board'da
+  (GameClient.board) görünmesine kadar geçen süre
+- onay gecikmesi: server'ın game_state'inde görünmesine kadar geçen süre
+Tahmin açık ve kapalı client'lar karşılaştırılır.
+
+Geri alma: O oyuncusu sırası gelmeden hamle yapar; hamle local board'da
+hemen görünür, server reddeder (seq'li error) ve client geri alır. Geri
+almadan sonra client'ın board'u server'ınkiyle aynı olmalı.
+
+Kullanım:
+    python -m Benchmarks.prediction_latency --delays 0 10 25 50 --games 10
+"""
+import argparse
+import asyncio
+import contextlib
+import logging
+import os
+import statistics
+import time
+from collections import deque
+
+from Game.player import Player
+from Network.websocket_client import GameClient
+from Network.websocket_server import GameServer
+
+# X kazanır: X (0,0) (0,1) (0,2) - O (1,0) (1,1)
+MOVES = {"X": [(0, 0), (0, 1), (0, 2)], "O": [(1, 0), (1, 1)]}
+
+
+class LatencyProxy:
+    """
+    TCP proxy: client -> server ve server -> client yönlerinde `delay` saniye gecikme
+    Veri sırası korunur (her yön için tek writer task'ı)
+    """
+
+    def __init__(self, target_port, delay):
+        self.target_port = target_port
+        self.delay = delay
+        self.server = None
+
+    async def start(self, port):
+        self.server = await asyncio.start_server(self.handle, "localhost", port)
+
+    async def close(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, client_reader, client_writer):
+        server_reader, server_writer = await asyncio.open_connection("localhost", self.target_port)
+        await asyncio.gather(self.pipe(client_reader, server_writer), self.pipe(server_reader, client_writer),
+                             return_exceptions=True)
+
+    async def pipe(self, reader, writer):
+        loop = asyncio.get_running_loop()
+        queue = deque()
+        ready = asyncio.Event()
+
+        async def deliver():
+            while True:
+                await ready.wait()
+                while queue:
+                    deadline, data = queue[0]
+                    wait = deadline - loop.time()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                    queue.popleft()
+                    if data is None:
+                        writer.close()
+                        return
+                    writer.write(data)
+                ready.clear()
+
+        sender = asyncio.create_task(deliver())
+        try:
+            while True:
+                data = await reader.read(65536)
+                queue.append((loop.time() + self.delay, data or None))
+                ready.set()
+                if not data:
+                    break
+            await sender
+        except (ConnectionError, OSError):
+            sender.cancel()
+            writer.close()
+
+
+async def play(url, name, predict, results, out_of_turn=None):
+    """
+    Bir oyuncu: sırası gelince hamle yapar ve hamlesinin board'da görünme sürelerini ölçer
+
+    Args:
+        out_of_turn (tuple, optional): Oyunun başında sıra beklenmeden yapılacak hamle
+    """
+    client = GameClient(url, predict=predict)
+    await client.connect()
+    player = Player(player_id=name, symbol="X", name=name)
+    await client.send_player_join(player)
+    moves = None
+    sent = None  # (row, col, gönderilme zamanı, board'da görüldü mü)
+    rejected = None  # (row, col, gönderilme zamanı)
+    while True:
+        message = await client.listen_for_updates()
+        if message is None:
+            break
+        parsed = client.handle_server_message(message)
+        if not parsed:
+            continue
+        message_type = parsed["type"]
+        data = parsed.get("data", {})
+        now = time.perf_counter()
+
+        if message_type == "waiting":
+            player.symbol = client.player_symbol
+            moves = list(MOVES[player.symbol])
+        if sent:
+            row, col, started, seen = sent
+            board = client.board
+            if not seen and board and board[row][col] == player.symbol:
+                results["perceived"].append(now - started)
+                sent = (row, col, started, True)
+            if message_type == "game_state" and data["board"][row][col] == player.symbol:
+                results["confirmed"].append(now - started)
+                sent = None
+        if rejected and message_type == "error" and data.get("seq") is not None:
+            row, col, started = rejected
+            results["rollback"].append(now - started)
+            results["consistent"].append(client.board == client.last_state["board"])
+            rejected = None
+
+        if message_type == "game_state" and out_of_turn and not client.is_my_turn() and data["move_count"] == 0:
+            # Sıra rakipte: hamle tahminle board'da görünür, server reddeder
+            row, col = out_of_turn
+            out_of_turn = None
+            started = time.perf_counter()
+            if await client.send_move(player, row, col) and client.board[row][col] == player.symbol:
+                results["rejected_visible"].append(time.perf_counter() - started)
+                rejected = (row, col, started)
+        elif message_type == "game_state" and client.is_my_turn() and moves:
+            row, col = moves.pop(0)
+            started = time.perf_counter()
+            await client.send_move(player, row, col)
+            board = client.board
+            seen = bool(board) and board[row][col] == player.symbol
+            if seen:
+                results["perceived"].append(time.perf_counter() - started)
+            sent = (row, col, started, seen)
+        elif message_type == "game_end":
+            break
+    await client.disconnect()
+
+
+async def run_config(server_port, proxy_port, delay, predict, games, out_of_turn=False):
+    proxy = LatencyProxy(server_port, delay)
+    await proxy.start(proxy_port)
+    url = f"ws://localhost:{proxy_port}"
+    results = {"perceived": [], "confirmed": [], "rollback": [], "consistent": [], "rejected_visible": []}
+    tasks = []
+    for idx in range(games):
+        # X önce katılır, O sonra: aynı room'a düşerler
+        tasks.append(asyncio.create_task(play(url, f"x{idx}", predict, results)))
+        await asyncio.sleep(delay * 2 + 0.02)
+        tasks.append(asyncio.create_task(play(url, f"o{idx}", predict, results,
+                                              out_of_turn=(2, 2) if out_of_turn else None)))
+        await asyncio.sleep(delay * 2 + 0.02)
+    await asyncio.gather(*tasks)
+    await proxy.close()
+    return results
+
+
+def ms(values):
+    return f"{statistics.median(values) * 1000:7.2f} ms" if values else "      -"
+
+
+async def run(args):
+    server = GameServer("localhost", args.port, message_rate=None, connection_rate=None)
+    server_task = asyncio.create_task(server.start_server())
+    await asyncio.sleep(0.3)
+
+    proxy_port = args.port + 1
+    print(f"Hamle gecikmesi, {args.games} oyun/ayar (p50, algılanan = kullanıcının board'da görmesi):")
+    print(f"  {'RTT':>7}  {'tahmin':<7} {'algılanan':>11} {'onay':>11}")
+    with contextlib.redirect_stdout(open(os.devnull, "w")) as devnull:
+        rows = []
+        for delay in args.delays:
+            for predict in (False, True):
+                results = await run_config(args.port, proxy_port, delay / 1000, predict, args.games)
+                proxy_port += 1
+                rows.append((delay, predict, results))
+        rollback = await run_config(args.port, proxy_port, max(args.delays) / 1000, True, args.games,
+                                    out_of_turn=True)
+        devnull.close()
+    for delay, predict, results in rows:
+        print(f"  {delay * 2:5d} ms  {'açık' if predict else 'kapalı':<7} {ms(results['perceived']):>11} "
+              f"{ms(results['confirmed']):>11}")
+
+    print(f"Geri alma (RTT {max(args.delays) * 2} ms, sırası gelmeden hamle):")
+    print(f"  board'da görünme {ms(rollback['rejected_visible'])}, geri alma {ms(rollback['rollback'])}, "
+          f"{len(rollback['rollback'])}/{args.games} geri alındı, "
+          f"server board'u ile aynı: {sum(rollback['consistent'])}/{len(rollback['consistent'])}")
+    assert len(rollback["rollback"]) == args.games and all(rollback["consistent"]), "Geri alma başarısız"
+
+    server.request_shutdown()
+    await server_task
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hamle tahmini gecikme testi")
+    parser.add_argument("--delays", type=int, nargs="+", default=[0, 10, 25, 50], help="Tek yön gecikme (ms)")
+    parser.add_argument("--games", type=int, default=10)
+    parser.add_argument("--port", type=int, default=8830)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
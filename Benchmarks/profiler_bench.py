@@ -0,0 +1,196 @@
+"""
+Canlı profilleme testi: yük altındaki server'ı yeniden başlatmadan profille
+
+Server ayrı bir process olarak (python -m server --profile-socket ...)
+başlatılır, oyuncu çiftleri sürekli oyun oynar. Sırayla:
+1. Profil yok (referans)
+2. Unix socket'ten "profile N collapsed" (stack örneklemesi)
+3. Unix socket'ten "profile N pstats" (cProfile)
+4. SIGUSR1 (collapsed, --profile-seconds)
+Her aşamada hamle throughput'u ve hamle gecikmesi (gönderim -> game_state)
+ölçülür; loop durursa gecikme p99'u bunu gösterir. Çıktı dosyaları
+doğrulanır (collapsed-stack satır formatı, pstats yüklenebilir).
+
+Kullanım:
+    python -m Benchmarks.profiler_bench --pairs 8 --seconds 2
+"""
+import argparse
+import asyncio
+import json
+import os
+import pstats
+import re
+import signal
+import stat
+import subprocess
+import sys
+import tempfile
+import time
+
+import websockets
+
+from Game.player import Player
+from Utils.protocol import GameProtocol
+
+# X kazanır: X (0,0) (0,1) (0,2) - O (1,0) (1,1)
+MOVES = {"X": [(0, 0), (0, 1), (0, 2)], "O": [(1, 0), (1, 1)]}
+COLLAPSED_LINE = re.compile(r"^\S.* \d+$")
+
+
+async def start_server(port, socket_path, output_dir, seconds):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    process = subprocess.Popen(
+        [sys.executable, "-m", "server", "--port", str(port), "--message-rate", "0",
+         "--connection-rate", "0", "--log-level", "WARNING", "--drain-timeout", "2", "--profile-socket", socket_path,
+         "--profile-dir", output_dir, "--profile-seconds", str(seconds)],
+        cwd=root)
+    for _ in range(100):
+        try:
+            async with websockets.connect(f"ws://localhost:{port}"):
+                return process
+        except OSError:
+            await asyncio.sleep(0.1)
+    process.kill()
+    raise RuntimeError("Server başlamadı")
+
+
+async def player(url, name, latencies, stop):
+    """
+    Durdurulana kadar oyun oynar; her hamlesinin gecikmesini (bitiş zamanı, süre) kaydeder
+    """
+    while not stop.is_set():
+        async with websockets.connect(url) as ws:
+            await ws.recv()  # welcome
+            await ws.send(GameProtocol.serialize_player_join(Player(player_id=name, symbol="X", name=name)))
+            symbol = None
+            moves = None
+            sent = None
+            while True:
+                message = json.loads(await ws.recv())
+                data = message["data"]
+                if message["type"] == "waiting":
+                    symbol = data["your_symbol"]
+                    moves = list(MOVES[symbol])
+                elif message["type"] == "game_state":
+                    now = time.perf_counter()
+                    if sent and data["board"][sent[0]][sent[1]] == symbol:
+                        latencies.append((now, now - sent[2]))
+                        sent = None
+                    if data["current_player"] == symbol and not data["is_game_over"] and moves:
+                        row, col = moves.pop(0)
+                        sent = (row, col, time.perf_counter())
+                        await ws.send(json.dumps({"type": "move", "data": {"row": row, "col": col}}))
+                elif message["type"] == "game_end":
+                    break
+
+
+async def command(socket_path, line):
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    writer.write((line + "\n").encode())
+    await writer.drain()
+    reply = (await reader.readline()).decode().strip()
+    writer.close()
+    return reply
+
+
+def phase_stats(latencies, started, ended):
+    values = sorted(latency for at, latency in latencies if started <= at < ended)
+    if not values:
+        return 0, None, None
+    p99 = values[min(len(values) - 1, int(len(values) * 0.99))]
+    return len(values) / (ended - started), values[len(values) // 2] * 1000, p99 * 1000
+
+
+def check_collapsed(path):
+    with open(path, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    assert lines and all(COLLAPSED_LINE.match(line) for line in lines), "Collapsed format hatalı"
+    samples = sum(int(line.rsplit(" ", 1)[1]) for line in lines)
+    moves = sum(int(line.rsplit(" ", 1)[1]) for line in lines if "handle_player_move" in line)
+    return f"{len(lines)} stack, {samples} örnek, handle_player_move içinde {moves}"
+
+
+def check_pstats(path):
+    stats = pstats.Stats(path)
+    names = [func[2] for func in stats.stats]
+    assert "handle_player_move" in names, "pstats'ta hamle işleme yok"
+    return f"{len(stats.stats)} fonksiyon, handle_player_move {sum(1 for n in names if n == 'handle_player_move')} kayıt"
+
+
+async def run(args):
+    output_dir = tempfile.mkdtemp(prefix="profile-")
+    socket_path = os.path.join(output_dir, "control.sock")
+    process = await start_server(args.port, socket_path, output_dir, args.seconds)
+    stop = asyncio.Event()
+    latencies = []
+    url = f"ws://localhost:{args.port}"
+    tasks = []
+    try:
+        mode = stat.S_IMODE(os.stat(socket_path).st_mode)
+        print(f"Socket izinleri: {oct(mode)}")
+        assert mode == 0o600, "Socket sadece sahibine açık olmalı"
+
+        for idx in range(args.pairs * 2):
+            tasks.append(asyncio.create_task(player(url, f"p{idx}", latencies, stop)))
+        await asyncio.sleep(1.0)  # Isınma
+
+        phases = []
+        started = time.perf_counter()
+        await asyncio.sleep(args.seconds)
+        phases.append(("profil yok", started, time.perf_counter(), None))
+
+        for mode in ("collapsed", "pstats"):
+            started = time.perf_counter()
+            request = asyncio.create_task(command(socket_path, f"profile {args.seconds} {mode}"))
+            await asyncio.sleep(0.1)
+            busy = await command(socket_path, "profile 1 collapsed")
+            reply = await request
+            phases.append((f"socket: {mode}", started, time.perf_counter(), reply))
+            assert reply.startswith("ok "), reply
+            assert busy.startswith("error "), "Eşzamanlı ikinci kayıt reddedilmeli"
+
+        before = set(os.listdir(output_dir))
+        started = time.perf_counter()
+        os.kill(process.pid, signal.SIGUSR1)
+        await asyncio.sleep(args.seconds + 0.5)
+        created = sorted(set(os.listdir(output_dir)) - before)
+        phases.append(("SIGUSR1: collapsed", started, time.perf_counter(),
+                       f"ok {os.path.join(output_dir, created[0])}" if created else "dosya yok"))
+
+        print(f"{args.pairs * 2} oyuncu, aşama başına {args.seconds:g}s:")
+        print(f"  {'aşama':<20} {'hamle/s':>8} {'p50':>9} {'p99':>9}  çıktı")
+        for label, started, ended, reply in phases:
+            rate, p50, p99 = phase_stats(latencies, started, ended)
+            output = ""
+            if reply and reply.startswith("ok "):
+                path = reply.split()[1]
+                output = check_pstats(path) if path.endswith(".pstats") else check_collapsed(path)
+            elif reply:
+                output = reply
+            print(f"  {label:<20} {rate:8.0f} {p50:7.2f}ms {p99:7.2f}ms  {output}")
+        bad = [line for line in (await command(socket_path, "profile abc"),
+                                 await command(socket_path, "profile 999 collapsed"),
+                                 await command(socket_path, "profile 1 /etc/passwd"))
+               if not line.startswith("error ")]
+        assert not bad, f"Geçersiz komut kabul edildi: {bad}"
+        print("Geçersiz komutlar reddedildi")
+    finally:
+        stop.set()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        process.send_signal(signal.SIGTERM)
+        process.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Canlı profilleme testi")
+    parser.add_argument("--pairs", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--port", type=int, default=8890)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Rating sistemi benchmark'ı
+
+N oyuncu arasında rastgele oyunlar oynatılır; her oyun iki rating
+güncellemesidir (varsayılan 500k oyun = 1M güncelleme). Sonuçlar server'daki
+gibi partiler halinde uygulanır ve her partide değişen oyuncular SQLite'a
+(WAL) tek transaction'da yazılır. Sonra:
+1. Rank ve top-K sorgu süreleri ölçülür
+2. Sıralama, tüm oyuncuları sıralayan naif yöntemle karşılaştırılıp doğrulanır
+3. Kayıtlardan yeniden yükleme süresi ölçülür
+
+Kullanım:
+    python -m Benchmarks.rating_bench --players 100000 --games 500000
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from Game.rating import RatingSystem, RatingStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rating sistemi benchmark'ı")
+    parser.add_argument("--players", type=int, default=100000)
+    parser.add_argument("--games", type=int, default=500000, help="Oyun sayısı (güncelleme sayısının yarısı)")
+    parser.add_argument("--batch", type=int, default=1000, help="Parti başına oyun")
+    parser.add_argument("--queries", type=int, default=100000)
+    parser.add_argument("--db", default=None, help="SQLite dosyası (verilmezse geçici dizin)")
+    args = parser.parse_args()
+
+    db_path = args.db or os.path.join(tempfile.mkdtemp(prefix="tttrating-"), "ratings.db")
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(db_path + suffix):
+            os.remove(db_path + suffix)
+
+    rng = random.Random(1)
+    player_ids = [f"player-{idx}" for idx in range(args.players)]
+    # Oyuncuların gizli gücü: sonuçlar rastgele değil, sıralama anlamlı olsun
+    strength = {player_id: rng.gauss(0, 1) for player_id in player_ids}
+
+    results = []
+    for _ in range(args.games):
+        first, second = rng.sample(player_ids, 2)
+        diff = strength[first] - strength[second] + rng.gauss(0, 1)
+        score = 0.5 if abs(diff) < 0.1 else (1.0 if diff > 0 else 0.0)
+        results.append((first, second, score))
+
+    ratings = RatingSystem()
+    store = RatingStore(db_path)
+    apply_time = 0.0
+    save_time = 0.0
+    rows_written = 0
+    batches = 0
+    for start in range(0, len(results), args.batch):
+        started = time.perf_counter()
+        changed = ratings.apply_batch(results[start:start + args.batch])
+        rows = [(player_id, *ratings.get(player_id)) for player_id in changed]
+        apply_time += time.perf_counter() - started
+
+        started = time.perf_counter()
+        store.save(rows)
+        save_time += time.perf_counter() - started
+        rows_written += len(rows)
+        batches += 1
+
+    updates = args.games * 2
+    print(f"{args.players} oyuncu, {args.games} oyun = {updates} rating güncellemesi, "
+          f"{batches} parti x {args.batch} oyun")
+    print(f"Uygulama (Elo + leaderboard): {apply_time:.2f}s, "
+          f"{apply_time / updates * 1e6:.2f} µs/güncelleme, {updates / apply_time / 1e6:.2f}M güncelleme/s")
+    print(f"SQLite (WAL, parti başına 1 transaction): {save_time:.2f}s, {rows_written} satır, "
+          f"{rows_written / save_time:.0f} satır/s, {save_time / batches * 1000:.2f} ms/parti")
+
+    # 1. Sorgular
+    probes = [rng.choice(player_ids) for _ in range(args.queries)]
+    started = time.perf_counter()
+    for player_id in probes:
+        ratings.leaderboard.rank(player_id)
+    rank_time = (time.perf_counter() - started) / args.queries
+
+    top_queries = max(1, args.queries // 100)
+    started = time.perf_counter()
+    for _ in range(top_queries):
+        ratings.leaderboard.top(100)
+    top_time = (time.perf_counter() - started) / top_queries
+    print(f"rank(): {rank_time * 1e6:.2f} µs, top(100): {top_time * 1e6:.1f} µs")
+
+    # 2. Doğrulama: naif sıralama ile
+    started = time.perf_counter()
+    ordered = sorted(ratings.players.items(), key=lambda item: item[1][0], reverse=True)
+    naive_time = time.perf_counter() - started
+    buckets = sorted((int(entry[0] + 0.5) for _, entry in ordered), reverse=True)
+    for player_id in probes[:1000]:
+        bucket = int(ratings.players[player_id][0] + 0.5)
+        expected = sum(1 for value in buckets if value > bucket) + 1
+        assert ratings.leaderboard.rank(player_id) == expected, player_id
+    top = ratings.leaderboard.top(100)
+    assert [rating for _, rating in top] == [entry[0] for _, entry in ordered[:100]]
+    print(f"Naif sıralama (her sorguda tüm oyuncular): {naive_time * 1000:.1f} ms/sorgu; sonuçlar aynı")
+    correlation_top = sum(strength[player_id] for player_id, _ in top) / len(top)
+    print(f"İlk 100'ün ortalama gizli gücü: {correlation_top:+.2f} (ortalama 0)")
+    store.close()
+
+    # 3. Yeniden yükleme
+    started = time.perf_counter()
+    store = RatingStore(db_path)
+    reloaded = RatingSystem()
+    reloaded.load(store.load_all())
+    load_time = time.perf_counter() - started
+    assert len(reloaded.leaderboard) == len(ratings.leaderboard)
+    assert reloaded.leaderboard.top(100) == top
+    store.close()
+    print(f"Yeniden yükleme: {len(reloaded.leaderboard)} oyuncu, {load_time:.2f}s; "
+          f"db {os.path.getsize(db_path) / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
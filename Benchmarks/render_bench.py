@@ -0,0 +1,132 @@
+"""
+Terminal renderer benchmark
+
+Eski per-cell print() çizimi ile buffer'lı BoardRenderer karşılaştırılır.
+Çıktı /dev/null'a gider; stdout'un terminaldeki davranışı (line buffering)
+taklit edilir ve alttaki write() syscall'ları sayılır.
+
+Her frame'de board'un rastgele bir hücresi değişir (oyun sırasında olduğu gibi).
+
+Kullanım:
+    python -m Benchmarks.render_bench --sizes 3 15 50 100 --seconds 1
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import time
+
+from Utils.board_renderer import BoardRenderer
+
+
+class CountingRaw(io.RawIOBase):
+    """/dev/null'a yazan ve write() çağrılarını (syscall) sayan raw stream"""
+
+    def __init__(self):
+        self.fd = os.open(os.devnull, os.O_WRONLY)
+        self.writes = 0
+        self.bytes = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.writes += 1
+        written = os.write(self.fd, data)
+        self.bytes += written
+        return written
+
+    def close(self):
+        os.close(self.fd)
+        super().close()
+
+
+def terminal_stream(raw, tty):
+    """Terminaldeki sys.stdout gibi: line buffered text stream"""
+    stream = io.TextIOWrapper(io.BufferedWriter(raw), encoding="utf-8", line_buffering=True)
+    if tty:
+        stream.isatty = lambda: True
+    return stream
+
+
+def legacy_display(board):
+    """Eski TerminalUI.display_board: her hücre ve ayırıcı için ayrı print"""
+    size = len(board)
+    print("\n   " + "   ".join(str(i) for i in range(size)))
+    print("  " + "-" * (4 * size - 1))
+    for row_idx in range(size):
+        print(f"{row_idx}|", end="")
+        for col_idx in range(size):
+            cell = board[row_idx][col_idx]
+            display_char = " " if cell is None else cell
+            print(f" {display_char} ", end="")
+            if col_idx < size - 1:
+                print("|", end="")
+        print()
+        if row_idx < size - 1:
+            print("  " + "-" * (4 * size - 1))
+    print("  " + "-" * (4 * size - 1) + "\n")
+
+
+def run(size, seconds, mode):
+    raw = CountingRaw()
+    stream = terminal_stream(raw, tty=(mode == "diff"))
+    renderer = BoardRenderer(stream=stream)
+    board = [[None] * size for _ in range(size)]
+    rng = random.Random(1)
+
+    frames = 0
+    deadline = time.perf_counter() + seconds
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(stream):
+        while time.perf_counter() < deadline:
+            board[rng.randrange(size)][rng.randrange(size)] = rng.choice("XO")
+            if mode == "legacy":
+                legacy_display(board)
+            else:
+                renderer.draw(board)
+            frames += 1
+    stream.flush()
+    elapsed = time.perf_counter() - started
+    result = (frames / elapsed, raw.writes / frames, raw.bytes / frames)
+    stream.close()
+    return result
+
+
+def measure_clear(count):
+    """Eski clear_screen (os.system) ile ANSI temizleme süresi"""
+    started = time.perf_counter()
+    for _ in range(count):
+        os.system("clear > /dev/null 2>&1")
+    legacy = (time.perf_counter() - started) / count
+
+    raw = CountingRaw()
+    stream = terminal_stream(raw, tty=True)
+    renderer = BoardRenderer(stream=stream)
+    started = time.perf_counter()
+    for _ in range(count):
+        renderer.clear()
+    ansi = (time.perf_counter() - started) / count
+    stream.close()
+    return legacy, ansi
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Renderer benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[3, 15, 50, 100])
+    parser.add_argument("--seconds", type=float, default=1.0, help="Her ölçüm için süre")
+    args = parser.parse_args()
+
+    print(f"{'N':>4} {'mod':<8} {'FPS':>10} {'write/frame':>12} {'byte/frame':>11}")
+    for size in args.sizes:
+        for mode in ("legacy", "full", "diff"):
+            fps, writes, size_bytes = run(size, args.seconds, mode)
+            print(f"{size:>4} {mode:<8} {fps:>10.0f} {writes:>12.1f} {size_bytes:>11.0f}")
+
+    legacy, ansi = measure_clear(50)
+    print(f"clear_screen: os.system {legacy * 1000:.2f} ms, ANSI {ansi * 1e6:.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Spectator load testi
+
+Aynı process içinde bir GameServer başlatır, yüzlerce room'da oyun oynatır
+ve her room'a binlerce izleyici bağlar. İzleyicilerin bir kısmı hiç okumayan
+"yavaş" client'lardır. Ölçülen: oyuncu hamle gecikmesi (move -> game_state).
+
+Kullanım:
+    python -m Benchmarks.spectator_load --rooms 200 --spectators 10 --slow-fraction 0.1
+"""
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import time
+
+import websockets
+
+from Network.websocket_server import GameServer
+
+# X kazanır: X (0,0) (0,1) (0,2) - O (1,0) (1,1)
+MOVES = {"X": [(0, 0), (0, 1), (0, 2)], "O": [(1, 0), (1, 1)]}
+
+
+async def player_bot(url, name, start_event, rooms, latencies):
+    async with websockets.connect(url, max_size=None) as ws:
+        await ws.recv()  # welcome
+        await ws.send(json.dumps({
+            "type": "player_join",
+            "data": {"player": {"id": name, "symbol": "X", "name": name}}
+        }))
+
+        symbol = None
+        moves = None
+        sent_at = None
+        while True:
+            message = json.loads(await ws.recv())
+            message_type = message["type"]
+            data = message["data"]
+
+            if message_type == "waiting":
+                symbol = data["your_symbol"]
+                moves = list(MOVES[symbol])
+                rooms.add(data["room_id"])
+
+            elif message_type == "game_state":
+                if sent_at is not None:
+                    latencies.append(time.perf_counter() - sent_at)
+                    sent_at = None
+                if data["current_player"] == symbol and not data["is_game_over"] and moves:
+                    await start_event.wait()
+                    row, col = moves.pop(0)
+                    sent_at = time.perf_counter()
+                    await ws.send(json.dumps({"type": "move", "data": {"row": row, "col": col}}))
+
+            elif message_type == "game_end":
+                return
+
+
+async def spectator_bot(url, room_id, slow, received, stop_event):
+    async with websockets.connect(url, max_size=None, max_queue=1) as ws:
+        await ws.recv()  # welcome
+        await ws.send(json.dumps({"type": "spectate", "data": {"room_id": room_id}}))
+        if slow:
+            # Hiç okuma yapma, sadece bağlı kal
+            await stop_event.wait()
+            return
+        try:
+            while True:
+                message = json.loads(await ws.recv())
+                received[0] += 1
+                if message["type"] == "game_end":
+                    return
+        except websockets.exceptions.ConnectionClosed:
+            pass
+
+
+async def run(args):
+    server = GameServer("localhost", args.port, connection_rate=None)
+    server_task = asyncio.create_task(server.start_server())
+    await asyncio.sleep(0.3)
+    url = f"ws://localhost:{args.port}"
+
+    start_event = asyncio.Event()
+    stop_event = asyncio.Event()
+    rooms = set()
+    latencies = []
+    received = [0]
+
+    setup_started = time.perf_counter()
+
+    # Oyuncular çift çift bağlanır (sıralı eşleşme için ikişer ikişer)
+    players = []
+    for i in range(args.rooms):
+        for side in ("a", "b"):
+            players.append(asyncio.create_task(
+                player_bot(url, f"p{i}{side}", start_event, rooms, latencies)))
+            await asyncio.sleep(0)
+    while len(rooms) < args.rooms:
+        await asyncio.sleep(0.05)
+
+    spectators = []
+    slow_every = int(1 / args.slow_fraction) if args.slow_fraction > 0 else 0
+    count = 0
+    for room_id in sorted(rooms):
+        for _ in range(args.spectators):
+            count += 1
+            slow = bool(slow_every) and count % slow_every == 0
+            spectators.append(asyncio.create_task(
+                spectator_bot(url, room_id, slow, received, stop_event)))
+    while len(server.spectating) < len(spectators):
+        await asyncio.sleep(0.05)
+    # Biten room'lar silindiğinde abonelikler de gider; sayaçlar baştan toplanır
+    subscribers = [s for r in server.game_rooms.values() for s in r.spectators.values()]
+    print(f"Bağlantılar hazır: {time.perf_counter() - setup_started:.1f}s")
+
+    started = time.perf_counter()
+    start_event.set()
+    await asyncio.gather(*players)
+    elapsed = time.perf_counter() - started
+
+    stop_event.set()
+    await asyncio.wait(spectators, timeout=5)
+
+    latencies.sort()
+    coalesced = sum(s.coalesced for s in subscribers)
+    print(f"Room: {args.rooms}, izleyici: {len(spectators)} (yavaş: {count // slow_every if slow_every else 0})")
+    print(f"Toplam süre: {elapsed:.2f}s, hamle: {len(latencies)}")
+    print(f"Hamle gecikmesi p50: {statistics.median(latencies) * 1000:.2f} ms, "
+          f"p99: {latencies[int(len(latencies) * 0.99) - 1] * 1000:.2f} ms")
+    print(f"İzleyicilere ulaşan frame: {received[0]}, coalesce edilen: {coalesced}")
+
+    server.drain_timeout = 0
+    server.request_shutdown()
+    await server_task
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Spectator load testi")
+    parser.add_argument("--port", type=int, default=8790)
+    parser.add_argument("--rooms", type=int, default=200)
+    parser.add_argument("--spectators", type=int, default=10, help="Room başına izleyici")
+    parser.add_argument("--slow-fraction", type=float, default=0.1, help="Hiç okumayan izleyici oranı")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Timer wheel benchmark
+
+N eşzamanlı süreli oyunu simüle eder: her oyunun bir GameClock'u ve timer
+wheel'de bir süre aşımı timer'ı vardır. Her tick'te oyunların bir kısmı
+hamle yapar (timer iptal + yeniden kurulum). Gerçek zaman beklenmez,
+wheel sentetik saatle ilerletilir.
+
+Ölçülen: timer alt sisteminin belleği ve tick başına CPU süresi.
+Karşılaştırma için aynı sayıda loop.call_later handle'ının belleği de ölçülür.
+
+Kullanım:
+    python -m Benchmarks.timer_wheel_bench --games 100000
+"""
+import argparse
+import asyncio
+import random
+import time
+import tracemalloc
+
+from Game.clock import GameClock
+from Utils.timer_wheel import TimerWheel
+
+
+class FakeRoom:
+    __slots__ = ("clock", "timer")
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.timer = None
+
+
+def measure_wheel(args):
+    now = 0.0
+    timeouts = [0]
+
+    def on_timeout(room):
+        room.timer = None
+        timeouts[0] += 1
+
+    rooms = []
+    for _ in range(args.games):
+        room = FakeRoom(GameClock(turn_time=args.turn_time, game_time=args.game_time, increment=args.increment))
+        room.clock.start_turn("X", now)
+        rooms.append(room)
+
+    # Sadece timer alt sistemini ölç (room ve saat nesneleri hariç)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+
+    wheel = TimerWheel(tick=args.tick, now=now)
+    for room in rooms:
+        room.timer = wheel.schedule(room.clock.time_left(now), on_timeout, room)
+
+    after = tracemalloc.take_snapshot()
+    memory = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    tracemalloc.stop()
+
+    # Simülasyon: her tick'te oyunların move_fraction kadarı hamle yapar
+    ticks = int(args.seconds / args.tick)
+    moves = 0
+    cpu_advance = 0.0
+    cpu_moves = 0.0
+    rng = random.Random(1)
+    per_tick = int(args.games * args.move_fraction)
+    for _ in range(ticks):
+        now += args.tick
+
+        started = time.process_time()
+        for room in rng.sample(rooms, per_tick):
+            if room.timer is None:
+                continue
+            room.timer.cancel()
+            room.clock.end_turn(now)
+            room.clock.start_turn("O" if rng.random() < 0.5 else "X", now)
+            room.timer = wheel.schedule(room.clock.time_left(now), on_timeout, room)
+            moves += 1
+        cpu_moves += time.process_time() - started
+
+        started = time.process_time()
+        wheel.advance(now)
+        cpu_advance += time.process_time() - started
+
+    return {
+        "memory": memory,
+        "ticks": ticks,
+        "moves": moves,
+        "timeouts": timeouts[0],
+        "cpu_advance": cpu_advance,
+        "cpu_moves": cpu_moves,
+    }
+
+
+def measure_call_later(args):
+    loop = asyncio.new_event_loop()
+    rooms = [FakeRoom(None) for _ in range(args.games)]
+
+    def on_timeout(room):
+        room.timer = None
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    handles = [loop.call_later(args.turn_time, on_timeout, room) for room in rooms]
+    after = tracemalloc.take_snapshot()
+    memory = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    tracemalloc.stop()
+    for handle in handles:
+        handle.cancel()
+    loop.close()
+    return memory
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Timer wheel benchmark")
+    parser.add_argument("--games", type=int, default=100000)
+    parser.add_argument("--tick", type=float, default=0.1)
+    parser.add_argument("--turn-time", type=float, default=30.0)
+    parser.add_argument("--game-time", type=float, default=300.0)
+    parser.add_argument("--increment", type=float, default=2.0)
+    parser.add_argument("--seconds", type=float, default=60.0, help="Simüle edilen süre")
+    parser.add_argument("--move-fraction", type=float, default=0.01, help="Tick başına hamle yapan oyun oranı")
+    args = parser.parse_args()
+
+    result = measure_wheel(args)
+    call_later_memory = measure_call_later(args)
+
+    print(f"Oyun: {args.games}, tick: {args.tick}s, simüle süre: {args.seconds}s ({result['ticks']} tick)")
+    print(f"Bellek (wheel + timer): {result['memory'] / 1024 / 1024:.1f} MB "
+          f"({result['memory'] / args.games:.0f} B/oyun)")
+    print(f"Karşılaştırma, sadece call_later handle'ları: {call_later_memory / 1024 / 1024:.1f} MB "
+          f"({call_later_memory / args.games:.0f} B/oyun)")
+    print(f"advance(): toplam {result['cpu_advance'] * 1000:.1f} ms CPU, "
+          f"tick başına {result['cpu_advance'] / result['ticks'] * 1e6:.1f} µs")
+    print(f"Hamle başına yeniden kurulum: {result['cpu_moves'] / max(1, result['moves']) * 1e6:.2f} µs "
+          f"({result['moves']} hamle)")
+    print(f"Süre aşımı: {result['timeouts']}")
+
+
+if __name__ == "__main__":
+    main()
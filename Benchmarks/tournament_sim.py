@@ -0,0 +1,160 @@
+"""
+Turnuva simülasyonu
+
+Aynı process'te bir GameServer kurulur ve N bot (varsayılan 10000) Swiss
+turnuvasına kaydolur. Botlar socket yerine server'a doğrudan bağlı bellek
+içi bağlantılardır: her mesaj yine JSON olarak server'ın normal
+process_client_message / broadcast yolundan geçer, boş hücrelerden rastgele
+hamle yaparlar. Swiss turnuvasıyla aynı loop'ta eşzamanlı olarak birkaç
+round-robin turnuvası da oynanır.
+
+Ölçülen: tur başına süre (eşleştirme + room açma + tüm oyunlar), sadece
+eşleştirmenin süresi (10k ve 100k oyuncu) ve tekrar eşleşme sayısı.
+
+Kullanım:
+    python -m Benchmarks.tournament_sim --players 10000 --round-robins 4 --rr-players 16
+"""
+import argparse
+import asyncio
+import json
+import logging
+import random
+import statistics
+import time
+
+from Game.player import Player
+from Network.tournament import SWISS, ROUND_ROBIN, Tournament
+from Network.websocket_server import GameServer
+from Utils.protocol import GameProtocol
+
+
+class BotConnection:
+    """
+    Server'a bellek içinden bağlı bot: server'ın gönderdiği her mesajı okur,
+    sırası gelince rastgele hamle yapar
+    """
+    remote_address = ("127.0.0.1", 0)
+
+    def __init__(self, server, player_id, rng):
+        self.server = server
+        self.player_id = player_id
+        self.rng = rng
+        self.messages = 0
+        self.updates = []
+
+    async def send(self, data):
+        self.messages += 1
+        message = json.loads(data)
+        message_type = message["type"]
+        if message_type == "game_state":
+            state = message["data"]
+            if state["is_game_over"]:
+                return
+            players = state["players"]
+            symbol = "X" if players["player1"]["id"] == self.player_id else "O"
+            if state["current_player"] != symbol:
+                return
+            board = state["board"]
+            empty = [(row, col) for row in range(3) for col in range(3) if board[row][col] is None]
+            row, col = self.rng.choice(empty)
+            move = json.dumps({"type": "move", "data": {"row": row, "col": col}})
+            # Broadcast'in içinden değil, ayrı task olarak (gerçek client gibi)
+            asyncio.get_running_loop().create_task(self.server.process_client_message(self, move))
+        elif message_type == "tournament_update":
+            self.updates.append(message["data"])
+
+
+async def register(server, tournament_id, bots):
+    for bot in bots:
+        player = Player(player_id=bot.player_id, symbol="X", name=bot.player_id)
+        await server.process_client_message(bot, GameProtocol.serialize_tournament_join(tournament_id, player))
+
+
+def pairing_only(players, rounds, seed):
+    """Sadece eşleştirme algoritmasının süresi (oyunlar rastgele sonuçlanır)"""
+    rng = random.Random(seed)
+    tournament = Tournament(1, SWISS, rounds)
+    for idx in range(players):
+        tournament.add_player(f"s{idx}")
+    tournament.start()
+    times = []
+    rematches = 0
+    for _ in range(rounds):
+        started = time.perf_counter()
+        pairs, _ = tournament.pair_next_round()
+        times.append(time.perf_counter() - started)
+        for x_id, o_id in pairs:
+            if o_id in tournament.opponents[x_id]:
+                rematches += 1
+            tournament.record_result(x_id, o_id, rng.choice((0.0, 0.5, 1.0)))
+    return times, rematches
+
+
+async def run(args):
+    server = GameServer("localhost", 0, message_rate=None, connection_rate=None)
+    rng = random.Random(args.seed)
+
+    swiss = server.tournaments.create(SWISS, args.rounds, name="Swiss")
+    swiss_bots = [BotConnection(server, f"p{idx}", rng) for idx in range(args.players)]
+    started = time.perf_counter()
+    await register(server, swiss.tournament.tournament_id, swiss_bots)
+    print(f"{args.players} oyuncu kaydoldu: {time.perf_counter() - started:.2f}s")
+
+    round_robins = []
+    for bracket in range(args.round_robins):
+        run_ = server.tournaments.create(ROUND_ROBIN, name=f"RR {bracket}")
+        bots = [BotConnection(server, f"rr{bracket}-{idx}", rng) for idx in range(args.rr_players)]
+        await register(server, run_.tournament.tournament_id, bots)
+        round_robins.append(run_)
+
+    started = time.perf_counter()
+    for run_ in [swiss] + round_robins:
+        success, error = server.tournaments.start(run_.tournament.tournament_id)
+        assert success, error
+    await asyncio.gather(*(run_.task for run_ in [swiss] + round_robins))
+    elapsed = time.perf_counter() - started
+
+    tournament = swiss.tournament
+    games = sum(len(opponents) for opponents in tournament.opponents.values()) // 2
+    print(f"Swiss: {tournament.rounds} tur, {elapsed:.1f}s toplam (round-robin'lerle eşzamanlı)")
+    for idx, round_time in enumerate(swiss.round_times, 1):
+        print(f"  Tur {idx:2d}: {round_time:.2f}s")
+    print(f"  Ortalama: {statistics.mean(swiss.round_times):.2f}s/tur, "
+          f"{args.players // 2 / statistics.mean(swiss.round_times):.0f} oyun/s")
+    for run_ in round_robins:
+        print(f"{run_.tournament.name}: {run_.tournament.rounds} tur, "
+              f"{sum(run_.round_times):.1f}s, lider: {run_.tournament.standings()[0]['player_id']}")
+
+    # Doğrulama: her tur herkes en fazla bir oyun/bye, tüm room'lar temizlendi
+    total_points = sum(tournament.scores.values())
+    byes = len(tournament.byes)
+    assert total_points == tournament.rounds * (args.players // 2) + byes
+    assert not server.player_rooms and not swiss.rooms
+    top = tournament.standings()[:3]
+    print(f"Bitti: {games} farklı eşleşme, {byes} bye, açık room: "
+          f"{sum(1 for room in server.game_rooms.values() if room.tournament)}")
+    print("İlk 3: " + ", ".join(f"{row['player_id']} {row['score']} (BH {row['buchholz']})" for row in top))
+    updates = swiss_bots[0].updates  # Kayıt cevabı + her turun sonu
+    assert len(updates) == tournament.rounds + 1 and updates[-1]["tournament"]["status"] == "finished"
+
+    # Sadece eşleştirme
+    for players in (args.players, args.players * 10):
+        times, rematches = pairing_only(players, args.rounds or 14, args.seed)
+        print(f"Sadece eşleştirme, {players} oyuncu: ortalama {statistics.mean(times) * 1000:.1f} ms/tur, "
+              f"en fazla {max(times) * 1000:.1f} ms, tekrar eşleşme: {rematches}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Turnuva simülasyonu")
+    parser.add_argument("--players", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=None, help="Swiss tur sayısı (varsayılan log2(n))")
+    parser.add_argument("--round-robins", type=int, default=4, help="Eşzamanlı round-robin turnuvası")
+    parser.add_argument("--rr-players", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Hamle tracing testi: span dökümü ve kapalıyken maliyet
+
+1) Uçtan uca: iki GameClient (tracer'lı) gerçek server'a bağlanıp oyun
+   oynar. Client ve server span'ları aynı bellek içi collector'a yazılır;
+   her hamle için client.send_move -> server.receive -> deserialize ->
+   validate -> process_move -> serialize -> broadcast.send ->
+   client.state_received zinciri trace id ile birleşir. Span adı başına
+   p50/p99 süreleri yazdırılır.
+2) Maliyet: process_client_message, sahte bağlantılarla (ağ yok) hamle
+   başına ölçülür: tracer yok / tracer var ama örneklenmiyor / her hamle izleniyor.
+
+Kullanım:
+    python -m Benchmarks.trace_bench --games 20 --moves 20000
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import statistics
+import time
+
+from Game.player import Player
+from Network.websocket_client import GameClient
+from Network.websocket_server import GameServer
+from Utils.tracing import MemoryCollector, Tracer
+
+# X kazanır: X (0,0) (0,1) (0,2) - O (1,0) (1,1)
+MOVES = {"X": [(0, 0), (0, 1), (0, 2)], "O": [(1, 0), (1, 1)]}
+SEQUENCE = [("X", 0, 0), ("O", 1, 0), ("X", 0, 1), ("O", 1, 1), ("X", 0, 2)]
+SPAN_ORDER = ["client.send_move", "server.receive", "protocol.deserialize", "server.validate",
+              "game.process_move", "protocol.serialize", "broadcast.send", "client.state_received"]
+
+
+async def play(url, name, collector):
+    """
+    Bir oyuncu: sırası gelince listedeki hamleyi yapar (her hamle izlenir)
+    """
+    client = GameClient(url, predict=False, tracer=Tracer(1.0, collector))
+    await client.connect()
+    player = Player(player_id=name, symbol="X", name=name)
+    await client.send_player_join(player)
+    moves = None
+    while True:
+        message = await client.listen_for_updates()
+        if message is None:
+            break
+        parsed = client.handle_server_message(message)
+        if not parsed:
+            continue
+        if parsed["type"] == "waiting":
+            player.symbol = client.player_symbol
+            moves = list(MOVES[player.symbol])
+        elif parsed["type"] == "game_state" and client.is_my_turn() and moves:
+            await client.send_move(player, *moves.pop(0))
+        elif parsed["type"] == "game_end":
+            break
+    await client.disconnect()
+
+
+async def end_to_end(args):
+    collector = MemoryCollector()
+    server = GameServer("localhost", args.port, message_rate=None, connection_rate=None,
+                        tracer=Tracer(0.0, collector, join_rate=1.0))
+    server_task = asyncio.create_task(server.start_server())
+    await asyncio.sleep(0.3)
+    url = f"ws://localhost:{args.port}"
+    with contextlib.redirect_stdout(open(os.devnull, "w")) as devnull:
+        for idx in range(args.games):
+            first = asyncio.create_task(play(url, f"x{idx}", collector))
+            await asyncio.sleep(0.02)
+            await asyncio.gather(first, play(url, f"o{idx}", collector))
+        devnull.close()
+    server.request_shutdown()
+    await server_task
+
+    traces = collector.traces()
+    durations = {}
+    complete = 0
+    for spans in traces.values():
+        names = {span["name"] for span in spans}
+        complete += all(name in names for name in SPAN_ORDER)
+        for span in spans:
+            durations.setdefault(span["name"], []).append(span["duration_ms"])
+    print(f"Uçtan uca: {len(traces)} izlenen hamle, {complete} tanesinde tüm span'lar var")
+    print(f"  {'span':<24} {'adet':>6} {'p50':>10} {'p99':>10}")
+    for name in SPAN_ORDER:
+        values = sorted(durations.get(name, []))
+        if not values:
+            print(f"  {name:<24} {0:>6} {'-':>10} {'-':>10}")
+            continue
+        p99 = values[min(len(values) - 1, int(len(values) * 0.99))]
+        print(f"  {name:<24} {len(values):>6} {statistics.median(values):>7.3f} ms {p99:>7.3f} ms")
+    assert complete == len(traces) == args.games * len(SEQUENCE), "Eksik trace"
+
+
+class FakeConnection:
+    """
+    Ağsız bağlantı: gönderilen frame'leri sadece sayar
+    """
+
+    def __init__(self):
+        self.remote_address = ("127.0.0.1", 0)
+        self.sent = 0
+
+    async def send(self, data):
+        self.sent += 1
+
+
+async def measure(tracer, traced, moves):
+    """
+    process_client_message'ın hamle başına süresi (mikrosaniye)
+    """
+    server = GameServer(message_rate=None, connection_rate=None, tracer=tracer)
+    room = server.create_game_room()
+    connections = {}
+    for symbol in ("X", "O"):
+        ws = FakeConnection()
+        room.add_player(ws, {"id": symbol, "symbol": symbol, "name": symbol})
+        server.player_rooms[ws] = room
+        connections[symbol] = ws
+    frames = []
+    for symbol, row, col in SEQUENCE:
+        message = {"type": "move", "data": {"row": row, "col": col}}
+        if traced:
+            message["trace"] = {"id": "0" * 32, "span": "0" * 16}
+        frames.append((connections[symbol], json.dumps(message)))
+
+    games = moves // len(SEQUENCE)
+    elapsed = 0.0
+    for _ in range(games):
+        await server.start_room_game(room)
+        started = time.perf_counter()
+        for ws, frame in frames:
+            await server.process_client_message(ws, frame)
+        elapsed += time.perf_counter() - started
+        if tracer:
+            tracer.exporter.spans.clear()
+    assert room.game.winner == "X"
+    return elapsed / (games * len(SEQUENCE)) * 1e6
+
+
+async def overhead(args):
+    print(f"Maliyet (process_client_message, {args.moves} hamle, ağ yok):")
+    baseline = None
+    for label, tracer, traced in (("tracer yok", None, False),
+                                  ("tracer, örneklenmiyor", Tracer(0.0), False),
+                                  ("her hamle izleniyor", Tracer(1.0), True)):
+        await measure(tracer, traced, 500)  # Isınma
+        per_move = min([await measure(tracer, traced, args.moves) for _ in range(3)])
+        baseline = baseline or per_move
+        print(f"  {label:<24} {per_move:7.2f} µs/hamle  ({(per_move / baseline - 1) * 100:+5.1f}%)")
+
+
+async def run(args):
+    await end_to_end(args)
+    await overhead(args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hamle tracing testi")
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--moves", type=int, default=20000)
+    parser.add_argument("--port", type=int, default=8880)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Tam oyun ağacı araması: make_move / unmake_move ile tek board
+
+Boş board'dan tüm oyun ağacı negamax ile gezilir. Tüm arama tek bir
+GameBoard üzerinde yapılır; aramanın hiç board (GameBoard veya satır listesi)
+oluşturmadığı kontrol edilir ve sonuç bilinen değerlerle doğrulanır:
+549946 düğüm, 255168 bitmiş oyun, mükemmel oyunda sonuç berabere.
+
+Karşılaştırma için her düğümde board kopyalayan arama da ölçülür.
+
+Kullanım:
+    python -m Benchmarks.tree_search
+"""
+import argparse
+import time
+
+from Game.board import GameBoard
+
+FULL_TREE_NODES = 549946
+FULL_TREE_GAMES = 255168
+
+
+class SearchStats:
+    def __init__(self):
+        self.nodes = 0
+        self.games = 0
+
+
+def negamax(board, player, opponent, stats):
+    """
+    Sırası gelen oyuncu için pozisyon değeri: 1 kazanır, 0 berabere, -1 kaybeder
+    Board her dönüşte aramadan önceki haline geri getirilir
+    """
+    stats.nodes += 1
+    best = -2
+    for cell in range(9):
+        row, col = divmod(cell, 3)
+        if not board.make_move(row, col, player):
+            continue
+        if board.check_winner()["state"]:
+            stats.nodes += 1
+            stats.games += 1
+            value = 1
+        elif board.move_count == 9:
+            stats.nodes += 1
+            stats.games += 1
+            value = 0
+        else:
+            value = -negamax(board, opponent, player, stats)
+        board.unmake_move()
+        if value > best:
+            best = value
+    return best
+
+
+def negamax_copy(board, player, opponent, stats):
+    """Karşılaştırma: her hamlede yeni board oluşturan arama"""
+    stats.nodes += 1
+    best = -2
+    for cell in range(9):
+        row, col = divmod(cell, 3)
+        if board.board[row][col] is not None:
+            continue
+        child = GameBoard()
+        child.load_board(board.board)
+        child.make_move(row, col, player)
+        if child.check_winner()["state"]:
+            stats.nodes += 1
+            stats.games += 1
+            value = 1
+        elif child.is_board_full():
+            stats.nodes += 1
+            stats.games += 1
+            value = 0
+        else:
+            value = -negamax_copy(child, opponent, player, stats)
+        if value > best:
+            best = value
+    return best
+
+
+def count_board_allocations(func):
+    """func çalışırken oluşturulan GameBoard sayısını döndür"""
+    created = [0]
+    original_init = GameBoard.__init__
+
+    def counting_init(self, *args, **kwargs):
+        created[0] += 1
+        original_init(self, *args, **kwargs)
+
+    GameBoard.__init__ = counting_init
+    try:
+        result = func()
+    finally:
+        GameBoard.__init__ = original_init
+    return result, created[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tam oyun ağacı araması")
+    parser.add_argument("--skip-copy", action="store_true", help="Kopyalayan aramayı çalıştırma")
+    args = parser.parse_args()
+
+    board = GameBoard()
+    rows = board.board
+    row_ids = [id(row) for row in rows]
+    stats = SearchStats()
+
+    started = time.perf_counter()
+    value, allocations = count_board_allocations(lambda: negamax(board, "X", "O", stats))
+    elapsed = time.perf_counter() - started
+
+    # Doğrulama: sonuç, ağaç boyutu, sıfır board allocation, board aramadan önceki halinde
+    assert value == 0, value
+    assert stats.nodes == FULL_TREE_NODES, stats.nodes
+    assert stats.games == FULL_TREE_GAMES, stats.games
+    assert allocations == 0, allocations
+    assert board.board is rows and [id(row) for row in board.board] == row_ids
+    assert board.move_count == 0 and board.symmetry_hashes == 0
+    assert board.player_product == {"X": 1, "O": 1}
+    assert all(cell is None for row in board.board for cell in row)
+
+    print(f"unmake_move araması: sonuç {value} (berabere), {stats.nodes} düğüm, {stats.games} oyun, "
+          f"{allocations} board oluşturuldu")
+    print(f"  {elapsed:.2f}s, {stats.nodes / elapsed / 1000:.0f}k düğüm/s")
+
+    if not args.skip_copy:
+        copy_stats = SearchStats()
+        started = time.perf_counter()
+        copy_value, copy_allocations = count_board_allocations(
+            lambda: negamax_copy(GameBoard(), "X", "O", copy_stats))
+        copy_elapsed = time.perf_counter() - started
+        assert copy_value == value and copy_stats.nodes == stats.nodes
+        print(f"Kopyalayan arama: {copy_allocations} board oluşturuldu, {copy_elapsed:.2f}s, "
+              f"{copy_stats.nodes / copy_elapsed / 1000:.0f}k düğüm/s")
+
+
+if __name__ == "__main__":
+    main()
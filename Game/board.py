@@ -1,3 +1,39 @@
+import random
+import sys
+from Utils.board_renderer import render_board
+
+# 3x3 board'un 8 simetrisi: her biri hücre index'ini (row * 3 + col) dönüştürür
+SYMMETRIES = [
+    [r * 3 + c for r in range(3) for c in range(3)],              # Aynı
+    [c * 3 + (2 - r) for r in range(3) for c in range(3)],        # 90° döndürme
+    [(2 - r) * 3 + (2 - c) for r in range(3) for c in range(3)],  # 180° döndürme
+    [(2 - c) * 3 + r for r in range(3) for c in range(3)],        # 270° döndürme
+    [r * 3 + (2 - c) for r in range(3) for c in range(3)],        # Yatay ayna
+    [(2 - r) * 3 + c for r in range(3) for c in range(3)],        # Dikey ayna
+    [c * 3 + r for r in range(3) for c in range(3)],              # Ana köşegen
+    [(2 - c) * 3 + (2 - r) for r in range(3) for c in range(3)],  # Ters köşegen
+]
+
+# Zobrist anahtarları: sabit seed, böylece hash'ler process'ler arasında aynıdır
+_rng = random.Random(0x7A0B)
+ZOBRIST_KEYS = {
+    symbol: [_rng.getrandbits(64) for _ in range(9)]
+    for symbol in ("X", "O")
+}
+# (sembol, hücre) için 8 simetrideki anahtarlar tek bir 512 bitlik sayıda:
+# k. simetrinin anahtarı [64*k, 64*k+64) bitlerinde. Hamle başına tek XOR.
+HASH_BITS = 64
+HASH_MASK = (1 << HASH_BITS) - 1
+SYMMETRY_KEYS = {
+    symbol: [
+        sum(keys[symmetry[cell]] << (HASH_BITS * idx) for idx, symmetry in enumerate(SYMMETRIES))
+        for cell in range(9)
+    ]
+    for symbol, keys in ZOBRIST_KEYS.items()
+}
+del _rng
+
+
 class GameBoard:
     def __init__(self):
         """
@@ -12,18 +48,111 @@ class GameBoard:
             "X": 1,
             "O": 1
             }
+        # 8 simetrinin Zobrist hash'leri tek sayıda paketli, hamle başına O(1) güncellenir
+        # En düşük 64 bit board'un kendi hash'idir
+        self.symmetry_hashes = 0
+        # Hamle geçmişi: hücre index'leri (row * 3 + col), taşın sahibi board'dan okunur
+        self.move_stack = []
+        self.redo_stack = []  # Geri alınan hamleler: [(cell, player), ...]
         
 
     def make_move(self, row, col, player):
         move_validation = self.is_valid_move(row, col)
 
         if move_validation:
+            cell = row * 3 + col
             self.board[row][col] = player
             self.player_product[player] *= self.products[row][col]
+            self.symmetry_hashes ^= SYMMETRY_KEYS[player][cell]
+            self.move_stack.append(cell)
+            # Geri alınan hamle tekrar yapıldıysa redo geçmişi korunur, farklı hamle siler
+            if self.redo_stack:
+                if self.redo_stack[-1] == (cell, player):
+                    self.redo_stack.pop()
+                else:
+                    self.redo_stack.clear()
             return True
         else:
             return False
 
+    def unmake_move(self):
+        """
+        Son hamleyi O(1) geri al: hücre, player_product ve hash'ler eski haline döner
+        Geri alınan hamle redo_stack'e eklenir
+        
+        Returns:
+            str: Geri alınan taşın sembolü, geçmiş boşsa None
+        """
+        if not self.move_stack:
+            return None
+        cell = self.move_stack.pop()
+        row, col = divmod(cell, 3)
+        player = self.board[row][col]
+        self.board[row][col] = None
+        self.player_product[player] //= self.products[row][col]
+        self.symmetry_hashes ^= SYMMETRY_KEYS[player][cell]
+        self.redo_stack.append((cell, player))
+        return player
+
+    def redo_move(self):
+        """
+        En son geri alınan hamleyi tekrar yap
+        
+        Returns:
+            bool: Tekrar yapılacak hamle var mıydı?
+        """
+        if not self.redo_stack:
+            return False
+        cell, player = self.redo_stack[-1]
+        return self.make_move(cell // 3, cell % 3, player)
+
+    @property
+    def move_count(self):
+        """
+        Board'daki taş sayısı (geri alınanlar hariç)
+        """
+        return len(self.move_stack)
+
+    def load_board(self, board):
+        """
+        Board'u verilen 3x3 matristen yükle (snapshot restore için)
+        player_product değerleri hücrelerden yeniden hesaplanır
+        """
+        self.board = [[None for _ in range(3)] for _ in range(3)]
+        self.player_product = {"X": 1, "O": 1}
+        self.symmetry_hashes = 0
+        self.move_stack = []
+        self.redo_stack = []
+        for row in range(3):
+            for col in range(3):
+                cell = board[row][col]
+                if cell is not None:
+                    self.board[row][col] = cell
+                    self.player_product[cell] *= self.products[row][col]
+                    self.symmetry_hashes ^= SYMMETRY_KEYS[cell][row * 3 + col]
+                    # Hamle sırası bilinmiyor: geri alma yüklenen taşları satır sırasıyla kaldırır
+                    self.move_stack.append(row * 3 + col)
+
+    @property
+    def zobrist_hash(self):
+        """
+        Pozisyonun Zobrist hash'i (64 bit)
+        """
+        return self.symmetry_hashes & HASH_MASK
+
+    def canonical_hash(self):
+        """
+        Simetri-bağımsız hash: 8 simetrinin hash'lerinin en küçüğü
+        Döndürülmüş/aynalanmış pozisyonlar aynı değeri verir
+        
+        Returns:
+            int: 64 bit canonical hash
+        """
+        h = self.symmetry_hashes
+        mask = HASH_MASK
+        return min(h & mask, (h >> 64) & mask, (h >> 128) & mask, (h >> 192) & mask,
+                   (h >> 256) & mask, (h >> 320) & mask, (h >> 384) & mask, h >> 448)
+
     def is_valid_move(self, row, col):
         if (row <= 2 and row >= 0) and (col <= 2 and col >= 0):
             if self.board[row][col] is None :
@@ -58,42 +187,24 @@ class GameBoard:
     def display(self):
         """
         Board'u terminal'de ASCII art olarak göster
-        Koordinat numaraları ile birlikte
+        Koordinat numaraları ile birlikte, tek write ile
         """
-        print("\n   0   1   2")  # Sütun numaraları
-        print("  -----------")
-        
-        for row_idx in range(self.size):
-            print(f"{row_idx}|", end="")  # Satır numarası
-            
-            for col_idx in range(self.size):
-                # Hücre içeriği
-                cell = self.board[row_idx][col_idx]
-                if cell is None:
-                    display_char = " "
-                else:
-                    display_char = cell
-                
-                print(f" {display_char} ", end="")
-                
-                # Sütun ayırıcısı
-                if col_idx < self.size - 1:
-                    print("|", end="")
-            
-            print()  # Satır sonu
-            
-            # Satır ayırıcısı (son satır değilse)
-            if row_idx < self.size - 1:
-                print("  -----------")
-        
-        print("  -----------\n")
+        sys.stdout.write(render_board(self.board))
+        sys.stdout.flush()
 
     def reset(self):
         """
         Board'u başlangıç durumuna sıfırla
-        Tüm hücreleri None yap
+        Tüm hücreleri None yap; player_product, hash'ler ve hamle geçmişi de sıfırlanır
+        Mevcut listeler yerinde temizlenir, yeni board oluşturulmaz
         """
-        self.board = [[None for _ in range(3)] for _ in range(3)]
+        for row in self.board:
+            row[0] = row[1] = row[2] = None
+        self.player_product["X"] = 1
+        self.player_product["O"] = 1
+        self.symmetry_hashes = 0
+        self.move_stack.clear()
+        self.redo_stack.clear()
         print("Board sıfırlandı!")
 
 
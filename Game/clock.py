@@ -0,0 +1,116 @@
+import time
+
+
+class GameClock:
+    """
+    Oyun saati: hamle başına süre ve/veya oyun başına toplam süre
+
+    - turn_time: tek bir hamle için en fazla süre (saniye), None = sınırsız
+    - game_time: oyuncu başına toplam süre (saniye), None = sınırsız
+    - increment: her hamleden sonra toplam süreye eklenen Fischer bonusu
+    - lag: oyuncunun ölçülen ağ gecikmesi (RTT, server ayarlar); hamle başına
+      bu kadar süre oyuncunun saatinden düşülmez
+    """
+
+    def __init__(self, turn_time=None, game_time=None, increment=0.0):
+        self.turn_time = turn_time
+        self.game_time = game_time
+        self.increment = increment
+        self.remaining = {"X": game_time, "O": game_time}
+        self.running_for = None  # Saati işleyen oyuncunun sembolü
+        self.turn_started = None
+        self.lag = {"X": 0.0, "O": 0.0}  # Gecikme telafisi (saniye)
+
+    def start_turn(self, symbol, now=None):
+        """
+        Oyuncunun saatini başlat
+        """
+        self.running_for = symbol
+        self.turn_started = time.monotonic() if now is None else now
+
+    def _elapsed(self, now):
+        """
+        Sırası gelen oyuncunun bu hamlede harcadığı süre (gecikme telafisi düşülmüş)
+        """
+        return max(0.0, now - self.turn_started - self.lag.get(self.running_for, 0.0))
+
+    def end_turn(self, now=None, add_increment=True):
+        """
+        Çalışan saati durdur, harcanan süreyi düş ve increment ekle
+        Süre aşımında add_increment=False verilir
+        """
+        if self.running_for is None:
+            return
+        now = time.monotonic() if now is None else now
+        if self.game_time is not None:
+            elapsed = self._elapsed(now)
+            remaining = self.remaining[self.running_for] - elapsed
+            if add_increment:
+                remaining += self.increment
+            self.remaining[self.running_for] = max(0.0, remaining)
+        self.running_for = None
+        self.turn_started = None
+
+    def stop(self):
+        """
+        Saati durdur (oyun bitti)
+        """
+        self.running_for = None
+        self.turn_started = None
+
+    def time_left(self, now=None):
+        """
+        Sırası gelen oyuncunun süresinin dolmasına kalan süre
+
+        Returns:
+            float: Saniye, saat çalışmıyorsa None
+        """
+        if self.running_for is None:
+            return None
+        now = time.monotonic() if now is None else now
+        elapsed = self._elapsed(now)
+        limits = []
+        if self.turn_time is not None:
+            limits.append(self.turn_time - elapsed)
+        if self.game_time is not None:
+            limits.append(self.remaining[self.running_for] - elapsed)
+        return min(limits) if limits else None
+
+    def is_flagged(self, now=None):
+        """
+        Sırası gelen oyuncunun süresi doldu mu?
+        """
+        left = self.time_left(now)
+        return left is not None and left <= 0
+
+    def to_dict(self, now=None):
+        """
+        Network için saat durumu (state broadcast'lerine eklenir)
+
+        Returns:
+            dict: Kalan süreler
+        """
+        now = time.monotonic() if now is None else now
+        remaining = dict(self.remaining)
+        if self.running_for is not None and self.game_time is not None:
+            elapsed = self._elapsed(now)
+            remaining[self.running_for] = max(0.0, remaining[self.running_for] - elapsed)
+        left = self.time_left(now)
+        return {
+            "remaining": remaining,
+            "turn_time": self.turn_time,
+            "turn_left": None if left is None else max(0.0, left),
+            "increment": self.increment,
+            "running_for": self.running_for
+        }
+
+    def load(self, clock_state):
+        """
+        to_dict() çıktısından kalan süreleri geri yükle (saat durmuş olarak)
+        """
+        remaining = clock_state.get("remaining") or {}
+        if self.game_time is not None:
+            for symbol in ("X", "O"):
+                if remaining.get(symbol) is not None:
+                    self.remaining[symbol] = remaining[symbol]
+        self.stop()
@@ -0,0 +1,273 @@
+SYMBOL_INDEX = {"X": 0, "O": 1}
+
+_LINE_TABLES = {}  # {(size, k) : (lines, cell_lines)}
+_NEIGHBORHOODS = {}  # {(size, radius) : [hücrenin komşuları, ...]}
+
+
+def line_table(size, k):
+    """
+    N x N board'da K'lık tüm pencereler (satır, sütun, iki çapraz)
+
+    GameBoard.winning_patterns'taki 8 sabit çizginin genellemesi:
+    size = k = 3 için aynı 8 çizgi üretilir.
+
+    Args:
+        size (int): Board kenarı
+        k (int): Kazanmak için gereken sıra uzunluğu
+
+    Returns:
+        tuple: (lines, cell_lines)
+            lines: [(hücre, ...), ...] pencere başına K hücre index'i (row * size + col)
+            cell_lines: [(pencere index'i, ...), ...] hücre başına, o hücreden geçen pencereler
+    """
+    table = _LINE_TABLES.get((size, k))
+    if table is None:
+        lines = []
+        cell_lines = [[] for _ in range(size * size)]
+        for row in range(size):
+            for col in range(size):
+                for d_row, d_col in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                    end_row, end_col = row + d_row * (k - 1), col + d_col * (k - 1)
+                    if not (0 <= end_row < size and 0 <= end_col < size):
+                        continue
+                    cells = tuple((row + d_row * i) * size + col + d_col * i for i in range(k))
+                    for cell in cells:
+                        cell_lines[cell].append(len(lines))
+                    lines.append(cells)
+        table = _LINE_TABLES[(size, k)] = (lines, [tuple(indexes) for indexes in cell_lines])
+    return table
+
+
+def neighborhood(size, radius):
+    """
+    Her hücrenin `radius` uzaklığındaki hücreleri (kendisi dahil)
+
+    Returns:
+        list: [(hücre, ...), ...] hücre başına
+    """
+    cells = _NEIGHBORHOODS.get((size, radius))
+    if cells is None:
+        cells = []
+        for row in range(size):
+            for col in range(size):
+                cells.append(tuple(
+                    n_row * size + n_col
+                    for n_row in range(max(0, row - radius), min(size, row + radius + 1))
+                    for n_col in range(max(0, col - radius), min(size, col + radius + 1))
+                ))
+        _NEIGHBORHOODS[(size, radius)] = cells
+    return cells
+
+
+class ThreatEvaluator:
+    """
+    K'lı sıra oyunları için artımlı tehdit/pattern değerlendirici
+
+    Her pencere için iki oyuncunun taş sayısı tutulur. Rakip taşı olmayan bir
+    pencere oyuncu için "açık"tır; açık pencereler taş sayısına göre sayılır
+    (K = 5 için 2, 3, 4 taşlı açık pencereler: açık ikili, üçlü, dörtlü).
+    Hamle ve geri alma sadece hücreden geçen pencereleri (en fazla 4K) günceller;
+    skor, pattern sayıları ve aday hamleler tam tarama olmadan okunur.
+
+    Aday hamleler: en az bir taşa `radius` uzaklıktaki boş hücreler, komşuluk
+    sayaçlarıyla artımlı tutulur.
+    """
+
+    def __init__(self, size=15, k=5, radius=2):
+        self.size = size
+        self.k = k
+        self.radius = radius
+        self.lines, self.cell_lines = line_table(size, k)
+        self.neighbors = neighborhood(size, radius)
+        # Pencere ağırlıkları: c taşlı açık pencere 10^(c-1), tamamlanmış pencere kazanç
+        self.weights = [0] + [10 ** (count - 1) for count in range(1, k)] + [10 ** (k + 2)]
+        self.cells = [None] * (size * size)  # Hücre başına oyuncu index'i (0 = X, 1 = O)
+        self.move_stack = []  # Hücre index'leri
+        self.candidates = set()  # Aday hücreler
+        self._reset_counts()
+
+    def _reset_counts(self):
+        lines = len(self.lines)
+        self.line_counts = ([0] * lines, [0] * lines)  # Oyuncu başına pencere taş sayıları
+        # patterns[p][c]: p'nin c taşlı açık pencere sayısı (c >= 1)
+        self.patterns = ([0] * (self.k + 1), [0] * (self.k + 1))
+        self.scores = [0, 0]
+        self.near = [0] * (self.size * self.size)  # radius içindeki taş sayısı
+
+    def make_move(self, row, col, player):
+        """
+        Taşı koy ve değerlendirmeyi artımlı güncelle
+
+        Args:
+            row (int): Satır
+            col (int): Sütun
+            player (str): "X" veya "O"
+
+        Returns:
+            bool: Hamle geçerli miydi?
+        """
+        if not (0 <= row < self.size and 0 <= col < self.size):
+            return False
+        cell = row * self.size + col
+        if self.cells[cell] is not None:
+            return False
+        p = SYMBOL_INDEX[player]
+        self.cells[cell] = p
+        self.move_stack.append(cell)
+
+        mine = self.line_counts[p]
+        theirs = self.line_counts[p ^ 1]
+        my_patterns = self.patterns[p]
+        their_patterns = self.patterns[p ^ 1]
+        weights = self.weights
+        gained = lost = 0
+        for line in self.cell_lines[cell]:
+            m = mine[line]
+            t = theirs[line]
+            if t == 0:
+                # Açık pencere bir taş büyüdü
+                if m:
+                    my_patterns[m] -= 1
+                my_patterns[m + 1] += 1
+                gained += weights[m + 1] - weights[m]
+            elif m == 0:
+                # Rakibin açık penceresi kapandı
+                their_patterns[t] -= 1
+                lost += weights[t]
+            mine[line] = m + 1
+        self.scores[p] += gained
+        self.scores[p ^ 1] -= lost
+
+        near = self.near
+        cells = self.cells
+        candidates = self.candidates
+        for neighbor in self.neighbors[cell]:
+            near[neighbor] += 1
+            if near[neighbor] == 1 and cells[neighbor] is None:
+                candidates.add(neighbor)
+        candidates.discard(cell)
+        return True
+
+    def unmake_move(self):
+        """
+        Son hamleyi geri al (make_move'un tersi, aynı pencereler)
+
+        Returns:
+            str: Geri alınan taşın sembolü, geçmiş boşsa None
+        """
+        if not self.move_stack:
+            return None
+        cell = self.move_stack.pop()
+        p = self.cells[cell]
+        self.cells[cell] = None
+
+        mine = self.line_counts[p]
+        theirs = self.line_counts[p ^ 1]
+        my_patterns = self.patterns[p]
+        their_patterns = self.patterns[p ^ 1]
+        weights = self.weights
+        gained = lost = 0
+        for line in self.cell_lines[cell]:
+            m = mine[line] - 1
+            mine[line] = m
+            t = theirs[line]
+            if t == 0:
+                my_patterns[m + 1] -= 1
+                if m:
+                    my_patterns[m] += 1
+                gained += weights[m + 1] - weights[m]
+            elif m == 0:
+                their_patterns[t] += 1
+                lost += weights[t]
+        self.scores[p] -= gained
+        self.scores[p ^ 1] += lost
+
+        near = self.near
+        candidates = self.candidates
+        for neighbor in self.neighbors[cell]:
+            near[neighbor] -= 1
+            if near[neighbor] == 0:
+                candidates.discard(neighbor)
+        if near[cell]:
+            candidates.add(cell)
+        return "XO"[p]
+
+    def load_board(self, board):
+        """
+        Değerlendiriciyi GameBoard uyumlu matristen (None / "X" / "O") yükle
+
+        Args:
+            board (list): size x size matris
+        """
+        self.cells = [None] * (self.size * self.size)
+        self.move_stack = []
+        self.candidates = set()
+        self._reset_counts()
+        for row in range(self.size):
+            for col in range(self.size):
+                if board[row][col] is not None:
+                    self.make_move(row, col, board[row][col])
+
+    def evaluate(self, player):
+        """
+        Statik değerlendirme, O(1): oyuncunun açık pencere skoru eksi rakibinki
+
+        Args:
+            player (str): Bakış açısı ("X" / "O")
+
+        Returns:
+            int: Pozitif değer oyuncunun lehine
+        """
+        p = SYMBOL_INDEX[player]
+        return self.scores[p] - self.scores[p ^ 1]
+
+    def threats(self, player):
+        """
+        Oyuncunun açık pencereleri, taş sayısına göre
+
+        Returns:
+            dict: {taş sayısı : pencere sayısı}, 2..K-1 (K = 5: ikili, üçlü, dörtlü)
+        """
+        patterns = self.patterns[SYMBOL_INDEX[player]]
+        return {count: patterns[count] for count in range(2, self.k)}
+
+    def winner(self):
+        """
+        Returns:
+            str: K'lı sırası tamamlanan oyuncu, yoksa None
+        """
+        for player in ("X", "O"):
+            if self.patterns[SYMBOL_INDEX[player]][self.k]:
+                return player
+        return None
+
+    def candidate_moves(self):
+        """
+        Taşların komşuluğundaki boş hücreler; board boşsa merkez
+
+        Returns:
+            list: [(row, col), ...]
+        """
+        if not self.move_stack:
+            return [(self.size // 2, self.size // 2)]
+        return [divmod(cell, self.size) for cell in sorted(self.candidates)]
+
+    def ranked_moves(self, player, limit=None):
+        """
+        Aday hamleleri, oynandıktan sonraki değerlendirmeye göre sırala
+        (saldırı ve savunma birlikte: rakip pencereyi kapatmak da skoru artırır)
+
+        Args:
+            player (str): Sıradaki oyuncu
+            limit (int, optional): En iyi kaç hamle
+
+        Returns:
+            list: [((row, col), skor), ...] en iyiden başlayarak
+        """
+        ranked = []
+        for row, col in self.candidate_moves():
+            self.make_move(row, col, player)
+            ranked.append(((row, col), self.evaluate(player)))
+            self.unmake_move()
+        ranked.sort(key=lambda item: item[1], reverse=True)
+        return ranked[:limit] if limit is not None else ranked
@@ -1,4 +1,5 @@
 from Game.board import GameBoard
+from Game.clock import GameClock
 from enum import Enum
 
 class Status(Enum):
@@ -7,7 +8,7 @@ class Status(Enum):
     WAITING = 3
 
 class Game:
-    def __init__(self, player1, player2):
+    def __init__(self, player1, player2, clock=None):
         self.player1 = player1
         self.player2 = player2
         self.game_board = GameBoard()
@@ -15,6 +16,7 @@ class Game:
         self.game_status = Status.STARTED
         self.move_count = 0
         self.winner = None
+        self.clock = clock  # GameClock (opsiyonel): hamle/oyun süresi
         
     def start_game(self):
         """
@@ -43,6 +45,10 @@ class Game:
         if not player.is_turn(self.current_player):
             return False, "Sizin sıranız değil!", self.get_game_state()
         
+        # Süre kontrolü (süresi dolan oyuncu hamle yapamaz)
+        if self.clock and self.clock.is_flagged():
+            return False, "Süreniz doldu!", self.get_game_state()
+        
         # 2. Hamle geçerliliği kontrolü
         if not self.game_board.is_valid_move(row, col):
             return False, "Geçersiz hamle! Bu pozisyon dolu veya koordinatlar yanlış.", self.get_game_state()
@@ -58,16 +64,24 @@ class Game:
             if winner_result["state"]:  # Kazanan var
                 self.winner = winner_result["player"]
                 self.game_status = Status.FINISHED
+                if self.clock:
+                    self.clock.stop()
                 return True, f"Oyun bitti! Kazanan: {self.winner}", self.get_game_state()
             
             # 5. Berabere kontrolü
             if self.game_board.is_board_full():
                 self.winner = "tie"
                 self.game_status = Status.FINISHED
+                if self.clock:
+                    self.clock.stop()
                 return True, "Oyun bitti! Berabere!", self.get_game_state()
             
-            # 6. Sırayı değiştir
+            # 6. Sırayı değiştir (saat varsa süreyi diğer oyuncuya geçir)
+            if self.clock:
+                self.clock.end_turn()
             self.switch_turn()
+            if self.clock:
+                self.clock.start_turn(self.current_player)
             return True, f"Hamle başarılı! Sıra: {self.current_player}", self.get_game_state()
         
         else:
@@ -87,7 +101,79 @@ class Game:
         """
         self.current_player = "O" if self.current_player == "X" else "X"
 
+    def undo_move(self):
+        """
+        Son hamleyi geri al (takeback, replay'de geri sarma)
+        Board, sıra, hamle sayısı ve oyun durumu hamleden önceki haline döner
+        
+        Return: (success: bool, message: str, game_state: dict)
+        """
+        player_symbol = self.game_board.unmake_move()
+        if player_symbol is None:
+            return False, "Geri alınacak hamle yok!", self.get_game_state()
+        
+        self.move_count -= 1
+        self.winner = None
+        self.game_status = Status.STARTED
+        self.current_player = player_symbol
+        if self.clock:
+            # Geçen süre sırası gelen oyuncudan düşülür, saat geri alınan hamlenin sahibine geçer
+            self.clock.end_turn(add_increment=False)
+            self.clock.start_turn(self.current_player)
+        return True, f"Hamle geri alındı! Sıra: {self.current_player}", self.get_game_state()
+    
+    def redo_move(self):
+        """
+        Geri alınan hamleyi tekrar yap (normal hamle gibi process_move'dan geçer)
+        
+        Return: (success: bool, message: str, game_state: dict)
+        """
+        if not self.game_board.redo_stack:
+            return False, "Tekrar yapılacak hamle yok!", self.get_game_state()
+        cell, player_symbol = self.game_board.redo_stack[-1]
+        player = self.player1 if player_symbol == self.player1.symbol else self.player2
+        return self.process_move(player, cell // 3, cell % 3)
+    
+    def start_clock(self):
+        """
+        Sırası gelen oyuncunun saatini başlat (oyun başında veya devam ederken)
+        """
+        if self.clock and self.game_status == Status.STARTED:
+            self.clock.start_turn(self.current_player)
+    
+    def timeout(self):
+        """
+        Sırası gelen oyuncunun süresi doldu: oyunu rakibi kazanır
         
+        Return: (success: bool, message: str, game_state: dict)
+        """
+        if self.game_status == Status.FINISHED:
+            return False, "Oyun zaten bitti!", self.get_game_state()
+        
+        self.winner = "O" if self.current_player == "X" else "X"
+        self.game_status = Status.FINISHED
+        if self.clock:
+            self.clock.end_turn(add_increment=False)
+        return True, f"Süre doldu! Kazanan: {self.winner}", self.get_game_state()
+
+    def adjudicate(self, winner):
+        """
+        Bitmeyen oyunu hakem kararıyla bitir (örn. turnuva turunun süresi doldu)
+
+        Args:
+            winner (str): "X", "O" veya "tie"
+
+        Return: (success: bool, message: str, game_state: dict)
+        """
+        if self.game_status == Status.FINISHED:
+            return False, "Oyun zaten bitti!", self.get_game_state()
+
+        self.winner = winner
+        self.game_status = Status.FINISHED
+        if self.clock:
+            self.clock.end_turn(add_increment=False)
+        return True, f"Hakem kararı! Sonuç: {self.winner}", self.get_game_state()
+
     def end_game(self):
         """
         Oyunu sonlandır ve sonuçları göster
@@ -124,9 +210,7 @@ class Game:
         Mevcut oyun durumunu network için serialize edilebilir format'ta döndür
         Return: dictionary with game state
         """
-        winner_result = self.game_board.check_winner()
-        
-        return {
+        game_state = {
             "board": [row[:] for row in self.game_board.board],  # Deep copy
             "current_player": self.current_player,
             "game_status": self.game_status.name,
@@ -146,6 +230,25 @@ class Game:
                 }
             }
         }
+        if self.clock:
+            game_state["clock"] = self.clock.to_dict()
+        return game_state
+    
+    def load_state(self, game_state):
+        """
+        get_game_state() çıktısından oyun durumunu geri yükle
+        Server restart sonrası snapshot'tan devam etmek için kullanılır
+        
+        Args:
+            game_state (dict): get_game_state() formatında oyun durumu
+        """
+        self.game_board.load_board(game_state["board"])
+        self.current_player = game_state["current_player"]
+        self.game_status = Status[game_state["game_status"]]
+        self.move_count = game_state.get("move_count", 0)
+        self.winner = game_state.get("winner")
+        if self.clock and game_state.get("clock"):
+            self.clock.load(game_state["clock"])
     
     def get_current_player_object(self):
         """
@@ -166,5 +269,7 @@ class Game:
         self.game_status = Status.STARTED
         self.move_count = 0
         self.winner = None
+        if self.clock:
+            self.clock = GameClock(self.clock.turn_time, self.clock.game_time, self.clock.increment)
         print("Oyun yeniden başlatıldı!")
         self.game_board.display()
\ No newline at end of file
@@ -0,0 +1,338 @@
+import asyncio
+import math
+import random
+import time
+from Game.evaluator import line_table
+
+# N x N board, K'lı sıra kazanır. Pozisyon iki bitboard'dur (Python int):
+# hücre index'i row * size + col, X = 0, O = 1, berabere = DRAW
+X, O, DRAW = 0, 1, 2
+SYMBOLS = ("X", "O")
+
+_WIN_MASKS = {}  # {(size, k) : [hücreden geçen K'lık pencerelerin maskeleri, ...]}
+_NEIGHBORS = {}  # {(size, radius) : [hücrenin komşuluk maskesi, ...]}
+
+
+def win_masks(size, k):
+    """
+    Her hücre için, o hücreden geçen tüm K'lık pencerelerin bit maskeleri
+    Hamleden sonra sadece oynanan hücrenin pencerelerine bakılır
+
+    Returns:
+        list: [tuple(mask, ...), ...] hücre başına
+    """
+    masks = _WIN_MASKS.get((size, k))
+    if masks is None:
+        lines, cell_lines = line_table(size, k)
+        line_masks = [sum(1 << cell for cell in line) for line in lines]
+        masks = _WIN_MASKS[(size, k)] = [tuple(line_masks[line] for line in indexes) for indexes in cell_lines]
+    return masks
+
+
+def neighbor_masks(size, radius):
+    """
+    Her hücrenin `radius` uzaklığındaki komşularının maskesi
+    Büyük board'larda ağaç sadece taşların yakınındaki hamlelerle genişletilir
+    """
+    masks = _NEIGHBORS.get((size, radius))
+    if masks is None:
+        masks = []
+        for row in range(size):
+            for col in range(size):
+                mask = 0
+                for n_row in range(max(0, row - radius), min(size, row + radius + 1)):
+                    for n_col in range(max(0, col - radius), min(size, col + radius + 1)):
+                        mask |= 1 << (n_row * size + n_col)
+                masks.append(mask)
+        _NEIGHBORS[(size, radius)] = masks
+    return masks
+
+
+def position_from_board(board):
+    """
+    GameBoard uyumlu matristen (None / "X" / "O") bitboard pozisyonu
+
+    Args:
+        board (list): size x size matris
+
+    Returns:
+        tuple: (size, x_bits, o_bits)
+    """
+    size = len(board)
+    x_bits = o_bits = 0
+    for row in range(size):
+        for col in range(size):
+            cell = board[row][col]
+            if cell == "X":
+                x_bits |= 1 << (row * size + col)
+            elif cell == "O":
+                o_bits |= 1 << (row * size + col)
+    return size, x_bits, o_bits
+
+
+def rollout(mine, theirs, player, free, count, masks, bits, rand):
+    """
+    Rastgele oyun sonu (playout)
+
+    Boş hücreler `free` listesinin ilk `count` elemanıdır; liste yerinde
+    karıştırılarak sırayla oynanır (Fisher-Yates), board kopyası veya yeni
+    liste oluşturulmaz. Liste aynı hücre kümesini tutmaya devam eder.
+
+    Args:
+        mine / theirs (int): Sıradaki oyuncunun ve rakibin bitboard'u
+        player (int): Sıradaki oyuncu (X / O)
+
+    Returns:
+        int: Kazanan (X / O) veya DRAW
+    """
+    for i in range(count):
+        j = i + int(rand() * (count - i))
+        cell = free[j]
+        free[j] = free[i]
+        free[i] = cell
+        mine |= bits[cell]
+        for mask in masks[cell]:
+            if mine & mask == mask:
+                return player
+        mine, theirs = theirs, mine
+        player ^= 1
+    return DRAW
+
+
+class Node:
+    """
+    Arama ağacı düğümü; wins, `player`'ın (bu düğümün hamlesini yapan) bakış açısından
+    """
+    __slots__ = ("move", "parent", "player", "children", "untried", "visits", "wins", "result")
+
+    def __init__(self, move, parent, player):
+        self.move = move
+        self.parent = parent
+        self.player = player
+        self.children = []
+        self.untried = None
+        self.visits = 0
+        self.wins = 0.0
+        self.result = None  # Oyun bu hamleyle bittiyse kazanan / DRAW
+
+
+def search(size, k, x_bits, o_bits, to_move, budget, seed=None, max_playouts=None,
+           exploration=1.4, radius=2):
+    """
+    Tek çekirdekte UCT Monte Carlo ağaç araması (process pool worker'ında çalışır)
+
+    Args:
+        size (int): Board kenarı
+        k (int): Kazanmak için gereken sıra uzunluğu
+        x_bits / o_bits (int): Pozisyon
+        to_move (int): Sıradaki oyuncu (X / O)
+        budget (float): Süre (saniye)
+        seed (int, optional): Rastgelelik seed'i (root paralelliğinde worker başına farklı)
+        max_playouts (int, optional): Süreden önce durmak için playout sınırı
+        exploration (float): UCT keşif katsayısı
+        radius (int): Büyük board'larda genişletme için taşlara en fazla uzaklık
+
+    Returns:
+        tuple: ({hamle: (ziyaret, kazanç)}, playout sayısı)
+    """
+    rng = random.Random(seed)
+    rand = rng.random
+    masks = win_masks(size, k)
+    cells = size * size
+    bits = [1 << cell for cell in range(cells)]
+    full = (1 << cells) - 1
+    # 3x3 gibi küçük board'larda tüm boş hücreler aday
+    neighbors = neighbor_masks(size, radius) if size > 2 * radius + 1 else None
+    free = [0] * cells  # Rollout'un boş hücre listesi (tek sefer ayrılır)
+    log = math.log
+    sqrt = math.sqrt
+
+    def candidates(occupied):
+        empty = full & ~occupied
+        if neighbors is not None and occupied:
+            near = 0
+            rest = occupied
+            while rest:
+                low = rest & -rest
+                near |= neighbors[low.bit_length() - 1]
+                rest ^= low
+            empty &= near
+        moves = []
+        while empty:
+            low = empty & -empty
+            moves.append(low.bit_length() - 1)
+            empty ^= low
+        return moves
+
+    root = Node(None, None, to_move ^ 1)
+    root.untried = candidates(x_bits | o_bits)
+    deadline = time.perf_counter() + budget
+    playouts = 0
+
+    while True:
+        node = root
+        x, o = x_bits, o_bits
+
+        # Seçim: tüm çocukları açılmış düğümlerde UCT
+        while not node.untried and node.children and node.result is None:
+            log_visits = log(node.visits)
+            best_score = -1.0
+            best = None
+            for child in node.children:
+                score = child.wins / child.visits + exploration * sqrt(log_visits / child.visits)
+                if score > best_score:
+                    best_score = score
+                    best = child
+            node = best
+            if node.player == X:
+                x |= bits[node.move]
+            else:
+                o |= bits[node.move]
+
+        # Genişletme: açılmamış bir hamle
+        if node.result is None and node.untried:
+            untried = node.untried
+            idx = int(rand() * len(untried))
+            move = untried[idx]
+            untried[idx] = untried[-1]
+            untried.pop()
+            player = node.player ^ 1
+            child = Node(move, node, player)
+            if player == X:
+                x |= bits[move]
+                mine = x
+            else:
+                o |= bits[move]
+                mine = o
+            for mask in masks[move]:
+                if mine & mask == mask:
+                    child.result = player
+                    break
+            else:
+                if x | o == full:
+                    child.result = DRAW
+                else:
+                    child.untried = candidates(x | o)
+            node.children.append(child)
+            node = child
+
+        # Simülasyon
+        if node.result is not None:
+            winner = node.result
+        else:
+            occupied = x | o
+            count = 0
+            for cell in range(cells):
+                if not occupied & bits[cell]:
+                    free[count] = cell
+                    count += 1
+            player = node.player ^ 1
+            if player == X:
+                winner = rollout(x, o, X, free, count, masks, bits, rand)
+            else:
+                winner = rollout(o, x, O, free, count, masks, bits, rand)
+
+        # Geri yayılım
+        while node is not None:
+            node.visits += 1
+            if winner == node.player:
+                node.wins += 1.0
+            elif winner == DRAW:
+                node.wins += 0.5
+            node = node.parent
+
+        playouts += 1
+        if max_playouts is not None and playouts >= max_playouts:
+            break
+        if time.perf_counter() >= deadline:
+            break
+
+    return {child.move: (child.visits, child.wins) for child in root.children}, playouts
+
+
+def merge_results(results):
+    """
+    Root paralelliği: worker'ların kök istatistiklerini topla
+
+    Args:
+        results (list): search() dönüşleri
+
+    Returns:
+        tuple: ({hamle: [ziyaret, kazanç]}, toplam playout)
+    """
+    merged = {}
+    total = 0
+    for stats, playouts in results:
+        total += playouts
+        for move, (visits, wins) in stats.items():
+            entry = merged.setdefault(move, [0, 0.0])
+            entry[0] += visits
+            entry[1] += wins
+    return merged, total
+
+
+class MCTSBot:
+    """
+    GameBoard uyumlu board'lar için Monte Carlo ağaç araması botu
+
+    Root paralelliği: her hamlede `parallelism` bağımsız arama, farklı seed'lerle
+    process pool'da aynı süre bütçesiyle çalışır; kök istatistikleri toplanır ve
+    en çok ziyaret edilen hamle seçilir. Arama event loop dışında yapılır.
+    """
+
+    def __init__(self, time_budget=1.0, parallelism=1, executor=None, k=None, exploration=1.4):
+        self.time_budget = time_budget  # Hamle başına süre (saniye)
+        self.parallelism = parallelism  # Hamle başına paralel arama sayısı
+        self.executor = executor  # ProcessPoolExecutor (None ise aramalar bu process'te)
+        self.k = k  # Kazanmak için sıra uzunluğu (None ise board kenarı)
+        self.exploration = exploration
+        self.playouts = 0  # Toplam playout (istatistik)
+        self._seeds = random.Random()
+
+    def _jobs(self, board, symbol):
+        size, x_bits, o_bits = position_from_board(board)
+        k = self.k or size
+        to_move = SYMBOLS.index(symbol)
+        return [
+            (size, k, x_bits, o_bits, to_move, self.time_budget, self._seeds.getrandbits(32), None, self.exploration)
+            for _ in range(max(1, self.parallelism))
+        ], size
+
+    def _pick(self, results, size):
+        merged, playouts = merge_results(results)
+        self.playouts += playouts
+        if not merged:
+            return None
+        move = max(merged, key=lambda cell: merged[cell][0])
+        return divmod(move, size)
+
+    def choose_move(self, board, symbol):
+        """
+        Hamle seç (bloklar)
+
+        Args:
+            board (list): size x size matris
+            symbol (str): Botun sembolü
+
+        Returns:
+            tuple: (row, col), hamle yoksa None
+        """
+        jobs, size = self._jobs(board, symbol)
+        if self.executor:
+            futures = [self.executor.submit(search, *job) for job in jobs]
+            results = [future.result() for future in futures]
+        else:
+            results = [search(*job) for job in jobs]
+        return self._pick(results, size)
+
+    async def choose_move_async(self, board, symbol):
+        """
+        Hamleyi process pool'da seç; event loop diğer room'lara hizmet etmeye devam eder
+
+        Returns:
+            tuple: (row, col), hamle yoksa None
+        """
+        jobs, size = self._jobs(board, symbol)
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*(loop.run_in_executor(self.executor, search, *job) for job in jobs))
+        return self._pick(results, size)
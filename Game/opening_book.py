@@ -0,0 +1,260 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import mmap
+import struct
+import time
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from Game.board import GameBoard
+from Utils.game_log import read_records, decode_game
+
+# Dosya formatı (little-endian):
+#   header : magic, pozisyon sayısı N, indekslenen oyun sayısı, log'da işlenen kayıt sayısı
+#   hashes : N x uint64, sıralı canonical hash'ler
+#   counts : N x 3 x uint32, her pozisyon için (X kazandı, berabere, O kazandı)
+HEADER = struct.Struct("<8sQQQ")
+MAGIC = b"TTTBOOK1"
+RESULT_INDEX = {"X": 0, "tie": 1, "O": 2}
+
+
+class OpeningBookBuilder:
+    """
+    Offline indexer: oyun log'undan canonical pozisyon başına sonuç sayıları
+
+    - Aynı hamle dizisi log'da ne kadar tekrar ederse etsin bir kez oynatılır
+      (kayıtlar önce C hızında Counter ile sayılır)
+    - Artımlı çalışır: mevcut kitap yüklenir ve log'un sadece yeni kayıtları işlenir
+    - Yarıda kalan oyunlar (sonuç yok) sayılmaz
+    """
+
+    def __init__(self):
+        self.counts = {}  # {canonical hash : [X, berabere, O]}
+        self.games = 0
+        self.log_position = 0  # Log'da işlenen kayıt sayısı
+        self.board = GameBoard()
+
+    def load(self, path):
+        """
+        Mevcut kitabı artımlı güncelleme için belleğe yükle
+        """
+        book = OpeningBook(path)
+        try:
+            for idx in range(len(book)):
+                self.counts[book.hashes[idx]] = list(book.counts[idx * 3:idx * 3 + 3])
+            self.games = book.games
+            self.log_position = book.log_position
+        finally:
+            book.close()
+
+    def add_log(self, path, chunk_records=1 << 20):
+        """
+        Log'un henüz işlenmemiş kayıtlarını indeksle
+
+        Returns:
+            int: Bu çağrıda eklenen oyun sayısı
+        """
+        records = Counter()
+        for chunk in read_records(path, self.log_position, chunk_records):
+            records.update(chunk)
+            self.log_position += len(chunk)
+
+        added = 0
+        for record, count in records.items():
+            added += self.add_game(record, count)
+        return added
+
+    def add_game(self, record, count=1):
+        """
+        Tek bir hamle dizisini `count` kez oynanmış gibi ekle
+
+        Returns:
+            int: Eklenen oyun sayısı (geçersiz veya yarım kayıtsa 0)
+        """
+        moves, winner = decode_game(record)
+        result = RESULT_INDEX.get(winner)
+        if result is None:
+            return 0
+
+        board = self.board
+        hashes = [board.canonical_hash()]
+        player, opponent = "X", "O"
+        valid = True
+        for cell in moves:
+            if not board.make_move(cell // 3, cell % 3, player):
+                valid = False
+                break
+            hashes.append(board.canonical_hash())
+            player, opponent = opponent, player
+        # Board'u tek nesne üzerinde geri sar (yeni board oluşturmadan)
+        while board.move_count:
+            board.unmake_move()
+        board.redo_stack.clear()
+        if not valid:
+            return 0
+
+        for position in hashes:
+            entry = self.counts.get(position)
+            if entry is None:
+                entry = self.counts[position] = [0, 0, 0]
+            entry[result] += count
+        self.games += count
+        return count
+
+    def save(self, path):
+        """
+        Kitabı sıralı hash dizisi + paketli sayılar olarak yaz (atomik)
+        """
+        positions = sorted(self.counts)
+        hashes = array("Q", positions)
+        counts = array("I")
+        for position in positions:
+            counts.extend(self.counts[position])
+        if sys.byteorder != "little":
+            hashes.byteswap()
+            counts.byteswap()
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, len(positions), self.games, self.log_position))
+            f.write(hashes.tobytes())
+            f.write(counts.tobytes())
+        os.replace(tmp_path, path)
+        return len(positions)
+
+
+class OpeningBook:
+    """
+    Memory-mapped açılış kitabı
+
+    Arama sıralı hash dizisinde binary search'tür: dosya belleğe kopyalanmaz,
+    sorgu başına O(log N) ve mikro saniyeler mertebesindedir.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count, self.games, self.log_position = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Geçersiz açılış kitabı dosyası: {path}")
+
+        hashes_start = HEADER.size
+        counts_start = hashes_start + count * 8
+        if sys.byteorder == "little":
+            view = memoryview(self._mmap)
+            self.hashes = view[hashes_start:counts_start].cast("Q")
+            self.counts = view[counts_start:counts_start + count * 12].cast("I")
+        else:
+            # Big-endian makinede mmap yerine çevrilmiş kopya kullanılır
+            self.hashes = array("Q", self._mmap[hashes_start:counts_start])
+            self.counts = array("I", self._mmap[counts_start:counts_start + count * 12])
+            self.hashes.byteswap()
+            self.counts.byteswap()
+
+    def __len__(self):
+        return len(self.hashes)
+
+    def lookup(self, position_hash):
+        """
+        Canonical hash'in istatistikleri
+
+        Returns:
+            tuple: (X kazandı, berabere, O kazandı) veya kitapta yoksa None
+        """
+        idx = bisect_left(self.hashes, position_hash)
+        if idx < len(self.hashes) and self.hashes[idx] == position_hash:
+            return tuple(self.counts[idx * 3:idx * 3 + 3])
+        return None
+
+    def popular_replies(self, board, limit=None):
+        """
+        Pozisyondaki hamlelerin kitap istatistikleri, en çok oynanandan başlayarak
+        Simetrik olarak aynı pozisyona giden hamlelerden sadece biri döner
+
+        Args:
+            board (list): 3x3 board matrix
+            limit (int, optional): En fazla döndürülecek hamle sayısı
+
+        Returns:
+            list: [{"row", "col", "games", "x_wins", "draws", "o_wins"}, ...]
+        """
+        scratch = GameBoard()
+        scratch.load_board(board)
+        filled = scratch.move_count
+        player = "X" if filled % 2 == 0 else "O"
+
+        replies = []
+        seen = set()
+        for cell in range(9):
+            row, col = divmod(cell, 3)
+            if not scratch.make_move(row, col, player):
+                continue
+            position = scratch.canonical_hash()
+            scratch.unmake_move()
+            if position in seen:
+                continue
+            seen.add(position)
+            stats = self.lookup(position)
+            if stats:
+                replies.append({
+                    "row": row,
+                    "col": col,
+                    "games": sum(stats),
+                    "x_wins": stats[0],
+                    "draws": stats[1],
+                    "o_wins": stats[2]
+                })
+        replies.sort(key=lambda reply: reply["games"], reverse=True)
+        return replies[:limit] if limit else replies
+
+    def close(self):
+        for attr in ("hashes", "counts"):
+            value = getattr(self, attr, None)
+            if isinstance(value, memoryview):
+                value.release()
+        self._mmap.close()
+        self._file.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Açılış kitabı indexer'ı")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build = subparsers.add_parser("build", help="Log'dan kitabı oluştur/güncelle")
+    build.add_argument("--log", required=True, help="Server'ın --game-log dosyası")
+    build.add_argument("--book", required=True, help="Kitap dosyası (varsa artımlı güncellenir)")
+
+    query = subparsers.add_parser("query", help="Pozisyondaki popüler hamleler")
+    query.add_argument("--book", required=True)
+    query.add_argument("--moves", default="", help="Oynanan hamleler, örn: 1,1 0,0")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        builder = OpeningBookBuilder()
+        if os.path.exists(args.book):
+            builder.load(args.book)
+        started = time.perf_counter()
+        added = builder.add_log(args.log)
+        positions = builder.save(args.book)
+        print(f"{added} oyun eklendi ({time.perf_counter() - started:.1f}s), "
+              f"toplam {builder.games} oyun, {positions} pozisyon")
+    else:
+        board = GameBoard()
+        player = "X"
+        for move in args.moves.split():
+            row, col = (int(part) for part in move.split(","))
+            board.make_move(row, col, player)
+            player = "O" if player == "X" else "X"
+        book = OpeningBook(args.book)
+        for reply in book.popular_replies(board.board):
+            print(f"{reply['row']},{reply['col']}: {reply['games']} oyun "
+                  f"(X {reply['x_wins']} / berabere {reply['draws']} / O {reply['o_wins']})")
+        book.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+import sqlite3
+import time
+
+
+class Leaderboard:
+    """
+    Rating sıralaması: Fenwick tree (binary indexed tree) üzerinde
+
+    Rating'ler tam sayı bucket'lara (1 puan) ayrılır; her bucket'taki oyuncu
+    sayısı Fenwick tree'de tutulur, oyuncular bucket içinde dict'te durur.
+    - update / remove: O(log R)
+    - rank: O(log R), aynı tam sayı rating'e sahip oyuncular aynı sırayı paylaşır
+    - top(k): O(k log R) + bucket içi sıralama
+
+    R rating aralığıdır (varsayılan 0-4000), oyuncu sayısından bağımsızdır.
+    """
+
+    def __init__(self, max_rating=4000):
+        self.size = max_rating + 1
+        self.tree = [0] * (self.size + 1)  # 1 tabanlı Fenwick dizisi
+        self.buckets = {}  # {fenwick index : {player_id : rating}}
+        self.players = {}  # {player_id : fenwick index}
+        self._log = 1 << (self.size.bit_length() - 1)
+
+    def _index(self, rating):
+        # Yüksek rating küçük index: prefix toplamı "bu rating'den yüksek olanlar" olur
+        if rating <= 0:
+            return self.size
+        bucket = int(rating + 0.5)
+        return 1 if bucket >= self.size else self.size - bucket
+
+    def _add(self, index, delta):
+        while index <= self.size:
+            self.tree[index] += delta
+            index += index & -index
+
+    def _move(self, old, new):
+        """
+        Bir oyuncuyu old bucket'ından new bucket'ına taşı
+        İki yol birleştiği noktadan sonra -1 ve +1 birbirini götürür; Elo değişimleri
+        küçük olduğundan çoğu güncelleme birkaç düğümde biter
+        """
+        tree = self.tree
+        size = self.size
+        while old != new:
+            if old < new:
+                tree[old] -= 1
+                old += old & -old
+            else:
+                tree[new] += 1
+                new += new & -new
+            if old > size and new > size:
+                break
+
+    def _prefix(self, index):
+        total = 0
+        while index > 0:
+            total += self.tree[index]
+            index -= index & -index
+        return total
+
+    def _select(self, k):
+        """
+        Prefix toplamı k'ya ulaşan en küçük index (k. en yüksek rating'in bucket'ı)
+        """
+        index = 0
+        step = self._log
+        while step:
+            nxt = index + step
+            if nxt <= self.size and self.tree[nxt] < k:
+                index = nxt
+                k -= self.tree[nxt]
+            step >>= 1
+        return index + 1
+
+    def __len__(self):
+        return len(self.players)
+
+    def update(self, player_id, rating):
+        """
+        Oyuncuyu ekle veya rating'ini güncelle
+        """
+        index = self._index(rating)
+        buckets = self.buckets
+        old_index = self.players.get(player_id)
+        if old_index == index:
+            buckets[index][player_id] = rating
+            return
+
+        if old_index is None:
+            self._add(index, 1)
+        else:
+            old_bucket = buckets[old_index]
+            del old_bucket[player_id]
+            if not old_bucket:
+                del buckets[old_index]
+            self._move(old_index, index)
+        self.players[player_id] = index
+        bucket = buckets.get(index)
+        if bucket is None:
+            bucket = buckets[index] = {}
+        bucket[player_id] = rating
+
+    def remove(self, player_id):
+        """
+        Oyuncuyu sıralamadan çıkar
+        """
+        index = self.players.pop(player_id, None)
+        if index is None:
+            return
+        bucket = self.buckets[index]
+        del bucket[player_id]
+        if not bucket:
+            del self.buckets[index]
+        self._add(index, -1)
+
+    def rank(self, player_id):
+        """
+        Oyuncunun sırası (1 = en yüksek)
+
+        Returns:
+            int: Sıra, oyuncu yoksa None
+        """
+        index = self.players.get(player_id)
+        if index is None:
+            return None
+        return self._prefix(index - 1) + 1
+
+    def top(self, k):
+        """
+        En yüksek rating'li k oyuncu
+
+        Returns:
+            list: [(player_id, rating), ...] azalan rating sırasıyla
+        """
+        result = []
+        k = min(k, len(self.players))
+        while len(result) < k:
+            index = self._select(len(result) + 1)
+            bucket = sorted(self.buckets[index].items(), key=lambda item: item[1], reverse=True)
+            result.extend(bucket[:k - len(result)])
+        return result
+
+
+class RatingSystem:
+    """
+    Oyuncu id'si ile anahtarlanan Elo rating'leri ve sıralama
+
+    - Başlangıç rating'i 1500
+    - İlk PROVISIONAL_GAMES oyunda K = 40, sonra K = 20
+    - Beraberlik 0.5 puan sayılır
+    """
+
+    INITIAL_RATING = 1500.0
+    PROVISIONAL_GAMES = 30
+
+    def __init__(self, k_factor=20.0, provisional_k=40.0):
+        self.k_factor = k_factor
+        self.provisional_k = provisional_k
+        self.players = {}  # {player_id : [rating, oyun, galibiyet, beraberlik, mağlubiyet]}
+        self.leaderboard = Leaderboard()
+
+    def get(self, player_id):
+        """
+        Returns:
+            list: [rating, oyun, galibiyet, beraberlik, mağlubiyet] veya None
+        """
+        return self.players.get(player_id)
+
+    def load(self, rows):
+        """
+        Kalıcı kayıtlardan yükle
+
+        Args:
+            rows (iterable): (player_id, rating, games, wins, draws, losses)
+        """
+        for player_id, rating, games, wins, draws, losses in rows:
+            self.players[player_id] = [rating, games, wins, draws, losses]
+            self.leaderboard.update(player_id, rating)
+
+    def _entry(self, player_id):
+        entry = self.players.get(player_id)
+        if entry is None:
+            entry = self.players[player_id] = [self.INITIAL_RATING, 0, 0, 0, 0]
+        return entry
+
+    def apply_result(self, player1_id, player2_id, score1):
+        """
+        Tek oyunun sonucunu uygula
+
+        Args:
+            player1_id (str): Birinci oyuncu
+            player2_id (str): İkinci oyuncu
+            score1 (float): Birinci oyuncunun puanı (1 kazandı, 0.5 berabere, 0 kaybetti)
+        """
+        first = self._entry(player1_id)
+        second = self._entry(player2_id)
+        expected1 = 1.0 / (1.0 + 10.0 ** ((second[0] - first[0]) / 400.0))
+        k1 = self.provisional_k if first[1] < self.PROVISIONAL_GAMES else self.k_factor
+        k2 = self.provisional_k if second[1] < self.PROVISIONAL_GAMES else self.k_factor
+        first[0] += k1 * (score1 - expected1)
+        second[0] += k2 * ((1.0 - score1) - (1.0 - expected1))
+
+        for entry, score in ((first, score1), (second, 1.0 - score1)):
+            entry[1] += 1
+            if score == 1.0:
+                entry[2] += 1
+            elif score == 0.5:
+                entry[3] += 1
+            else:
+                entry[4] += 1
+        self.leaderboard.update(player1_id, first[0])
+        self.leaderboard.update(player2_id, second[0])
+
+    def apply_batch(self, results):
+        """
+        Biriken sonuçları sırayla uygula
+
+        Args:
+            results (list): [(player1_id, player2_id, score1), ...]
+
+        Returns:
+            set: Rating'i değişen oyuncular (kalıcı kayıt için)
+        """
+        changed = set()
+        for player1_id, player2_id, score1 in results:
+            self.apply_result(player1_id, player2_id, score1)
+            changed.add(player1_id)
+            changed.add(player2_id)
+        return changed
+
+    def top(self, k):
+        """
+        Returns:
+            list: [{"player_id", "rating", "games", "rank"}, ...]
+        """
+        entries = []
+        for player_id, rating in self.leaderboard.top(k):
+            entries.append(self.describe(player_id))
+        return entries
+
+    def describe(self, player_id):
+        """
+        Oyuncunun rating ve sıra bilgisi
+
+        Returns:
+            dict: Oyuncu yoksa None
+        """
+        entry = self.players.get(player_id)
+        if entry is None:
+            return None
+        return {
+            "player_id": player_id,
+            "rating": round(entry[0], 1),
+            "games": entry[1],
+            "wins": entry[2],
+            "draws": entry[3],
+            "losses": entry[4],
+            "rank": self.leaderboard.rank(player_id)
+        }
+
+
+class RatingStore:
+    """
+    Rating'lerin SQLite'ta (WAL modu) kalıcı kaydı
+
+    Değişen oyuncular tek transaction'da toplu yazılır; çağıran taraf
+    (GameServer) bunu event loop dışında bir thread'de çalıştırır.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        # Sadece tek bir thread (sıralı to_thread çağrıları) kullanır
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS ratings ("
+            " player_id TEXT PRIMARY KEY,"
+            " rating REAL NOT NULL,"
+            " games INTEGER NOT NULL,"
+            " wins INTEGER NOT NULL,"
+            " draws INTEGER NOT NULL,"
+            " losses INTEGER NOT NULL,"
+            " updated_at REAL NOT NULL)"
+        )
+        self.connection.commit()
+
+    def load_all(self):
+        """
+        Returns:
+            list: [(player_id, rating, games, wins, draws, losses), ...]
+        """
+        return self.connection.execute(
+            "SELECT player_id, rating, games, wins, draws, losses FROM ratings").fetchall()
+
+    def save(self, rows):
+        """
+        Değişen oyuncuları tek transaction'da yaz
+
+        Args:
+            rows (list): [(player_id, rating, games, wins, draws, losses), ...]
+        """
+        now = time.time()
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO ratings (player_id, rating, games, wins, draws, losses, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT(player_id) DO UPDATE SET"
+                " rating = excluded.rating, games = excluded.games, wins = excluded.wins,"
+                " draws = excluded.draws, losses = excluded.losses, updated_at = excluded.updated_at",
+                [row + (now,) for row in rows]
+            )
+
+    def close(self):
+        self.connection.close()
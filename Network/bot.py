@@ -0,0 +1,63 @@
+import asyncio
+import json
+import logging
+from Utils.protocol import MessageType
+
+logger = logging.getLogger(__name__)
+
+BOT_OPPONENT = "bot"  # Join mesajındaki "opponent" değeri
+BOT_PLAYER = {"id": "mcts-bot", "symbol": "O", "name": "MCTS Bot"}
+
+
+class BotConnection:
+    """
+    Room'da oyuncu olarak oturan server tarafı bot
+
+    Server kodu için websocket gibi davranır: gelen game_state'te sıra bottaysa
+    hamle MCTSBot ile process pool'da aranır, sonuç normal hamle yolundan
+    (handle_player_move) işlenir. Arama sürerken event loop diğer room'lara
+    hizmet etmeye devam eder.
+    """
+    __slots__ = ("server", "bot", "symbol", "remote_address", "closed", "_thinking")
+
+    def __init__(self, server, bot):
+        self.server = server
+        self.bot = bot  # MCTSBot
+        self.symbol = None  # waiting mesajıyla atanır
+        self.remote_address = None
+        self.closed = False
+        self._thinking = None  # Aranan pozisyonun hamle sayısı (aynı state için tek arama)
+
+    async def send(self, data):
+        if self.closed:
+            return
+        message = json.loads(data)
+        message_type = message.get("type")
+        if message_type == MessageType.WAITING.value:
+            self.symbol = message["data"]["your_symbol"]
+        elif message_type == MessageType.GAME_STATE.value:
+            state = message["data"]
+            if (state["is_game_over"] or state["current_player"] != self.symbol
+                    or state["move_count"] == self._thinking):
+                return
+            self._thinking = state["move_count"]
+            task = asyncio.get_running_loop().create_task(self.play(state["board"]))
+            self.server._background_tasks.add(task)
+            task.add_done_callback(self.server._background_tasks.discard)
+
+    async def play(self, board):
+        """
+        Hamleyi ara ve oyna
+        """
+        try:
+            move = await self.bot.choose_move_async(board, self.symbol)
+        except Exception as e:
+            logger.error(f"Bot arama hatası: {e}")
+            return
+        if move is None or self.closed:
+            return
+        row, col = move
+        await self.server.handle_player_move(self, {"row": row, "col": col})
+
+    async def close(self, code=1000, reason=""):
+        self.closed = True
@@ -0,0 +1,555 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import struct
+
+logger = logging.getLogger(__name__)
+
+# Cluster'daki en fazla node; room id'leri bu adımla node index'ine göre dağıtılır
+MAX_NODES = 1024
+
+# TCP frame'i: 4 byte uzunluk + 1 byte tür + gövde
+#   CONTROL: JSON başlık (hello, sub, unsub, match, requeue, cancel, reply)
+#   PUBLISH / MESSAGE: 2 byte topic uzunluğu + topic + mesaj (utf-8)
+FRAME_HEADER = struct.Struct("!I")
+TOPIC_LENGTH = struct.Struct("!H")
+CONTROL = b"\x00"
+PUBLISH = b"\x01"
+MESSAGE = b"\x02"
+MAX_FRAME = 16 * 1024 * 1024
+READ_CHUNK = 256 * 1024
+MAX_WRITE_BUFFER = 64 * 1024 * 1024  # Bunu aşan yavaş node'un bağlantısı kesilir
+
+
+class Broker:
+    """
+    Node'lar arası mesaj broker'ı arayüzü
+
+    GameServer node'ları broker üzerinden:
+    - node index'i alır (room id'leri ve sahiplik bu index'ten türetilir)
+    - topic'lere abone olur / yayın yapar (cross-node fan-out)
+    - cluster genelindeki tek eşleştirme kuyruğunu kullanır
+
+    Gelen mesajlar geliş sırasıyla, tek bir dispatch task'ında handler'lara
+    verilir; handler'lar broker isteklerini (örn. match) bekleyebilir.
+    """
+
+    def __init__(self):
+        self.index = None  # connect() sonrası node index'i
+        self.handlers = {}  # {topic : async handler(message)}
+        self._inbox = None
+        self._dispatcher = None
+
+    async def connect(self):
+        """
+        Broker'a bağlan ve node index'i al
+
+        Returns:
+            int: Node index'i (0 <= index < MAX_NODES)
+        """
+        raise NotImplementedError
+
+    async def subscribe(self, topic, handler):
+        """
+        Topic'e abone ol
+
+        Args:
+            topic (str): Topic adı
+            handler: Her mesaj için çağrılan async fonksiyon (message: str)
+        """
+        raise NotImplementedError
+
+    async def unsubscribe(self, topic):
+        raise NotImplementedError
+
+    def publish(self, topic, message):
+        """
+        Topic'e mesaj yayınla (bloklamaz, mesaj sıraya alınır)
+
+        Args:
+            topic (str): Topic adı
+            message (str): Mesaj
+        """
+        raise NotImplementedError
+
+    async def match(self, ticket):
+        """
+        Eşleştirme kuyruğunda bekleyen bilet varsa onu al, yoksa bileti kuyruğa ekle
+        Atomiktir: bekleyen bir bilet en fazla bir node'a verilir
+
+        Args:
+            ticket (dict): {"id": str, "node": int, ...}
+
+        Returns:
+            dict: Eşleşilen bilet, kuyruğa eklendiyse None
+        """
+        raise NotImplementedError
+
+    async def requeue(self, ticket):
+        """
+        Alınmış ama kullanılamayan bileti kuyruğun başına geri koy
+        """
+        raise NotImplementedError
+
+    async def cancel_match(self, ticket_id):
+        """
+        Kuyruktaki bileti iptal et
+
+        Returns:
+            bool: Bilet hâlâ kuyruktaydı ve silindi mi?
+        """
+        raise NotImplementedError
+
+    async def close(self):
+        raise NotImplementedError
+
+    def start_dispatcher(self):
+        self._inbox = asyncio.Queue()
+        self._dispatcher = asyncio.create_task(self._dispatch())
+
+    def stop_dispatcher(self):
+        if self._dispatcher:
+            self._dispatcher.cancel()
+            self._dispatcher = None
+
+    def deliver(self, topic, message):
+        """
+        Gelen mesajı dispatch kuyruğuna ekle
+        """
+        self._inbox.put_nowait((topic, message))
+
+    async def _dispatch(self):
+        while True:
+            topic, message = await self._inbox.get()
+            handler = self.handlers.get(topic)
+            if not handler:
+                continue
+            try:
+                await handler(message)
+            except Exception as e:
+                logger.error(f"Broker mesaj işleme hatası ({topic}): {e}")
+
+
+class BrokerHub:
+    """
+    Broker durumu: node'lar, topic abonelikleri ve eşleştirme kuyruğu
+
+    LocalBroker'lar aynı hub'ı doğrudan, TcpBroker'lar BrokerServer üzerinden kullanır.
+    Client nesnesinin deliver(topic, message) metodu olmalıdır; hub mesajın
+    içeriğine bakmaz (BrokerServer'da mesaj, abonelere yazılacak hazır frame'dir).
+    """
+
+    def __init__(self, max_nodes=MAX_NODES):
+        self.max_nodes = max_nodes
+        self.nodes = {}  # {index : client}
+        self.topics = {}  # {topic : set(client)}
+        self.subscriptions = {}  # {client : set(topic)}
+        self.waiting = {}  # {ticket_id : (client, ticket)} ekleme sırasıyla (FIFO)
+        self.published = 0
+        self.delivered = 0
+
+    def register(self, client):
+        """
+        Node'a boştaki en küçük index'i ver
+
+        Returns:
+            int: Node index'i
+        """
+        for index in range(self.max_nodes):
+            if index not in self.nodes:
+                self.nodes[index] = client
+                self.subscriptions[client] = set()
+                return index
+        raise RuntimeError(f"Cluster dolu ({self.max_nodes} node)")
+
+    def unregister(self, client):
+        """
+        Node'u, aboneliklerini ve kuyruktaki biletlerini sil
+        """
+        for index, node in list(self.nodes.items()):
+            if node is client:
+                del self.nodes[index]
+        for topic in self.subscriptions.pop(client, ()):
+            subscribers = self.topics.get(topic)
+            if subscribers:
+                subscribers.discard(client)
+                if not subscribers:
+                    del self.topics[topic]
+        for ticket_id in [ticket_id for ticket_id, (owner, _) in self.waiting.items() if owner is client]:
+            del self.waiting[ticket_id]
+
+    def subscribe(self, client, topic):
+        self.topics.setdefault(topic, set()).add(client)
+        self.subscriptions[client].add(topic)
+
+    def unsubscribe(self, client, topic):
+        subscribers = self.topics.get(topic)
+        if subscribers:
+            subscribers.discard(client)
+            if not subscribers:
+                del self.topics[topic]
+        self.subscriptions[client].discard(topic)
+
+    def publish(self, topic, message):
+        self.published += 1
+        for client in self.topics.get(topic, ()):
+            self.delivered += 1
+            client.deliver(topic, message)
+
+    def match(self, client, ticket):
+        if self.waiting:
+            ticket_id = next(iter(self.waiting))
+            _, waiting_ticket = self.waiting.pop(ticket_id)
+            return waiting_ticket
+        self.waiting[ticket["id"]] = (client, ticket)
+        return None
+
+    def requeue(self, ticket):
+        owner = self.nodes.get(ticket.get("node"))
+        if owner is None:
+            return
+        self.waiting = {ticket["id"]: (owner, ticket), **self.waiting}
+
+    def cancel(self, ticket_id):
+        return self.waiting.pop(ticket_id, None) is not None
+
+
+class LocalBroker(Broker):
+    """
+    Process içi broker: aynı hub'ı paylaşan GameServer'lar tek cluster gibi çalışır
+    Testler ve benchmark'lar için; mesajlar yine de asenkron teslim edilir
+    """
+
+    def __init__(self, hub=None):
+        super().__init__()
+        self.hub = hub if hub is not None else BrokerHub()
+
+    async def connect(self):
+        self.index = self.hub.register(self)
+        self.start_dispatcher()
+        return self.index
+
+    async def subscribe(self, topic, handler):
+        self.handlers[topic] = handler
+        self.hub.subscribe(self, topic)
+
+    async def unsubscribe(self, topic):
+        self.handlers.pop(topic, None)
+        self.hub.unsubscribe(self, topic)
+
+    def publish(self, topic, message):
+        self.hub.publish(topic, message)
+
+    async def match(self, ticket):
+        return self.hub.match(self, ticket)
+
+    async def requeue(self, ticket):
+        self.hub.requeue(ticket)
+
+    async def cancel_match(self, ticket_id):
+        return self.hub.cancel(ticket_id)
+
+    async def close(self):
+        self.hub.unregister(self)
+        self.stop_dispatcher()
+
+
+def encode_control(header):
+    """
+    Kontrol frame'i (hello, sub, match, reply ...): JSON başlık
+
+    Returns:
+        bytes: Uzunluk önekli frame
+    """
+    body = CONTROL + json.dumps(header, separators=(",", ":")).encode("utf-8")
+    return FRAME_HEADER.pack(len(body)) + body
+
+
+def encode_message(kind, topic, message):
+    """
+    Yayın frame'i: tür + topic uzunluğu + topic + mesaj
+    Broker bu frame'i mesajı çözmeden abonelere iletir
+
+    Args:
+        kind (bytes): PUBLISH (node -> broker) veya MESSAGE (broker -> node)
+        topic (str): Topic adı
+        message (str): Mesaj
+
+    Returns:
+        bytes: Uzunluk önekli frame
+    """
+    topic_bytes = topic.encode("utf-8")
+    body = kind + TOPIC_LENGTH.pack(len(topic_bytes)) + topic_bytes + message.encode("utf-8")
+    return FRAME_HEADER.pack(len(body)) + body
+
+
+def split_message(body):
+    """
+    Yayın frame'inin gövdesini ayır
+
+    Returns:
+        tuple: (topic: str, mesaj: bytes)
+    """
+    topic_end = 1 + TOPIC_LENGTH.size + TOPIC_LENGTH.unpack_from(body, 1)[0]
+    return body[1 + TOPIC_LENGTH.size:topic_end].decode("utf-8"), body[topic_end:]
+
+
+async def read_frames(reader):
+    """
+    Stream'den frame gövdelerini oku
+    Okuma parça parça yapılır; bir parçadaki tüm frame'ler tek seferde çıkarılır
+
+    Yields:
+        bytes: Frame gövdesi (tür byte'ı dahil)
+    """
+    buffer = bytearray()
+    while True:
+        chunk = await reader.read(READ_CHUNK)
+        if not chunk:
+            return
+        buffer += chunk
+        offset = 0
+        while len(buffer) - offset >= FRAME_HEADER.size:
+            size, = FRAME_HEADER.unpack_from(buffer, offset)
+            if size > MAX_FRAME:
+                raise ValueError(f"Frame çok büyük: {size} byte")
+            end = offset + FRAME_HEADER.size + size
+            if end > len(buffer):
+                break
+            yield bytes(buffer[offset + FRAME_HEADER.size:end])
+            offset = end
+        del buffer[:offset]
+
+
+class TcpBroker(Broker):
+    """
+    BrokerServer'a TCP ile bağlanan broker client'ı
+    Aynı makinedeki birden fazla server process'ini (örn. --workers) tek cluster yapar
+    """
+
+    def __init__(self, host="localhost", port=8790):
+        super().__init__()
+        self.host = host
+        self.port = port
+        self._reader = None
+        self._writer = None
+        self._receiver = None
+        self._requests = {}  # {request_id : Future}
+        self._request_ids = itertools.count(1)
+
+    async def connect(self):
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        self.start_dispatcher()
+        self._receiver = asyncio.create_task(self._receive_loop())
+        self.index = await self._request({"op": "hello"})
+        logger.info(f"Broker'a bağlanıldı: {self.host}:{self.port}, node {self.index}")
+        return self.index
+
+    def _write(self, frame):
+        if self._writer is None or self._writer.is_closing():
+            raise ConnectionError("Broker bağlantısı yok")
+        self._writer.write(frame)
+
+    async def _request(self, header):
+        request_id = next(self._request_ids)
+        future = asyncio.get_running_loop().create_future()
+        self._requests[request_id] = future
+        try:
+            self._write(encode_control(dict(header, id=request_id)))
+            return await future
+        finally:
+            self._requests.pop(request_id, None)
+
+    async def _receive_loop(self):
+        try:
+            async for body in read_frames(self._reader):
+                if body[:1] == MESSAGE:
+                    topic, message = split_message(body)
+                    self.deliver(topic, message.decode("utf-8"))
+                    continue
+                header = json.loads(body[1:])
+                future = self._requests.get(header.get("id"))
+                if future and not future.done():
+                    if "error" in header:
+                        future.set_exception(RuntimeError(header["error"]))
+                    else:
+                        future.set_result(header.get("result"))
+            logger.error("Broker bağlantısı kapandı")
+        except (ConnectionError, ValueError) as e:
+            logger.error(f"Broker bağlantısı koptu: {e}")
+        except asyncio.CancelledError:
+            pass
+        finally:
+            for future in self._requests.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Broker bağlantısı koptu"))
+
+    async def subscribe(self, topic, handler):
+        self.handlers[topic] = handler
+        self._write(encode_control({"op": "sub", "topic": topic}))
+
+    async def unsubscribe(self, topic):
+        self.handlers.pop(topic, None)
+        self._write(encode_control({"op": "unsub", "topic": topic}))
+
+    def publish(self, topic, message):
+        self._write(encode_message(PUBLISH, topic, message))
+
+    async def match(self, ticket):
+        return await self._request({"op": "match", "ticket": ticket})
+
+    async def requeue(self, ticket):
+        self._write(encode_control({"op": "requeue", "ticket": ticket}))
+
+    async def cancel_match(self, ticket_id):
+        return await self._request({"op": "cancel", "ticket_id": ticket_id})
+
+    async def close(self):
+        if self._receiver:
+            self._receiver.cancel()
+        self.stop_dispatcher()
+        if self._writer:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+            self._writer = None
+
+
+class NodeConnection:
+    """
+    BrokerServer tarafında bağlı bir node (hub client'ı)
+    Hub'dan gelen mesaj, abonelere olduğu gibi yazılacak hazır MESSAGE frame'idir
+    """
+
+    def __init__(self, writer):
+        self.writer = writer
+
+    def deliver(self, topic, frame):
+        if self.writer.is_closing():
+            return
+        if self.writer.transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+            logger.warning("Yavaş node'un broker bağlantısı kesildi (yazma tamponu dolu)")
+            self.writer.close()
+            return
+        self.writer.write(frame)
+
+
+class BrokerServer:
+    """
+    Yerel TCP broker'ı: tek process'te bir BrokerHub'ı TcpBroker client'larına açar
+    Test ve tek makinelik kurulumlar için; dağıtık bir broker'ın yerine geçer
+    """
+
+    def __init__(self, host="localhost", port=8790):
+        self.host = host
+        self.port = port
+        self.hub = BrokerHub()
+        self._server = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self.handle_node, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"Broker çalışıyor: {self.host}:{self.port}")
+
+    async def handle_node(self, reader, writer):
+        """
+        Node bağlantısının frame'lerini hub'a uygula
+        Yayınlar çözülmeden, tür byte'ı değiştirilerek abonelere iletilir
+        """
+        node = NodeConnection(writer)
+        index = None
+        try:
+            async for body in read_frames(reader):
+                if body[:1] == PUBLISH:
+                    topic, _ = split_message(body)
+                    self.hub.publish(topic, FRAME_HEADER.pack(len(body)) + MESSAGE + body[1:])
+                    continue
+                header = json.loads(body[1:])
+                op = header.get("op")
+                if op == "sub":
+                    self.hub.subscribe(node, header["topic"])
+                elif op == "unsub":
+                    self.hub.unsubscribe(node, header["topic"])
+                elif op == "match":
+                    self.reply(writer, header, self.hub.match(node, header["ticket"]))
+                elif op == "requeue":
+                    self.hub.requeue(header["ticket"])
+                elif op == "cancel":
+                    self.reply(writer, header, self.hub.cancel(header["ticket_id"]))
+                elif op == "hello" and index is None:
+                    try:
+                        index = self.hub.register(node)
+                        self.reply(writer, header, index)
+                        logger.info(f"Node {index} bağlandı")
+                    except RuntimeError as e:
+                        writer.write(encode_control({"op": "reply", "id": header.get("id"), "error": str(e)}))
+                        break
+                await writer.drain()
+        except (ConnectionError, ValueError):
+            pass
+        except Exception as e:
+            logger.error(f"Broker node hatası: {e}")
+        finally:
+            if index is not None:
+                self.hub.unregister(node)
+                logger.info(f"Node {index} ayrıldı")
+            writer.close()
+
+    @staticmethod
+    def reply(writer, header, result):
+        writer.write(encode_control({"op": "reply", "id": header.get("id"), "result": result}))
+
+    async def close(self):
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+
+def broker_from_url(url):
+    """
+    Broker URL'inden client oluştur
+
+    Args:
+        url (str): "tcp://host:port"
+
+    Returns:
+        Broker: Broker client'ı
+    """
+    scheme, _, address = url.partition("://")
+    host, _, port = address.rpartition(":")
+    if scheme != "tcp" or not host or not port.isdigit():
+        raise ValueError(f"Geçersiz broker adresi: {url} (örn. tcp://localhost:8790)")
+    return TcpBroker(host, int(port))
+
+
+async def main():
+    """
+    Yerel TCP broker'ını başlat
+    """
+    parser = argparse.ArgumentParser(description="Yerel cluster broker'ı")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8790)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    server = BrokerServer(args.host, args.port)
+    await server.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
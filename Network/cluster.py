@@ -0,0 +1,470 @@
+import asyncio
+import itertools
+import json
+import logging
+from Network.broker import MAX_NODES
+from Network.spectator import Subscriber
+from Utils.protocol import MessageType
+
+logger = logging.getLogger(__name__)
+
+# Node'lar arası mesaj türleri: "tür gönderen_node conn_id room_id\npayload"
+JOIN = "join"            # oyuncuyu owner'daki room'a oturt (payload: join verisi)
+MOVE = "move"            # oyuncu hamlesi (payload: move verisi)
+LEAVE = "leave"          # oyuncunun bağlantısı koptu / room'dan ayrıldı
+REJECT = "reject"        # room'a oturtulamadı, tekrar eşleştir (payload: join verisi)
+FRAME = "frame"          # oyuncuya gönderilecek frame
+WATCH = "watch"          # node'un izleyicileri için room'a abone ol
+UNWATCH = "unwatch"      # node'da izleyici kalmadı
+ROOM = "room"            # room'un izleyici frame'i (node başına bir kez)
+UNWATCHED = "unwatched"  # abonelik owner tarafından sonlandırıldı (payload: sebep)
+
+MATCH_ATTEMPTS = 8
+
+
+def node_topic(index):
+    return f"node.{index}"
+
+
+def frame_type(frame):
+    """
+    JSON frame'in "type" alanı (json.dumps çıktısında ilk alan)
+    """
+    if frame.startswith('{"type": "'):
+        end = frame.find('"', 10)
+        if end > 0:
+            return frame[10:end]
+    return json.loads(frame).get("type")
+
+
+class RemoteConnection:
+    """
+    Başka node'daki oyuncunun owner node'daki temsilcisi
+
+    Server kodu için websocket gibi davranır: room'a oyuncu olarak eklenir,
+    gönderilen frame'ler broker üzerinden oyuncunun bağlı olduğu node'a iletilir.
+    """
+    __slots__ = ("cluster", "node", "conn_id", "remote_address", "closed")
+
+    def __init__(self, cluster, node, conn_id):
+        self.cluster = cluster
+        self.node = node  # Oyuncunun bağlı olduğu node
+        self.conn_id = conn_id
+        self.remote_address = None
+        self.closed = False
+
+    async def send(self, data):
+        if not self.closed:
+            self.cluster.send(self.node, FRAME, self.conn_id, 0, data)
+
+    async def close(self, code=1000, reason=""):
+        self.closed = True
+
+
+class RemoteWatcher:
+    """
+    Bir node'daki tüm izleyicilerin owner room'daki tek aboneliği
+
+    Room'un Subscriber kuyruğu (coalescing dahil) bu nesneye yazar; frame
+    node başına bir kez gönderilir, node kendi izleyicilerine dağıtır.
+    """
+    __slots__ = ("cluster", "node", "room_id", "remote_address", "closed")
+
+    def __init__(self, cluster, node, room_id):
+        self.cluster = cluster
+        self.node = node
+        self.room_id = room_id
+        self.remote_address = None
+        self.closed = False
+
+    async def send(self, data):
+        if not self.closed:
+            self.cluster.send(self.node, ROOM, 0, self.room_id, data)
+
+    async def close(self, code=1000, reason=""):
+        # Subscriber düşürüldü veya room silindi
+        if self.closed:
+            return
+        self.closed = True
+        self.cluster.watch_proxies.pop((self.node, self.room_id), None)
+        self.cluster.send(self.node, UNWATCHED, 0, self.room_id, "İzleme sonlandı")
+
+
+class ClusterNode:
+    """
+    GameServer'ın cluster üyeliği: broker üzerinden eşleştirme, room sahipliği
+    ve node'lar arası fan-out
+
+    - Room id'leri node index'ini taşır (room_id % MAX_NODES), sahip node
+      kayıt tutmadan id'den bulunur
+    - Eşleştirme broker'daki tek kuyruktandır: ilk gelen oyuncu kendi node'unda
+      waiting room açar, ikinci oyuncu o room'a (gerekirse uzaktan) oturur
+    - Oyun her zaman sahibi olan node'da oynanır; uzak oyuncu owner'da
+      RemoteConnection ile temsil edilir, hamleleri owner'a iletilir
+    - Uzak room'un izleyicileri için owner'a node başına tek abonelik açılır
+    """
+
+    def __init__(self, server, broker):
+        self.server = server
+        self.broker = broker
+        self.index = None
+        self._room_ids = itertools.count(1)
+        self._conn_ids = itertools.count(1)
+        self._tasks = set()
+
+        # Bu node'a bağlı client'lar (ingress)
+        self.conn_ids = {}  # {websocket : conn_id}
+        self.connections = {}  # {conn_id : websocket}
+        self.remote_players = {}  # {websocket : owner node} oyunu başka node'da olan oyuncular
+        self.watched = {}  # {room_id : {websocket : Subscriber}} uzak room izleyicileri
+        self.last_states = {}  # {room_id : frame} yeni izleyiciye gönderilecek son state
+
+        # Bu node'un room'ları (owner)
+        self.queued = {}  # {room_id : ticket_id} broker kuyruğundaki waiting room'lar
+        self.reserved = {}  # {room_id : asyncio.Event} bileti kuyrukta, oyuncusu henüz oturmamış
+        self.proxies = {}  # {(node, conn_id) : RemoteConnection}
+        self.watch_proxies = {}  # {(node, room_id) : RemoteWatcher}
+
+    async def start(self):
+        """
+        Broker'a bağlan ve node topic'ine abone ol
+        """
+        self.index = await self.broker.connect()
+        await self.broker.subscribe(node_topic(self.index), self.on_message)
+        logger.info(f"Cluster node {self.index} hazır")
+
+    async def close(self):
+        for task in list(self._tasks):
+            task.cancel()
+        await self.broker.close()
+
+    def owner(self, room_id):
+        return room_id % MAX_NODES
+
+    def is_remote(self, room_id):
+        """
+        Room id'si başka bir node'un room'u mu?
+        """
+        return (isinstance(room_id, int) and not isinstance(room_id, bool) and room_id > 0
+                and self.owner(room_id) != self.index)
+
+    def allocate_room_id(self):
+        """
+        Bu node'a ait yeni room id'si (node index'i id'nin içinde)
+        """
+        while True:
+            room_id = next(self._room_ids) * MAX_NODES + self.index
+            if room_id not in self.server.game_rooms:
+                return room_id
+
+    def conn_id(self, websocket):
+        conn = self.conn_ids.get(websocket)
+        if conn is None:
+            conn = next(self._conn_ids)
+            self.conn_ids[websocket] = conn
+            self.connections[conn] = websocket
+        return conn
+
+    def send(self, node, kind, conn=0, room=0, payload=""):
+        """
+        Node'a cluster mesajı gönder (bloklamaz)
+        """
+        try:
+            self.broker.publish(node_topic(node), f"{kind} {self.index} {conn} {room}\n{payload}")
+        except ConnectionError as e:
+            logger.error(f"Cluster mesajı gönderilemedi: {e}")
+
+    def spawn(self, coroutine):
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def is_connected(self, websocket):
+        return websocket in self.conn_ids and not getattr(websocket, "closed", False)
+
+    async def matchmake(self, websocket, player_data):
+        """
+        Oyuncuyu cluster kuyruğundan eşleştir
+
+        Kuyrukta bekleyen yoksa bu node'da waiting room açılır ve bileti kuyruğa
+        girer; varsa oyuncu bekleyenin room'una (başka node'daysa uzaktan) oturur.
+
+        Args:
+            websocket: Client websocket
+            player_data (dict): Doğrulanmış oyuncu verisi
+        """
+        self.leave(websocket)
+        conn = self.conn_id(websocket)
+        for _ in range(MATCH_ATTEMPTS):
+            room_id = self.allocate_room_id()
+            ticket = {"id": f"{self.index}:{room_id}", "node": self.index, "room": room_id}
+            # Bilet kuyruğa girdiği anda başka node'dan JOIN gelebilir;
+            # oyuncu oturana kadar bekletilir
+            event = self.reserved[room_id] = asyncio.Event()
+            try:
+                partner = await self.broker.match(ticket)
+                if not self.is_connected(websocket):
+                    # Oyuncu beklerken ayrıldı: kendi bileti iptal edilir,
+                    # aldığı bilet başkası için kuyruğa döner
+                    if partner is None:
+                        self.spawn(self.broker.cancel_match(ticket["id"]))
+                    else:
+                        await self.broker.requeue(partner)
+                    return
+                if partner is None:
+                    room = self.server.create_game_room(room_id)
+                    self.queued[room_id] = ticket["id"]
+                    await self.server.seat_player(websocket, player_data, room)
+                    return
+            finally:
+                event.set()
+                del self.reserved[room_id]
+
+            owner = partner["node"]
+            if owner == self.index:
+                room = self.server.game_rooms.get(partner["room"])
+                self.queued.pop(partner["room"], None)
+                if self.open_seat(room):
+                    await self.server.seat_player(websocket, player_data, room)
+                    return
+                # Bekleyen oyuncu ayrılmış, tekrar dene
+                continue
+
+            self.remote_players[websocket] = owner
+            self.send(owner, JOIN, conn, partner["room"], json.dumps({"player": player_data}))
+            return
+
+        await self.server.send_error(websocket, "Eşleştirme başarısız, tekrar deneyin")
+
+    async def rejoin(self, websocket, data):
+        """
+        Başka node'daki yarım kalan oyuna geri dönüş isteğini owner'a ilet
+
+        Returns:
+            bool: İstek iletildi mi? (room bu node'unsa False)
+        """
+        room_id = data.get("room_id")
+        if not self.is_remote(room_id):
+            return False
+        self.leave(websocket)
+        owner = self.owner(room_id)
+        self.remote_players[websocket] = owner
+        payload = json.dumps({"player": data.get("player"), "room_id": room_id})
+        self.send(owner, JOIN, self.conn_id(websocket), room_id, payload)
+        return True
+
+    def open_seat(self, room):
+        """
+        Room'da ikinci oyuncuyu bekleyen bağlı bir oyuncu var mı?
+        """
+        return (room is not None and room.game is None and len(room.players) == 1
+                and room.players[0]["websocket"] is not None)
+
+    def forward_move(self, websocket, data):
+        """
+        Uzak room'daki oyuncunun hamlesini owner node'a ilet
+        """
+        self.send(self.remote_players[websocket], MOVE, self.conn_ids[websocket], 0, json.dumps(data))
+
+    def leave(self, websocket):
+        """
+        Oyuncunun uzak room'dan ve eşleştirme kuyruğundan ayrılması
+        """
+        owner = self.remote_players.pop(websocket, None)
+        if owner is not None:
+            self.send(owner, LEAVE, self.conn_ids[websocket])
+        room = self.server.player_rooms.get(websocket)
+        if room and room.room_id in self.queued:
+            room.remove_player(websocket)
+            del self.server.player_rooms[websocket]
+            self.drop_waiting_room(room)
+
+    def drop_waiting_room(self, room):
+        """
+        Oyuncusu ayrılan waiting room'un kuyruktaki biletini iptal et, boşsa room'u sil
+        Bilet zaten alındıysa gelen JOIN boş koltuk bulamaz ve reddedilir
+        """
+        ticket_id = self.queued.pop(room.room_id, None)
+        if ticket_id is not None:
+            self.spawn(self.broker.cancel_match(ticket_id))
+        if not room.players:
+            self.server.remove_game_room(room)
+
+    def release(self, websocket, room=None):
+        """
+        Bağlantı kapandı: uzak oyun, kuyruk bileti ve node kayıtlarını temizle
+
+        Args:
+            websocket: Client websocket
+            room (GameRoom, optional): Oyuncunun bu node'daki room'u
+        """
+        owner = self.remote_players.pop(websocket, None)
+        conn = self.conn_ids.pop(websocket, None)
+        if conn is not None:
+            del self.connections[conn]
+            if owner is not None:
+                self.send(owner, LEAVE, conn)
+        if room and room.room_id in self.queued:
+            self.drop_waiting_room(room)
+
+    async def spectate(self, websocket, room_id):
+        """
+        Uzak room'u izle: node'un ilk izleyicisi owner'a abonelik açar
+
+        Args:
+            websocket: İzleyici websocket
+            room_id (int): Başka node'daki room
+        """
+        watchers = self.watched.get(room_id)
+        if watchers is None:
+            watchers = self.watched[room_id] = {}
+            self.send(self.owner(room_id), WATCH, 0, room_id)
+        subscriber = Subscriber(websocket)
+        watchers[websocket] = subscriber
+        state = self.last_states.get(room_id)
+        if state:
+            subscriber.push(MessageType.GAME_STATE.value, state)
+
+    def unwatch(self, websocket, room_id):
+        """
+        Uzak room izleyicisini çıkar; node'da izleyici kalmadıysa aboneliği kapat
+        """
+        watchers = self.watched.get(room_id)
+        if not watchers:
+            return
+        subscriber = watchers.pop(websocket, None)
+        if subscriber:
+            subscriber.close()
+        if not watchers:
+            del self.watched[room_id]
+            self.last_states.pop(room_id, None)
+            self.send(self.owner(room_id), UNWATCH, 0, room_id)
+
+    def proxy(self, node, conn):
+        key = (node, conn)
+        proxy = self.proxies.get(key)
+        if proxy is None:
+            proxy = self.proxies[key] = RemoteConnection(self, node, conn)
+        return proxy
+
+    async def on_message(self, message):
+        """
+        Node topic'ine gelen cluster mesajını işle
+        """
+        head, _, payload = message.partition("\n")
+        kind, sender, conn, room_id = head.split(" ")
+        sender, conn, room_id = int(sender), int(conn), int(room_id)
+
+        if kind == FRAME:
+            websocket = self.connections.get(conn)
+            if websocket:
+                try:
+                    await websocket.send(payload)
+                except Exception as e:
+                    logger.debug(f"Uzak frame gönderilemedi: {e}")
+        elif kind == MOVE:
+            proxy = self.proxies.get((sender, conn))
+            if proxy:
+                await self.server.handle_player_move(proxy, json.loads(payload))
+        elif kind == ROOM:
+            self.on_room_frame(room_id, payload)
+        elif kind == JOIN:
+            await self.on_join(sender, conn, room_id, payload)
+        elif kind == REJECT:
+            self.on_reject(sender, conn, payload)
+        elif kind == LEAVE:
+            proxy = self.proxies.pop((sender, conn), None)
+            if proxy:
+                proxy.closed = True
+                self.server.release_client(proxy)
+        elif kind == WATCH:
+            self.on_watch(sender, room_id)
+        elif kind == UNWATCH:
+            proxy = self.watch_proxies.pop((sender, room_id), None)
+            room = self.server.game_rooms.get(room_id)
+            if proxy and room:
+                proxy.closed = True
+                room.remove_spectator(proxy)
+        elif kind == UNWATCHED:
+            self.on_unwatched(room_id, payload)
+
+    async def on_join(self, sender, conn, room_id, payload):
+        """
+        Başka node'daki oyuncuyu bu node'un room'una oturt (geri dönüş veya eşleşme)
+        """
+        event = self.reserved.get(room_id)
+        if event:
+            await event.wait()
+        data = json.loads(payload)
+        proxy = self.proxy(sender, conn)
+        room = self.server.game_rooms.get(room_id)
+
+        if data.get("room_id") == room_id:
+            if room and room.rebind_player(proxy, data.get("player", {}), data.get("resume_token")):
+                self.server.player_rooms[proxy] = room
+                await self.server.resume_room_game(room, proxy)
+                return
+        elif self.open_seat(room):
+            self.queued.pop(room_id, None)
+            if await self.server.seat_player(proxy, data["player"], room):
+                return
+
+        self.proxies.pop((sender, conn), None)
+        self.send(sender, REJECT, conn, room_id, payload)
+
+    def on_reject(self, sender, conn, payload):
+        """
+        Owner oyuncuyu oturtamadı: oyuncu tekrar eşleştirilir
+        """
+        websocket = self.connections.get(conn)
+        if websocket is None or self.remote_players.get(websocket) != sender:
+            return
+        del self.remote_players[websocket]
+        if self.server.draining:
+            self.spawn(self.server.send_error(websocket, "Server kapanıyor, yeni oyun kabul edilmiyor"))
+            return
+        self.spawn(self.matchmake(websocket, json.loads(payload)["player"]))
+
+    def on_watch(self, sender, room_id):
+        room = self.server.game_rooms.get(room_id)
+        if not room:
+            self.send(sender, UNWATCHED, 0, room_id, f"Room bulunamadı: {room_id}")
+            return
+        key = (sender, room_id)
+        if key not in self.watch_proxies:
+            proxy = self.watch_proxies[key] = RemoteWatcher(self, sender, room_id)
+            room.add_spectator(proxy)
+
+    def on_room_frame(self, room_id, frame):
+        """
+        Uzak room'un frame'ini bu node'daki izleyicilerine dağıt
+        """
+        watchers = self.watched.get(room_id)
+        if not watchers:
+            return
+        message_type = frame_type(frame)
+        if message_type == MessageType.GAME_STATE.value:
+            self.last_states[room_id] = frame
+        dropped = [ws for ws, subscriber in watchers.items() if not subscriber.push(message_type, frame)]
+        for ws in dropped:
+            del watchers[ws]
+            self.server.spectating.pop(ws, None)
+        if not watchers:
+            del self.watched[room_id]
+            self.last_states.pop(room_id, None)
+            self.send(self.owner(room_id), UNWATCH, 0, room_id)
+
+    def on_unwatched(self, room_id, reason):
+        """
+        Owner aboneliği kapattı: izleyicilere bildir (bağlantıları açık kalır)
+        """
+        watchers = self.watched.pop(room_id, None)
+        self.last_states.pop(room_id, None)
+        if not watchers:
+            return
+        for ws, subscriber in watchers.items():
+            # Owner'dan son gelen frame'ler (GAME_END) önce gönderilir
+            subscriber.close(close_socket=False, drain=True)
+            self.server.spectating.pop(ws, None)
+            self.spawn(self.server.send_error(ws, reason))
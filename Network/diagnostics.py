@@ -0,0 +1,325 @@
+import asyncio
+import gc
+import logging
+import random
+import sys
+import threading
+import time
+import tracemalloc
+import types
+from collections import deque
+from enum import Enum
+
+logger = logging.getLogger(__name__)
+
+# İçine girilmeyen (paylaşılan veya Python'un kendi yapıları olan) türler
+SHARED_TYPES = (
+    type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType,
+    types.CodeType, types.FrameType, types.GeneratorType, types.CoroutineType, types.AsyncGeneratorType,
+    Enum, asyncio.AbstractEventLoop, asyncio.Future, asyncio.Event, asyncio.BaseTransport,
+    asyncio.BaseProtocol, logging.Logger, logging.LoggerAdapter, type(threading.Lock()),
+)
+ATOMIC_TYPES = (str, bytes, bytearray, int, float, complex, bool, memoryview, range)
+# Nesne sayımında raporlanan modüller (oyun nesneleri ve bağlantı yapıları)
+COUNTED_MODULES = ("Game.", "Network.", "Utils.", "websockets.")
+
+
+def deep_size(root, skip=()):
+    """
+    Nesnenin ve ondan erişilen nesnelerin yaklaşık bellek kullanımı
+
+    sys.getsizeof ile sayılır: container'lar, __dict__ ve __slots__ takip
+    edilir. Paylaşılan nesnelere (sınıflar, fonksiyonlar, enum'lar, event
+    loop, transport'lar, diğer bağlantılar) ve `skip` türlerine girilmez;
+    kökün kendisi her zaman sayılır. C kütüphanelerinin kendi ayırdığı bellek
+    (ör. zlib tamponları) görünmez, bunun için tracemalloc raporuna bakılır.
+
+    Args:
+        root: Ölçülecek nesne
+        skip (tuple): İçine girilmeyecek ek türler
+
+    Returns:
+        tuple: (bytes, nesne sayısı)
+    """
+    seen = set()
+    size = count = 0
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if obj is None or id(obj) in seen:
+            continue
+        if obj is not root and (isinstance(obj, SHARED_TYPES) or isinstance(obj, skip)):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        count += 1
+        if isinstance(obj, ATOMIC_TYPES):
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+            stack.extend(obj)
+        else:
+            attrs = getattr(obj, "__dict__", None)
+            if attrs is not None:
+                stack.append(attrs)
+            for cls in type(obj).__mro__:
+                slots = cls.__dict__.get("__slots__", ())
+                for slot in (slots,) if isinstance(slots, str) else slots:
+                    if slot not in ("__dict__", "__weakref__"):
+                        stack.append(getattr(obj, slot, None))
+    return size, count
+
+
+class MemoryDiagnostics:
+    """
+    Room ve bağlantı başına bellek / nesne muhasebesi
+
+    report() çalışma anında (local socket komutu veya SIGUSR2 ile) çağrılır:
+    - Room'lar: status başına sayı, örneklenen room'ların ortalama boyutu ve
+      toplam tahmin, en büyük room'lar, oyuncusu kalmamış (sızıntı adayı) room'lar
+    - Bağlantılar: bağlantının kendisi + server'ın o bağlantı için tuttuğu
+      state (rate limit, saat senkronu, oturumlar, izleyici kuyruğu)
+    - Sınıf başına canlı nesne sayısı (GameRoom, Game, GameBoard, Player, ...)
+    - tracemalloc açıksa: kod satırı başına en çok ayıran yerler
+    - Önceki rapora göre büyüme (sayılar ve tracemalloc farkı)
+
+    Rapor loop thread'inde üretilir ve o süre boyunca loop'u bekletir. Derin
+    boyut ölçümü örneklenen room/bağlantı sayısıyla (sample) sınırlıdır;
+    room'lar sadece status sayımı için gezilir. Nesne sayımı (objects=True)
+    gc.get_objects() ile tüm heap'i gezer.
+    """
+
+    def __init__(self, server, sample=500, top=15):
+        self.server = server
+        self.sample = sample  # Boyutu ölçülen en fazla room / bağlantı
+        self.top = top
+        self.previous = None  # Önceki raporun büyüme karşılaştırması için özeti
+        self._snapshot = None  # Önceki tracemalloc snapshot'ı
+        self._skip = None
+        self.reports = 0
+
+    @staticmethod
+    def start_tracing(frames=1):
+        """
+        tracemalloc'u başlat (sonraki ayırmalar izlenir)
+
+        Args:
+            frames (int): Ayırma başına saklanan stack derinliği
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+
+    def room_usage(self, room):
+        """
+        Room'un kendine ait belleği: GameRoom, Game, GameBoard, Player'lar, saat,
+        oyuncu bilgileri. Bağlantılar, izleyiciler ve paylaşılan server
+        nesneleri dahil edilmez.
+
+        Returns:
+            tuple: (bytes, nesne sayısı)
+        """
+        return deep_size(room, skip=self._room_skip())
+
+    def connection_usage(self, websocket):
+        """
+        Bağlantının belleği: websocket / sarmalayıcı nesnesi ve server'ın o
+        bağlantı için tuttuğu kayıtlar
+
+        Returns:
+            tuple: (bytes, nesne sayısı)
+        """
+        server = self.server
+        roots = [websocket]
+        # Sarmalanmış asıl websockets bağlantısı (OutboundConnection) da sayılır
+        inner = getattr(websocket, "connection", None)
+        if inner is not None:
+            roots.append(inner)
+        for table in (server.connection_buckets, server.clock_sync, server._last_errors, server.admins):
+            entry = table.get(websocket)
+            if entry is not None:
+                roots.append(entry)
+        roots.extend(server.sessions.get(websocket, {}).values())
+        room_id = server.spectating.get(websocket)
+        room = server.game_rooms.get(room_id) if room_id is not None else None
+        if room and websocket in room.spectators:
+            roots.append(room.spectators[websocket])
+        skip = self._room_skip()
+        size = count = 0
+        for root in roots:
+            root_size, root_count = deep_size(root, skip=skip)
+            size += root_size
+            count += root_count
+        return size, count
+
+    def _room_skip(self):
+        """
+        Room ve bağlantı ölçümünde içine girilmeyen server türleri (import döngüsü
+        olmaması için ilk kullanımda yüklenir)
+        """
+        if self._skip is not None:
+            return self._skip
+        from Network.websocket_server import GameRoom, GameServer
+        from Network.server_stats import ServerStats
+        from Network.spectator import Subscriber
+        from Network.tournament import TournamentRun, TournamentManager
+        from Network.multiplex import SessionChannel
+        from Network.outbound import OutboundConnection, OutboundScheduler
+        from Network.bot import BotConnection
+        from Network.transport import MemoryConnection, MemoryTransport
+        self._skip = (GameServer, GameRoom, ServerStats, Subscriber, TournamentRun, TournamentManager,
+                      SessionChannel, OutboundConnection, OutboundScheduler, BotConnection,
+                      MemoryConnection, MemoryTransport)
+        return self._skip
+
+    def rooms_report(self):
+        """
+        Room sayıları ve örneklenen room'ların boyutları
+        """
+        rooms = list(self.server.game_rooms.values())
+        by_status = {}
+        stale = 0  # Bağlı oyuncusu ve izleyicisi olmayan room'lar
+        for room in rooms:
+            by_status[room.status.name] = by_status.get(room.status.name, 0) + 1
+            if not room.spectators and room.connected_count() == 0:
+                stale += 1
+        sampled = rooms if len(rooms) <= self.sample else random.sample(rooms, self.sample)
+        skip = self._room_skip()
+        usage = []
+        for room in sampled:
+            size, count = deep_size(room, skip=skip)
+            usage.append((size, count, room))
+        total_size = sum(size for size, _, _ in usage)
+        total_objects = sum(count for _, count, _ in usage)
+        average = total_size / len(usage) if usage else 0
+        usage.sort(key=lambda item: -item[0])
+        return {
+            "count": len(rooms),
+            "by_status": by_status,
+            "stale": stale,
+            "sampled": len(usage),
+            "avg_bytes": round(average),
+            "avg_objects": round(total_objects / len(usage), 1) if usage else 0,
+            "est_total_bytes": round(average * len(rooms)),
+            "largest": [{"room_id": room.room_id, "status": room.status.name, "bytes": size, "objects": count}
+                        for size, count, room in usage[:5]]
+        }
+
+    def connections_report(self):
+        """
+        Bağlantı sayısı ve örneklenen bağlantıların boyutları
+        """
+        clients = list(self.server.clients)
+        sampled = clients if len(clients) <= self.sample else random.sample(clients, self.sample)
+        usage = [self.connection_usage(ws) for ws in sampled]
+        total_size = sum(size for size, _ in usage)
+        average = total_size / len(usage) if usage else 0
+        return {
+            "count": len(clients),
+            "sessions": sum(len(channels) for channels in self.server.sessions.values()),
+            "spectators": len(self.server.spectating),
+            "sampled": len(usage),
+            "avg_bytes": round(average),
+            "avg_objects": round(sum(count for _, count in usage) / len(usage), 1) if usage else 0,
+            "est_total_bytes": round(average * len(clients))
+        }
+
+    @staticmethod
+    def object_counts():
+        """
+        Oyun ve ağ modüllerindeki sınıfların canlı nesne sayıları (gc ile)
+        Önce döngüsel çöp toplanır: kapanmış bağlantıların henüz toplanmamış
+        nesneleri büyüme farkında sızıntı gibi görünmesin.
+
+        Returns:
+            dict: {"Modül.Sınıf" : sayı} en çoktan aza
+        """
+        gc.collect()
+        counts = {}
+        for obj in gc.get_objects():
+            cls = type(obj)
+            module = cls.__module__
+            if module.startswith(COUNTED_MODULES):
+                name = f"{module}.{cls.__qualname__}"
+                counts[name] = counts.get(name, 0) + 1
+        return dict(sorted(counts.items(), key=lambda item: -item[1]))
+
+    def allocators(self, snapshot):
+        """
+        tracemalloc: kod satırı başına en çok bellek tutan yerler
+        """
+        stats = snapshot.statistics("lineno")[:self.top]
+        return [{"where": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                 "bytes": stat.size, "blocks": stat.count} for stat in stats]
+
+    def report(self, objects=True):
+        """
+        Bellek raporu üret ve önceki rapora göre büyümeyi hesapla
+
+        Args:
+            objects (bool): Sınıf başına nesne sayımı yapılsın mı? (tüm heap gezilir)
+
+        Returns:
+            dict: JSON'a çevrilebilir rapor
+        """
+        started = time.perf_counter()
+        report = {
+            "time": time.time(),
+            "rooms": self.rooms_report(),
+            "connections": self.connections_report()
+        }
+        if objects:
+            report["objects"] = self.object_counts()
+
+        snapshot = None
+        if tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot().filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>")))
+            current, peak = tracemalloc.get_traced_memory()
+            report["tracemalloc"] = {"current": current, "peak": peak, "top": self.allocators(snapshot)}
+
+        summary = {
+            "time": report["time"],
+            "rooms": report["rooms"]["count"],
+            "by_status": report["rooms"]["by_status"],
+            "room_bytes": report["rooms"]["est_total_bytes"],
+            "connections": report["connections"]["count"],
+            "connection_bytes": report["connections"]["est_total_bytes"],
+            "objects": report.get("objects", {})
+        }
+        if self.previous:
+            report["growth"] = self._growth(self.previous, summary, snapshot)
+        self.previous = summary
+        if snapshot is not None:
+            self._snapshot = snapshot
+        self.reports += 1
+        report["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return report
+
+    def _growth(self, old, new, snapshot):
+        """
+        İki rapor arasındaki fark (sadece değişenler)
+        """
+        def delta(old_counts, new_counts):
+            keys = set(old_counts) | set(new_counts)
+            changes = {key: new_counts.get(key, 0) - old_counts.get(key, 0) for key in keys}
+            return dict(sorted(((key, value) for key, value in changes.items() if value),
+                               key=lambda item: -abs(item[1])))
+
+        growth = {
+            "seconds": round(new["time"] - old["time"], 1),
+            "rooms": new["rooms"] - old["rooms"],
+            "by_status": delta(old["by_status"], new["by_status"]),
+            "room_bytes": new["room_bytes"] - old["room_bytes"],
+            "connections": new["connections"] - old["connections"],
+            "connection_bytes": new["connection_bytes"] - old["connection_bytes"],
+            "objects": dict(list(delta(old["objects"], new["objects"]).items())[:self.top])
+        }
+        if snapshot is not None and self._snapshot is not None:
+            growth["allocators"] = [
+                {"where": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                 "bytes": stat.size_diff, "blocks": stat.count_diff}
+                for stat in snapshot.compare_to(self._snapshot, "lineno")[:self.top] if stat.size_diff]
+        return growth
@@ -0,0 +1,72 @@
+import json
+
+MAX_SESSION_ID_LENGTH = 64
+
+
+def valid_session_id(session_id):
+    """
+    Oturum id'si: boş olmayan kısa string veya tam sayı
+
+    Returns:
+        bool: Geçerli mi?
+    """
+    if isinstance(session_id, bool):
+        return False
+    if isinstance(session_id, int):
+        return True
+    return isinstance(session_id, str) and 0 < len(session_id) <= MAX_SESSION_ID_LENGTH
+
+
+class SessionChannel:
+    """
+    Tek bir websocket üzerindeki oturumlardan biri (multiplexed mod)
+
+    Server kodu için websocket gibi davranır: room'lar, player_rooms index'i,
+    broadcast ve izleyici kuyrukları bu nesneyi normal bir bağlantı gibi kullanır.
+    Giden her JSON frame'e, yeniden parse etmeden, oturum id'si eklenir:
+        {"type": ...}  ->  {"session": "s1", "type": ...}
+    """
+    __slots__ = ("connection", "session_id", "remote_address", "closed", "_prefix", "_on_close")
+
+    def __init__(self, connection, session_id, on_close=None):
+        self.connection = connection  # Asıl websocket
+        self.session_id = session_id
+        self.remote_address = getattr(connection, "remote_address", None)
+        self.closed = False
+        self._prefix = '{"session": ' + json.dumps(session_id) + ', '
+        self._on_close = on_close  # Oturum kapanınca server kaynakları serbest bırakır
+
+    def tag(self, data):
+        """
+        JSON frame'e oturum id'sini ekle
+        """
+        if data.startswith("{") and data != "{}":
+            return self._prefix + data[1:]
+        return data
+
+    def push(self, data):
+        """
+        Frame'i asıl bağlantının giden tamponuna beklemeden ekle (OutboundConnection)
+
+        Returns:
+            bool: Eklendi mi? (False ise send() kullanılmalı)
+        """
+        if self.closed:
+            return True
+        push = getattr(self.connection, "push", None)
+        return push is not None and push(self.tag(data))
+
+    async def send(self, data):
+        if self.closed:
+            return
+        await self.connection.send(self.tag(data))
+
+    async def close(self, code=1000, reason=""):
+        """
+        Sadece oturumu kapatır; asıl bağlantı ve diğer oturumlar etkilenmez
+        """
+        if self.closed:
+            return
+        self.closed = True
+        if self._on_close:
+            self._on_close(self)
@@ -0,0 +1,204 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+import itertools
+import json
+import websockets
+from Utils.protocol import GameProtocol, MessageType
+from Network.transport import WebSocketTransport
+
+
+class GameSession:
+    """
+    Multiplexed bağlantı üzerindeki tek bir oyun
+
+    GameClient'ın tek oyunluk API'sinin async karşılığı: kendi room_id ve
+    player_symbol'u vardır, mesajları kendi kuyruğundan okur.
+    """
+
+    def __init__(self, client, session_id):
+        self.client = client
+        self.session_id = session_id
+        self.room_id = None
+        self.player_symbol = None
+        self.game_state = None  # Son alınan game_state verisi
+        self.result = None  # game_end verisi
+        self.queue = asyncio.Queue()
+        self.closed = False
+
+    async def send_message(self, message):
+        """
+        Mesajı oturum id'siyle etiketleyip gönder
+
+        Args:
+            message (dict): Gönderilecek mesaj
+
+        Returns:
+            bool: Gönderme başarılı mı?
+        """
+        message["session"] = self.session_id
+        return await self.client.send_message(message)
+
+    async def recv(self):
+        """
+        Oturumun sıradaki mesajı (bağlantı koptuysa None)
+        """
+        message = await self.queue.get()
+        if message is None:
+            return None
+        message_type = message.get("type")
+        data = message.get("data", {})
+        if message_type == MessageType.WAITING.value:
+            self.room_id = data.get("room_id")
+            self.player_symbol = data.get("your_symbol")
+        elif message_type == MessageType.GAME_STATE.value:
+            self.game_state = data
+        elif message_type == MessageType.GAME_END.value:
+            self.result = data
+        return message
+
+    async def join(self, player):
+        """
+        Oyuna katıl ve sembolün atanmasını bekle
+
+        Args:
+            player (Player): Oyuncu
+
+        Returns:
+            str: Atanan sembol, hata veya kopmada None
+        """
+        await self.send_message(json.loads(GameProtocol.serialize_player_join(player)))
+        while True:
+            message = await self.recv()
+            if message is None or message.get("type") == MessageType.ERROR.value:
+                return None
+            if message.get("type") == MessageType.WAITING.value:
+                return self.player_symbol
+
+    async def wait_for_turn(self):
+        """
+        Sıra bu oyuncuya gelene veya oyun bitene kadar bekle
+
+        Returns:
+            dict: Sıra gelince game_state verisi, oyun bittiyse/koptuysa None
+        """
+        while True:
+            message = await self.recv()
+            if message is None:
+                return None
+            message_type = message.get("type")
+            if message_type == MessageType.GAME_END.value:
+                return None
+            if message_type == MessageType.GAME_STATE.value:
+                data = message["data"]
+                if not data.get("is_game_over") and data.get("current_player") == self.player_symbol:
+                    return data
+
+    async def move(self, row, col):
+        """
+        Hamle gönder
+
+        Returns:
+            bool: Gönderme başarılı mı?
+        """
+        return await self.send_message({
+            "type": MessageType.MOVE.value,
+            "data": {"row": row, "col": col}
+        })
+
+    async def close(self):
+        """
+        Oturumu kapat; bağlantı ve diğer oturumlar açık kalır
+        """
+        if self.closed:
+            return
+        self.closed = True
+        self.client.sessions.pop(self.session_id, None)
+        await self.send_message({"type": MessageType.SESSION_CLOSE.value, "data": {}})
+
+
+class MultiplexClient:
+    """
+    Tek WebSocket bağlantısı üzerinde birden fazla eşzamanlı oyun
+
+    Gelen her frame "session" alanına göre ilgili GameSession'ın kuyruğuna
+    yönlendirilir. Bot çiftlikleri ve yük testleri oyun başına socket açmak
+    yerine tek bağlantıda yüzlerce oturum taşıyabilir.
+    """
+
+    def __init__(self, server_url="", transport=None):
+        self.server_url = server_url
+        self.transport = transport or WebSocketTransport()
+        self.websocket = None
+        self.sessions = {}  # {session_id : GameSession}
+        self.unrouted = asyncio.Queue()  # Oturumsuz frame'ler (welcome vb.)
+        self._ids = itertools.count(1)
+        self._receiver = None
+
+    async def connect(self):
+        """
+        Server'a bağlan ve frame yönlendirme task'ını başlat
+
+        Returns:
+            bool: Bağlantı başarılı mı?
+        """
+        try:
+            self.websocket = await self.transport.connect(self.server_url, max_size=None)
+            self._receiver = asyncio.create_task(self._receive_loop())
+            return True
+        except Exception as e:
+            print(f"Bağlantı hatası: {e}")
+            return False
+
+    def open_session(self, session_id=None):
+        """
+        Yeni oyun oturumu oluştur (server tarafında ilk frame ile açılır)
+
+        Returns:
+            GameSession: Oturum
+        """
+        if session_id is None:
+            session_id = next(self._ids)
+        session = GameSession(self, session_id)
+        self.sessions[session_id] = session
+        return session
+
+    async def send_message(self, message):
+        if not self.websocket:
+            return False
+        try:
+            await self.websocket.send(json.dumps(message))
+            return True
+        except websockets.exceptions.ConnectionClosed:
+            return False
+
+    async def _receive_loop(self):
+        """
+        Frame'leri oturum kuyruklarına dağıt
+        """
+        try:
+            async for raw in self.websocket:
+                message = json.loads(raw)
+                session = self.sessions.get(message.pop("session", None))
+                if session:
+                    session.queue.put_nowait(message)
+                else:
+                    self.unrouted.put_nowait(message)
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        finally:
+            # Bekleyen oturumları uyandır
+            for session in self.sessions.values():
+                session.queue.put_nowait(None)
+
+    async def close(self):
+        """
+        Bağlantıyı ve tüm oturumları kapat
+        """
+        if self.websocket:
+            await self.websocket.close()
+        if self._receiver:
+            await self._receiver
+        self.websocket = None
@@ -0,0 +1,168 @@
+import asyncio
+import logging
+
+import websockets
+from websockets.protocol import State
+
+try:
+    from websockets.asyncio.connection import Connection
+except ImportError:  # websockets < 13: asyncio bağlantısı yok
+    Connection = None
+
+logger = logging.getLogger(__name__)
+
+# OutboundConnection websockets'in public API'sinde olmayan iç yapısını kullanır
+# (protocol.send_text, data_to_send, transport.write, paused, drain); sadece
+# denenmiş major sürümde açılır. requirements.txt'deki sürümle aynı tutulmalı.
+TESTED_WEBSOCKETS_MAJOR = 17
+
+
+def websockets_supported():
+    """
+    Kurulu websockets sürümü OutboundConnection ile denenmiş sürüm mü?
+
+    Returns:
+        bool: Frame toplama açılabilir mi?
+    """
+    major = websockets.__version__.split(".")[0]
+    return Connection is not None and major.isdigit() and int(major) == TESTED_WEBSOCKETS_MAJOR
+
+
+class OutboundScheduler:
+    """
+    Giden frame'leri bağlantı başına toplayıp tek seferde yazan zamanlayıcı
+
+    Bir loop turunda (ör. bir hamlenin işlenmesi: game_state + game_end,
+    multiplexed bağlantıdaki birden fazla oturum) aynı bağlantıya giden tüm
+    frame'ler biriktirilir ve tur sonunda tek transport.write ile gönderilir.
+    Tüm bağlantılar için tek bir flush callback'i planlanır.
+
+    flush_delay > 0 ise frame'ler en fazla bu kadar bekletilir (daha az yazma,
+    daha yüksek gecikme); 0 ise bir sonraki loop turunda gönderilir.
+    """
+
+    def __init__(self, flush_delay=0.0):
+        self.flush_delay = flush_delay  # Flush deadline (saniye)
+        self.pending = []  # Gönderilmemiş frame'i olan bağlantılar
+        self._handle = None
+        self.frames = 0  # Gönderilen frame sayısı (istatistik)
+        self.writes = 0  # transport.write sayısı (istatistik)
+
+    def schedule(self, connection):
+        """
+        Bağlantıyı flush listesine ekle (ilk frame'inde çağrılır)
+        """
+        self.pending.append(connection)
+        if self._handle is None:
+            loop = asyncio.get_running_loop()
+            if self.flush_delay > 0:
+                self._handle = loop.call_later(self.flush_delay, self.flush)
+            else:
+                self._handle = loop.call_soon(self.flush)
+
+    def flush(self):
+        """
+        Bekleyen tüm bağlantıları yaz
+        """
+        self._handle = None
+        pending = self.pending
+        self.pending = []
+        for connection in pending:
+            connection.flush()
+
+
+class OutboundConnection:
+    """
+    Giden frame'leri OutboundScheduler ile toplayan websocket sarmalayıcısı
+
+    Server kodu için websocket gibi davranır: send() frame'i bağlantının
+    tamponuna ekler ve hemen döner, sıralama bağlantı başına korunur.
+    Flush'ta tüm frame'ler websocket protokolüyle çerçevelenir ve tek
+    transport.write ile socket'e yazılır.
+
+    Socket yavaşsa (transport tamponu dolu, websockets yazmayı durdurmuş)
+    send() eskisi gibi boşalmasını bekler; yavaş client'ın geri basıncı
+    gönderen coroutine'e (ör. izleyici writer task'ı) yansır.
+
+    websockets'in iç yapısına dayandığı için sadece TESTED_WEBSOCKETS_MAJOR
+    sürümünde kullanılır; diğer sürümlerde server frame'leri ayrı ayrı yazar.
+    """
+    __slots__ = ("connection", "scheduler", "remote_address", "frames")
+
+    def __init__(self, connection, scheduler):
+        self.connection = connection  # websockets ServerConnection
+        self.scheduler = scheduler
+        self.remote_address = getattr(connection, "remote_address", None)
+        self.frames = []  # Bu turda gönderilecek frame'ler
+
+    @staticmethod
+    def supports(connection):
+        """
+        Bağlantı tek yazmada birden fazla frame gönderilebilen türden mi?
+        (denenmiş sürümdeki websockets asyncio bağlantısı: sans-I/O protokol + transport)
+        """
+        return websockets_supported() and isinstance(connection, Connection)
+
+    def push(self, data):
+        """
+        Frame'i beklemeden tampona ekle
+
+        Returns:
+            bool: Eklendi mi? (bağlantı kapanıyorsa veya socket yavaşsa False, send() kullanılmalı)
+        """
+        connection = self.connection
+        if connection.protocol.state is not State.OPEN or connection.paused:
+            return False
+        if not self.frames:
+            self.scheduler.schedule(self)
+        self.frames.append(data)
+        return True
+
+    async def send(self, data):
+        if self.push(data):
+            return
+        connection = self.connection
+        if connection.protocol.state is not State.OPEN:
+            # Kapanan bağlantı: websockets'in kendi hatası (ConnectionClosed) yükselsin
+            await connection.send(data)
+            return
+        # Socket yavaş: önce biriken frame'ler yazılır, tampon boşalınca bu frame eklenir
+        self.flush()
+        await connection.drain()
+        await self.send(data)
+
+    def flush(self):
+        """
+        Biriken frame'leri tek yazmada gönder
+        """
+        frames = self.frames
+        if not frames:
+            return
+        self.frames = []
+        connection = self.connection
+        protocol = connection.protocol
+        if protocol.state is not State.OPEN:
+            return
+        try:
+            for data in frames:
+                protocol.send_text(data.encode() if isinstance(data, str) else data)
+            connection.transport.write(b"".join(protocol.data_to_send()))
+        except Exception as e:
+            logger.debug(f"Gönderim hatası: {e}")
+            connection.transport.abort()
+            return
+        self.scheduler.frames += len(frames)
+        self.scheduler.writes += 1
+
+    async def close(self, code=1000, reason=""):
+        """
+        Bekleyen frame'leri gönder ve bağlantıyı kapat
+        """
+        self.flush()
+        await self.connection.close(code, reason)
+
+    def __aiter__(self):
+        return self.connection.__aiter__()
+
+    async def recv(self):
+        return await self.connection.recv()
@@ -0,0 +1,278 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+import logging
+import random
+import struct
+import time
+
+logger = logging.getLogger(__name__)
+
+# Paket başlığı: tür (1 byte), değer (1 byte), sıra numarası (2 byte)
+HEADER = struct.Struct("!BBH")
+
+HELLO = 1  # değer: 0, gövde: oyuncu adı (utf-8)
+MOVE = 2   # değer: hücre index'i (row * 3 + col)
+ACK = 3    # sıra numarası: onaylanan paketin sırası
+BYE = 4    # oyundan çıkış
+
+SEQ_MOD = 1 << 16
+
+
+def encode_move(row, col):
+    """
+    Hamleyi tek byte'lık compact formata çevir
+
+    Returns:
+        int: Hücre index'i (0-8)
+    """
+    return row * 3 + col
+
+
+def decode_move(value):
+    """
+    Compact hamleyi (row, col) tuple'ına çevir
+    """
+    return divmod(value, 3)
+
+
+class P2PPeer(asyncio.DatagramProtocol):
+    """
+    İki oyuncu arasında doğrudan UDP bağlantısı (relay server yok)
+
+    UDP üzerinde güvenilir ve sıralı teslimat:
+    - Her veri paketi bir sıra numarası taşır ve karşı taraf ACK gönderir
+    - ACK gelmezse paket RTO süresi sonunda tekrar gönderilir (exponential backoff)
+    - RTO, ölçülen RTT'den hesaplanır (SRTT + 4 * RTTVAR, TCP gibi)
+    - Sırası bozuk gelen paketler tamponlanır, tekrarlar atılır
+
+    loss_rate > 0 verilirse giden paketlerin bu oranı kasıtlı düşürülür (test için).
+    """
+
+    INITIAL_RTO = 0.2
+    MIN_RTO = 0.02
+    MAX_RTO = 2.0
+
+    def __init__(self, name, loss_rate=0.0, max_retries=10):
+        self.name = name
+        self.loss_rate = loss_rate
+        self.max_retries = max_retries
+        self.transport = None
+        self.peer_addr = None
+        self.peer_name = None
+        self.hello_sent = False
+        self.remote_bound = False  # Client: socket karşı adrese bağlı (connect edilmiş UDP)
+        self.inbox = asyncio.Queue()  # ("move", (row, col)) | ("bye", None) | ("lost", None)
+        self.connected = asyncio.Event()
+
+        self.next_seq = 0
+        self.expected_seq = 0
+        self.out_of_order = {}  # {seq: (kind, value, body)}
+        self.pending = {}  # {seq: [packet, gönderim zamanı, deneme sayısı, timer handle]}
+
+        self.srtt = None
+        self.rttvar = None
+        self.rto = self.INITIAL_RTO
+        self.rtt_samples = []
+        self.retransmits = 0
+
+    # --- asyncio.DatagramProtocol ---
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        if len(data) < HEADER.size:
+            return
+        kind, value, seq = HEADER.unpack_from(data)
+        body = data[HEADER.size:]
+
+        if self.peer_addr is None:
+            # Host: ilk HELLO gönderen peer olur
+            if kind != HELLO:
+                return
+            self.peer_addr = addr
+        elif addr != self.peer_addr:
+            return
+
+        if kind == ACK:
+            self._handle_ack(seq)
+            return
+
+        # Veri paketi: her zaman ACK gönder (tekrarlar dahil, ACK kaybolmuş olabilir)
+        self._send_raw(HEADER.pack(ACK, 0, seq))
+
+        diff = (seq - self.expected_seq) % SEQ_MOD
+        if diff == 0:
+            self._deliver(kind, value, body)
+            self.expected_seq = (self.expected_seq + 1) % SEQ_MOD
+            # Tampondaki sıradaki paketleri teslim et
+            while self.expected_seq in self.out_of_order:
+                self._deliver(*self.out_of_order.pop(self.expected_seq))
+                self.expected_seq = (self.expected_seq + 1) % SEQ_MOD
+        elif diff < SEQ_MOD // 2:
+            self.out_of_order[seq] = (kind, value, body)
+        # Aksi halde eski bir tekrar: sadece ACK yeterli
+
+    def error_received(self, exc):
+        logger.debug(f"UDP hatası: {exc}")
+
+    # --- Gönderim ---
+
+    def _send_raw(self, packet):
+        if self.transport is None or self.peer_addr is None:
+            return
+        if self.loss_rate and random.random() < self.loss_rate:
+            return  # Simüle edilmiş paket kaybı
+        self.transport.sendto(packet, None if self.remote_bound else self.peer_addr)
+
+    def _send_reliable(self, kind, value=0, body=b""):
+        seq = self.next_seq
+        self.next_seq = (self.next_seq + 1) % SEQ_MOD
+        packet = HEADER.pack(kind, value, seq) + body
+        entry = [packet, time.perf_counter(), 0, None]
+        self.pending[seq] = entry
+        self._send_raw(packet)
+        entry[3] = asyncio.get_running_loop().call_later(self.rto, self._retransmit, seq)
+        return seq
+
+    def _retransmit(self, seq):
+        entry = self.pending.get(seq)
+        if entry is None:
+            return
+        entry[2] += 1
+        if entry[2] > self.max_retries:
+            logger.warning("Peer yanıt vermiyor, bağlantı koptu")
+            self.pending.clear()
+            self.inbox.put_nowait(("lost", None))
+            return
+        self.retransmits += 1
+        self._send_raw(entry[0])
+        backoff = min(self.MAX_RTO, self.rto * (2 ** entry[2]))
+        entry[3] = asyncio.get_running_loop().call_later(backoff, self._retransmit, seq)
+
+    def _handle_ack(self, seq):
+        entry = self.pending.pop(seq, None)
+        if entry is None:
+            return
+        entry[3].cancel()
+        # Karn algoritması: tekrar gönderilen paketlerden RTT ölçme
+        if entry[2] == 0:
+            self._update_rtt(time.perf_counter() - entry[1])
+
+    def _update_rtt(self, sample):
+        self.rtt_samples.append(sample)
+        if self.srtt is None:
+            self.srtt = sample
+            self.rttvar = sample / 2
+        else:
+            self.rttvar = 0.75 * self.rttvar + 0.25 * abs(self.srtt - sample)
+            self.srtt = 0.875 * self.srtt + 0.125 * sample
+        self.rto = min(self.MAX_RTO, max(self.MIN_RTO, self.srtt + 4 * self.rttvar))
+
+    def _deliver(self, kind, value, body):
+        if kind == HELLO:
+            if self.peer_name is None:
+                self.peer_name = body.decode("utf-8", errors="replace") or "Rakip"
+                self.connected.set()
+                # Host, client'ın HELLO'suna kendi HELLO'su ile cevap verir
+                if not self.hello_sent:
+                    self.send_hello()
+        elif kind == MOVE:
+            self.inbox.put_nowait(("move", decode_move(value)))
+        elif kind == BYE:
+            self.inbox.put_nowait(("bye", None))
+
+    # --- Public API ---
+
+    def send_hello(self):
+        """
+        Handshake: oyuncu adını karşı tarafa gönder
+        """
+        self.hello_sent = True
+        self._send_reliable(HELLO, 0, self.name.encode("utf-8")[:64])
+
+    def send_move(self, row, col):
+        """
+        Hamleyi karşı tarafa güvenilir şekilde gönder
+        """
+        return self._send_reliable(MOVE, encode_move(row, col))
+
+    def send_bye(self):
+        """
+        Oyundan çıkıldığını bildir
+        """
+        return self._send_reliable(BYE)
+
+    async def receive(self):
+        """
+        Karşı taraftan sıradaki olayı bekle
+
+        Returns:
+            tuple: ("move", (row, col)) | ("bye", None) | ("lost", None)
+        """
+        return await self.inbox.get()
+
+    async def wait_connected(self, timeout=None):
+        """
+        Handshake tamamlanana kadar bekle
+
+        Returns:
+            bool: Peer bağlandı mı?
+        """
+        try:
+            await asyncio.wait_for(self.connected.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def flush(self, timeout=2.0):
+        """
+        Gönderilen tüm paketler onaylanana kadar bekle (kapanmadan önce)
+        """
+        deadline = time.perf_counter() + timeout
+        while self.pending and time.perf_counter() < deadline:
+            await asyncio.sleep(0.01)
+        return not self.pending
+
+    def close(self):
+        """
+        Bekleyen retransmit'leri iptal et ve socket'i kapat
+        """
+        for entry in self.pending.values():
+            if entry[3]:
+                entry[3].cancel()
+        self.pending.clear()
+        if self.transport:
+            self.transport.close()
+
+
+async def create_host(name, host="0.0.0.0", port=8766, **kwargs):
+    """
+    P2P host: UDP portunu dinle, ilk HELLO gönderen peer ile eşleş
+
+    Returns:
+        P2PPeer: Bağlantı nesnesi
+    """
+    loop = asyncio.get_running_loop()
+    _, peer = await loop.create_datagram_endpoint(
+        lambda: P2PPeer(name, **kwargs), local_addr=(host, port))
+    return peer
+
+
+async def create_client(name, host, port=8766, **kwargs):
+    """
+    P2P client: host'a HELLO gönder
+
+    Returns:
+        P2PPeer: Bağlantı nesnesi
+    """
+    loop = asyncio.get_running_loop()
+    _, peer = await loop.create_datagram_endpoint(
+        lambda: P2PPeer(name, **kwargs), remote_addr=(host, port))
+    peer.peer_addr = peer.transport.get_extra_info("peername")
+    peer.remote_bound = True
+    peer.send_hello()
+    return peer
@@ -0,0 +1,121 @@
+from Game.board import GameBoard
+
+
+class MovePredictor:
+    """
+    Client tarafı tahmin (optimistic move): oyuncunun hamlesi server'ın
+    game_state'i gelmeden local GameBoard kopyasına uygulanır
+
+    Her tahmin bir sıra numarası (seq) alır ve server'a hamleyle birlikte
+    gönderilir. Server'ın state'i her zaman esastır:
+    - game_state geldiğinde board server'ın board'undan kurulur ve server'ın
+      henüz işlemediği tahminler (move_count'u daha büyük olanlar) üstüne
+      tekrar uygulanır; local board farklıysa bu bir geri almadır (rollback)
+    - Server hamleyi reddederse (seq'li error) o hamle ve sonrakiler atılır
+    """
+
+    def __init__(self):
+        self.board = GameBoard()  # Gösterilen (tahminli) board
+        self.server_board = [[None] * 3 for _ in range(3)]  # Son onaylı board
+        self.server_count = 0  # Son onaylı state'in move_count'u
+        self.pending = []  # Onaylanmamış tahminler: [(seq, row, col, symbol, move_count), ...]
+        self.next_seq = 1
+        self.predicted = 0  # İstatistik: tahmin edilen hamle
+        self.rollbacks = 0  # İstatistik: geri alınan tahmin
+
+    def apply(self, row, col, symbol):
+        """
+        Hamleyi local board'a hemen uygula
+
+        Args:
+            row (int): Satır
+            col (int): Sütun
+            symbol (str): Oyuncunun sembolü
+
+        Returns:
+            int: Hamlenin seq'i, local board'da geçersizse None
+        """
+        if not self.board.make_move(row, col, symbol):
+            return None
+        seq = self.next_seq
+        self.next_seq += 1
+        # Server işlediğinde state'in move_count'u bu olmalı
+        target = self.server_count + len(self.pending) + 1
+        self.pending.append((seq, row, col, symbol, target))
+        self.predicted += 1
+        return seq
+
+    def on_state(self, state):
+        """
+        Server'ın game_state'iyle uzlaş
+
+        Args:
+            state (dict): game_state verisi (board, move_count, is_game_over)
+
+        Returns:
+            bool: Tahmin geri alındı mı?
+        """
+        board = state.get("board")
+        if not board:
+            return False
+        count = state.get("move_count", 0)
+        game_over = state.get("is_game_over", False)
+        rolled_back = False
+        kept = []
+        for move in self.pending:
+            _, row, col, symbol, target = move
+            if target <= count:
+                # Server bu hamle sayısına ulaştı: hücrede bizim taşımız olmalı
+                if board[row][col] != symbol:
+                    rolled_back = True
+            elif game_over or count < self.server_count:
+                # Oyun bitti veya yeni oyun başladı: hamle hiç işlenmeyecek
+                rolled_back = True
+            else:
+                kept.append(move)
+        self.pending = [] if rolled_back else kept
+        self.server_board = [row[:] for row in board]
+        self.server_count = count
+        self._rebuild()
+        if rolled_back:
+            self.rollbacks += 1
+        return rolled_back
+
+    def on_reject(self, seq):
+        """
+        Server hamleyi reddetti: o hamle ve sonraki tahminler geri alınır
+
+        Args:
+            seq (int): Reddedilen hamlenin seq'i
+
+        Returns:
+            bool: Geri alınan tahmin var mıydı?
+        """
+        for idx, pending in enumerate(self.pending):
+            if pending[0] == seq:
+                del self.pending[idx:]
+                self._rebuild()
+                self.rollbacks += 1
+                return True
+        return False
+
+    def reset(self):
+        """
+        Yeni oyun: onaylı board boş, bekleyen tahmin yok
+        """
+        self.server_board = [[None] * 3 for _ in range(3)]
+        self.server_count = 0
+        self.pending.clear()
+        self._rebuild()
+
+    def _rebuild(self):
+        """
+        Gösterilen board = onaylı board + bekleyen tahminler
+        Onaylı board üzerinde artık geçersiz olan tahminler atılır
+        """
+        self.board.load_board(self.server_board)
+        kept = []
+        for move in self.pending:
+            if self.board.make_move(move[1], move[2], move[3]):
+                kept.append(move)
+        self.pending = kept
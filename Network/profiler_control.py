@@ -0,0 +1,227 @@
+import asyncio
+import json
+import logging
+import os
+import stat
+import time
+from Utils.profiler import SamplingProfiler, DeterministicProfiler
+
+logger = logging.getLogger(__name__)
+
+MODES = ("collapsed", "pstats")
+
+
+class ProfilerControl:
+    """
+    Canlı server'ı yeniden başlatmadan profilleme ve bellek raporu
+
+    Kayıt event loop thread'inde N saniye sürer, loop durdurulmaz:
+    - "collapsed": stack örneklemesi (SamplingProfiler), flamegraph için
+      collapsed-stack dosyası
+    - "pstats": cProfile ile tüm çağrıların ölçümü, pstats dump'ı
+    Bellek raporu (MemoryDiagnostics) anında üretilip JSON olarak yazılır.
+
+    Tetikleme sadece makinenin içinden yapılabilir: sahibine özel (0600)
+    Unix socket'e satır komutu veya sinyal (server.py SIGUSR1 / SIGUSR2). Websocket
+    admin kanalından tetiklenemez. Aynı anda tek kayıt yapılır; çıktı
+    dosyaları output_dir'e yazılır, dışarıdan yol kabul edilmez.
+
+    Socket komutları:  profile <saniye> [collapsed|pstats]
+                       memory [trace]   (trace: tracemalloc'u da başlat)
+    Cevap:             ok <dosya> <özet>   veya   error <mesaj>
+    """
+
+    MAX_SECONDS = 300.0
+
+    def __init__(self, output_dir=".", interval=0.005, diagnostics=None):
+        self.output_dir = output_dir
+        self.diagnostics = diagnostics  # MemoryDiagnostics (None ise bellek raporu yok)
+        self.interval = interval  # Örnekleme aralığı (saniye)
+        self.active = None  # Çalışan kaydın modu
+        self.socket_path = None
+        self._server = None
+        self._tasks = set()
+
+    async def profile(self, seconds, mode="collapsed"):
+        """
+        Event loop'u `seconds` saniye profille ve sonucu dosyaya yaz
+
+        Args:
+            seconds (float): Kayıt süresi
+            mode (str): "collapsed" veya "pstats"
+
+        Returns:
+            tuple: (dosya yolu, satır veya fonksiyon sayısı)
+
+        Raises:
+            ValueError: Geçersiz süre/mod veya başka bir kayıt sürüyor
+        """
+        if mode not in MODES:
+            raise ValueError(f"Geçersiz mod: {mode}")
+        if not 0 < seconds <= self.MAX_SECONDS:
+            raise ValueError(f"Süre 0-{self.MAX_SECONDS:.0f} saniye arasında olmalı")
+        if self.active:
+            raise ValueError(f"Başka bir kayıt sürüyor ({self.active})")
+
+        loop = asyncio.get_running_loop()
+        extension = "collapsed.txt" if mode == "collapsed" else "pstats"
+        path = os.path.join(self.output_dir,
+                            f"profile-{os.getpid()}-{time.strftime('%Y%m%d-%H%M%S')}.{extension}")
+        self.active = mode
+        logger.info(f"Profilleme başladı: {mode}, {seconds:g}s")
+        try:
+            if mode == "collapsed":
+                # Bu coroutine loop thread'inde çalışır: örneklenecek thread budur
+                profiler = SamplingProfiler(interval=self.interval)
+                profiler.start(seconds)
+                try:
+                    await asyncio.sleep(seconds)
+                finally:
+                    profiler.stop()
+                count = await loop.run_in_executor(None, profiler.write_collapsed, path)
+            else:
+                profiler = DeterministicProfiler()
+                profiler.start()
+                try:
+                    await asyncio.sleep(seconds)
+                finally:
+                    profiler.stop()
+                count = await loop.run_in_executor(None, profiler.write_pstats, path)
+        finally:
+            self.active = None
+        logger.info(f"Profil yazıldı: {path} ({count})")
+        return path, count
+
+    async def memory_report(self, trace=False):
+        """
+        Bellek raporunu üret ve JSON dosyasına yaz
+
+        Args:
+            trace (bool): tracemalloc kapalıysa başlatılsın mı? (sonraki raporlarda
+                ayırma yerleri ve farkları görünür)
+
+        Returns:
+            tuple: (dosya yolu, rapor)
+
+        Raises:
+            ValueError: Bellek raporu desteklenmiyor
+        """
+        if self.diagnostics is None:
+            raise ValueError("Bellek raporu kapalı")
+        if trace:
+            self.diagnostics.start_tracing()
+        report = self.diagnostics.report()
+        path = os.path.join(self.output_dir, f"memory-{os.getpid()}-{time.strftime('%Y%m%d-%H%M%S')}"
+                                             f"-{self.diagnostics.reports}.json")
+        data = json.dumps(report, indent=2)
+        await asyncio.get_running_loop().run_in_executor(None, self._write, path, data)
+        rooms = report["rooms"]
+        growth = report.get("growth")
+        logger.info(f"Bellek raporu yazıldı: {path} - {rooms['count']} room (~{rooms['avg_bytes']} B/room), "
+                    f"{report['connections']['count']} bağlantı"
+                    + (f", büyüme: {growth['rooms']:+d} room" if growth else ""))
+        return path, report
+
+    @staticmethod
+    def _write(path, data):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(data)
+
+    def trigger_memory(self):
+        """
+        Bellek raporunu arka planda üret (sinyal handler'ından çağrılır)
+        """
+        task = asyncio.get_running_loop().create_task(self._memory_logged())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _memory_logged(self):
+        try:
+            await self.memory_report()
+        except Exception as e:
+            logger.error(f"Bellek raporu hatası: {e}")
+
+    def trigger(self, seconds, mode="collapsed"):
+        """
+        Kaydı arka planda başlat (sinyal handler'ından çağrılır)
+
+        Returns:
+            bool: Başlatıldı mı? (başka kayıt sürüyorsa False)
+        """
+        if self.active:
+            logger.warning(f"Profilleme isteği yok sayıldı: kayıt sürüyor ({self.active})")
+            return False
+        task = asyncio.get_running_loop().create_task(self._run_logged(seconds, mode))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    async def _run_logged(self, seconds, mode):
+        try:
+            await self.profile(seconds, mode)
+        except Exception as e:
+            logger.error(f"Profilleme hatası: {e}")
+
+    async def start_socket(self, path):
+        """
+        Komutları dinleyen Unix socket'i aç (sadece dosya sahibi bağlanabilir)
+
+        Args:
+            path (str): Socket dosyası
+        """
+        if not hasattr(asyncio, "start_unix_server"):
+            logger.warning("Unix socket desteklenmiyor, profilleme sadece sinyalle tetiklenebilir")
+            return
+        if os.path.exists(path) and stat.S_ISSOCK(os.stat(path).st_mode):
+            os.unlink(path)  # Önceki process'ten kalan socket
+        old_umask = os.umask(0o177)  # Socket bind anından itibaren 0600 olsun
+        try:
+            self._server = await asyncio.start_unix_server(self.handle_command, path)
+        finally:
+            os.umask(old_umask)
+        self.socket_path = path
+        logger.info(f"Profilleme socket'i: {path}")
+
+    async def handle_command(self, reader, writer):
+        """
+        Socket'ten gelen tek satırlık komutu işle
+        """
+        try:
+            line = await asyncio.wait_for(reader.readline(), timeout=10.0)
+            parts = line.decode(errors="replace").split()
+            if parts and parts[0] == "memory" and (len(parts) == 1 or parts[1:] == ["trace"]):
+                try:
+                    path, report = await self.memory_report(trace=len(parts) == 2)
+                    reply = (f"ok {path} rooms={report['rooms']['count']} "
+                             f"room_bytes={report['rooms']['est_total_bytes']} "
+                             f"connections={report['connections']['count']}")
+                except ValueError as e:
+                    reply = f"error {e}"
+            elif len(parts) not in (2, 3) or parts[0] != "profile":
+                reply = "error Kullanım: profile <saniye> [collapsed|pstats] | memory [trace]"
+            else:
+                try:
+                    path, count = await self.profile(float(parts[1]), parts[2] if len(parts) == 3 else "collapsed")
+                    reply = f"ok {path} {count}"
+                except ValueError as e:
+                    reply = f"error {e}"
+            writer.write((reply + "\n").encode())
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        except Exception as e:
+            logger.error(f"Profilleme komutu hatası: {e}")
+        finally:
+            writer.close()
+
+    async def close(self):
+        """
+        Socket'i kapat ve dosyasını sil
+        """
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self.socket_path and os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        self.socket_path = None
@@ -0,0 +1,156 @@
+import bisect
+import heapq
+import time
+
+# Heartbeat RTT histogramının üst sınırları (milisaniye); son kova bunlardan büyükler
+RTT_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+class ServerStats:
+    """
+    Operatör dashboard'u için artımlı (incremental) server özeti
+
+    Sayaçlar olay anında güncellenir; özet oluşturmak için tüm room'lar
+    taranmaz:
+    - Room sayıları status başına tutulur (GameRoom.status setter'ı bildirir)
+    - Hamleler toplam sayaca ve pencere içi room sayaçlarına yazılır
+    - En yoğun board'lar sadece son pencerede hamle yapılan room'lar
+      arasından seçilir
+    - Bağlantıların heartbeat RTT ölçümleri sabit kovalı histograma yazılır
+
+    Özet maliyeti: O(pencerede aktif room) + O(top_k), toplam room sayısından bağımsız.
+    """
+
+    def __init__(self, top_k=12):
+        self.top_k = top_k
+        self.status_counts = {}  # {status adı : room sayısı}
+        self.total_moves = 0
+        self.window_moves = {}  # {room : son penceredeki hamle sayısı}
+        self.window_total = 0
+        self.window_started = time.monotonic()
+        self.moves_per_sec = 0.0
+        self.busiest = []  # Son pencerenin en yoğun room'ları
+        self.rtt_counts = [0] * (len(RTT_BUCKETS_MS) + 1)  # RTT histogramı
+        self.rtt_samples = 0
+
+    def room_added(self, status):
+        """
+        Yeni room oluşturuldu
+        """
+        self.status_counts[status.name] = self.status_counts.get(status.name, 0) + 1
+
+    def room_status_changed(self, old_status, new_status):
+        """
+        Room'un status'u değişti
+        """
+        if old_status == new_status:
+            return
+        self.status_counts[old_status.name] -= 1
+        self.status_counts[new_status.name] = self.status_counts.get(new_status.name, 0) + 1
+
+    def room_removed(self, status):
+        """
+        Room server'dan silindi
+        """
+        self.status_counts[status.name] -= 1
+
+    def record_move(self, room):
+        """
+        Room'da hamle yapıldı
+        """
+        self.total_moves += 1
+        self.window_total += 1
+        self.window_moves[room] = self.window_moves.get(room, 0) + 1
+
+    def record_rtt(self, rtt):
+        """
+        Bağlantının heartbeat RTT ölçümü
+
+        Args:
+            rtt (float): Round-trip süresi (saniye)
+        """
+        self.rtt_counts[bisect.bisect_left(RTT_BUCKETS_MS, rtt * 1000)] += 1
+        self.rtt_samples += 1
+
+    def rtt_percentile(self, fraction):
+        """
+        RTT histogramından yüzdelik (kovanın üst sınırı)
+
+        Args:
+            fraction (float): 0-1 arası (ör. 0.99)
+
+        Returns:
+            int: Milisaniye; ölçüm yoksa None
+        """
+        if not self.rtt_samples:
+            return None
+        target = fraction * self.rtt_samples
+        seen = 0
+        for idx, count in enumerate(self.rtt_counts):
+            seen += count
+            if seen >= target and count:
+                break
+        return RTT_BUCKETS_MS[min(idx, len(RTT_BUCKETS_MS) - 1)]
+
+    def roll_window(self, now=None, rank=True):
+        """
+        Hamle penceresini kapat: throughput'u ve en yoğun room'ları hesapla
+        rank=False ise (abone yokken) sadece throughput güncellenir
+
+        Returns:
+            list: [(hamle sayısı, room), ...] en yoğundan başlayarak
+        """
+        now = time.monotonic() if now is None else now
+        elapsed = max(now - self.window_started, 1e-6)
+        self.moves_per_sec = self.window_total / elapsed
+
+        if rank and self.window_moves:
+            self.busiest = heapq.nlargest(
+                self.top_k, self.window_moves.items(), key=lambda item: item[1])
+            self.busiest = [(count, room) for room, count in self.busiest]
+        # Pencerede hamle yoksa son yoğun room'lar ekranda kalır
+        self.window_moves = {}
+        self.window_total = 0
+        self.window_started = now
+        return self.busiest
+
+    def summary(self, connections, spectators, now=None):
+        """
+        Admin kanalına gönderilecek özet
+
+        Args:
+            connections (int): Bağlı client sayısı
+            spectators (int): İzleyici sayısı
+
+        Returns:
+            dict: Serialize edilebilir özet
+        """
+        self.roll_window(now)
+        boards = []
+        for count, room in self.busiest:
+            game = room.game
+            if not game:
+                continue
+            boards.append({
+                "room_id": room.room_id,
+                "status": room.status.name,
+                "board": [row[:] for row in game.game_board.board],
+                "current_player": game.current_player,
+                "winner": game.winner,
+                "move_count": game.move_count,
+                "recent_moves": count,
+                "players": [game.player1.name, game.player2.name]
+            })
+        return {
+            "rooms": dict(self.status_counts),
+            "connections": connections,
+            "spectators": spectators,
+            "total_moves": self.total_moves,
+            "moves_per_sec": round(self.moves_per_sec, 1),
+            "rtt_ms": {
+                "p50": self.rtt_percentile(0.5),
+                "p99": self.rtt_percentile(0.99),
+                "samples": self.rtt_samples
+            },
+            "boards": boards
+        }
@@ -0,0 +1,110 @@
+import asyncio
+import logging
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+
+class Subscriber:
+    """
+    Bir room'u izleyen client için sınırlı (bounded) gönderim kuyruğu
+
+    Her subscriber'ın kendi writer task'ı vardır; broadcast sadece kuyruğa
+    ekler ve beklemez. Böylece yavaş bir socket diğer izleyicileri ve
+    oyuncuları bekletmez.
+
+    - game_state frame'leri birleştirilir (coalesce): kuyrukta gönderilmemiş
+      bir state varsa en yenisiyle değiştirilir
+    - Kuyruk yine de dolarsa subscriber düşürülür (bağlantı kapatılır)
+    """
+
+    COALESCE_TYPES = ("game_state", "server_summary")
+
+    def __init__(self, websocket, max_queue=16):
+        self.websocket = websocket
+        self.max_queue = max_queue
+        self.queue = deque()  # [(message_type, data), ...]
+        self.coalesced = 0  # Üzerine yazılan state sayısı
+        self.dropped = False
+        self.close_after = None  # Kuyruk boşaltılarak kapanıyorsa: sonunda socket kapatılsın mı?
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._writer())
+
+    def push(self, message_type, data):
+        """
+        Frame'i kuyruğa ekle (bloklamaz)
+
+        Args:
+            message_type (str): Mesaj türü (coalesce kararı için)
+            data (str): Gönderilecek JSON string
+
+        Returns:
+            bool: Subscriber hâlâ aktif mi?
+        """
+        if self.dropped or self.close_after is not None:
+            return False
+
+        if message_type in self.COALESCE_TYPES:
+            for idx, (queued_type, _) in enumerate(self.queue):
+                if queued_type == message_type:
+                    self.queue[idx] = (message_type, data)
+                    self.coalesced += 1
+                    return True
+
+        if len(self.queue) >= self.max_queue:
+            logger.info("Yavaş izleyici düşürüldü (kuyruk dolu)")
+            self.close()
+            return False
+
+        self.queue.append((message_type, data))
+        self._wakeup.set()
+        return True
+
+    async def _writer(self):
+        """
+        Kuyruktaki frame'leri sırayla socket'e yaz
+        """
+        try:
+            while not self.dropped:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                while self.queue and not self.dropped:
+                    _, data = self.queue.popleft()
+                    await self.websocket.send(data)
+                if self.close_after is not None and not self.dropped:
+                    self.dropped = True
+                    if self.close_after:
+                        await self._close_socket()
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.debug(f"İzleyici gönderim hatası: {e}")
+            self.dropped = True
+            self.queue.clear()
+
+    def close(self, close_socket=True, drain=False):
+        """
+        Subscriber'ı kapat, bekleyen frame'leri at
+
+        Args:
+            close_socket (bool): Bağlantı da kapatılsın mı?
+            drain (bool): Bekleyen frame'ler (örn. GAME_END) önce gönderilsin mi?
+                Yeni frame kabul edilmez, writer kuyruk bitince kapatır
+        """
+        if self.dropped:
+            return
+        if drain and self.queue:
+            self.close_after = close_socket
+            self._wakeup.set()
+            return
+        self.dropped = True
+        self.queue.clear()
+        self._task.cancel()
+        if close_socket:
+            asyncio.create_task(self._close_socket())
+
+    async def _close_socket(self):
+        try:
+            await self.websocket.close()
+        except Exception:
+            pass
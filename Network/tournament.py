@@ -0,0 +1,608 @@
+import asyncio
+import logging
+import math
+import time
+from Utils.protocol import GameProtocol
+from Utils.validator import GameValidator
+
+logger = logging.getLogger(__name__)
+
+ROUND_ROBIN = "round_robin"
+SWISS = "swiss"
+FORMATS = (ROUND_ROBIN, SWISS)
+
+REGISTERING = "registering"
+RUNNING = "running"
+FINISHED = "finished"
+
+
+def round_robin_pairings(players, round_index):
+    """
+    Round-robin turu (circle method): ilk oyuncu sabit, diğerleri her turda döner
+    n oyuncu n - 1 turda (tek sayıda oyuncuyla n turda) herkesle bir kez eşleşir
+
+    Args:
+        players (list): Oyuncu id'leri, seed sırasıyla
+        round_index (int): 0 tabanlı tur numarası
+
+    Returns:
+        tuple: ([(x_id, o_id), ...], bye alan oyuncu veya None)
+    """
+    entrants = list(players)
+    if len(entrants) % 2:
+        entrants.append(None)
+    count = len(entrants)
+    if count < 2:
+        return [], None
+
+    shift = round_index % (count - 1)
+    rest = entrants[1:]
+    if shift:
+        rest = rest[-shift:] + rest[:-shift]
+    order = [entrants[0]] + rest
+
+    pairs = []
+    bye = None
+    for idx in range(count // 2):
+        first, second = order[idx], order[count - 1 - idx]
+        if first is None or second is None:
+            bye = second if first is None else first
+            continue
+        # Renkler turdan tura değişir
+        if (round_index + idx) % 2:
+            first, second = second, first
+        pairs.append((first, second))
+    return pairs, bye
+
+
+def swiss_pairings(order, opponents, lookahead=32):
+    """
+    Swiss eşleştirme, tur başına O(n * lookahead)
+
+    order puan grubu içinde üst yarı / alt yarı sırasına dizilmiş olmalı
+    (Tournament.swiss_order). Her oyuncu, kalan listede ilk `lookahead` aday içinde
+    daha önce oynamadığı ilk rakiple eşleşir; bulamazsa tekrar eşleşmeye izin verilir.
+    Eşleşen oyuncular bağlı listeden O(1) çıkarılır.
+
+    Args:
+        order (list): Çift sayıda oyuncu id'si
+        opponents (dict): {player_id : set(oynadığı rakipler)}
+        lookahead (int): Rakip aramada bakılacak en fazla aday
+
+    Returns:
+        list: [(player_id, player_id), ...]
+    """
+    count = len(order)
+    next_idx = list(range(1, count + 1))
+    prev_idx = list(range(-1, count - 1))
+
+    def unlink(idx):
+        before, after = prev_idx[idx], next_idx[idx]
+        if before >= 0:
+            next_idx[before] = after
+        if after < count:
+            prev_idx[after] = before
+
+    pairs = []
+    head = 0
+    while head < count:
+        current = head
+        unlink(current)
+        head = next_idx[current]
+        if head >= count:
+            break  # Tek kalan oyuncu (çağıran bye'ı önceden ayırmalı)
+
+        played = opponents.get(order[current], ())
+        chosen = None
+        candidate = head
+        steps = 0
+        while candidate < count and steps < lookahead:
+            if order[candidate] not in played:
+                chosen = candidate
+                break
+            candidate = next_idx[candidate]
+            steps += 1
+        if chosen is None:
+            chosen = head  # Tekrar eşleşme kaçınılmaz
+
+        unlink(chosen)
+        if chosen == head:
+            head = next_idx[chosen]
+        pairs.append((order[current], order[chosen]))
+    return pairs
+
+
+class Tournament:
+    """
+    Turnuva durumu ve eşleştirme (ağ ve room'lardan bağımsız)
+
+    Puan: galibiyet 1, beraberlik 0.5, bye 1. Sıralamada eşitlik Buchholz
+    (rakiplerin puan toplamı) ve seed ile bozulur.
+    """
+
+    def __init__(self, tournament_id, tournament_format=SWISS, rounds=None, name=None):
+        if tournament_format not in FORMATS:
+            raise ValueError(f"Bilinmeyen turnuva formatı: {tournament_format}")
+        self.tournament_id = tournament_id
+        self.format = tournament_format
+        self.name = name or f"Turnuva {tournament_id}"
+        self.rounds = rounds
+        self.round = 0  # Oynanan/oynanmakta olan tur (1 tabanlı)
+        self.status = REGISTERING
+        self.players = []  # Seed sırası
+        self.seeds = {}  # {player_id : seed index}
+        self.scores = {}  # {player_id : puan}
+        self.opponents = {}  # {player_id : set(rakipler)}
+        self.x_counts = {}  # {player_id : X ile oynadığı oyun}
+        self.byes = set()
+
+    def add_player(self, player_id):
+        """
+        Returns:
+            bool: Kayıt yapıldı mı? (kayıt kapalıysa veya zaten kayıtlıysa False)
+        """
+        if self.status != REGISTERING or player_id in self.scores:
+            return False
+        self.seeds[player_id] = len(self.players)
+        self.players.append(player_id)
+        self.scores[player_id] = 0.0
+        self.opponents[player_id] = set()
+        self.x_counts[player_id] = 0
+        return True
+
+    def start(self, seed_key=None):
+        """
+        Kaydı kapat ve seed'leri belirle
+
+        Args:
+            seed_key (callable, optional): player_id -> sıralama anahtarı (küçük önce)
+        """
+        if seed_key:
+            self.players.sort(key=seed_key)
+            self.seeds = {player_id: idx for idx, player_id in enumerate(self.players)}
+        if self.rounds is None:
+            if self.format == ROUND_ROBIN:
+                count = len(self.players)
+                self.rounds = count - 1 if count % 2 == 0 else count
+            else:
+                self.rounds = max(1, math.ceil(math.log2(max(2, len(self.players)))))
+        self.status = RUNNING
+
+    def is_finished(self):
+        return self.round >= self.rounds
+
+    def swiss_order(self):
+        """
+        Oyuncuları puan grubuna göre sırala; her grup içinde üst yarı alt yarıyla
+        eşleşecek şekilde dizilir (1-5, 2-6, ...). Tek kalan oyuncu sonraki gruba kayar.
+        """
+        ranked = sorted(self.players, key=lambda player_id: (-self.scores[player_id], self.seeds[player_id]))
+        order = []
+        carry = []
+        idx = 0
+        while idx < len(ranked):
+            score = self.scores[ranked[idx]]
+            end = idx
+            while end < len(ranked) and self.scores[ranked[end]] == score:
+                end += 1
+            group = carry + ranked[idx:end]
+            half = len(group) // 2
+            for top, bottom in zip(group[:half], group[half:2 * half]):
+                order.append(top)
+                order.append(bottom)
+            carry = group[2 * half:]
+            idx = end
+        order.extend(carry)
+        return order
+
+    def pair_next_round(self):
+        """
+        Sonraki turun eşleşmelerini üret; bye alan oyuncuya puanı hemen yazılır
+
+        Returns:
+            tuple: ([(x_id, o_id), ...], bye alan oyuncu veya None)
+        """
+        self.round += 1
+        if self.format == ROUND_ROBIN:
+            pairs, bye = round_robin_pairings(self.players, self.round - 1)
+        else:
+            order = self.swiss_order()
+            bye = None
+            if len(order) % 2:
+                # En alttaki, daha önce bye almamış oyuncu
+                for idx in range(len(order) - 1, -1, -1):
+                    if order[idx] not in self.byes:
+                        bye = order.pop(idx)
+                        break
+                else:
+                    bye = order.pop()
+            pairs = []
+            for first, second in swiss_pairings(order, self.opponents):
+                # X, daha az X oynamış oyuncuya
+                if self.x_counts[second] < self.x_counts[first]:
+                    first, second = second, first
+                pairs.append((first, second))
+
+        if bye is not None:
+            self.byes.add(bye)
+            self.scores[bye] += 1.0
+        for x_id, o_id in pairs:
+            self.x_counts[x_id] += 1
+        return pairs, bye
+
+    def record_result(self, x_id, o_id, x_score, o_score=None):
+        """
+        Oyun sonucunu yaz
+
+        Args:
+            x_score (float): X oyuncusunun puanı
+            o_score (float, optional): O oyuncusunun puanı (varsayılan 1 - x_score;
+                iki oyuncu da gelmezse 0 verilebilir)
+        """
+        if o_score is None:
+            o_score = 1.0 - x_score
+        self.scores[x_id] += x_score
+        self.scores[o_id] += o_score
+        self.opponents[x_id].add(o_id)
+        self.opponents[o_id].add(x_id)
+
+    def standings(self):
+        """
+        Returns:
+            list: [{"rank", "player_id", "score", "buchholz"}, ...] sıralı
+        """
+        scores = self.scores
+        rows = []
+        for player_id in self.players:
+            buchholz = sum(scores[opponent] for opponent in self.opponents[player_id])
+            rows.append((-scores[player_id], -buchholz, self.seeds[player_id], player_id))
+        rows.sort()
+        return [
+            {"rank": idx + 1, "player_id": player_id, "score": -score, "buchholz": -buchholz}
+            for idx, (score, buchholz, _, player_id) in enumerate(rows)
+        ]
+
+    def summary(self):
+        return {
+            "tournament_id": self.tournament_id,
+            "name": self.name,
+            "format": self.format,
+            "status": self.status,
+            "round": self.round,
+            "rounds": self.rounds,
+            "players": len(self.players)
+        }
+
+
+class TournamentGame:
+    """
+    Turnuva room'una bağlı eşleşme bilgisi (GameRoom.tournament)
+    """
+    __slots__ = ("run", "x_id", "o_id")
+
+    def __init__(self, run, x_id, o_id):
+        self.run = run
+        self.x_id = x_id
+        self.o_id = o_id
+
+
+class TournamentRun:
+    """
+    Çalışan bir turnuvanın server tarafındaki durumu
+    """
+
+    def __init__(self, tournament, round_timeout):
+        self.tournament = tournament
+        self.round_timeout = round_timeout  # Tur bu sürede bitmezse kalan oyunlara hakem kararı
+        self.entrants = {}  # {player_id : {"websocket": ws, "player_info": {...}}}
+        self.rooms = {}  # {player_id : GameRoom} devam eden oyunlar
+        self.pending = 0  # Turda bitmemiş oyun sayısı
+        self.round_done = asyncio.Event()
+        self.starting = False  # Tur oyunları açılırken True: erken biten oyun turu bitirmez
+        self.round_times = []  # Tur başına süre (saniye)
+        self.task = None
+
+
+class TournamentManager:
+    """
+    GameServer üzerinde turnuvaları çalıştırır
+
+    - Her turnuva kendi task'ında tur tur ilerler; turnuvalar aynı loop'ta eşzamanlı çalışır
+    - Her eşleşme için normal bir GameRoom açılır ve oyun server'ın hamle / GAME_END
+      yolundan geçer; sonuç GameServer.publish_game_state'ten game_finished ile gelir
+    - Tur başlarken bağlı olmayan oyuncu hükmen kaybeder
+    """
+
+    def __init__(self, server, round_timeout=300.0, top_count=10):
+        self.server = server
+        self.round_timeout = round_timeout
+        self.top_count = top_count  # Güncellemelerde gönderilen sıralama uzunluğu
+        self.runs = {}  # {tournament_id : TournamentRun}
+        self.registrations = {}  # {websocket : (tournament_id, player_id)}
+        self._counter = 0
+
+    def create(self, tournament_format=SWISS, rounds=None, name=None, round_timeout=None):
+        """
+        Yeni turnuva oluştur (kayıt açık)
+
+        Returns:
+            TournamentRun: Oluşturulan turnuva
+        """
+        self._counter += 1
+        tournament = Tournament(self._counter, tournament_format, rounds, name)
+        run = TournamentRun(tournament, round_timeout if round_timeout is not None else self.round_timeout)
+        self.runs[tournament.tournament_id] = run
+        logger.info(f"Turnuva oluşturuldu: {tournament.name} ({tournament_format})")
+        return run
+
+    def register(self, websocket, tournament_id, player_info):
+        """
+        Oyuncuyu turnuvaya kaydet; çalışan turnuvada aynı oyuncunun yeniden bağlanması
+
+        Returns:
+            tuple: (success: bool, error: str)
+        """
+        run = self.runs.get(tournament_id)
+        if not run:
+            return False, f"Turnuva bulunamadı: {tournament_id}"
+        registered = self.registrations.get(websocket)
+        if registered and registered[0] != tournament_id:
+            other = self.runs.get(registered[0])
+            if other and other.tournament.status != FINISHED:
+                return False, "Aynı anda tek turnuvada oynanabilir"
+
+        player_id = str(player_info["id"])
+        tournament = run.tournament
+        entrant = run.entrants.get(player_id)
+        if entrant:
+            # Yeniden bağlanma: aynı id ve isimle
+            if entrant["player_info"]["name"] != player_info["name"]:
+                return False, "Bu oyuncu id'si turnuvada kayıtlı"
+            entrant["websocket"] = websocket
+            self.registrations[websocket] = (tournament_id, player_id)
+            room = run.rooms.get(player_id)
+            # Turnuva kaydı koltuğun sahibini zaten doğruladı: koltuğun kendi token'ı kullanılır
+            seat_token = next((player["resume_token"] for player in room.players
+                               if str(player["player_info"]["id"]) == player_id), None) if room else None
+            if room and room.rebind_player(websocket, player_info, seat_token):
+                self.server.player_rooms[websocket] = room
+                self.server.session_seated(websocket)
+            return True, None
+
+        if not tournament.add_player(player_id):
+            return False, "Turnuva kaydı kapalı"
+        run.entrants[player_id] = {
+            "websocket": websocket,
+            "player_info": {"id": player_id, "name": player_info["name"]}
+        }
+        self.registrations[websocket] = (tournament_id, player_id)
+        return True, None
+
+    def start(self, tournament_id):
+        """
+        Kaydı kapat ve turnuvayı başlat
+
+        Returns:
+            tuple: (success: bool, error: str)
+        """
+        run = self.runs.get(tournament_id)
+        if not run:
+            return False, f"Turnuva bulunamadı: {tournament_id}"
+        tournament = run.tournament
+        if tournament.status != REGISTERING:
+            return False, "Turnuva zaten başladı"
+        if len(tournament.players) < 2:
+            return False, "En az 2 oyuncu gerekli"
+
+        # Seed: rating'e göre (bilinmeyen oyuncular başlangıç rating'iyle)
+        ratings = self.server.ratings
+
+        def seed_key(player_id):
+            entry = ratings.get(player_id)
+            return -(entry[0] if entry else ratings.INITIAL_RATING)
+
+        tournament.start(seed_key)
+        run.task = asyncio.create_task(self.run_tournament(run))
+        logger.info(f"Turnuva başladı: {tournament.name}, {len(tournament.players)} oyuncu, "
+                    f"{tournament.rounds} tur")
+        return True, None
+
+    async def run_tournament(self, run):
+        """
+        Turnuvayı tur tur oynat: eşleştir, room'ları aç, sonuçları bekle, sıralamayı gönder
+        """
+        tournament = run.tournament
+        try:
+            while not tournament.is_finished():
+                started = time.perf_counter()
+                pairs, bye = tournament.pair_next_round()
+                run.pending = 0
+                run.round_done.clear()
+                run.starting = True
+                try:
+                    for x_id, o_id in pairs:
+                        await self.start_game(run, x_id, o_id)
+                finally:
+                    run.starting = False
+
+                if run.pending:
+                    try:
+                        await asyncio.wait_for(run.round_done.wait(), run.round_timeout)
+                    except asyncio.TimeoutError:
+                        logger.warning(f"{tournament.name}: tur {tournament.round} süresi doldu, "
+                                       f"{run.pending} oyun hakem kararıyla bitiriliyor")
+                        await self.adjudicate_round(run)
+
+                run.round_times.append(time.perf_counter() - started)
+                logger.info(f"{tournament.name}: tur {tournament.round}/{tournament.rounds} bitti "
+                            f"({len(pairs)} oyun, {run.round_times[-1]:.2f}s)")
+                if tournament.round >= tournament.rounds:
+                    tournament.status = FINISHED
+                await self.send_updates(run)
+        except Exception:
+            logger.exception(f"Turnuva hatası ({tournament.name})")
+        finally:
+            tournament.status = FINISHED
+
+    async def start_game(self, run, x_id, o_id):
+        """
+        Eşleşme için room aç ve oyunu başlat; bağlı olmayan oyuncu hükmen kaybeder
+        """
+        tournament = run.tournament
+        x_entrant, o_entrant = run.entrants[x_id], run.entrants[o_id]
+        x_ws, o_ws = x_entrant["websocket"], o_entrant["websocket"]
+        if x_ws is None or o_ws is None:
+            tournament.record_result(x_id, o_id, 0.0 if x_ws is None else 1.0, 0.0 if o_ws is None else 1.0)
+            return
+
+        room = self.server.create_game_room()
+        room.add_player(x_ws, dict(x_entrant["player_info"], symbol="X"))
+        room.add_player(o_ws, dict(o_entrant["player_info"], symbol="O"))
+        room.tournament = TournamentGame(run, x_id, o_id)
+        self.server.player_rooms[x_ws] = room
+        self.server.player_rooms[o_ws] = room
+        self.server.session_seated(x_ws)
+        self.server.session_seated(o_ws)
+        run.rooms[x_id] = room
+        run.rooms[o_id] = room
+        run.pending += 1
+        await self.server.start_room_game(room)
+
+    def game_finished(self, room, winner):
+        """
+        Turnuva oyunu bitti (GameServer.publish_game_state'ten çağrılır)
+        """
+        game = room.tournament
+        room.tournament = None
+        run = game.run
+        score = 1.0 if winner == "X" else 0.5 if winner == "tie" else 0.0
+        run.tournament.record_result(game.x_id, game.o_id, score)
+        run.rooms.pop(game.x_id, None)
+        run.rooms.pop(game.o_id, None)
+        self.server.remove_game_room(room)
+        run.pending -= 1
+        # Tur açılırken biten oyun turu bitirmez: sonraki eşleşmeler henüz başlamadı
+        if run.pending <= 0 and not run.starting:
+            run.round_done.set()
+
+    async def adjudicate_round(self, run):
+        """
+        Süresi dolan turda bitmemiş oyunları bitir: tek bağlı oyuncu kazanır, yoksa berabere
+        """
+        rooms = {id(room): room for room in run.rooms.values()}
+        for room in rooms.values():
+            if not room.tournament or not room.game:
+                continue
+            connected = [player["player_info"]["symbol"] for player in room.players
+                         if player["websocket"] is not None]
+            winner = connected[0] if len(connected) == 1 else "tie"
+            success, _, game_state = room.game.adjudicate(winner)
+            if success:
+                await self.server.publish_game_state(room, game_state, reason="adjudicated")
+
+    async def send_updates(self, run):
+        """
+        Her oyuncuya kendi sırası ve sıralamanın başıyla turnuva durumunu gönder
+        """
+        tournament = run.tournament
+        standings = tournament.standings()
+        top = standings[:self.top_count]
+        summary = tournament.summary()
+        sends = []
+        for standing in standings:
+            websocket = run.entrants[standing["player_id"]]["websocket"]
+            if websocket is not None:
+                sends.append(websocket.send(GameProtocol.serialize_tournament_update(summary, standing, top)))
+        if sends:
+            await asyncio.gather(*sends, return_exceptions=True)
+
+    def player_disconnected(self, websocket):
+        """
+        Bağlantı koptu: oyuncu yeniden bağlanana kadar eşleşmelerde hükmen kaybeder
+        """
+        registered = self.registrations.pop(websocket, None)
+        if not registered:
+            return
+        run = self.runs.get(registered[0])
+        entrant = run.entrants.get(registered[1]) if run else None
+        if entrant and entrant["websocket"] is websocket:
+            entrant["websocket"] = None
+
+    async def handle_create(self, websocket, data):
+        """
+        Operatör yeni turnuva oluşturur (admin_token gerekir, localhost yetmez)
+
+        Args:
+            data (dict): {"format", "rounds", "name", "token"}
+        """
+        try:
+            if not self.server.is_admin(websocket, data, require_token=True):
+                await self.server.send_error(websocket, "Turnuva oluşturmak için yetkiniz yok (server --admin-token "
+                                                        "ile çalışmalı)", "unauthorized")
+                return
+            tournament_format = data.get("format", SWISS)
+            if tournament_format not in FORMATS:
+                await self.server.send_error(websocket, f"Bilinmeyen turnuva formatı: {tournament_format}")
+                return
+            rounds = data.get("rounds")
+            if rounds is not None and (not isinstance(rounds, int) or rounds <= 0):
+                await self.server.send_error(websocket, "Tur sayısı pozitif tam sayı olmalı")
+                return
+            name = data.get("name")
+            run = self.create(tournament_format, rounds, name if isinstance(name, str) else None)
+            await websocket.send(GameProtocol.serialize_tournament_update(run.tournament.summary()))
+        except Exception as e:
+            logger.error(f"Turnuva oluşturma hatası: {e}")
+            await self.server.send_error(websocket, "Turnuva oluşturulamadı")
+
+    async def handle_join(self, websocket, data):
+        """
+        Oyuncu turnuvaya kaydolur (veya çalışan turnuvaya geri döner)
+
+        Args:
+            data (dict): {"tournament_id", "player"}
+        """
+        try:
+            player_data = data.get("player", {})
+            valid, error = GameValidator.validate_player_data(player_data)
+            if not valid:
+                await self.server.send_error(websocket, f"Geçersiz oyuncu verisi: {error}")
+                return
+            tournament_id = data.get("tournament_id")
+            success, error = self.register(websocket, tournament_id, player_data)
+            if not success:
+                await self.server.send_error(websocket, error)
+                return
+            if self.server.event_store:
+                self.server.event_store.record_player_join(player_data["id"], player_data["name"])
+            await websocket.send(GameProtocol.serialize_tournament_update(self.runs[tournament_id].tournament.summary()))
+        except Exception as e:
+            logger.error(f"Turnuva kayıt hatası: {e}")
+            await self.server.send_error(websocket, "Turnuva kaydı başarısız")
+
+    async def handle_start(self, websocket, data):
+        """
+        Operatör turnuvayı başlatır (admin_token gerekir, localhost yetmez)
+
+        Args:
+            data (dict): {"tournament_id", "token"}
+        """
+        try:
+            if not self.server.is_admin(websocket, data, require_token=True):
+                await self.server.send_error(websocket, "Turnuva başlatmak için yetkiniz yok (server --admin-token "
+                                                        "ile çalışmalı)", "unauthorized")
+                return
+            success, error = self.start(data.get("tournament_id"))
+            if not success:
+                await self.server.send_error(websocket, error)
+        except Exception as e:
+            logger.error(f"Turnuva başlatma hatası: {e}")
+            await self.server.send_error(websocket, "Turnuva başlatılamadı")
+
+    def close(self):
+        """
+        Çalışan turnuva task'larını durdur
+        """
+        for run in self.runs.values():
+            if run.task and not run.task.done():
+                run.task.cancel()
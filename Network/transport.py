@@ -0,0 +1,295 @@
+import asyncio
+import contextlib
+import itertools
+import random
+from collections import deque
+from urllib.parse import urlsplit
+
+import websockets
+from websockets.exceptions import ConnectionClosedError, ConnectionClosedOK
+from websockets.frames import Close
+
+# Normal kapanış kodları: karşı taraf ConnectionClosedOK görür, `async for` sessizce biter
+NORMAL_CLOSE_CODES = (1000, 1001)
+
+
+class WebSocketTransport:
+    """
+    Gerçek ağ: websockets kütüphanesi üzerinden TCP bağlantıları (varsayılan)
+
+    GameServer.start_server serve(), GameClient.connect connect() çağırır;
+    ikisi de websockets'in kendi fonksiyonlarına aynen geçer.
+    """
+
+    @staticmethod
+    def serve(handler, host, port, **kwargs):
+        """
+        Bağlantı kabul eden server (async context manager)
+        """
+        return websockets.serve(handler, host, port, **kwargs)
+
+    @staticmethod
+    async def connect(url, **kwargs):
+        """
+        Server'a bağlan
+
+        Returns:
+            websockets ClientConnection
+        """
+        return await websockets.connect(url, **kwargs)
+
+
+class MemoryConnection:
+    """
+    Bellek içi duplex bağlantının bir ucu
+
+    Server ve client kodu için websocket gibi davranır: send(), recv(),
+    `async for`, close(), remote_address. Kapanınca websockets'in kendi
+    hataları (ConnectionClosedOK / ConnectionClosedError) yükselir, mevcut
+    hata yolları değişmeden çalışır.
+
+    Frame'ler MemoryTransport'un gecikme / jitter / kayıp ayarlarıyla karşı
+    uca iletilir; websocket (TCP) gibi sıra korunur. Socket, tampon ve
+    handshake yoktur: bağlantı başına maliyet birkaç Python nesnesidir.
+    """
+    __slots__ = ("transport", "peer", "remote_address", "inbox", "close_frame", "closed",
+                 "_waiter", "in_flight")
+
+    def __init__(self, transport, remote_address):
+        self.transport = transport
+        self.peer = None  # Karşı uç (MemoryConnection)
+        self.remote_address = remote_address
+        self.inbox = deque()  # Alınmış, okunmamış frame'ler
+        self.close_frame = None  # Karşıdan gelen (veya bizim gönderdiğimiz) Close
+        self.closed = False  # close() çağrıldı veya karşıdan Close geldi
+        self._waiter = None  # recv()'in beklediği future
+        self.in_flight = None  # Gecikme varsa bu uçtan giden, yoldaki [(teslim anı, frame), ...]
+
+    def push(self, data):
+        """
+        Frame'i beklemeden gönder (OutboundConnection.push gibi, broadcast bu yolu kullanır)
+
+        Returns:
+            bool: Gönderildi mi? (bağlantı kapalıysa False, send() hatayı yükseltir)
+        """
+        if self.closed or self.close_frame:
+            return False
+        self.transport.transmit(self, data)
+        return True
+
+    async def send(self, data):
+        if not self.push(data):
+            raise self._closed_error()
+
+    async def recv(self):
+        """
+        Sıradaki frame'i bekle
+
+        Raises:
+            ConnectionClosed: Bağlantı kapandıysa ve okunmamış frame kalmadıysa
+        """
+        while not self.inbox:
+            if self.close_frame:
+                raise self._closed_error()
+            if self._waiter is not None:
+                raise RuntimeError("Aynı bağlantıda eşzamanlı recv()")
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        return self.inbox.popleft()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return await self.recv()
+        except ConnectionClosedOK:
+            raise StopAsyncIteration from None
+
+    async def close(self, code=1000, reason=""):
+        """
+        Bağlantıyı kapat: Close frame'i veri frame'lerinin arkasından karşıya gider
+        """
+        if self.closed:
+            return
+        self.closed = True
+        frame = Close(code, reason)
+        if self.close_frame is None:
+            self.close_frame = frame
+        self.transport.transmit(self, frame)
+        self._wake()
+
+    def deliver(self, item):
+        """
+        Karşı uçtan gelen frame'i (veya Close'u) al
+        """
+        if isinstance(item, Close):
+            if self.close_frame is None:
+                self.close_frame = item
+            self.closed = True
+        elif not self.closed:
+            self.inbox.append(item)
+        self._wake()
+
+    def _wake(self):
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def _closed_error(self):
+        frame = self.close_frame
+        if frame is None or frame.code not in NORMAL_CLOSE_CODES:
+            return ConnectionClosedError(frame, None)
+        return ConnectionClosedOK(frame, None)
+
+
+class MemoryTransport:
+    """
+    Socket'siz transport: aynı process'teki server ve client'lar bellek içi
+    duplex bağlantılarla konuşur
+
+    Dosya tanımlayıcısı, kernel ve websocket çerçeveleme maliyeti olmadığı
+    için tek process'te yüz binlerce client simüle edilebilir; eşleştirme,
+    yönlendirme ve broadcast gibi server mantığı ağdan bağımsız ölçülür.
+
+    Ağ koşulları (her yön için ayrı):
+    - latency: tek yön gecikme (saniye)
+    - jitter: gecikmeye eklenen rastgele 0..jitter süre
+    - loss: frame'in kaybolma olasılığı. Websocket TCP üzerinde çalıştığı için
+      kayıp frame düşürülmez, `rto` sonra yeniden iletilir; sıra korunduğu
+      için arkasındaki frame'ler de bekler (head-of-line blocking)
+
+    Gecikme, jitter ve kayıp 0 ise frame karşı uca hemen eklenir (timer yok).
+
+    Kullanım:
+        transport = MemoryTransport(latency=0.02, jitter=0.005, loss=0.01)
+        server = GameServer("sim", 1, transport=transport)
+        client = GameClient("ws://sim:1", transport=transport)
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, loss=0.0, rto=0.2, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.loss = loss
+        self.rto = rto  # Kayıp frame'in yeniden iletim gecikmesi (saniye)
+        self.random = random.Random(seed)
+        self.listeners = {}  # {(host, port) : handler}
+        self.connections = {}  # {(host, port) : server tarafı açık bağlantılar}
+        self._ids = itertools.count(1)
+        self._tasks = set()
+        self.frames = 0  # İletilen frame sayısı (istatistik)
+        self.retransmits = 0  # Kayıp yüzünden yeniden iletilen frame sayısı (istatistik)
+
+    def delay(self):
+        """
+        Tek frame için tek yön gecikme
+        """
+        delay = self.latency
+        if self.jitter:
+            delay += self.random.random() * self.jitter
+        if self.loss and self.random.random() < self.loss:
+            self.retransmits += 1
+            delay += self.rto
+        return delay
+
+    def transmit(self, sender, item):
+        """
+        Frame'i gönderen ucun karşısına ilet (sıra korunarak)
+        """
+        self.frames += 1
+        peer = sender.peer
+        if not (self.latency or self.jitter or self.loss):
+            peer.deliver(item)
+            return
+        loop = asyncio.get_running_loop()
+        in_flight = sender.in_flight
+        if in_flight is None:
+            in_flight = sender.in_flight = deque()
+        at = loop.time() + self.delay()
+        if in_flight:
+            # Önceki frame'den önce teslim edilmez (TCP gibi sıralı); yön başına tek timer
+            in_flight.append((max(at, in_flight[-1][0]), item))
+        else:
+            in_flight.append((at, item))
+            loop.call_at(at, self._arrive, sender)
+
+    def _arrive(self, sender):
+        """
+        Teslim anı gelmiş frame'leri sırayla karşı uca ver, kalan varsa timer'ı yenile
+        """
+        loop = asyncio.get_running_loop()
+        in_flight = sender.in_flight
+        peer = sender.peer
+        # Timer baştaki frame için kuruldu (loop onu saat çözünürlüğü kadar erken çalıştırabilir)
+        peer.deliver(in_flight.popleft()[1])
+        now = loop.time()
+        while in_flight and in_flight[0][0] <= now:
+            peer.deliver(in_flight.popleft()[1])
+        if in_flight:
+            loop.call_at(in_flight[0][0], self._arrive, sender)
+
+    @contextlib.asynccontextmanager
+    async def serve(self, handler, host, port, **kwargs):
+        """
+        (host, port) adresinde bağlantı kabul et; websockets.serve gibi her
+        bağlantı için handler(connection) ayrı task'ta çalışır. Çıkışta açık
+        bağlantılar 1001 ile kapatılır.
+        """
+        key = (host, port)
+        if key in self.listeners:
+            raise OSError(f"Adres kullanımda: {host}:{port}")
+        self.listeners[key] = handler
+        self.connections[key] = set()
+        try:
+            yield self
+        finally:
+            del self.listeners[key]
+            for connection in list(self.connections.pop(key)):
+                await connection.close(1001, "Server kapanıyor")
+
+    async def connect(self, url, **kwargs):
+        """
+        URL'deki (host, port) adresini dinleyen server'a bağlan
+
+        Gecikme varsa handshake bir RTT sürer.
+
+        Returns:
+            MemoryConnection: Client ucu
+
+        Raises:
+            ConnectionRefusedError: Adreste dinleyen server yok
+        """
+        parts = urlsplit(url)
+        key = (parts.hostname, parts.port)
+        if key not in self.listeners:
+            raise ConnectionRefusedError(f"Bağlantı reddedildi: {url}")
+        if self.latency or self.jitter:
+            await asyncio.sleep(2 * self.latency + self.random.random() * self.jitter)
+        handler = self.listeners.get(key)
+        if handler is None:
+            raise ConnectionRefusedError(f"Bağlantı reddedildi: {url}")
+        conn_id = next(self._ids)
+        client = MemoryConnection(self, key)
+        server = MemoryConnection(self, ("memory", conn_id))
+        client.peer = server
+        server.peer = client
+        self.connections[key].add(server)
+        task = asyncio.get_running_loop().create_task(self._run_handler(handler, server, key))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return client
+
+    async def _run_handler(self, handler, connection, key):
+        """
+        Handler'ı çalıştır; bitince bağlantıyı kapat (websockets.serve gibi)
+        """
+        try:
+            await handler(connection)
+        finally:
+            await connection.close()
+            listening = self.connections.get(key)
+            if listening is not None:
+                listening.discard(connection)
@@ -5,9 +5,14 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import asyncio
 import websockets
 import json
+import time
 from enum import Enum
 from Utils.protocol import GameProtocol, MessageType
 from Utils.validator import GameValidator
+from Utils.board_renderer import BoardRenderer
+from Network.prediction import MovePredictor
+from Utils.clock_sync import ClockSync, ntp_sample, valid_timestamp
+from Network.transport import WebSocketTransport
 
 class ClientStatus(Enum):
     DISCONNECTED = 1
@@ -16,12 +21,30 @@ class ClientStatus(Enum):
 
 
 class GameClient:
-    def __init__(self, server_url=""):
+    MAX_PENDING_TRACES = 16  # Cevabı beklenen en fazla trace
+    
+    def __init__(self, server_url="", predict=True, tracer=None, transport=None):
         self.server_url = server_url
+        self.transport = transport or WebSocketTransport()  # Test/simülasyon için MemoryTransport
         self.websocket = None
         self.status = ClientStatus.DISCONNECTED
         self.player_symbol = None
         self.room_id = None
+        self.resume_token = None  # Kopunca koltuğu geri almak için (waiting mesajıyla gelir)
+        self.renderer = BoardRenderer()
+        # Optimistic move: kendi hamlemiz server'ın cevabını beklemeden local board'a uygulanır
+        self.predictor = MovePredictor() if predict else None
+        self.last_state = None  # Server'dan gelen son game_state verisi
+        # Heartbeat'lerden RTT ve server saat farkı (NTP tarzı, ek mesaj yok)
+        self.clock_sync = ClockSync()
+        self._last_reply = None  # (cevabın t2'si, alındığı an): sonraki heartbeat'le server'a döner
+        # Ayrı receive task'ı çalışıyorsa heartbeat dışındaki frame'ler bu kuyruktan okunur
+        self._inbox = None
+        self._receiver = None
+        # Hamle tracing'i: örneklenen hamlenin trace bağlamı frame'de server'a gider,
+        # aynı trace id'li game_state gelince uçtan uca süre kaydedilir
+        self.tracer = tracer
+        self.pending_traces = {}  # {trace_id : "client.send_move" span'ı}
 
     async def connect(self):
         """
@@ -35,7 +58,7 @@ class GameClient:
             self.status = ClientStatus.CONNECTING
             print(f"Bağlanılıyor: {self.server_url}")
             
-            self.websocket = await websockets.connect(self.server_url)
+            self.websocket = await self.transport.connect(self.server_url)
             self.status = ClientStatus.CONNECTED
             print("Server'a başarıyla bağlanıldı!")
             return True
@@ -58,6 +81,10 @@ class GameClient:
             bool: Disconnect başarılı mı?
         """
         try:
+            if self._receiver:
+                self._receiver.cancel()
+                self._receiver = None
+                self._inbox = None
             if self.websocket:
                 await self.websocket.close()
                 self.websocket = None
@@ -68,6 +95,27 @@ class GameClient:
             print(f"Disconnect hatası: {e}")
             return False
     
+    async def reconnect(self, player, retries=5, delay=1.0):
+        """
+        Bağlantı koptuğunda (örn. server restart) aynı room'a geri dön
+        room_id ve oyuncu kimliği join mesajıyla gönderilir, server
+        oyunu kaldığı yerden devam ettirir
+        
+        Args:
+            player (Player): Local player
+            retries (int): Deneme sayısı
+            delay (float): Denemeler arası bekleme (saniye)
+            
+        Returns:
+            bool: Yeniden bağlanma başarılı mı?
+        """
+        for attempt in range(1, retries + 1):
+            print(f"Yeniden bağlanılıyor... ({attempt}/{retries})")
+            if await self.connect():
+                return await self.send_player_join(player)
+            await asyncio.sleep(delay)
+        return False
+
     async def send_message(self, message):
         """
         Server'a mesaj gönder
@@ -94,24 +142,118 @@ class GameClient:
             print("Bağlantı yok veya kapalı!")
             return False
 
-    async def send_player_join(self, player):
+    async def send_player_join(self, player, opponent=None):
         """
         Oyuncunun katılma isteğini server'a gönder
         
         Args:
             player (Player): Katılacak oyuncu
+            opponent (str, optional): "bot" ise server'daki botla oynanır
             
         Returns:
             bool: Gönderme başarılı mı?
         """
         try:
-            join_message = GameProtocol.serialize_player_join(player, self.room_id)
+            join_message = GameProtocol.serialize_player_join(player, self.room_id, opponent, self.resume_token)
             message_dict = json.loads(join_message)
             return await self.send_message(message_dict)
         except Exception as e:
             print(f"Player join mesajı gönderme hatası: {e}")
             return False
 
+    async def send_spectate(self, room_id):
+        """
+        Bir room'u izleyici olarak takip etme isteği gönder
+        İzleyici state güncellemelerini alır, hamle yapamaz
+        
+        Args:
+            room_id (int): İzlenecek room ID'si
+            
+        Returns:
+            bool: Gönderme başarılı mı?
+        """
+        try:
+            message_dict = json.loads(GameProtocol.serialize_spectate(room_id))
+            return await self.send_message(message_dict)
+        except Exception as e:
+            print(f"Spectate mesajı gönderme hatası: {e}")
+            return False
+
+    async def send_admin_subscribe(self, token=None):
+        """
+        Server'ın admin kanalına abone ol (operatör dashboard'u için)
+        Server düzenli aralıklarla server_summary mesajı gönderir
+        
+        Args:
+            token (str, optional): Admin anahtarı
+            
+        Returns:
+            bool: Gönderme başarılı mı?
+        """
+        try:
+            message_dict = json.loads(GameProtocol.serialize_admin_subscribe(token))
+            return await self.send_message(message_dict)
+        except Exception as e:
+            print(f"Admin abonelik mesajı gönderme hatası: {e}")
+            return False
+
+    async def send_book_query(self, board, limit=None):
+        """
+        Açılış kitabından pozisyondaki popüler hamleleri iste
+        Server book_reply mesajıyla cevap verir
+        
+        Args:
+            board (list): 3x3 board matrix
+            limit (int, optional): En fazla hamle sayısı
+            
+        Returns:
+            bool: Gönderme başarılı mı?
+        """
+        try:
+            message_dict = json.loads(GameProtocol.serialize_book_query(board, limit))
+            return await self.send_message(message_dict)
+        except Exception as e:
+            print(f"Kitap sorgusu gönderme hatası: {e}")
+            return False
+
+    async def send_leaderboard_query(self, limit=10, player_id=None):
+        """
+        Rating sıralamasını iste
+        Server leaderboard mesajıyla cevap verir
+        
+        Args:
+            limit (int): İlk kaç oyuncu
+            player_id (str, optional): Sırası ayrıca istenen oyuncu
+            
+        Returns:
+            bool: Gönderme başarılı mı?
+        """
+        try:
+            message_dict = json.loads(GameProtocol.serialize_leaderboard_query(limit, player_id))
+            return await self.send_message(message_dict)
+        except Exception as e:
+            print(f"Sıralama sorgusu gönderme hatası: {e}")
+            return False
+
+    async def send_history_query(self, player_id, limit=20):
+        """
+        Oyuncunun kayıtlı oyun geçmişini ve istatistiklerini iste
+        Server history mesajıyla cevap verir
+        
+        Args:
+            player_id (str): Oyuncu id'si
+            limit (int): En fazla kaç oyun
+            
+        Returns:
+            bool: Gönderme başarılı mı?
+        """
+        try:
+            message_dict = json.loads(GameProtocol.serialize_history_query(player_id, limit))
+            return await self.send_message(message_dict)
+        except Exception as e:
+            print(f"Geçmiş sorgusu gönderme hatası: {e}")
+            return False
+
     async def send_move(self, player, row, col):
         """
         Hamleyi JSON olarak serialize et ve server'a gönder
@@ -124,6 +266,7 @@ class GameClient:
         Returns:
             bool: Gönderme başarılı mı?
         """
+        trace = self.tracer.start("client.send_move", row=row, col=col) if self.tracer else None
         try:
             # Koordinatları validate et
             valid, error = GameValidator.validate_coordinates(row, col)
@@ -131,6 +274,14 @@ class GameClient:
                 print(f"Geçersiz koordinat: {error}")
                 return False
             
+            # Tahmin: hamle hemen local board'a uygulanır, seq ile server'a gönderilir
+            seq = None
+            if self.predictor:
+                seq = self.predictor.apply(row, col, player.symbol)
+                if seq is None:
+                    print("Bu hücre dolu!")
+                    return False
+            
             message = {
                 "type": MessageType.MOVE.value,
                 "data": {
@@ -143,11 +294,96 @@ class GameClient:
                     }
                 }
             }
-            return await self.send_message(message)
+            if seq is not None:
+                message["data"]["seq"] = seq
+            if trace:
+                message["trace"] = trace.context()
+            sent = await self.send_message(message)
+            if not sent and seq is not None:
+                self.predictor.on_reject(seq)
+            if sent and trace:
+                self.track_trace(trace)
+            return sent
             
         except Exception as e:
             print(f"Move gönderme hatası: {e}")
             return False
+        finally:
+            if trace:
+                trace.finish()
+
+    def track_trace(self, trace):
+        """
+        Gönderilen hamlenin trace'ini server'ın cevabı gelene kadar sakla
+        (cevapsız kalanlar için en fazla MAX_PENDING_TRACES tutulur)
+        """
+        self.pending_traces[trace.trace_id] = trace
+        if len(self.pending_traces) > self.MAX_PENDING_TRACES:
+            del self.pending_traces[next(iter(self.pending_traces))]
+
+    def finish_trace(self, parsed_message):
+        """
+        Hamlemizin trace id'sini taşıyan server mesajı geldi: gönderimden bu
+        ana kadar geçen süreyi "client.state_received" span'ı olarak kaydet
+        
+        Returns:
+            bool: Bekleyen bir trace kapatıldı mı?
+        """
+        context = parsed_message.get("trace")
+        if not isinstance(context, dict):
+            return False
+        trace = self.pending_traces.pop(context.get("id"), None)
+        if trace is None:
+            return False
+        trace.record("client.state_received", trace.started, type=parsed_message.get("type"))
+        return True
+
+    @property
+    def board(self):
+        """
+        Kullanıcıya gösterilen board: tahmin açıksa bekleyen hamleler dahil
+        
+        Returns:
+            list: 3x3 board matrix veya henüz state yoksa None
+        """
+        if self.predictor:
+            return self.predictor.board.board
+        return self.last_state.get("board") if self.last_state else None
+
+    def is_my_turn(self):
+        """
+        Son server state'ine göre sıra bizde mi (oyun devam ediyorsa)?
+        """
+        state = self.last_state
+        return (state is not None and state.get("current_player") == self.player_symbol
+                and not state.get("is_game_over", False))
+
+    def reconcile(self, parsed_message):
+        """
+        Tahmin edilen board'u server mesajıyla uzlaştır
+        game_state server'ın board'unu esas alır, seq'li error o hamleyi geri alır
+        İzlenen bir hamlenin cevabıysa trace'i de kapatılır
+        
+        Args:
+            parsed_message (dict): Server mesajı
+            
+        Returns:
+            bool: Tahmin edilen bir hamle geri alındı mı?
+        """
+        message_type = parsed_message.get("type")
+        data = parsed_message.get("data") or {}
+        if self.pending_traces:
+            self.finish_trace(parsed_message)
+        if message_type == MessageType.GAME_STATE.value:
+            self.last_state = data
+            return self.predictor.on_state(data) if self.predictor else False
+        if message_type == MessageType.GAME_START.value:
+            self.last_state = None
+            if self.predictor:
+                self.predictor.reset()
+        elif message_type == MessageType.ERROR.value and self.predictor and data.get("seq") is not None:
+            return self.predictor.on_reject(data["seq"])
+        return False
 
     async def listen_for_updates(self):
         """
@@ -157,6 +393,12 @@ class GameClient:
         Returns:
             str: Gelen mesaj (JSON string) veya None
         """
+        if self._inbox is not None:
+            # Frame'leri receive task'ı okuyor; None bağlantının kapandığını bildirir
+            message = await self._inbox.get()
+            if message is None:
+                self._inbox.put_nowait(None)
+            return message
         while self.status == ClientStatus.CONNECTED:
             try:
                 if self.websocket:
@@ -175,6 +417,42 @@ class GameClient:
         
         return None
 
+    def start_receiver(self):
+        """
+        Frame'leri ayrı bir task'ta okumaya başla
+
+        Heartbeat cevabı geldiği an damgalanıp işlenir; oyun döngüsü kullanıcının
+        hamlesini beklerken bile t3 geç kalmaz (aksi halde RTT şişer). Diğer
+        frame'ler sırayla listen_for_updates'e verilir.
+
+        Returns:
+            asyncio.Task: Receive task'ı (disconnect iptal eder)
+        """
+        self._inbox = asyncio.Queue()
+        self._receiver = asyncio.create_task(self.receive_loop(self._inbox))
+        return self._receiver
+
+    async def receive_loop(self, inbox):
+        """
+        Bağlantı kapanana kadar frame oku: heartbeat'leri hemen işle, kalanları kuyruğa koy
+        """
+        try:
+            while self.websocket:
+                message = await self.websocket.recv()
+                received = time.time()
+                parsed_message = GameProtocol.deserialize_message(message)
+                if parsed_message and parsed_message.get("type") == MessageType.HEARTBEAT.value:
+                    self.handle_heartbeat(parsed_message.get("data", {}), received)
+                    continue
+                inbox.put_nowait(message)
+        except websockets.exceptions.ConnectionClosed:
+            print("Server bağlantısı kesildi!")
+            self.status = ClientStatus.DISCONNECTED
+        except Exception as e:
+            print(f"Mesaj dinleme hatası: {e}")
+        finally:
+            inbox.put_nowait(None)
+
     async def send_heartbeat(self):
         """
         Server'a heartbeat gönder (connection canlılığı için)
@@ -183,13 +461,44 @@ class GameClient:
             bool: Gönderme başarılı mı?
         """
         try:
-            heartbeat_message = GameProtocol.create_heartbeat()
+            heartbeat_message = GameProtocol.create_heartbeat(*(self._last_reply or ()))
             message_dict = json.loads(heartbeat_message)
+            self.clock_sync.mark_sent(message_dict["data"]["t0"])
             return await self.send_message(message_dict)
         except Exception as e:
             print(f"Heartbeat gönderme hatası: {e}")
             return False
 
+    def handle_heartbeat(self, data, received=None):
+        """
+        Heartbeat cevabından RTT ve saat farkı ölçümü yap
+        
+        Args:
+            data (dict): {"t0", "t1", "t2"} (server cevabı)
+            received (float, optional): Cevabın alındığı an (varsayılan: şimdi)
+            
+        Returns:
+            bool: Ölçüm kabul edildi mi?
+        """
+        received = time.time() if received is None else received
+        sync = self.clock_sync
+        t0, t1, t2 = (data.get(key) for key in ("t0", "t1", "t2"))
+        if not (valid_timestamp(t1) and valid_timestamp(t2)) or not sync.acknowledge(t0):
+            return False
+        self._last_reply = (t2, received)
+        return sync.add_sample(*ntp_sample(t0, t1, t2, received))
+
+    async def heartbeat_loop(self, interval=5.0):
+        """
+        Bağlantı açık kaldıkça sabit aralıkla heartbeat gönder
+        
+        Args:
+            interval (float): Heartbeat aralığı (saniye)
+        """
+        while self.is_connected():
+            await self.send_heartbeat()
+            await asyncio.sleep(interval)
+
     def get_user_input(self):
         """
         Kullanıcıdan hamle koordinatlarını al (network client için özel)
@@ -239,40 +548,14 @@ class GameClient:
         Mevcut board durumunu terminal'de göster
         
         Args:
-            board (list): 3x3 board matrix
+            board (list): N x N board matrix
         """
         try:
             if not board:
                 print("Board verisi yok!")
                 return
             
-            print("\n   0   1   2")  # Sütun numaraları
-            print("  -----------")
-            
-            for row_idx in range(3):
-                print(f"{row_idx}|", end="")
-                
-                for col_idx in range(3):
-                    # Hücre içeriği
-                    cell = board[row_idx][col_idx] if row_idx < len(board) and col_idx < len(board[row_idx]) else None
-                    if cell is None:
-                        display_char = " "
-                    else:
-                        display_char = cell
-                    
-                    print(f" {display_char} ", end="")
-                    
-                    # Sütun ayırıcısı
-                    if col_idx < 2:
-                        print("|", end="")
-                
-                print()  # Satır sonu
-                
-                # Satır ayırıcısı (son satır değilse)
-                if row_idx < 2:
-                    print("  -----------")
-            
-            print("  -----------\n")
+            self.renderer.draw(board)
             
         except Exception as e:
             print(f"Board display hatası: {e}")
@@ -295,28 +578,38 @@ class GameClient:
             
             message_type = parsed_message.get("type")
             data = parsed_message.get("data", {})
+            if message_type == MessageType.HEARTBEAT.value:
+                self.handle_heartbeat(data)
+                return parsed_message
+            rolled_back = self.reconcile(parsed_message)
             
             print(f"Server mesajı: {message_type}")
             
             if message_type == "welcome":
                 print(f"✅ {data.get('message', 'Hoş geldiniz!')}")
-                self.room_id = data.get("room_id")
+                # Yeniden bağlanırken oyunun room_id'sini koru
+                if self.room_id is None:
+                    self.room_id = data.get("room_id")
                 
             elif message_type == "waiting":
                 print(f"⏳ {data.get('message', 'Bekleniyor...')}")
                 self.player_symbol = data.get("your_symbol")
+                self.resume_token = data.get("resume_token", self.resume_token)
                 if self.player_symbol:
                     print(f"🎯 Sizin sembolünüz: {self.player_symbol}")
                 
             elif message_type == MessageType.GAME_START.value:
                 print("🎮 Oyun başlıyor!")
+                self.room_id = data.get("room_id", self.room_id)
                 players = data.get("players", [])
                 for player in players:
                     print(f"👤 {player.get('name')} ({player.get('symbol')})")
                 
             elif message_type == MessageType.GAME_STATE.value:
-                # Game state göster
-                board = data.get("board")
+                # Game state göster (tahmin açıksa server'ın henüz işlemediği hamlemiz dahil)
+                if rolled_back:
+                    self.renderer.notice("↩️  Hamleniz server tarafından kabul edilmedi, geri alındı")
+                board = self.board
                 if board:
                     self.display_board(board)
                 
@@ -327,9 +620,24 @@ class GameClient:
                     else:
                         print(f"⏳ Rakibin sırası... ({current_player})")
                 
+                # Süre limiti varsa kalan süreleri göster
+                clock = data.get("clock")
+                if clock:
+                    remaining = clock.get("remaining", {})
+                    if remaining.get("X") is not None:
+                        print(f"⏱️  X: {remaining['X']:.1f}s | O: {remaining['O']:.1f}s")
+                    if clock.get("turn_left") is not None:
+                        print(f"⏱️  Hamle için kalan süre: {clock['turn_left']:.1f}s")
+                
+                # Heartbeat'lerden ölçülen bağlantı gecikmesi
+                if self.clock_sync.srtt is not None:
+                    print(f"📶 Gecikme (RTT): {self.clock_sync.srtt * 1000:.0f} ms")
+                
             elif message_type == MessageType.GAME_END.value:
                 winner = data.get("winner")
                 print("\n" + "="*50)
+                if data.get("reason") == "timeout":
+                    print("⏰ Süre doldu!")
                 if winner == "tie":
                     print("🤝 BERABERE!")
                 elif winner == self.player_symbol:
@@ -340,11 +648,11 @@ class GameClient:
                 
             elif message_type == MessageType.ERROR.value:
                 error_msg = data.get("message", "Bilinmeyen hata")
-                print(f"❌ HATA: {error_msg}")
-                
-            elif message_type == MessageType.HEARTBEAT.value:
-                # Heartbeat response - sessizce handle et
-                pass
+                # Board yeniden çizilirse altında tekrar görünsün
+                self.renderer.notice(f"❌ HATA: {error_msg}")
+                if rolled_back:
+                    self.renderer.notice("↩️  Hamle geri alındı")
+                    self.display_board(self.board)
                 
             else:
                 print(f"⚠️ Bilinmeyen mesaj türü: {message_type}")
@@ -371,6 +679,7 @@ class GameClient:
         Args:
             player (Player): Local player
         """
+        heartbeat_task = None
         try:
             print("Oyun döngüsü başlatılıyor...")
             
@@ -378,6 +687,9 @@ class GameClient:
             if not await self.send_player_join(player):
                 print("Player join gönderilemedi!")
                 return
+            # Heartbeat cevapları ayrı task'ta, geldiği an işlenir (hamle beklenirken de)
+            self.start_receiver()
+            heartbeat_task = asyncio.create_task(self.heartbeat_loop())
             
             # Ana oyun döngüsü
             while self.is_connected():
@@ -395,23 +707,34 @@ class GameClient:
                 data = parsed_message.get("data", {})
                 
                 # Eğer bizim sıramızsa ve oyun devam ediyorsa
-                if (message_type == MessageType.GAME_STATE.value and 
-                    data.get("current_player") == self.player_symbol and
-                    not data.get("is_game_over", False)):
-                    
-                    # Kullanıcıdan hamle al
-                    move = self.get_user_input()
-                    if move is None:  # Quit
-                        break
+                # (hamlemiz reddedildiyse sıra hâlâ bizde: tekrar sorulur)
+                rejected = message_type == MessageType.ERROR.value and data.get("seq") is not None
+                if (message_type == MessageType.GAME_STATE.value or rejected) and self.is_my_turn():
                     
-                    row, col = move
-                    # Hamleyi gönder
-                    if not await self.send_move(player, row, col):
+                    # Kullanıcıdan hamle al (geçersiz hamlede tekrar); input() loop'u
+                    # bloklamasın: heartbeat gönderimi ve receive task'ı çalışmaya devam etsin
+                    loop = asyncio.get_running_loop()
+                    while True:
+                        move = await loop.run_in_executor(None, self.get_user_input)
+                        if move is None:  # Quit
+                            break
+                        
+                        row, col = move
+                        # Hamleyi gönder; tahmin açıksa board hemen güncellenir
+                        if await self.send_move(player, row, col):
+                            if self.predictor:
+                                self.display_board(self.board)
+                            break
                         print("Hamle gönderilemedi!")
+                        if not self.is_connected():
+                            break
+                    if move is None:
+                        break
                 
                 # Oyun bittiyse döngüden çık
                 elif message_type == MessageType.GAME_END.value:
-                    input("Devam etmek için Enter'a basın...")
+                    await asyncio.get_running_loop().run_in_executor(
+                        None, input, "Devam etmek için Enter'a basın...")
                     break
             
         except KeyboardInterrupt:
@@ -419,6 +742,8 @@ class GameClient:
         except Exception as e:
             print(f"Oyun döngüsü hatası: {e}")
         finally:
+            if heartbeat_task:
+                heartbeat_task.cancel()
             await self.disconnect()
 
 
@@ -442,7 +767,8 @@ async def main():
         # Bağlan
         if await client.connect():
             from Game.player import Player
-            player = Player(player_id=1, symbol="X", name=player_name)
+            # Rating'ler oyuncu id'sine bağlı: id olarak oyuncu adı kullanılır
+            player = Player(player_id=player_name, symbol="X", name=player_name)
             
             # Oyun döngüsünü başlat
             await client.game_loop(player)
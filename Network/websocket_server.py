@@ -3,14 +3,45 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import asyncio
+import hmac
+import multiprocessing
+import secrets
+import logging
 import websockets
 import json
+import time
 import uuid
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
 from Utils.protocol import GameProtocol, MessageType
 from Game.player import Player
 from Game.game_logic import Game
+from Game.clock import GameClock
 from Utils.validator import GameValidator
+from Utils.rate_limiter import TokenBucket
+from Utils.timer_wheel import TimerWheel
+from Utils.clock_sync import ClockSync, ntp_sample, valid_timestamp
+from Utils.tracing import span
+from Network.profiler_control import ProfilerControl
+from Network.diagnostics import MemoryDiagnostics
+from Network.spectator import Subscriber
+from Network.server_stats import ServerStats
+from Game.opening_book import OpeningBook
+from Utils.game_log import GameLogWriter
+from Game.rating import RatingSystem, RatingStore
+from Utils.event_store import EventStore
+from Network.tournament import TournamentManager
+from Network.multiplex import SessionChannel, valid_session_id
+from Network.cluster import ClusterNode
+from Network.bot import BotConnection, BOT_OPPONENT, BOT_PLAYER
+from Network.outbound import OutboundScheduler, OutboundConnection, websockets_supported
+from Network.transport import WebSocketTransport, MemoryConnection
+from Game.mcts import MCTSBot
+
+logger = logging.getLogger(__name__)
+
+# Frame'i beklemeden tampona ekleyebilen (push) bağlantı türleri
+PUSH_CONNECTIONS = (OutboundConnection, SessionChannel, MemoryConnection)
 
 
 class Status(Enum):
@@ -20,23 +51,137 @@ class Status(Enum):
 
     
 class GameServer:
-    def __init__(self, host='localhost', port=8765):
+    ERROR_DEDUP_WINDOW = 1.0  # Aynı hata mesajı bu süre içinde tekrar gönderilmez (saniye)
+    MAX_BUCKET_SCALE = 32  # Multiplexed bağlantının mesaj limiti en fazla bu kadar katına çıkar
+    MAX_LAG_COMPENSATION = 0.5  # Oyuncu saatinden hamle başına düşülebilecek en fazla gecikme (saniye)
+    
+    def __init__(self, host='localhost', port=8765, reuse_port=False, drain_timeout=30.0, snapshot_path=None,
+                 message_rate=20.0, message_burst=40, max_violations=50,
+                 connection_rate=500.0, max_clients=None,
+                 turn_time=None, game_time=None, increment=0.0, timer_tick=0.1,
+                 admin_token=None, summary_interval=0.5,
+                 game_log_path=None, opening_book_path=None,
+                 rating_db_path=None, rating_interval=1.0, event_db_path=None,
+                 max_sessions=256, broker=None, bot_time=1.0, bot_workers=None, max_bot_games=None,
+                 flush_delay=0.0, tracer=None, profile_dir=".", profile_socket=None, transport=None,
+                 reconnect_grace=60.0):
         self.host = host
         self.port = port 
+        # Bağlantıların geldiği transport: gerçek websocket (varsayılan) veya
+        # simülasyon için bellek içi MemoryTransport
+        self.transport = transport or WebSocketTransport()
+        self.reuse_port = reuse_port  # Birden fazla worker aynı portu paylaşsın mı?
+        self.drain_timeout = drain_timeout  # Kapanışta aktif oyunlar için beklenecek süre (saniye)
+        self.snapshot_path = snapshot_path  # Restart'ta yarım kalan oyunların kaydedileceği dosya
+        # Ayrılan oyuncu bu süre içinde dönmezse oyun hakem kararıyla bitirilip silinir
+        self.reconnect_grace = reconnect_grace
         self.clients = set()
         self.game_rooms = {}  # {room_id : GameRoom}
+        self.player_rooms = {}  # {websocket : GameRoom} oyuncunun şu an oynadığı room
         self.waiting_room = None  # Bekleyen oyuncular için
+        self.spectating = {}  # {websocket : room_id} izleyiciler için
+        self.draining = False  # True iken yeni oyuncu kabul edilmez
+        self._stop_event = None
+        
+        # Bağlantı başına mesaj limiti (None = limitsiz)
+        self.message_rate = message_rate
+        self.message_burst = message_burst
+        self.max_violations = max_violations  # Art arda bu kadar limit aşımında bağlantı kapatılır
+        # Global kabul limiti: saniyedeki yeni bağlantı ve toplam client sayısı
+        self.admission = TokenBucket(connection_rate, connection_rate) if connection_rate else None
+        self.max_clients = max_clients
+        self.connection_buckets = {}  # {websocket : TokenBucket}
+        self._last_errors = {}  # {websocket : (mesaj, zaman)} hata tekrarını önlemek için
+        self.clock_sync = {}  # {websocket : ClockSync} heartbeat'lerden RTT ve saat farkı
+        
+        # Oyun saati: tüm room'ların süreleri tek bir timer wheel ile takip edilir
+        self.turn_time = turn_time
+        self.game_time = game_time
+        self.increment = increment
+        self.timer_wheel = TimerWheel(tick=timer_tick, now=time.monotonic())
+        self._timer_task = None
+        self._background_tasks = set()
+        
+        # Operatör admin kanalı: artımlı özet, sabit aralıkla abonelere gönderilir
+        self.admin_token = admin_token  # None ise sadece localhost'tan abone olunabilir
+        self.summary_interval = summary_interval
+        self.stats = ServerStats()
+        self.admins = {}  # {websocket : Subscriber}
+        self._summary_task = None
+        
+        # Biten oyunların append-only log'u (açılış kitabı indexer'ı okur)
+        self.game_log = GameLogWriter(game_log_path) if game_log_path else None
+        # Memory-mapped açılış kitabı ("popüler hamleler" sorguları için)
+        self.opening_book = OpeningBook(opening_book_path) if opening_book_path else None
+        
+        # Elo rating'leri: biten oyunlar kuyruğa alınır, tek task toplu uygular
+        # ve değişen oyuncuları SQLite'a (WAL) tek transaction'da yazar
+        self.ratings = RatingSystem()
+        self.rating_db_path = rating_db_path
+        self.rating_store = None
+        self.rating_interval = rating_interval
+        self.pending_results = []  # [(player1_id, player2_id, score1), ...]
+        self._rating_task = None
+        self._rating_stop = None  # Set edilince updater son kez yazıp çıkar
+        
+        # Katılım / oyun başlangıç / bitiş kayıtları (tek writer task, toplu transaction)
+        self.event_db_path = event_db_path
+        self.event_store = None
+        
+        # Round-robin / Swiss turnuvaları (aynı loop'ta eşzamanlı)
+        self.tournaments = TournamentManager(self)
+        
+        # Multiplexed mod: tek bağlantıda "session" etiketli birden fazla oyun
+        self.max_sessions = max_sessions  # Bağlantı başına en fazla oturum
+        self.sessions = {}  # {websocket : {session_id : SessionChannel}}
+        
+        # Cluster modu: eşleştirme ve room'lar broker üzerinden node'lar arasında paylaşılır
+        self.cluster = ClusterNode(self, broker) if broker else None
+        
+        # Bota karşı oyun: MCTS araması process pool'da, event loop dışında yapılır
+        self.bot_time = bot_time  # Bot hamlesi başına süre (saniye)
+        self.bot_workers = (os.cpu_count() or 1) if bot_workers is None else bot_workers  # 0 = kapalı
+        self.bot_pool = None  # İlk bot oyununda oluşturulur
+        self.bot = None
+        # Aynı anda en fazla bu kadar bot oyunu (her hamle tüm pool'u bot_time boyunca kullanır)
+        self.max_bot_games = 2 * self.bot_workers if max_bot_games is None else max_bot_games
+        self.bot_rooms = set()  # Bot oturan room'lar (bitenler sayılırken ayıklanır)
+        
+        # Giden frame'ler bağlantı başına bir loop turu (veya flush_delay) boyunca
+        # toplanıp tek yazmada gönderilir; None = her frame ayrı yazılır
+        if flush_delay is not None and not websockets_supported():
+            logger.warning(f"Frame toplama kapatıldı: websockets {websockets.__version__} denenmiş sürüm değil "
+                           f"(requirements.txt)")
+            flush_delay = None
+        self.outbound = OutboundScheduler(flush_delay) if flush_delay is not None else None
+        
+        # Hamle tracing'i: tracer'ın kendi oranıyla örneklenen hamleler ve frame'de
+        # trace bağlamı gelenlerden tracer'ın join oranıyla seçilenler izlenir; None = kapalı
+        self.tracer = tracer
+        
+        # Canlı profilleme ve bellek raporu: sadece local Unix socket'ten veya sinyalle tetiklenir
+        self.diagnostics = MemoryDiagnostics(self)
+        self.profiler = ProfilerControl(profile_dir, diagnostics=self.diagnostics)
+        self.profile_socket = profile_socket
         
     async def handle_client(self, websocket, path=None):
         """
         Yeni client connection'ını işle ve message loop'unu başlat
         """
+        # Global kabul limiti
+        if not self.admit_connection():
+            logger.warning("Bağlantı reddedildi: server kapasitesi dolu")
+            await websocket.close(code=1013, reason="Server meşgul, daha sonra tekrar deneyin")
+            return
+        
+        if self.outbound and OutboundConnection.supports(websocket):
+            websocket = OutboundConnection(websocket, self.outbound)
         self.clients.add(websocket)
-        print(f"Yeni client bağlandı. Toplam client: {len(self.clients)}")
+        logger.info(f"Yeni client bağlandı. Toplam client: {len(self.clients)}")
         
         try:
-            # Client'ı waiting room'a ekle
-            if not self.waiting_room or self.waiting_room.is_full():
+            # Client'ı waiting room'a ekle (cluster modunda room eşleşmede açılır)
+            if not self.cluster and (not self.waiting_room or self.waiting_room.is_full()):
                 self.waiting_room = self.create_game_room()
             
             # Hoş geldin mesajı gönder
@@ -44,24 +189,141 @@ class GameServer:
                 "type": "welcome",
                 "data": {
                     "message": "Server'a hoş geldiniz!",
-                    "room_id": self.waiting_room.room_id
+                    "room_id": self.waiting_room.room_id if self.waiting_room else None
                 }
             }
             await websocket.send(json.dumps(welcome_message))
             
+            # Bağlantı başına token bucket
+            bucket = TokenBucket(self.message_rate, self.message_burst) if self.message_rate else None
+            if bucket:
+                self.connection_buckets[websocket] = bucket
+            violations = 0
+            
             # Message handling loop
             async for message in websocket:
+                if bucket and not bucket.consume():
+                    violations += 1
+                    if violations > self.max_violations:
+                        logger.warning(f"Mesaj flood'u, bağlantı kapatılıyor ({violations} limit aşımı)")
+                        await websocket.close(code=1008, reason="Mesaj limiti aşıldı")
+                        break
+                    
+                    await self.send_error(websocket, "Çok fazla mesaj, lütfen yavaşlayın", "rate_limited")
+                    # Throttle: token gelene kadar socket'ten okumayı bırak (TCP backpressure)
+                    await asyncio.sleep(bucket.time_until_available())
+                    bucket.consume()
+                else:
+                    violations = 0
+                
                 await self.process_client_message(websocket, message)
                 
         except websockets.exceptions.ConnectionClosed:
-            print("Client bağlantısı kesildi")
+            logger.info("Client bağlantısı kesildi")
         except Exception as e:
-            print(f"Client handling hatası: {e}")
+            logger.error(f"Client handling hatası: {e}")
         finally:
             self.clients.remove(websocket)
-            # Client'ı tüm room'lardan çıkar
-            for room in self.game_rooms.values():
-                room.remove_player(websocket)
+            self.connection_buckets.pop(websocket, None)
+            # Bağlantıdaki tüm oturumlar da kapanır
+            for channel in list(self.sessions.get(websocket, {}).values()):
+                self.release_session(channel)
+            self.sessions.pop(websocket, None)
+            self.release_client(websocket)
+    
+    def release_client(self, websocket):
+        """
+        Bağlantının (veya multiplexed oturumun) room, izleyici ve admin kayıtlarını temizle
+        Oyuncunun room'u player_rooms index'inden bulunur, room'lar taranmaz
+        
+        Args:
+            websocket: Client websocket veya SessionChannel
+        """
+        self._last_errors.pop(websocket, None)
+        self.clock_sync.pop(websocket, None)
+        room = self.player_rooms.pop(websocket, None)
+        if room:
+            room.remove_player(websocket)
+            self.start_reconnect_timers(room)
+        if self.cluster:
+            self.cluster.release(websocket, room)
+        self.tournaments.player_disconnected(websocket)
+        # İzleyiciyse aboneliğini kaldır
+        self.stop_spectating(websocket)
+        admin = self.admins.pop(websocket, None)
+        if admin:
+            admin.close()
+    
+    async def open_session(self, websocket, session_id):
+        """
+        Frame'in oturum kanalını bul veya oluştur (multiplexed mod)
+        
+        Args:
+            websocket: Asıl client websocket
+            session_id: Frame'deki "session" değeri
+            
+        Returns:
+            SessionChannel: Oturum kanalı, oluşturulamadıysa None
+        """
+        channels = self.sessions.get(websocket)
+        channel = channels.get(session_id) if channels else None
+        if channel:
+            return channel
+        
+        if not valid_session_id(session_id):
+            await self.send_error(websocket, "Geçersiz oturum id'si")
+            return None
+        if channels is None:
+            channels = self.sessions[websocket] = {}
+        if len(channels) >= self.max_sessions:
+            await self.send_error(websocket, f"Bağlantı başına en fazla {self.max_sessions} oturum", "too_many_sessions")
+            return None
+        
+        channel = SessionChannel(websocket, session_id, on_close=self.release_session)
+        channels[session_id] = channel
+        return channel
+    
+    def release_session(self, channel):
+        """
+        Oturumu kapat ve kaynaklarını serbest bırak (asıl bağlantı açık kalır)
+        
+        Args:
+            channel (SessionChannel): Kapanan oturum
+        """
+        channel.closed = True
+        channels = self.sessions.get(channel.connection)
+        removed = channels and channels.get(channel.session_id) is channel
+        if removed:
+            del channels[channel.session_id]
+        self.release_client(channel)
+        if removed:
+            self.scale_bucket(channel.connection)
+    
+    def session_seated(self, websocket):
+        """
+        Oyuncu bir room'a oturduktan sonra çağrılır: multiplexed oturumsa
+        asıl bağlantının mesaj limiti yeniden hesaplanır
+        
+        Args:
+            websocket: Client websocket veya SessionChannel
+        """
+        if isinstance(websocket, SessionChannel):
+            self.scale_bucket(websocket.connection)
+    
+    def scale_bucket(self, websocket):
+        """
+        Mesaj limitini bağlantıdaki, room'a oturmuş oturum sayısıyla ölçekle
+        Sadece oyunu olan oturumlar sayılır (boş oturum açmak limiti artırmaz)
+        ve çarpan MAX_BUCKET_SCALE ile sınırlıdır
+        """
+        bucket = self.connection_buckets.get(websocket)
+        if bucket:
+            seated = sum(1 for channel in self.sessions.get(websocket, {}).values()
+                         if channel in self.player_rooms)
+            factor = min(1 + seated, self.MAX_BUCKET_SCALE)
+            bucket.rate = self.message_rate * factor
+            bucket.capacity = self.message_burst * factor
+            bucket.tokens = min(bucket.tokens, bucket.capacity)
     
     async def process_client_message(self, websocket, message):
         """
@@ -71,9 +333,11 @@ class GameServer:
             websocket: Client websocket
             message (str): JSON mesaj
         """
+        started = time.perf_counter() if self.tracer else None
         try:
             # Mesajı parse et
             parsed_message = GameProtocol.deserialize_message(message)
+            deserialized = time.perf_counter() if started else None
             if not parsed_message:
                 await self.send_error(websocket, "Geçersiz mesaj formatı")
                 return
@@ -81,25 +345,149 @@ class GameServer:
             message_type = parsed_message.get("type")
             data = parsed_message.get("data", {})
             
-            print(f"Mesaj alındı: {message_type}")
+            # Multiplexed mod: frame oturumun kanalına yönlendirilir
+            session_id = parsed_message.get("session")
+            if session_id is not None:
+                websocket = await self.open_session(websocket, session_id)
+                if websocket is None:
+                    return
+            
+            logger.debug(f"Mesaj alındı: {message_type}")
             
             if message_type == MessageType.PLAYER_JOIN.value:
                 await self.handle_player_join(websocket, data)
                 
             elif message_type == MessageType.MOVE.value:
-                await self.handle_player_move(websocket, data)
+                trace = self.start_move_trace(parsed_message, started, deserialized) if started else None
+                await self.handle_player_move(websocket, data, trace)
+                if trace:
+                    trace.finish()
+                
+            elif message_type == MessageType.SPECTATE.value:
+                await self.handle_spectate(websocket, data)
+                
+            elif message_type == MessageType.ADMIN_SUBSCRIBE.value:
+                await self.handle_admin_subscribe(websocket, data)
+                
+            elif message_type == MessageType.BOOK_QUERY.value:
+                await self.handle_book_query(websocket, data)
+                
+            elif message_type == MessageType.LEADERBOARD_QUERY.value:
+                await self.handle_leaderboard_query(websocket, data)
+                
+            elif message_type == MessageType.HISTORY_QUERY.value:
+                await self.handle_history_query(websocket, data)
+                
+            elif message_type == MessageType.TOURNAMENT_CREATE.value:
+                await self.tournaments.handle_create(websocket, data)
+                
+            elif message_type == MessageType.TOURNAMENT_JOIN.value:
+                await self.tournaments.handle_join(websocket, data)
+                
+            elif message_type == MessageType.TOURNAMENT_START.value:
+                await self.tournaments.handle_start(websocket, data)
+                
+            elif message_type == MessageType.SESSION_CLOSE.value:
+                if isinstance(websocket, SessionChannel):
+                    self.release_session(websocket)
                 
             elif message_type == MessageType.HEARTBEAT.value:
-                # Heartbeat'e response gönder
-                await websocket.send(GameProtocol.create_heartbeat())
+                await self.handle_heartbeat(websocket, data, time.time())
                 
             else:
                 await self.send_error(websocket, f"Bilinmeyen mesaj türü: {message_type}")
                 
         except Exception as e:
-            print(f"Mesaj işleme hatası: {e}")
+            logger.error(f"Mesaj işleme hatası: {e}")
             await self.send_error(websocket, "Mesaj işleme hatası")
     
+    def start_move_trace(self, parsed_message, started, deserialized):
+        """
+        Hamle frame'i için "server.receive" span'ını başlat
+        Frame trace bağlamı taşıyorsa client'ın trace'i (tracer'ın join
+        oranıyla örneklenirse) sürdürülür, yoksa tracer'ın örnekleme oranıyla
+        yeni trace başlatılır
+        
+        Args:
+            parsed_message (dict): Hamle mesajı
+            started (float): Frame'in işlenmeye başlandığı an (time.perf_counter)
+            deserialized (float): Parse'ın bittiği an
+            
+        Returns:
+            Span: İzlenmiyorsa None
+        """
+        context = parsed_message.get("trace")
+        if context is not None:
+            trace = self.tracer.join(context, "server.receive", started)
+        else:
+            trace = self.tracer.start("server.receive", started=started)
+        if trace:
+            trace.record("protocol.deserialize", started, deserialized)
+        return trace
+    
+    async def handle_heartbeat(self, websocket, data, received):
+        """
+        Heartbeat'e NTP tarzı cevap ver ve bağlantının RTT / saat farkı tahminini güncelle
+        
+        Client isteğine önceki cevabımızın gönderme damgasını (echo) ve onu aldığı
+        anı (t3) ekler; server kendi ölçümünü bu çiftten ve isteğin t0'ından
+        çıkarır. Ölçüm için heartbeat dışında ek mesaj gönderilmez.
+        
+        Args:
+            websocket: Client websocket
+            data (dict): {"t0", "echo", "t3"} (echo/t3 opsiyonel)
+            received (float): İsteğin alındığı an (t1)
+        """
+        sync = self.clock_sync.get(websocket)
+        if sync is None:
+            sync = self.clock_sync[websocket] = ClockSync()
+        data = data if isinstance(data, dict) else {}
+        t0, echo, t3 = (data.get(key) for key in ("t0", "echo", "t3"))
+        if not valid_timestamp(t0):
+            t0 = None
+        if t0 is not None and valid_timestamp(t3) and sync.acknowledge(echo):
+            # Server'ın gönderdiği (echo) -> client aldı (t3) -> client gönderdi (t0) -> server aldı
+            rtt, offset = ntp_sample(echo, t3, t0, received)
+            if sync.add_sample(rtt, offset):
+                self.stats.record_rtt(rtt)
+                room = self.player_rooms.get(websocket)
+                if room:
+                    self.apply_lag_compensation(room)
+        sent = time.time()
+        sync.mark_sent(sent)
+        await websocket.send(GameProtocol.create_heartbeat_reply(t0, received, sent))
+    
+    def connection_rtt(self, websocket):
+        """
+        Bağlantının son ölçüm penceresindeki en küçük RTT'si
+        
+        Yumuşatılmış ortalama (srtt) kullanılmaz: client'ın loop'u bloklandığında
+        geç damgalanan ölçümler ortalamayı şişirir ve oyuncuya bedava süre olarak
+        dönerdi. Pencerenin en küçüğünü tek bir sahte/geç ölçüm büyütemez.
+        
+        Returns:
+            float: Saniye; henüz ölçüm yoksa None
+        """
+        sync = self.clock_sync.get(websocket)
+        return sync.min_rtt if sync else None
+    
+    def apply_lag_compensation(self, room):
+        """
+        Oyuncuların ölçülen RTT'lerini room'un oyun saatine aktar
+        Hamlenin server'a ulaşması ve state'in client'a dönmesi oyuncunun
+        süresinden sayılmaz (en fazla MAX_LAG_COMPENSATION)
+        
+        Args:
+            room (GameRoom): Oyun odası
+        """
+        clock = room.game.clock if room.game else None
+        if not clock:
+            return
+        for player in room.players:
+            rtt = self.connection_rtt(player["websocket"]) if player["websocket"] else None
+            if rtt is not None:
+                clock.lag[player["player_info"]["symbol"]] = min(rtt, self.MAX_LAG_COMPENSATION)
+    
     async def handle_player_join(self, websocket, data):
         """
         Oyuncu katılma isteğini işle
@@ -117,76 +505,455 @@ class GameServer:
                 await self.send_error(websocket, f"Geçersiz oyuncu verisi: {error}")
                 return
             
-            print(f"Player join isteği alındı: {player_data}")
+            # Yarım kalan bir oyuna (restart/kopma sonrası) geri dönüş mü?
+            # Koltuk sadece waiting mesajında verilen resume_token ile geri alınır
+            room_id = data.get("room_id")
+            if room_id in self.game_rooms:
+                room = self.game_rooms[room_id]
+                if room.rebind_player(websocket, player_data, data.get("resume_token")):
+                    self.player_rooms[websocket] = room
+                    self.session_seated(websocket)
+                    await self.resume_room_game(room, websocket)
+                    return
+            
+            # Room başka node'daysa geri dönüş isteği sahibine iletilir
+            if self.cluster and await self.cluster.rejoin(websocket, data):
+                return
+            
+            # Kapanış sürecindeyse yeni oyun açma
+            if self.draining:
+                await self.send_error(websocket, "Server kapanıyor, yeni oyun kabul edilmiyor")
+                return
+            
+            logger.debug(f"Player join isteği alındı: {player_data}")
+            
+            # Bota karşı oyun (cluster modunda da bu node'da oynanır)
+            if data.get("opponent") == BOT_OPPONENT:
+                await self.start_bot_game(websocket, player_data)
+                return
+            
+            # Cluster modunda rakip tüm node'lar arasından eşleştirilir
+            if self.cluster:
+                await self.cluster.matchmake(websocket, player_data)
+                return
             
             # Waiting room yoksa veya doluysa yeni oluştur
             if not self.waiting_room or self.waiting_room.is_full():
                 self.waiting_room = self.create_game_room()
-                print(f"Yeni waiting room oluşturuldu: {self.waiting_room.room_id}")
+                logger.info(f"Yeni waiting room oluşturuldu: {self.waiting_room.room_id}")
             
-            # Symbol ata (ilk gelen X, ikinci O)
-            symbol = "X" if len(self.waiting_room.players) == 0 else "O"
+            await self.seat_player(websocket, player_data, self.waiting_room)
+                
+        except Exception as e:
+            logger.error(f"Player join hatası: {e}")
+            await self.send_error(websocket, "Katılma işlemi başarısız")
+    
+    async def start_bot_game(self, websocket, player_data):
+        """
+        Oyuncuyu yeni bir room'da MCTS botuyla eşleştir (oyuncu X, bot O)
+        
+        Args:
+            websocket: Client websocket
+            player_data (dict): Doğrulanmış oyuncu verisi
+        """
+        if not self.bot_workers or not self.max_bot_games:
+            await self.send_error(websocket, "Bot oyunları kapalı", "bots_disabled")
+            return
+        if self.active_bot_games() >= self.max_bot_games:
+            await self.send_error(websocket, "Bot oyunları dolu, daha sonra tekrar deneyin", "bots_busy")
+            return
+        
+        room = self.create_game_room()
+        if await self.seat_player(websocket, player_data, room):
+            self.bot_rooms.add(room)
+            await self.seat_player(BotConnection(self, self.get_bot()), BOT_PLAYER, room)
+    
+    def get_bot(self):
+        """
+        Ortak MCTS botu (ilk çağrıda process pool'la birlikte oluşturulur)
+        
+        Returns:
+            MCTSBot: Bot
+        """
+        if self.bot is None:
+            # spawn: fork, server'ın thread'lerini (event store vb.) kopyalamasın
+            self.bot_pool = ProcessPoolExecutor(
+                max_workers=self.bot_workers, mp_context=multiprocessing.get_context("spawn"))
+            self.bot = MCTSBot(self.bot_time, parallelism=self.bot_workers, executor=self.bot_pool)
+        return self.bot
+    
+    def active_bot_games(self):
+        """
+        Devam eden bot oyunu sayısı; biten veya silinen room'lar listeden çıkarılır
+        
+        Returns:
+            int: Bot oyunu sayısı
+        """
+        self.bot_rooms = {
+            room for room in self.bot_rooms
+            if room.status != Status.FINISHED and self.game_rooms.get(room.room_id) is room
+        }
+        return len(self.bot_rooms)
+    
+    async def seat_player(self, websocket, player_data, room):
+        """
+        Oyuncuyu room'a ekle; room dolduysa oyunu başlat
+        
+        Args:
+            websocket: Client websocket (veya uzak oyuncunun temsilcisi)
+            player_data (dict): Doğrulanmış oyuncu verisi
+            room (GameRoom): Oturulacak room
             
-            player_info = {
-                "id": player_data.get("id"),
-                "name": player_data.get("name"),
-                "symbol": symbol
+        Returns:
+            bool: Oyuncu room'a eklendi mi?
+        """
+        # Önceki room'dan ayrıl: bağlantı aynı anda tek room'da oyuncu olur
+        previous_room = self.player_rooms.get(websocket)
+        if previous_room and previous_room is not room:
+            previous_room.remove_player(websocket)
+            self.start_reconnect_timers(previous_room)
+        
+        # Symbol ata (ilk gelen X, ikinci O)
+        symbol = "X" if len(room.players) == 0 else "O"
+        
+        player_info = {
+            "id": player_data.get("id"),
+            "name": player_data.get("name"),
+            "symbol": symbol
+        }
+        
+        # Player'ı room'a ekle
+        if not room.add_player(websocket, player_info):
+            await self.send_error(websocket, "Room'a eklenemedi")
+            return False
+        
+        logger.info(f"Oyuncu eklendi: {player_info['name']} ({symbol}) - Room: {room.room_id}")
+        self.player_rooms[websocket] = room
+        self.session_seated(websocket)
+        if self.event_store:
+            self.event_store.record_player_join(player_info["id"], player_info["name"])
+        
+        # Room dolduysa sonraki oyuncular için yeni waiting room açılsın
+        room_full = room.is_full()
+        if room_full and room is self.waiting_room:
+            self.waiting_room = None
+        
+        # Waiting mesajı gönder
+        waiting_message = {
+            "type": "waiting",
+            "data": {
+                "message": "İkinci oyuncuyu bekliyorsunuz..." if symbol == "X" else "Oyuna katıldınız!",
+                "your_symbol": symbol,
+                "room_id": room.room_id,
+                "players_in_room": len(room.players),
+                "resume_token": room.resume_token(websocket)
             }
+        }
+        await websocket.send(json.dumps(waiting_message))
+        
+        # Room dolduysa oyunu başlat
+        if room_full:
+            logger.info(f"Room doldu, oyun başlatılıyor: {room.room_id}")
+            await self.start_room_game(room)
+        return True
+        
+    async def handle_spectate(self, websocket, data):
+        """
+        İzleyici olarak bir room'a abone ol
+        İzleyiciler state güncellemelerini alır ama hamle yapamaz
+        
+        Args:
+            websocket: Client websocket
+            data (dict): {"room_id": ...}
+        """
+        try:
+            room_id = data.get("room_id")
+            room = self.game_rooms.get(room_id) if isinstance(room_id, int) else None
+            
+            # Başka node'un room'u: node başına tek abonelikle izlenir
+            if not room and self.cluster and self.cluster.is_remote(room_id):
+                self.stop_spectating(websocket)
+                await self.cluster.spectate(websocket, room_id)
+                self.spectating[websocket] = room_id
+                return
+            
+            if not room:
+                await self.send_error(websocket, f"Room bulunamadı: {room_id}")
+                return
+            
+            if any(player["websocket"] == websocket for player in room.players):
+                await self.send_error(websocket, "Oyuncular kendi oyunlarını izleyemez")
+                return
+            
+            # Başka bir room'u izliyorsa oradan çıkar
+            self.stop_spectating(websocket)
+            
+            room.add_spectator(websocket)
+            self.spectating[websocket] = room.room_id
+            logger.debug(f"İzleyici eklendi: Room {room.room_id} ({len(room.spectators)} izleyici)")
             
-            # Player'ı waiting room'a ekle
-            if self.waiting_room.add_player(websocket, player_info):
-                print(f"Oyuncu eklendi: {player_info['name']} ({symbol}) - Room: {self.waiting_room.room_id}")
-                
-                # Waiting mesajı gönder
-                waiting_message = {
-                    "type": "waiting",
-                    "data": {
-                        "message": "İkinci oyuncuyu bekliyorsunuz..." if symbol == "X" else "Oyuna katıldınız!",
-                        "your_symbol": symbol,
-                        "room_id": self.waiting_room.room_id,
-                        "players_in_room": len(self.waiting_room.players)
-                    }
-                }
-                await websocket.send(json.dumps(waiting_message))
-                
-                # Room dolduysa oyunu başlat
-                if self.waiting_room.is_full():
-                    print(f"Room doldu, oyun başlatılıyor: {self.waiting_room.room_id}")
-                    await self.start_room_game(self.waiting_room)
-                    # Yeni waiting room için hazırlan
-                    self.waiting_room = None
-                
-            else:
-                await self.send_error(websocket, "Room'a eklenemedi")
-                
         except Exception as e:
-            print(f"Player join hatası: {e}")
-            await self.send_error(websocket, "Katılma işlemi başarısız")
+            logger.error(f"Spectate hatası: {e}")
+            await self.send_error(websocket, "İzleme isteği başarısız")
+    
+    def stop_spectating(self, websocket):
+        """
+        Bağlantının izlediği room varsa aboneliğini kaldır
+        
+        Args:
+            websocket: İzleyici websocket
+        """
+        room_id = self.spectating.pop(websocket, None)
+        if room_id in self.game_rooms:
+            self.game_rooms[room_id].remove_spectator(websocket)
+        elif room_id is not None and self.cluster:
+            self.cluster.unwatch(websocket, room_id)
+    
+    async def handle_admin_subscribe(self, websocket, data):
+        """
+        Operatörü admin kanalına abone et
+        admin_token ayarlıysa token eşleşmeli, değilse sadece localhost kabul edilir
+        
+        Args:
+            websocket: Client websocket
+            data (dict): {"token": ...}
+        """
+        try:
+            if not self.is_admin(websocket, data):
+                logger.warning("Yetkisiz admin abonelik isteği")
+                await self.send_error(websocket, "Admin kanalı için yetkiniz yok", "unauthorized")
+                return
+            
+            if websocket not in self.admins:
+                self.admins[websocket] = Subscriber(websocket, max_queue=4)
+                logger.info(f"Admin aboneliği eklendi ({len(self.admins)} abone)")
+            
+        except Exception as e:
+            logger.error(f"Admin abonelik hatası: {e}")
+            await self.send_error(websocket, "Admin abonelik isteği başarısız")
+    
+    def is_admin(self, websocket, data, require_token=False):
+        """
+        İsteğin operatörden gelip gelmediğini kontrol et
+        admin_token ayarlıysa token eşleşmeli, değilse sadece localhost kabul edilir
+        (aynı makinedeki ters proxy arkasında tüm bağlantılar localhost görünür)
         
-    async def handle_player_move(self, websocket, data):
+        Args:
+            websocket: Client websocket
+            data (dict): {"token": ...}
+            require_token (bool): Durum değiştiren işlemler (örn. turnuva yönetimi)
+                için localhost yetmez; admin_token yoksa kimse yetkili değildir
+            
+        Returns:
+            bool: Yetkili mi?
+        """
+        if self.admin_token is not None:
+            token = data.get("token")
+            return isinstance(token, str) and hmac.compare_digest(token, self.admin_token)
+        if require_token:
+            return False
+        address = getattr(websocket, "remote_address", None)
+        return bool(address) and address[0] in ("127.0.0.1", "::1")
+    
+    async def handle_book_query(self, websocket, data):
+        """
+        Açılış kitabından pozisyonun popüler hamlelerini gönder
+        
+        Args:
+            websocket: Client websocket
+            data (dict): {"board": 3x3 matrix, "limit": int}
+        """
+        try:
+            if not self.opening_book:
+                await self.send_error(websocket, "Açılış kitabı yüklü değil", "no_book")
+                return
+            
+            board = data.get("board")
+            valid, error, _ = GameValidator.validate_board_state(board)
+            if not valid:
+                await self.send_error(websocket, f"Geçersiz board: {error}")
+                return
+            
+            limit = data.get("limit")
+            if not isinstance(limit, int) or limit <= 0:
+                limit = None
+            replies = self.opening_book.popular_replies(board, limit)
+            await websocket.send(GameProtocol.serialize_book_reply(replies, self.opening_book.games))
+            
+        except Exception as e:
+            logger.error(f"Kitap sorgusu hatası: {e}")
+            await self.send_error(websocket, "Kitap sorgusu başarısız")
+    
+    async def handle_leaderboard_query(self, websocket, data):
+        """
+        Rating sıralamasını gönder
+        
+        Args:
+            websocket: Client websocket
+            data (dict): {"limit": int, "player_id": str}
+        """
+        try:
+            limit = data.get("limit")
+            if not isinstance(limit, int) or limit <= 0:
+                limit = 10
+            limit = min(limit, 100)
+            
+            player_id = data.get("player_id")
+            player = self.ratings.describe(str(player_id)) if player_id is not None else None
+            await websocket.send(GameProtocol.serialize_leaderboard(
+                self.ratings.top(limit), player, len(self.ratings.leaderboard)))
+            
+        except Exception as e:
+            logger.error(f"Sıralama sorgusu hatası: {e}")
+            await self.send_error(websocket, "Sıralama sorgusu başarısız")
+    
+    async def handle_history_query(self, websocket, data):
+        """
+        Oyuncunun kayıtlı oyun geçmişini ve istatistiklerini gönder
+        Sorgular okuma havuzunda çalışır, event loop beklemez
+        
+        Args:
+            websocket: Client websocket
+            data (dict): {"player_id": str, "limit": int}
+        """
+        try:
+            if not self.event_store:
+                await self.send_error(websocket, "Oyun kaydı tutulmuyor", "no_history")
+                return
+            
+            player_id = data.get("player_id")
+            if not isinstance(player_id, (str, int)) or str(player_id).strip() == "":
+                await self.send_error(websocket, "Geçersiz oyuncu id'si")
+                return
+            
+            limit = data.get("limit")
+            if not isinstance(limit, int) or limit <= 0:
+                limit = 20
+            limit = min(limit, 100)
+            
+            games = await self.event_store.player_history(player_id, limit)
+            stats = await self.event_store.player_stats(player_id)
+            await websocket.send(GameProtocol.serialize_history(str(player_id), games, stats))
+            
+        except Exception as e:
+            logger.error(f"Geçmiş sorgusu hatası: {e}")
+            await self.send_error(websocket, "Geçmiş sorgusu başarısız")
+    
+    def queue_rating_result(self, room, winner):
+        """
+        Biten oyunu rating kuyruğuna ekle (uygulama run_rating_updater'da toplu yapılır)
+        
+        Args:
+            room (GameRoom): Oyunu biten oda
+            winner (str): "X", "O" veya "tie"
+        """
+        player1, player2 = room.game.player1, room.game.player2
+        player1_id, player2_id = str(player1.player_id), str(player2.player_id)
+        if player1_id == player2_id:
+            return  # Kendine karşı oynanan oyun rating'i etkilemez
+        
+        if winner == "tie":
+            score1 = 0.5
+        elif winner == player1.symbol:
+            score1 = 1.0
+        elif winner == player2.symbol:
+            score1 = 0.0
+        else:
+            return
+        self.pending_results.append((player1_id, player2_id, score1))
+    
+    def apply_pending_ratings(self):
+        """
+        Kuyruktaki sonuçları uygula
+        
+        Returns:
+            list: Kalıcı kayda yazılacak satırlar [(player_id, rating, games, wins, draws, losses), ...]
+        """
+        results, self.pending_results = self.pending_results, []
+        changed = self.ratings.apply_batch(results)
+        return [(player_id, *self.ratings.get(player_id)) for player_id in changed]
+    
+    async def run_rating_updater(self):
+        """
+        Sabit aralıkla biriken oyun sonuçlarını uygulayan tek task
+        Disk yazımı event loop'u bloklamamak için thread'de yapılır; kapanışta
+        task iptal edilmez (thread'deki yazım yarıda kalmaz), durdurma isteğinden
+        sonra kalanları yazıp kendisi biter
+        """
+        while not self._rating_stop.is_set():
+            try:
+                await asyncio.wait_for(self._rating_stop.wait(), self.rating_interval)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush_ratings()
+        # Son yazım sürerken gelen sonuçlar
+        await self.flush_ratings()
+    
+    async def flush_ratings(self):
+        """
+        Bekleyen sonuçları uygula ve değişen oyuncuları kaydet
+        """
+        if not self.pending_results:
+            return
+        rows = self.apply_pending_ratings()
+        if self.rating_store:
+            try:
+                await asyncio.to_thread(self.rating_store.save, rows)
+            except Exception as e:
+                logger.error(f"Rating kaydetme hatası: {e}")
+    
+    async def run_summary_publisher(self):
+        """
+        Sabit aralıkla server özetini admin abonelerine gönderen tek task
+        Özet artımlı sayaçlardan üretilir, room'lar taranmaz
+        """
+        while True:
+            await asyncio.sleep(self.summary_interval)
+            if not self.admins:
+                self.stats.roll_window(rank=False)
+                continue
+            
+            summary = self.stats.summary(len(self.clients), len(self.spectating))
+            data = GameProtocol.serialize_server_summary(summary)
+            dropped = [
+                ws for ws, subscriber in self.admins.items()
+                if not subscriber.push(MessageType.SERVER_SUMMARY.value, data)
+            ]
+            for ws in dropped:
+                del self.admins[ws]
+    
+    async def handle_player_move(self, websocket, data, trace=None):
         """
         Oyuncu hamlesini işle
         
         Args:
             websocket: Client websocket
             data (dict): Move verisi
+            trace (Span, optional): Hamle izleniyorsa "server.receive" span'ı
         """
+        seq = None
         try:
-            # Player'ın hangi room'da olduğunu bul
-            player_room = None
-            player_info = None
+            # Oyunu başka node'da: hamle room'un sahibine iletilir
+            if self.cluster and websocket in self.cluster.remote_players:
+                self.cluster.forward_move(websocket, data)
+                return
             
-            for room in self.game_rooms.values():
-                for player in room.players:
+            # Client tahmini (optimistic move) için sıra numarası; retlerde geri gönderilir
+            seq = data.get("seq")
+            if not isinstance(seq, int) or isinstance(seq, bool):
+                seq = None
+            
+            # Player'ın hangi room'da olduğunu bul (room'ları taramadan)
+            player_room = self.player_rooms.get(websocket)
+            player_info = None
+            if player_room:
+                for player in player_room.players:
                     if player["websocket"] == websocket:
-                        player_room = room
                         player_info = player["player_info"]
                         break
-                if player_room:
-                    break
             
             if not player_room or not player_info:
-                await self.send_error(websocket, "Oyuncu room'da bulunamadı")
+                await self.send_error(websocket, "Oyuncu room'da bulunamadı", seq=seq)
                 return
             
             # Move verilerini çıkar
@@ -194,16 +961,22 @@ class GameServer:
             col = data.get("col")
             
             # Koordinat validation
-            valid, error = GameValidator.validate_coordinates(row, col)
+            with span(trace, "server.validate"):
+                valid, error = GameValidator.validate_coordinates(row, col)
             if not valid:
-                await self.send_error(websocket, f"Geçersiz koordinat: {error}")
+                await self.send_error(websocket, f"Geçersiz koordinat: {error}", seq=seq)
                 return
             
             # Game'den hamleyi işle
             if hasattr(player_room, 'game') and player_room.game:
                 # Current player kontrolü
                 if player_room.game.current_player != player_info["symbol"]:
-                    await self.send_error(websocket, "Sizin sıranız değil!")
+                    await self.send_error(websocket, "Sizin sıranız değil!", seq=seq)
+                    return
+                
+                # Süresi dolduysa hamle yerine oyunu bitir
+                if player_room.game.clock and player_room.game.clock.is_flagged():
+                    await self.handle_turn_timeout(player_room)
                     return
                 
                 # Player object oluştur
@@ -214,29 +987,198 @@ class GameServer:
                 )
                 
                 # Hamleyi işle
-                success, message, game_state = player_room.game.process_move(temp_player, row, col)
+                with span(trace, "game.process_move"):
+                    success, message, game_state = player_room.game.process_move(temp_player, row, col)
                 
                 if success:
-                    # Game state'i room'a broadcast et
-                    await player_room.broadcast_game_state(game_state)
-                    
-                    # Oyun bittiyse end mesajı gönder
-                    if game_state.get("is_game_over"):
-                        end_message = GameProtocol.serialize_game_end(
-                            winner=game_state.get("winner"),
-                            final_board=game_state.get("board"),
-                            move_count=game_state.get("move_count", 0)
-                        )
-                        await player_room.broadcast(json.loads(end_message))
-                        player_room.status = Status.FINISHED
+                    self.stats.record_move(player_room)
+                    await self.publish_game_state(player_room, game_state, trace=trace, mover=websocket)
                 else:
-                    await self.send_error(websocket, message)
+                    await self.send_error(websocket, message, seq=seq)
             else:
-                await self.send_error(websocket, "Oyun henüz başlamadı")
+                await self.send_error(websocket, "Oyun henüz başlamadı", seq=seq)
                 
         except Exception as e:
-            print(f"Move handling hatası: {e}")
-            await self.send_error(websocket, "Hamle işleme hatası")
+            logger.error(f"Move handling hatası: {e}")
+            await self.send_error(websocket, "Hamle işleme hatası", seq=seq)
+    
+    async def publish_game_state(self, room, game_state, reason=None, trace=None, mover=None):
+        """
+        Yeni game state'i room'a gönder; oyun bittiyse GAME_END mesajını da gönder
+        Hamle ve süre aşımı aynı yoldan geçer
+        
+        Args:
+            room (GameRoom): Oyun odası
+            game_state (dict): Oyun durumu
+            reason (str, optional): Oyunun bitiş sebebi (örn. "timeout")
+            trace (Span, optional): Hamle izleniyorsa üst span
+            mover: Hamleyi yapan oyuncunun websocket'i (trace bağlamı sadece ona gider)
+        """
+        # Game state'i room'a broadcast et
+        await room.broadcast_game_state(game_state, trace, mover)
+        
+        # Oyun bittiyse end mesajı gönder
+        if game_state.get("is_game_over"):
+            self.cancel_turn_timer(room)
+            end_message = GameProtocol.serialize_game_end(
+                winner=game_state.get("winner"),
+                final_board=game_state.get("board"),
+                move_count=game_state.get("move_count", 0),
+                reason=reason
+            )
+            # GAME_END gönderilirken gelen istekler (örn. yeni bot oyunu) room'u bitmiş görsün
+            room.status = Status.FINISHED
+            await room.broadcast(json.loads(end_message), trace=trace, mover=mover)
+            # Açılış kitabı sadece tahtada biten oyunlardan beslenir: süre aşımı, terk ve
+            # hakem kararıyla yarıda kesilen hamle dizileri istatistiği bozmasın
+            if self.game_log and reason is None:
+                self.game_log.append(room.game.game_board.move_stack, game_state.get("winner"))
+            self.queue_rating_result(room, game_state.get("winner"))
+            if self.event_store and room.game_id:
+                self.event_store.record_game_end(
+                    room.game_id, room.room_id,
+                    room.game.player1.player_id, room.game.player2.player_id,
+                    game_state.get("winner"), room.game.game_board.move_stack, reason)
+            if room.tournament:
+                self.tournaments.game_finished(room, game_state.get("winner"))
+            else:
+                # Biten room'lar (bot oyunları dahil) tutulmaz; turnuva room'ları
+                # sonuç işlendikten sonra game_finished içinde silinir
+                self.remove_game_room(room)
+        else:
+            self.schedule_turn_timer(room)
+    
+    def create_clock(self):
+        """
+        Server ayarlarına göre yeni oyun saati oluştur
+        
+        Returns:
+            GameClock: Süre limiti yoksa None
+        """
+        if self.turn_time is None and self.game_time is None:
+            return None
+        return GameClock(self.turn_time, self.game_time, self.increment)
+    
+    def schedule_turn_timer(self, room):
+        """
+        Sırası gelen oyuncunun süre aşımı için timer wheel'e timer kur
+        
+        Args:
+            room (GameRoom): Oyun odası
+        """
+        self.cancel_turn_timer(room)
+        if not room.game or not room.game.clock:
+            return
+        time_left = room.game.clock.time_left()
+        if time_left is not None:
+            room.turn_timer = self.timer_wheel.schedule(max(0.0, time_left), self._on_turn_timer, room)
+    
+    def cancel_turn_timer(self, room):
+        """
+        Room'un bekleyen süre aşımı timer'ını iptal et
+        """
+        if room.turn_timer:
+            room.turn_timer.cancel()
+            room.turn_timer = None
+    
+    def _on_turn_timer(self, room):
+        """
+        Timer wheel callback'i: süre dolduysa oyunu bitirecek task'ı başlat
+        """
+        room.turn_timer = None
+        if room.status != Status.IN_PROGRESS or not room.game:
+            return
+        if not room.game.clock.is_flagged():
+            # Tick yuvarlaması nedeniyle erken geldiyse yeniden kur
+            self.schedule_turn_timer(room)
+            return
+        task = asyncio.get_running_loop().create_task(self.handle_turn_timeout(room))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    async def handle_turn_timeout(self, room):
+        """
+        Süresi dolan oyuncunun oyununu normal GAME_END yolundan bitir
+        
+        Args:
+            room (GameRoom): Oyun odası
+        """
+        try:
+            success, message, game_state = room.game.timeout()
+            if success:
+                logger.info(f"Süre aşımı: Room {room.room_id} - {message}")
+                await self.publish_game_state(room, game_state, reason="timeout")
+        except Exception as e:
+            logger.error(f"Süre aşımı hatası: {e}")
+    
+    def start_reconnect_timers(self, room):
+        """
+        Devam eden oyunda boşalan her koltuk için yeniden bağlanma süresini
+        (reconnect_grace) timer wheel'e kur; süre içinde dönen oyuncu koltuğunu
+        geri alır ve timer'ı iptal edilir
+        
+        Args:
+            room (GameRoom): Oyuncusu ayrılan (veya snapshot'tan gelen) room
+        """
+        if self.reconnect_grace is None or room.status != Status.IN_PROGRESS or not room.game:
+            return
+        for seat in room.players:
+            if seat["websocket"] is None and seat["leave_timer"] is None and not seat["grace_expired"]:
+                seat["leave_timer"] = self.timer_wheel.schedule(
+                    self.reconnect_grace, self._on_reconnect_timer, room, seat)
+    
+    def _on_reconnect_timer(self, room, seat):
+        """
+        Timer wheel callback'i: koltuğun sahibi dönmediyse oyunu bitirecek task'ı başlat
+        Diğer boş koltuğun süresi hâlâ işliyorsa karar onun timer'ına bırakılır
+        """
+        seat["leave_timer"] = None
+        if (self.game_rooms.get(room.room_id) is not room or room.status != Status.IN_PROGRESS
+                or seat["websocket"] is not None):
+            return
+        seat["grace_expired"] = True
+        if any(player["leave_timer"] for player in room.players):
+            return
+        task = asyncio.get_running_loop().create_task(self.handle_abandoned(room))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    def grace_expired(self, room):
+        """
+        Room'da yeniden bağlanma süresi dolmuş boş koltuk var mı? (oyun bitirilmek üzere)
+        
+        Returns:
+            bool: Süresi dolan koltuk varsa True
+        """
+        return any(player["websocket"] is None and player["grace_expired"] for player in room.players)
+    
+    async def handle_abandoned(self, room):
+        """
+        Terk edilen oyunu hakem kararıyla bitir (bağlı tek oyuncu kazanır, örn.
+        rakibi dönmeyen oyuncu veya bot; kimse yoksa berabere) ve room'u sil
+        
+        Args:
+            room (GameRoom): Oyun odası
+        """
+        try:
+            connected = [player["player_info"]["symbol"] for player in room.players
+                         if player["websocket"] is not None]
+            winner = connected[0] if len(connected) == 1 else "tie"
+            success, _, game_state = room.game.adjudicate(winner)
+            if success:
+                logger.info(f"Terk edilen oyun bitirildi: Room {room.room_id} - Sonuç: {winner}")
+                await self.publish_game_state(room, game_state, reason="abandoned")
+            self.remove_game_room(room)
+        except Exception as e:
+            logger.error(f"Terk edilen oyun hatası: {e}")
+    
+    async def run_timer_wheel(self):
+        """
+        Timer wheel'i her tick'te ilerleten tek task
+        """
+        while True:
+            await asyncio.sleep(self.timer_wheel.tick)
+            self.timer_wheel.advance(time.monotonic())
     
     async def start_room_game(self, room):
         """
@@ -264,10 +1206,17 @@ class GameServer:
                 )
                 
                 # Game objesi oluştur
-                room.game = Game(player1, player2)
+                room.game = Game(player1, player2, clock=self.create_clock())
+                room.game_id = uuid.uuid4().hex
                 room.status = Status.IN_PROGRESS
+                if self.event_store:
+                    self.event_store.record_game_start(
+                        room.game_id, room.room_id, player1.player_id, player2.player_id)
+                self.apply_lag_compensation(room)
+                room.game.start_clock()
+                self.schedule_turn_timer(room)
                 
-                print(f"Oyun başlatıldı: {player1.name} vs {player2.name}")
+                logger.info(f"Oyun başlatıldı: {player1.name} vs {player2.name}")
                 
                 # Game start mesajı gönder
                 start_message = GameProtocol.serialize_game_start([player1, player2], room.room_id)
@@ -278,56 +1227,404 @@ class GameServer:
                 await room.broadcast_game_state(initial_state)
                 
         except Exception as e:
-            print(f"Game start hatası: {e}")
+            logger.error(f"Game start hatası: {e}")
     
-    async def send_error(self, websocket, error_message):
+    async def resume_room_game(self, room, websocket):
+        """
+        Yeniden bağlanan oyuncuya kaldığı oyunun durumunu gönder
+        
+        Args:
+            room (GameRoom): Oyuncunun geri döndüğü oda
+            websocket: Yeniden bağlanan client websocket
+        """
+        try:
+            seat = next(player for player in room.players if player["websocket"] == websocket)
+            player_info = seat["player_info"]
+            logger.info(f"Oyuncu oyuna geri döndü: {player_info['name']} ({player_info['symbol']}) - Room: {room.room_id}")
+            
+            # Snapshot'tan gelen oyunda saat, iki oyuncu da dönünce yeniden başlar
+            clock = room.game.clock
+            if clock and clock.running_for is None and room.connected_count() == room.max_players:
+                room.game.start_clock()
+                self.schedule_turn_timer(room)
+            
+            waiting_message = {
+                "type": "waiting",
+                "data": {
+                    "message": "Oyuna geri döndünüz!",
+                    "your_symbol": player_info["symbol"],
+                    "room_id": room.room_id,
+                    "players_in_room": room.connected_count(),
+                    "resume_token": seat["resume_token"]
+                }
+            }
+            await websocket.send(json.dumps(waiting_message))
+            
+            players = [room.game.player1, room.game.player2]
+            await websocket.send(GameProtocol.serialize_game_start(players, room.room_id))
+            state_message = json.dumps({
+                "type": MessageType.GAME_STATE.value,
+                "data": room.game.get_game_state()
+            })
+            await websocket.send(state_message)
+            # Snapshot'tan geri gelen bot oyununda sıra bottaysa bot da state'i görüp oynasın
+            for player in room.players:
+                if isinstance(player["websocket"], BotConnection):
+                    await player["websocket"].send(state_message)
+            
+        except Exception as e:
+            logger.error(f"Oyun devam ettirme hatası: {e}")
+    
+    def admit_connection(self):
+        """
+        Yeni bağlantının global limitler içinde olup olmadığını kontrol et
+        
+        Returns:
+            bool: Bağlantı kabul edilsin mi?
+        """
+        if self.max_clients is not None and len(self.clients) >= self.max_clients:
+            return False
+        if self.admission and not self.admission.consume():
+            return False
+        return True
+    
+    async def send_error(self, websocket, error_message, error_code=None, seq=None):
         """
         Client'a hata mesajı gönder
+        Aynı mesaj ERROR_DEDUP_WINDOW içinde tekrar gönderilmez
+        (seq'li hamle retleri hariç: client her birini geri almalı)
         
         Args:
             websocket: Client websocket
             error_message (str): Hata mesajı
+            error_code (str, optional): Hata kodu
+            seq (int, optional): Reddedilen hamlenin sıra numarası
         """
         try:
-            error_msg = GameProtocol.serialize_error(error_message)
+            if seq is None:
+                now = time.monotonic()
+                last = self._last_errors.get(websocket)
+                if last and last[0] == error_message and now - last[1] < self.ERROR_DEDUP_WINDOW:
+                    return
+                self._last_errors[websocket] = (error_message, now)
+            
+            error_msg = GameProtocol.serialize_error(error_message, error_code, seq)
             await websocket.send(error_msg)
         except Exception as e:
-            print(f"Error gönderme hatası: {e}")
+            logger.error(f"Error gönderme hatası: {e}")
             
     async def start_server(self):
         """
         WebSocket server'ı başlat
+        request_shutdown() çağrılana kadar çalışır, sonra aktif oyunları drain eder
+        """
+        logger.info(f"Server başlatılıyor: {self.host}:{self.port}")
+        self._stop_event = asyncio.Event()
+        
+        # Önceki process'ten kalan oyunları geri yükle
+        if self.snapshot_path and os.path.exists(self.snapshot_path):
+            self.load_snapshot(self.snapshot_path)
+        
+        # Süre limiti veya yeniden bağlanma süresi varsa tüm room'lar için tek timer wheel task'ı çalıştır
+        if self.create_clock() or self.reconnect_grace is not None:
+            self._timer_task = asyncio.create_task(self.run_timer_wheel())
+        self._summary_task = asyncio.create_task(self.run_summary_publisher())
+        
+        if self.admin_token is None:
+            logger.warning("Admin anahtarı yok (--admin-token): admin kanalı localhost bağlantılarına açık, "
+                           "turnuva oluşturma/başlatma kapalı")
+        
+        # Kayıtlı rating'leri yükle
+        if self.rating_db_path:
+            self.rating_store = RatingStore(self.rating_db_path)
+            self.ratings.load(self.rating_store.load_all())
+            logger.info(f"{len(self.ratings.leaderboard)} oyuncunun rating'i yüklendi")
+        self._rating_stop = asyncio.Event()
+        self._rating_task = asyncio.create_task(self.run_rating_updater())
+        
+        if self.event_db_path:
+            self.event_store = EventStore(self.event_db_path)
+            self.event_store.start()
+        
+        if self.cluster:
+            await self.cluster.start()
+        
+        if self.profile_socket:
+            await self.profiler.start_socket(self.profile_socket)
+        
+        serve_kwargs = {"reuse_port": True} if self.reuse_port else {}
+        async with self.transport.serve(self.handle_client, self.host, self.port, **serve_kwargs):
+            logger.info(f"Server çalışıyor: ws://{self.host}:{self.port}")
+            logger.info("Oyuncular bekleniyor... (Ctrl+C ile çıkış)")
+            
+            # Kapanış isteği gelene kadar bekle
+            await self._stop_event.wait()
+            await self.drain()
+            
+            # Bitmeyen oyunları yeni process için kaydet
+            if self.snapshot_path:
+                self.save_snapshot(self.snapshot_path)
+            
+            if self._timer_task:
+                self._timer_task.cancel()
+            self._summary_task.cancel()
+            if self.game_log:
+                self.game_log.close()
+            if self.tracer:
+                self.tracer.close()
+            await self.profiler.close()
+            
+            self.tournaments.close()
+            
+            # Kuyrukta kalan sonuçları kaydetmeden kapanma: store, devam eden
+            # yazım ve son flush bittikten sonra kapatılır
+            self._rating_stop.set()
+            await self._rating_task
+            if self.rating_store:
+                self.rating_store.close()
+            if self.event_store:
+                await self.event_store.close()
+            if self.cluster:
+                await self.cluster.close()
+            if self.bot_pool:
+                self.bot_pool.shutdown(wait=False, cancel_futures=True)
+    
+    def request_shutdown(self):
+        """
+        Graceful shutdown iste (SIGTERM handler'ından çağrılabilir)
+        """
+        self.draining = True
+        if self._stop_event:
+            self._stop_event.set()
+    
+    def active_room_count(self):
         """
-        print(f"Server başlatılıyor: {self.host}:{self.port}")
+        Devam eden oyun sayısını döndür
         
-        async with websockets.serve(self.handle_client, self.host, self.port):
-            print(f"Server çalışıyor: ws://{self.host}:{self.port}")
-            print("Oyuncular bekleniyor... (Ctrl+C ile çıkış)")
+        Returns:
+            int: İki oyuncusu da bağlı olan IN_PROGRESS room sayısı
+        """
+        return sum(
+            1 for room in self.game_rooms.values()
+            if room.status == Status.IN_PROGRESS and room.connected_count() == room.max_players
+        )
+    
+    async def drain(self, timeout=None):
+        """
+        Yeni oyunları reddet ve aktif oyunların bitmesini bekle
+        
+        Args:
+            timeout (float, optional): En fazla beklenecek süre (saniye)
+            
+        Returns:
+            int: Süre dolduğunda hâlâ devam eden oyun sayısı
+        """
+        self.draining = True
+        if timeout is None:
+            timeout = self.drain_timeout
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        remaining = self.active_room_count()
+        logger.info(f"Drain başladı, aktif oyun: {remaining}")
+        
+        while remaining and loop.time() < deadline:
+            await asyncio.sleep(0.5)
+            remaining = self.active_room_count()
+        
+        if remaining:
+            logger.warning(f"Drain süresi doldu, {remaining} oyun yarıda kaldı")
+        else:
+            logger.info("Tüm oyunlar tamamlandı")
+        return remaining
             
-            # Server'ı sürekli çalışır durumda tut
-            await asyncio.Future()  # Run forever
+    def save_snapshot(self, path):
+        """
+        Devam eden oyunları JSON snapshot dosyasına yaz
+        Dosya önce geçici isimle yazılır, sonra atomik olarak yerine taşınır
+        Devam eden oyun yoksa dosya yazılmaz
+        
+        Args:
+            path (str): Snapshot dosya yolu
             
-    def create_game_room(self):
+        Returns:
+            int: Kaydedilen room sayısı
+        """
+        rooms = [
+            {
+                "room_id": room.room_id,
+                "game_id": room.game_id,
+                "game": room.game.get_game_state(),
+                "moves": list(room.game.game_board.move_stack),
+                # Restart sonrası koltuklar aynı token'la geri alınır
+                "resume_tokens": {player["player_info"]["symbol"]: player["resume_token"]
+                                  for player in room.players}
+            }
+            for room in self.game_rooms.values()
+            # Yeniden bağlanma süresi dolan oyun kaydedilmez (bitirilmek üzere); süresi
+            # işleyen koltuklar (örn. snapshot'tan gelip henüz dönülmemiş) kaydedilir
+            if room.status == Status.IN_PROGRESS and room.game and not self.grace_expired(room)
+        ]
+        if not rooms:
+            return 0
+        
+        snapshot = {
+            "version": 1,
+            "saved_at": time.time(),
+            "rooms": rooms
+        }
+        
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, path)
+        
+        logger.info(f"Snapshot kaydedildi: {len(rooms)} oyun -> {path}")
+        return len(rooms)
+    
+    def load_snapshot(self, path):
+        """
+        Snapshot dosyasındaki oyunları geri yükle
+        Oyuncu koltukları, aynı room_id, oyuncu kimliği ve resume_token ile yeniden
+        bağlanılana kadar boş tutulur
+        
+        Args:
+            path (str): Snapshot dosya yolu
+            
+        Returns:
+            int: Geri yüklenen room sayısı
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error(f"Snapshot okuma hatası: {e}")
+            return 0
+        
+        restored = 0
+        for room_data in snapshot.get("rooms", []):
+            try:
+                game_state = room_data["game"]
+                players = [
+                    Player(player_id=info["id"], symbol=info["symbol"], name=info["name"])
+                    for info in (game_state["players"]["player1"], game_state["players"]["player2"])
+                ]
+                
+                bot_symbols = [player.symbol for player in players if player.player_id == BOT_PLAYER["id"]]
+                if bot_symbols and not (self.bot_workers and self.max_bot_games):
+                    logger.warning(f"Bot oyunu geri yüklenmedi (bot kapalı): Room {room_data['room_id']}")
+                    continue
+                
+                room = GameRoom(room_id=room_data["room_id"], stats=self.stats)
+                tokens = room_data.get("resume_tokens") or {}
+                for player in players:
+                    room.reserve_seat({"id": player.player_id, "name": player.name, "symbol": player.symbol},
+                                      tokens.get(player.symbol))
+                # Bot koltuğu boş bekletilmez: yeni bir BotConnection oturtulur
+                for seat in room.players:
+                    if seat["player_info"]["symbol"] in bot_symbols:
+                        bot = BotConnection(self, self.get_bot())
+                        bot.symbol = seat["player_info"]["symbol"]
+                        seat["websocket"] = bot
+                        self.player_rooms[bot] = room
+                
+                room.game = Game(players[0], players[1], clock=self.create_clock())
+                room.game.load_state(game_state)
+                # Hamle sırası (oyun log'u ve geri alma için)
+                moves = room_data.get("moves")
+                if isinstance(moves, list) and sorted(moves) == sorted(room.game.game_board.move_stack):
+                    room.game.game_board.move_stack = moves
+                room.game_id = room_data.get("game_id") or uuid.uuid4().hex
+                room.status = Status.IN_PROGRESS
+                self.game_rooms[room.room_id] = room
+                if bot_symbols:
+                    self.bot_rooms.add(room)
+                # Oyuncular reconnect_grace içinde dönmezse oyun bitirilir
+                self.start_reconnect_timers(room)
+                restored += 1
+            except (KeyError, TypeError, ValueError) as e:
+                logger.error(f"Room geri yükleme hatası: {e}")
+        
+        # Aynı snapshot'ın ikinci kez yüklenmesini engelle
+        os.remove(path)
+        logger.info(f"Snapshot yüklendi: {restored} oyun geri getirildi")
+        return restored
+            
+    def create_game_room(self, room_id=None):
         """
         Yeni oyun odası oluştur
+        Cluster modunda room id'si node'a ait id aralığından verilir
+        
+        Args:
+            room_id (int, optional): Önceden ayrılmış room id'si
+        
         Return: GameRoom instance
         """
-        gameroom = GameRoom()
+        if room_id is None and self.cluster:
+            room_id = self.cluster.allocate_room_id()
+        gameroom = GameRoom(room_id=room_id, stats=self.stats)
         self.game_rooms[gameroom.room_id] = gameroom
-        print(f"Yeni room oluşturuldu: {gameroom.room_id}")
+        logger.debug(f"Yeni room oluşturuldu: {gameroom.room_id}")
         return gameroom
 
+    def remove_game_room(self, room):
+        """
+        Room'u server'dan sil (örn. biten oyun); izleyiciler kuyruklarındaki
+        son frame'leri (GAME_END) aldıktan sonra düşürülür
+        
+        Args:
+            room (GameRoom): Silinecek room
+        """
+        if self.game_rooms.pop(room.room_id, None) is None:
+            return
+        self.bot_rooms.discard(room)
+        self.cancel_turn_timer(room)
+        for player in room.players:
+            if player["leave_timer"]:
+                player["leave_timer"].cancel()
+                player["leave_timer"] = None
+        for player in room.players:
+            ws = player["websocket"]
+            if ws is not None and self.player_rooms.get(ws) is room:
+                del self.player_rooms[ws]
+        for ws in list(room.spectators):
+            room.remove_spectator(ws, drain=True)
+            self.spectating.pop(ws, None)
+        self.stats.room_removed(room.status)
+
 
 class GameRoom:
     room_counter = 0  # Static variable for unique room IDs
 
-    def __init__(self, max_players=2):
-        GameRoom.room_counter += 1
-        self.room_id = GameRoom.room_counter  # Unique ID
+    def __init__(self, max_players=2, room_id=None, stats=None):
+        if room_id is None:
+            GameRoom.room_counter += 1
+            room_id = GameRoom.room_counter
+        else:
+            # Snapshot'tan gelen ID'lerle çakışmamak için sayacı ilerlet
+            GameRoom.room_counter = max(GameRoom.room_counter, room_id)
+        self.room_id = room_id  # Unique ID
         self.max_players = max_players
-        self.status = Status.WAITING
+        self.stats = stats  # ServerStats: status değişiklikleri bildirilir
+        self._status = Status.WAITING
+        if stats:
+            stats.room_added(Status.WAITING)
         self.game = None  # Game instance
+        self.game_id = None  # Kayıtlarda oyunu tanımlayan benzersiz id
+        self.tournament = None  # Turnuva oyunuysa TournamentGame
         self.players = []  # list of dicts: {"websocket": ws, "player_info": {...}}
+        self.turn_timer = None  # Timer wheel'deki süre aşımı timer'ı
+        self.spectators = {}  # {websocket : Subscriber}
+
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, new_status):
+        if self.stats:
+            self.stats.room_status_changed(self._status, new_status)
+        self._status = new_status
 
     def add_player(self, websocket, player_info):
         """
@@ -343,11 +1640,82 @@ class GameRoom:
         if websocket and player_info and not self.is_full():
             self.players.append({
                 "websocket": websocket,
-                "player_info": player_info
+                "player_info": player_info,
+                "resume_token": secrets.token_urlsafe(16),
+                "leave_timer": None,  # Oyuncu ayrıldıysa yeniden bağlanma süresi timer'ı
+                "grace_expired": False
             })
             return True
         return False
 
+    def reserve_seat(self, player_info, resume_token=None):
+        """
+        Bağlantısı olmayan bir oyuncu için koltuk ayır (snapshot restore)
+        
+        Args:
+            player_info (dict): Oyuncu bilgileri
+            resume_token (str, optional): Snapshot'taki token (yoksa yenisi üretilir)
+        """
+        self.players.append({
+            "websocket": None,
+            "player_info": player_info,
+            "resume_token": resume_token if isinstance(resume_token, str) else secrets.token_urlsafe(16),
+            "leave_timer": None,
+            "grace_expired": False
+        })
+
+    def resume_token(self, websocket):
+        """
+        Oyuncunun koltuğunu geri almak için gereken gizli token
+        Sadece oyuncunun kendisine (waiting mesajında) gönderilir; id ve isim
+        game_state'lerle rakibe ve izleyicilere de gittiği için yeterli değildir.
+        
+        Returns:
+            str: Token; oyuncu room'da değilse None
+        """
+        for player in self.players:
+            if player["websocket"] == websocket:
+                return player["resume_token"]
+        return None
+
+    def rebind_player(self, websocket, player_data, resume_token):
+        """
+        Boş koltuğu, aynı id, isim ve resume_token ile gelen oyuncunun websocket'ine bağla
+        
+        Args:
+            websocket: Yeniden bağlanan client websocket
+            player_data (dict): Join mesajındaki oyuncu verisi
+            resume_token (str): Koltuğun waiting mesajında verilen token'ı
+            
+        Returns:
+            bool: Koltuk bulundu ve bağlandı mı?
+        """
+        if not isinstance(resume_token, str):
+            return False
+        for player in self.players:
+            info = player["player_info"]
+            if (player["websocket"] is None and
+                    str(info["id"]) == str(player_data.get("id")) and
+                    info["name"] == player_data.get("name") and
+                    hmac.compare_digest(player["resume_token"].encode(), resume_token.encode())):
+                player["websocket"] = websocket
+                # Oyuncu süresi dolmadan döndü: koltuğun timer'ı iptal
+                player["grace_expired"] = False
+                if player["leave_timer"]:
+                    player["leave_timer"].cancel()
+                    player["leave_timer"] = None
+                return True
+        return False
+
+    def connected_count(self):
+        """
+        Bağlı (websocket'i olan) oyuncu sayısı
+        
+        Returns:
+            int: Bağlı oyuncu sayısı
+        """
+        return sum(1 for player in self.players if player["websocket"] is not None)
+
     def remove_player(self, websocket):
         """
         Room'dan oyuncu çıkar
@@ -361,11 +1729,52 @@ class GameRoom:
         if websocket:
             for player in self.players:
                 if player["websocket"] == websocket:
-                    self.players.remove(player)
-                    print(f"Oyuncu room'dan çıkarıldı: Room {self.room_id}")
+                    if self.status == Status.IN_PROGRESS:
+                        # Devam eden oyunda koltuğu koru, oyuncu geri dönebilsin
+                        player["websocket"] = None
+                    else:
+                        self.players.remove(player)
+                    logger.debug(f"Oyuncu room'dan çıkarıldı: Room {self.room_id}")
                     return True
         return False
 
+    def add_spectator(self, websocket):
+        """
+        Room'a izleyici ekle ve mevcut oyun durumunu kuyruğa koy
+        
+        Args:
+            websocket: İzleyici websocket
+            
+        Returns:
+            Subscriber: İzleyicinin gönderim kuyruğu
+        """
+        subscriber = Subscriber(websocket)
+        self.spectators[websocket] = subscriber
+        if self.game:
+            message = {
+                "type": MessageType.GAME_STATE.value,
+                "data": self.game.get_game_state()
+            }
+            subscriber.push(MessageType.GAME_STATE.value, json.dumps(message))
+        return subscriber
+
+    def remove_spectator(self, websocket, drain=False):
+        """
+        İzleyiciyi room'dan çıkar
+        
+        Args:
+            websocket: İzleyici websocket
+            drain (bool): Kuyruktaki frame'ler gönderildikten sonra kapatılsın mı?
+            
+        Returns:
+            bool: Başarılı çıkarma
+        """
+        subscriber = self.spectators.pop(websocket, None)
+        if subscriber:
+            subscriber.close(drain=drain)
+            return True
+        return False
+
     def is_full(self):
         """
         Room'un dolu olup olmadığını kontrol et
@@ -375,23 +1784,48 @@ class GameRoom:
         """
         return len(self.players) >= self.max_players
 
-    async def broadcast(self, message, exclude_ws=None):
+    async def broadcast(self, message, exclude_ws=None, trace=None, mover=None):
         """
         Room'daki tüm oyunculara mesaj gönder
         
         Args:
             message (dict): Gönderilecek mesaj
             exclude_ws: Hariç tutulacak websocket (opsiyonel)
+            trace (Span, optional): İzlenen hamle; serialize ve her gönderim
+                span olarak kaydedilir
+            mover: Hamleyi yapan oyuncu; trace bağlamı sadece onun frame'ine
+                eklenir (rakip ve izleyiciler trace id'sini görmez)
         """
-        if not self.players:
+        if not self.players and not self.spectators:
             return
 
-        data = json.dumps(message)
+        if trace:
+            with trace.child("protocol.serialize", type=message.get("type")):
+                data = json.dumps(message)
+                traced_data = json.dumps(dict(message, trace=trace.context())) if mover is not None else None
+        else:
+            data = json.dumps(message)
+
+        # İzleyicilere kuyruk üzerinden gönder (beklemeden)
+        if self.spectators:
+            message_type = message.get("type")
+            dropped = [
+                ws for ws, subscriber in self.spectators.items()
+                if ws != exclude_ws and not subscriber.push(message_type, data)
+            ]
+            for ws in dropped:
+                del self.spectators[ws]
+
+        if trace:
+            await self.send_traced(data, exclude_ws, trace, mover, traced_data)
+            return
 
+        # Outbound bağlantılara frame beklemeden eklenir, sadece kalanlar için gönderim beklenir
         websockets_to_send = [
             player["websocket"]
             for player in self.players
-            if player["websocket"] != exclude_ws
+            if player["websocket"] is not None and player["websocket"] != exclude_ws
+            and not (isinstance(player["websocket"], PUSH_CONNECTIONS) and player["websocket"].push(data))
         ]
 
         if websockets_to_send:
@@ -400,27 +1834,59 @@ class GameRoom:
                 return_exceptions=True
             )
 
-    async def broadcast_game_state(self, game_state):
+    async def send_traced(self, data, exclude_ws, trace, mover=None, traced_data=None):
+        """
+        broadcast'in izlenen hali: her oyuncuya gönderim ayrı "broadcast.send" span'ı
+        (mode "push": frame outbound tampona eklendi, "send": gönderim beklendi)
+        Hamleyi yapan oyuncuya trace bağlamlı frame (traced_data) gider.
+        """
+        sends = []
+        for player in self.players:
+            ws = player["websocket"]
+            if ws is None or ws == exclude_ws:
+                continue
+            payload = traced_data if ws is mover and traced_data is not None else data
+            sent = trace.child("broadcast.send", player=player["player_info"].get("symbol"))
+            if isinstance(ws, PUSH_CONNECTIONS) and ws.push(payload):
+                sent.attrs["mode"] = "push"
+                sent.finish()
+            else:
+                sent.attrs["mode"] = "send"
+                sends.append(self._send_with_span(ws, payload, sent))
+        if sends:
+            await asyncio.gather(*sends, return_exceptions=True)
+
+    @staticmethod
+    async def _send_with_span(ws, data, sent):
+        try:
+            await ws.send(data)
+        finally:
+            sent.finish()
+
+    async def broadcast_game_state(self, game_state, trace=None, mover=None):
         """
         Game state'i room'daki tüm oyunculara gönder
         
         Args:
             game_state (dict): Oyun durumu
+            trace (Span, optional): Hamle izleniyorsa üst span
+            mover: Hamleyi yapan oyuncunun websocket'i (trace bağlamı sadece ona gider)
         """
         try:
             message = {
                 "type": MessageType.GAME_STATE.value,
                 "data": game_state
             }
-            await self.broadcast(message)
+            await self.broadcast(message, trace=trace, mover=mover)
         except Exception as e:
-            print(f"Game state broadcast hatası: {e}")
+            logger.error(f"Game state broadcast hatası: {e}")
         
         
 async def main():
     """
     Server'ı başlat
     """
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     server = GameServer()
     try:
         await server.start_server()
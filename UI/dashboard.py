@@ -0,0 +1,101 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import asyncio
+from UI.terminal_ui import TerminalUI
+from Network.websocket_client import GameClient
+from Utils.protocol import GameProtocol, MessageType
+
+
+class Dashboard:
+    """
+    Operatör için canlı server dashboard'u
+
+    Server'ın admin kanalına abone olur ve gelen server_summary mesajlarını
+    TerminalUI ile sabit frame rate'te çizer. Mesajlar frame'den hızlı gelirse
+    sadece en sonuncusu çizilir; yavaş gelirse son özet tekrar çizilmez.
+    """
+
+    def __init__(self, server_url, token=None, fps=4.0, ui=None):
+        self.client = GameClient(server_url)
+        self.token = token
+        self.fps = fps
+        self.ui = ui or TerminalUI()
+        self.latest = None  # Son alınan özet
+        self.dirty = False  # Son çizimden sonra yeni özet geldi mi?
+        self.frames = 0
+
+    async def receive_loop(self):
+        """
+        Server'dan gelen özetleri al, sadece en yenisini sakla
+        """
+        while True:
+            message = await self.client.listen_for_updates()
+            if not message:
+                break
+            parsed_message = GameProtocol.deserialize_message(message)
+            if not parsed_message:
+                continue
+            message_type = parsed_message.get("type")
+            if message_type == MessageType.SERVER_SUMMARY.value:
+                self.latest = parsed_message.get("data", {})
+                self.dirty = True
+            elif message_type == MessageType.ERROR.value:
+                self.ui.show_error(parsed_message.get("data", {}).get("message", "Bilinmeyen hata"))
+                break
+
+    async def render_loop(self):
+        """
+        Sabit frame rate'te en son özeti çiz
+        """
+        loop = asyncio.get_running_loop()
+        interval = 1.0 / self.fps
+        next_frame = loop.time()
+        while True:
+            if self.dirty:
+                self.dirty = False
+                self.ui.display_dashboard(self.latest)
+                self.frames += 1
+            next_frame += interval
+            await asyncio.sleep(max(0.0, next_frame - loop.time()))
+
+    async def run(self):
+        """
+        Bağlan, abone ol ve bağlantı kapanana kadar çiz
+
+        Returns:
+            bool: Bağlantı kurulabildi mi?
+        """
+        if not await self.client.connect():
+            return False
+        await self.client.send_admin_subscribe(self.token)
+        self.ui.clear_screen()
+
+        renderer = asyncio.create_task(self.render_loop())
+        try:
+            await self.receive_loop()
+        finally:
+            renderer.cancel()
+            await self.client.disconnect()
+        return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tic-Tac-Toe server dashboard")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--token", default=None, help="Server'da --admin-token verildiyse aynı anahtar")
+    parser.add_argument("--fps", type=float, default=4.0, help="Saniyedeki frame sayısı")
+    args = parser.parse_args()
+
+    dashboard = Dashboard(f"ws://{args.host}:{args.port}", token=args.token, fps=args.fps)
+    try:
+        asyncio.run(dashboard.run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
-import os
 import sys
+from Utils.board_renderer import BoardRenderer
 
 class TerminalUI:
     def __init__(self):
@@ -13,6 +13,7 @@ class TerminalUI:
             "4": "P2P Oyuna Katıl",
             "5": "Çıkış"
         }
+        self.renderer = BoardRenderer()
         
     def display_menu(self):
         """
@@ -38,36 +39,11 @@ class TerminalUI:
     
     def display_board(self, board):
         """
-        3x3 board'u terminal'de görsel olarak göster
+        Board'u terminal'de görsel olarak göster (N x N)
         board: 2D list [[None, 'X', 'O'], ...]
+        Frame tek write ile yazılır, terminalde sadece değişen hücreler güncellenir
         """
-        print("\n   0   1   2")  # Sütun numaraları
-        print("  -----------")
-        
-        for row_idx in range(3):
-            print(f"{row_idx}|", end="")  # Satır numarası
-            
-            for col_idx in range(3):
-                # Hücre içeriği
-                cell = board[row_idx][col_idx]
-                if cell is None:
-                    display_char = " "
-                else:
-                    display_char = cell
-                
-                print(f" {display_char} ", end="")
-                
-                # Sütun ayırıcısı
-                if col_idx < 2:
-                    print("|", end="")
-            
-            print()  # Satır sonu
-            
-            # Satır ayırıcısı (son satır değilse)
-            if row_idx < 2:
-                print("  -----------")
-        
-        print("  -----------\n")
+        self.renderer.draw(board)
     
     def get_move_input(self):
         """
@@ -140,9 +116,9 @@ class TerminalUI:
     
     def clear_screen(self):
         """
-        Terminal ekranını temizle (cross-platform)
+        Terminal ekranını temizle (ANSI, subprocess başlatmadan)
         """
-        os.system('cls' if os.name == 'nt' else 'clear')
+        self.renderer.clear()
     
     def show_waiting_for_player(self):
         """
@@ -173,14 +149,76 @@ class TerminalUI:
     def show_error(self, error_message):
         """
         Hata mesajlarını formatla ve göster
+        Sonraki board frame'i altını temizlese de mesaj board'un altına tekrar yazılır
         """
-        print(f"\n❌ HATA: {error_message}")
+        self.renderer.notice(f"\n❌ HATA: {error_message}")
     
     def show_info(self, info_message):
         """
         Bilgi mesajlarını formatla ve göster
+        Sonraki board frame'i altını temizlese de mesaj board'un altına tekrar yazılır
+        """
+        self.renderer.notice(f"\nℹ️  {info_message}")
+    
+    def show_status(self, status_message):
         """
-        print(f"\nℹ️  {info_message}")
+        Board'un altındaki durum satırı (her frame'de yeniden yazılır, tekrarlanmaz)
+        """
+        print(status_message)
+    
+    def display_dashboard(self, summary, columns=4):
+        """
+        Operatör dashboard'unu tek frame olarak çiz
+        summary: server_summary mesajının data alanı
+        """
+        self.renderer.draw_screen(self.render_dashboard(summary, columns))
+    
+    def render_dashboard(self, summary, columns=4):
+        """
+        Dashboard frame'inin satırlarını oluştur: sayaçlar ve en yoğun board'ların ızgarası
+        Return: list of str
+        """
+        rooms = summary.get("rooms", {})
+        lines = [
+            "=" * 66,
+            "         TIC-TAC-TOE SERVER DASHBOARD",
+            "=" * 66,
+            "Room'lar: " + "  ".join(f"{status}: {rooms.get(status, 0)}"
+                                    for status in ("WAITING", "IN_PROGRESS", "FINISHED")),
+            f"Bağlantı: {summary.get('connections', 0)}   İzleyici: {summary.get('spectators', 0)}",
+            f"Hamle: {summary.get('total_moves', 0)} toplam, {summary.get('moves_per_sec', 0):.1f}/s",
+        ]
+        rtt = summary.get("rtt_ms") or {}
+        if rtt.get("samples"):
+            lines.append(f"RTT: p50 <= {rtt['p50']} ms, p99 <= {rtt['p99']} ms ({rtt['samples']} ölçüm)")
+        lines += [
+            "-" * 66,
+            "En yoğun board'lar:",
+        ]
+        
+        boards = summary.get("boards", [])
+        cell_width = 16
+        for start in range(0, len(boards), columns):
+            group = boards[start:start + columns]
+            block = [[] for _ in range(5)]
+            for entry in group:
+                board = entry.get("board", [])
+                if entry.get("winner"):
+                    state = f"= {entry['winner']}"
+                else:
+                    state = f"> {entry.get('current_player', '')}"
+                block[0].append(f"#{entry.get('room_id')} {state}".ljust(cell_width))
+                for row_idx in range(3):
+                    row = board[row_idx] if row_idx < len(board) else []
+                    cells = "|".join(" " if cell is None else str(cell)[:1] for cell in row)
+                    block[row_idx + 1].append(f" {cells}".ljust(cell_width))
+                block[4].append(f" {entry.get('recent_moves', 0)} hamle".ljust(cell_width))
+            lines.extend("".join(parts).rstrip() for parts in block)
+            lines.append("")
+        
+        if not boards:
+            lines.append("  (son pencerede hamle yok)")
+        return lines
     
     def get_server_info(self):
         """
@@ -0,0 +1,188 @@
+import sys
+
+# ANSI escape dizileri (subprocess gerektirmez)
+CLEAR_SCREEN = "\x1b[2J\x1b[H"
+CLEAR_BELOW = "\x1b[J"
+CLEAR_LINE = "\x1b[K"
+
+
+def cursor_to(line, col):
+    """
+    İmleci verilen satır/sütuna taşıyan ANSI dizisi (0 tabanlı)
+    """
+    return f"\x1b[{line + 1};{col + 1}H"
+
+
+def render_board(board):
+    """
+    N x N board'u tek bir string olarak oluştur
+
+    Çıktı 3x3 için eski per-cell print'lerle birebir aynıdır:
+    sütun numaraları, satır numaraları ve ayırıcı çizgiler.
+
+    Args:
+        board (list): N x N board matrix (boş hücreler None)
+
+    Returns:
+        str: Yazılmaya hazır frame
+    """
+    size = len(board)
+    width = len(str(size - 1))
+    separator = " " * (width + 1) + "-" * (4 * size - 1)
+    header = " " * (width + 1) + " ".join(f"{col:^3}" for col in range(size))
+
+    lines = ["", header.rstrip(), separator]
+    for row_idx in range(size):
+        row = board[row_idx]
+        cells = "|".join(f" {cell_char(row[col_idx] if col_idx < len(row) else None)} "
+                         for col_idx in range(size))
+        lines.append(f"{row_idx:>{width}}|{cells}")
+        lines.append(separator)
+    lines.append("")
+    return "\n".join(lines) + "\n"
+
+
+def cell_char(cell):
+    """
+    Hücre içeriğinin ekranda görünecek karakteri
+    """
+    return " " if cell is None else str(cell)[:1]
+
+
+class BoardRenderer:
+    """
+    Buffer'lı, diff tabanlı board renderer
+
+    - Her frame tek bir string'de oluşturulur ve tek write() ile yazılır
+    - Terminal ise (tty) board ekranın en üstüne çizilir; sonraki frame'lerde
+      sadece değişen hücreler ANSI imleç hareketleriyle güncellenir ve
+      board'un altı temizlenir (turn bilgisi, input prompt'u oraya yazılır)
+    - notice() ile yazılan durum / hata satırları, sonraki frame board'un
+      altını temizlediği için o frame'de board'un altına yeniden yazılır
+    - Terminal değilse (pipe, dosya) her frame düz metin olarak yazılır
+
+    TerminalUI, GameClient ve GameBoard aynı renderer'ı kullanır.
+    """
+
+    def __init__(self, stream=None, diff=None):
+        """
+        Args:
+            stream: Yazılacak text stream (varsayılan sys.stdout, yazım anında çözülür)
+            diff (bool): Diff modunu zorla aç/kapat (None = stream tty ise açık)
+        """
+        self.stream = stream
+        self.diff = diff
+        self.last_board = None  # Ekranda olduğu bilinen son board (kopya)
+        self.notices = []  # Son frame'den sonra yazılan, sonraki frame'de tekrar yazılacak satırlar
+        self.frames = 0
+
+    def _stream(self):
+        return self.stream if self.stream is not None else sys.stdout
+
+    def _diff_enabled(self, stream):
+        if self.diff is not None:
+            return self.diff
+        try:
+            return stream.isatty()
+        except (AttributeError, ValueError):
+            return False
+
+    def invalidate(self):
+        """
+        Ekranın içeriği bilinmiyor (temizlendi / üzerine yazıldı): sonraki frame tam çizilir
+        """
+        self.last_board = None
+
+    def clear(self):
+        """
+        Ekranı ANSI ile temizle (os.system('clear') yerine)
+        """
+        stream = self._stream()
+        if self._diff_enabled(stream):
+            stream.write(CLEAR_SCREEN)
+            stream.flush()
+        self.notices = []
+        self.invalidate()
+
+    def notice(self, text):
+        """
+        Durum / hata satırını hemen yaz; terminalde sonraki frame'de board'un
+        altına tekrar yazılır (frame board'un altını temizlediği için kaybolmasın)
+
+        Args:
+            text (str): Yazılacak satır
+        """
+        stream = self._stream()
+        stream.write(text + "\n")
+        stream.flush()
+        if self._diff_enabled(stream):
+            self.notices.append(text)
+
+    def frame(self, board):
+        """
+        Board için yazılacak frame'i oluştur ve son durumu güncelle
+
+        Returns:
+            str: Tam frame veya sadece değişen hücreleri içeren ANSI dizisi
+        """
+        size = len(board)
+        stream = self._stream()
+        if not self._diff_enabled(stream):
+            return render_board(board)
+
+        last = self.last_board
+        self.last_board = [list(row) for row in board]
+        width = len(str(size - 1))
+        frame_lines = 2 * size + 4
+
+        notices = "".join(text + "\n" for text in self.notices)
+        self.notices = []
+
+        if last is None or len(last) != size:
+            # İlk frame: ekranın en üstüne tam çizim
+            return cursor_to(0, 0) + CLEAR_BELOW + render_board(board) + notices
+
+        parts = []
+        for row_idx in range(size):
+            old_row = last[row_idx]
+            new_row = board[row_idx]
+            if old_row == new_row:
+                continue
+            line = 3 + 2 * row_idx
+            for col_idx in range(size):
+                if old_row[col_idx] != new_row[col_idx]:
+                    parts.append(cursor_to(line, width + 2 + 4 * col_idx))
+                    parts.append(cell_char(new_row[col_idx]))
+        # İmleci board'un altına al, önceki turn mesajlarını temizle; son
+        # frame'den beri yazılan durum / hata satırları tekrar yazılır
+        parts.append(cursor_to(frame_lines, 0))
+        parts.append(CLEAR_BELOW)
+        parts.append(notices)
+        return "".join(parts)
+
+    def draw_screen(self, lines):
+        """
+        Tam ekran bir frame'i (örn. dashboard) tek write ile çiz
+        Terminalde ekran temizlenmeden satırların üzerine yazılır (titreme olmaz)
+
+        Args:
+            lines (list): Ekrana yazılacak satırlar
+        """
+        stream = self._stream()
+        if self._diff_enabled(stream):
+            text = cursor_to(0, 0) + "".join(line + CLEAR_LINE + "\n" for line in lines) + CLEAR_BELOW
+        else:
+            text = "\n".join(lines) + "\n"
+        self.invalidate()
+        stream.write(text)
+        stream.flush()
+        self.frames += 1
+
+    def draw(self, board):
+        """
+        Board'u tek write() + flush ile çiz
+        """
+        stream = self._stream()
+        stream.write(self.frame(board))
+        stream.flush()
+        self.frames += 1
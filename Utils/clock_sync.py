@@ -0,0 +1,164 @@
+import math
+import time
+from collections import deque
+
+
+def valid_timestamp(value):
+    """
+    Mesajdaki zaman damgası: sonlu, pozitif sayı (bool değil)
+
+    Returns:
+        bool: Geçerli mi?
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return False
+    return math.isfinite(value) and value > 0
+
+
+def ntp_sample(local_send, remote_receive, remote_send, local_receive):
+    """
+    NTP tarzı tek ölçüm: dört zaman damgasından RTT ve saat farkı
+
+    Karşı tarafın mesajı bekletme süresi (remote_send - remote_receive) RTT'den
+    düşülür; gidiş ve dönüş yollarının simetrik olduğu varsayılır.
+
+    Args:
+        local_send (float): İsteğin gönderildiği an (yerel saat)
+        remote_receive (float): İsteğin alındığı an (karşı tarafın saati)
+        remote_send (float): Cevabın gönderildiği an (karşı tarafın saati)
+        local_receive (float): Cevabın alındığı an (yerel saat)
+
+    Returns:
+        tuple: (rtt, offset) saniye; offset = karşı tarafın saati - yerel saat
+    """
+    rtt = (local_receive - local_send) - (remote_send - remote_receive)
+    offset = ((remote_receive - local_send) + (remote_send - local_receive)) / 2
+    return rtt, offset
+
+
+class ClockSync:
+    """
+    Bağlantı başına yumuşatılmış RTT ve saat farkı tahmini
+
+    - RTT: TCP'deki gibi (RFC 6298) üstel ortalama (srtt) ve sapma (rttvar)
+    - Saat farkı: son WINDOW ölçüm içinde RTT'si en küçük olanınki (NTP clock
+      filter); kuyrukta bekleyen mesajların bozduğu ölçümler seçilmez
+    - srtt + 4 * rttvar üstündeki ölçümler (bloklanan loop, geç damgalanan t3)
+      atılır; aykırı ölçümler en az SHIFT_SPAN saniye boyunca (ve en az
+      MAX_OUTLIERS kez) üst üste gelirse gecikme gerçekten artmıştır, tahmin
+      yeni ölçümden yeniden başlar. Süre şartı olmasa karşı taraf art arda
+      hızlıca gönderdiği birkaç şişirilmiş ölçümle pencereyi sıfırlayabilirdi.
+    """
+
+    ALPHA = 0.125  # srtt ağırlığı
+    BETA = 0.25  # rttvar ağırlığı
+    WINDOW = 8
+    MAX_RTT = 30.0  # Bundan büyük (veya negatif) ölçümler atılır (saniye)
+    MAX_OUTLIERS = WINDOW  # Tahminin sıfırlanması için gereken en az üst üste aykırı ölçüm
+    SHIFT_SPAN = 30.0  # Aykırı ölçümlerin sürmesi gereken en kısa süre (saniye)
+
+    def __init__(self):
+        self.srtt = None
+        self.rttvar = None
+        self.offset = None  # Karşı tarafın saati - yerel saat
+        self.samples = deque(maxlen=self.WINDOW)  # [(rtt, offset), ...]
+        self.count = 0
+        self.outliers = 0  # Üst üste atılan aykırı ölçüm sayısı
+        self.outlier_since = None  # İlk aykırı ölçümün anı (time.monotonic)
+        self.sent = deque(maxlen=self.WINDOW)  # Cevabı beklenen gönderme damgaları
+
+    def mark_sent(self, stamp):
+        """
+        Karşı tarafa gönderilen damgayı kaydet (cevapta geri gelmesi beklenir)
+        """
+        self.sent.append(stamp)
+
+    def acknowledge(self, stamp):
+        """
+        Cevapta geri gelen damga bizim gönderdiğimiz ve henüz cevaplanmamış biri mi?
+        Eşleşen damga ve ondan önce gönderilenler listeden çıkarılır; aynı damga
+        ikinci kez ölçüm üretmez.
+
+        Returns:
+            bool: Ölçüm yapılabilir mi?
+        """
+        if stamp is None or stamp not in self.sent:
+            return False
+        while self.sent.popleft() != stamp:
+            pass
+        return True
+
+    def add_sample(self, rtt, offset, now=None):
+        """
+        Yeni ölçümü ekle
+
+        Args:
+            rtt (float): Ölçülen RTT (saniye)
+            offset (float): Ölçülen saat farkı (saniye)
+            now (float, optional): Ölçüm anı, time.monotonic (varsayılan: şimdi)
+
+        Returns:
+            bool: Ölçüm kabul edildi mi?
+        """
+        if not (0.0 <= rtt <= self.MAX_RTT) or not math.isfinite(offset):
+            return False
+        if self.srtt is not None and rtt > self.srtt + 4 * self.rttvar:
+            now = time.monotonic() if now is None else now
+            if self.outliers == 0:
+                self.outlier_since = now
+            self.outliers += 1
+            if self.outliers < self.MAX_OUTLIERS or now - self.outlier_since < self.SHIFT_SPAN:
+                return False
+            # Gecikme kalıcı olarak artmış: eski pencere artık geçerli değil
+            self.srtt = None
+            self.samples.clear()
+        self.outliers = 0
+        self.outlier_since = None
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = (1 - self.BETA) * self.rttvar + self.BETA * abs(self.srtt - rtt)
+            self.srtt = (1 - self.ALPHA) * self.srtt + self.ALPHA * rtt
+        self.samples.append((rtt, offset))
+        self.offset = min(self.samples)[1]
+        self.count += 1
+        return True
+
+    @property
+    def min_rtt(self):
+        """
+        Son WINDOW ölçüm içindeki en küçük RTT (ölçüm yoksa None)
+
+        Ortalamadan farklı olarak kuyrukta bekleme ve ani sıçramalar bu değeri
+        büyütemez; karşı tarafa süre iadesi (lag telafisi) bununla yapılır.
+        """
+        return min(self.samples)[0] if self.samples else None
+
+    def timeout(self, minimum=0.0):
+        """
+        RTT'ye göre bekleme süresi: srtt + 4 * rttvar (ölçüm yoksa minimum)
+        """
+        if self.srtt is None:
+            return minimum
+        return max(minimum, self.srtt + 4 * self.rttvar)
+
+    def remote_time(self, local_time):
+        """
+        Yerel zamanı karşı tarafın saatine çevir
+        """
+        return local_time + (self.offset or 0.0)
+
+    def to_dict(self):
+        """
+        Metrik / gösterim için tahmin (milisaniye)
+
+        Returns:
+            dict: {"rtt_ms", "rttvar_ms", "offset_ms", "samples"}
+        """
+        return {
+            "rtt_ms": None if self.srtt is None else round(self.srtt * 1000, 2),
+            "rttvar_ms": None if self.rttvar is None else round(self.rttvar * 1000, 2),
+            "offset_ms": None if self.offset is None else round(self.offset * 1000, 2),
+            "samples": self.count
+        }
@@ -0,0 +1,293 @@
+import asyncio
+import logging
+import queue
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from Utils.game_log import encode_game, decode_game
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS players ("
+    " player_id TEXT PRIMARY KEY,"
+    " name TEXT,"
+    " first_seen REAL NOT NULL,"
+    " last_seen REAL NOT NULL,"
+    " joins INTEGER NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS games ("
+    " game_id TEXT PRIMARY KEY,"
+    " room_id INTEGER,"
+    " player_x TEXT,"
+    " player_o TEXT,"
+    " started_at REAL,"
+    " ended_at REAL,"
+    " winner TEXT,"
+    " reason TEXT,"
+    " move_count INTEGER,"
+    " moves INTEGER)",  # Utils.game_log.encode_game kaydı
+    "CREATE INDEX IF NOT EXISTS games_player_x ON games (player_x, ended_at)",
+    "CREATE INDEX IF NOT EXISTS games_player_o ON games (player_o, ended_at)",
+)
+
+# Yazma ifadeleri: her parti türüne göre tek executemany
+UPSERT_PLAYER = (
+    "INSERT INTO players (player_id, name, first_seen, last_seen, joins) VALUES (?, ?, ?, ?, 1)"
+    " ON CONFLICT(player_id) DO UPDATE SET"
+    " name = excluded.name, last_seen = excluded.last_seen, joins = joins + 1"
+)
+INSERT_GAME = (
+    "INSERT OR IGNORE INTO games (game_id, room_id, player_x, player_o, started_at)"
+    " VALUES (?, ?, ?, ?, ?)"
+)
+# Başlangıcı kaydedilmemiş oyunlar (örn. snapshot'tan dönenler) için de çalışır
+END_GAME = (
+    "INSERT INTO games (game_id, room_id, player_x, player_o, ended_at, winner, reason, move_count, moves)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    " ON CONFLICT(game_id) DO UPDATE SET"
+    " ended_at = excluded.ended_at, winner = excluded.winner, reason = excluded.reason,"
+    " move_count = excluded.move_count, moves = excluded.moves"
+)
+
+# Okuma ifadeleri: sabit SQL metinleri, bağlantı başına prepared statement cache'inde kalır
+SELECT_HISTORY = (
+    "SELECT game_id, room_id, player_x, player_o, started_at, ended_at, winner, reason, move_count, moves"
+    " FROM games WHERE ended_at IS NOT NULL AND (player_x = ? OR player_o = ?)"
+    " ORDER BY ended_at DESC LIMIT ?"
+)
+SELECT_STATS = (
+    "SELECT"
+    " COUNT(*),"
+    " SUM(CASE WHEN (winner = 'X' AND player_x = ?1) OR (winner = 'O' AND player_o = ?1) THEN 1 ELSE 0 END),"
+    " SUM(CASE WHEN winner = 'tie' THEN 1 ELSE 0 END)"
+    " FROM games WHERE ended_at IS NOT NULL AND (player_x = ?1 OR player_o = ?1)"
+)
+SELECT_PLAYER = "SELECT name, first_seen, last_seen, joins FROM players WHERE player_id = ?"
+COUNT_GAMES = "SELECT COUNT(*) FROM games WHERE ended_at IS NOT NULL"
+
+
+class EventStore:
+    """
+    Oyuncu katılımları, oyun başlangıçları ve bitişlerinin SQLite kaydı
+
+    Yazma:
+    - record_* metodları event loop'ta sadece olayı bellekteki tampona ekler
+    - Tek bir writer task tamponu alır ve tek bir thread'deki tek bağlantıyla
+      tek transaction'da yazar; yazma sürerken gelen olaylar sonraki partiye kalır
+    - WAL + synchronous=FULL: her commit bir fsync, yani bir fsync bir partideki
+      tüm oyunları kalıcı yapar
+
+    Okuma:
+    - Ayrı, salt okunur bağlantı havuzu (pool_size thread/bağlantı); WAL sayesinde
+      okuyucular writer'ı beklemez
+    """
+
+    def __init__(self, path, batch_size=1000, flush_interval=0.05, pool_size=2):
+        self.path = path
+        self.batch_size = batch_size  # Bu kadar olay birikince beklemeden yazılır
+        self.flush_interval = flush_interval  # Olay varken en fazla bu kadar beklenir (saniye)
+        self.pending = []  # [(tür, parametreler), ...]
+        self.events_written = 0
+        self.batches_written = 0
+        self.write_errors = 0
+        self._wakeup = None
+        self._writer_task = None
+        self._closing = False
+
+        self._writer_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="event-writer")
+        self._writer = sqlite3.connect(path, check_same_thread=False, timeout=30.0)
+        self._writer.execute("PRAGMA journal_mode=WAL")
+        self._writer.execute("PRAGMA synchronous=FULL")
+        for statement in SCHEMA:
+            self._writer.execute(statement)
+        self._writer.commit()
+
+        self._reader_executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="event-reader")
+        self._readers = queue.Queue()
+        for _ in range(pool_size):
+            reader = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False,
+                                     timeout=30.0, cached_statements=64)
+            self._readers.put(reader)
+
+    def start(self):
+        """
+        Writer task'ını başlat (çalışan event loop içinde çağrılmalı)
+        """
+        self._wakeup = asyncio.Event()
+        self._writer_task = asyncio.create_task(self.run_writer())
+
+    # -- Yazma ---------------------------------------------------------------
+
+    def _push(self, kind, params):
+        self.pending.append((kind, params))
+        # Writer'ı ilk olayda (parti beklemeye başlasın) ve parti dolunca uyandır
+        if self._wakeup and (len(self.pending) == 1 or len(self.pending) >= self.batch_size):
+            self._wakeup.set()
+
+    def record_player_join(self, player_id, name):
+        """
+        Oyuncu katılımını kaydet
+        """
+        now = time.time()
+        self._push(UPSERT_PLAYER, (str(player_id), name, now, now))
+
+    def record_game_start(self, game_id, room_id, player_x, player_o):
+        """
+        Oyun başlangıcını kaydet
+
+        Args:
+            game_id (str): Oyunun benzersiz id'si
+            room_id (int): Room id
+            player_x (str): X oyuncusunun id'si
+            player_o (str): O oyuncusunun id'si
+        """
+        self._push(INSERT_GAME, (game_id, room_id, str(player_x), str(player_o), time.time()))
+
+    def record_game_end(self, game_id, room_id, player_x, player_o, winner, moves, reason=None):
+        """
+        Oyun sonucunu kaydet
+
+        Args:
+            winner (str): "X", "O" veya "tie"
+            moves (list): Hücre index'leri, oynanma sırasıyla (GameBoard.move_stack)
+            reason (str, optional): Bitiş sebebi (örn. "timeout")
+        """
+        self._push(END_GAME, (game_id, room_id, str(player_x), str(player_o), time.time(),
+                              winner, reason, len(moves), encode_game(moves, winner)))
+
+    async def run_writer(self):
+        """
+        Tamponu partiler halinde yazan tek task
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            if not self.pending:
+                self._wakeup.clear()
+                if self._closing:
+                    return
+                await self._wakeup.wait()
+            if len(self.pending) < self.batch_size and not self._closing:
+                # Partinin dolmasını kısa süre bekle: daha az transaction, daha az fsync
+                try:
+                    self._wakeup.clear()
+                    await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+            batch, self.pending = self.pending, []
+            try:
+                await loop.run_in_executor(self._writer_executor, self._write_batch, batch)
+                self.events_written += len(batch)
+                self.batches_written += 1
+            except Exception as e:
+                self.write_errors += 1
+                logger.error(f"Olay kaydı yazma hatası ({len(batch)} olay kayboldu): {e}")
+
+    def _write_batch(self, batch):
+        """
+        Writer thread'inde: partiyi tek transaction'da yaz
+        Aynı türden ardışık olaylar tek executemany ile gönderilir, sıra korunur
+        """
+        with self._writer:
+            kind = None
+            rows = []
+            for event_kind, params in batch:
+                if event_kind is not kind and rows:
+                    self._writer.executemany(kind, rows)
+                    rows = []
+                kind = event_kind
+                rows.append(params)
+            if rows:
+                self._writer.executemany(kind, rows)
+
+    async def close(self):
+        """
+        Bekleyen olayları yaz ve bağlantıları kapat
+        """
+        self._closing = True
+        if self._writer_task:
+            self._wakeup.set()
+            await self._writer_task
+        elif self.pending:
+            self._write_batch(self.pending)
+            self.pending = []
+        self._writer_executor.shutdown()
+        self._writer.close()
+        self._reader_executor.shutdown()
+        while not self._readers.empty():
+            self._readers.get_nowait().close()
+
+    # -- Okuma ---------------------------------------------------------------
+
+    async def _read(self, func, *args):
+        """
+        Sorguyu okuma havuzundaki bir bağlantıyla thread'de çalıştır
+        """
+        def run():
+            connection = self._readers.get()
+            try:
+                return func(connection, *args)
+            finally:
+                self._readers.put(connection)
+        return await asyncio.get_running_loop().run_in_executor(self._reader_executor, run)
+
+    async def player_history(self, player_id, limit=20):
+        """
+        Oyuncunun son oyunları
+
+        Returns:
+            list: [{"game_id", "room_id", "player_x", "player_o", ..., "moves"}, ...] yeniden eskiye
+        """
+        player_id = str(player_id)
+        rows = await self._read(lambda conn: conn.execute(SELECT_HISTORY, (player_id, player_id, limit)).fetchall())
+        history = []
+        for game_id, room_id, player_x, player_o, started_at, ended_at, winner, reason, move_count, moves in rows:
+            history.append({
+                "game_id": game_id,
+                "room_id": room_id,
+                "player_x": player_x,
+                "player_o": player_o,
+                "started_at": started_at,
+                "ended_at": ended_at,
+                "winner": winner,
+                "reason": reason,
+                "move_count": move_count,
+                "moves": decode_game(moves)[0] if moves is not None else []
+            })
+        return history
+
+    async def player_stats(self, player_id):
+        """
+        Oyuncunun toplam istatistikleri
+
+        Returns:
+            dict: {"player_id", "name", "joins", "games", "wins", "draws", "losses", ...} veya None
+        """
+        player_id = str(player_id)
+
+        def query(conn):
+            return (conn.execute(SELECT_PLAYER, (player_id,)).fetchone(),
+                    conn.execute(SELECT_STATS, (player_id,)).fetchone())
+
+        player, stats = await self._read(query)
+        if player is None:
+            return None
+        games, wins, draws = stats[0], stats[1] or 0, stats[2] or 0
+        return {
+            "player_id": player_id,
+            "name": player[0],
+            "first_seen": player[1],
+            "last_seen": player[2],
+            "joins": player[3],
+            "games": games,
+            "wins": wins,
+            "draws": draws,
+            "losses": games - wins - draws
+        }
+
+    async def finished_games(self):
+        """
+        Returns:
+            int: Kaydedilmiş biten oyun sayısı
+        """
+        return await self._read(lambda conn: conn.execute(COUNT_GAMES).fetchone()[0])
@@ -0,0 +1,110 @@
+import os
+import sys
+from array import array
+
+# Oyun kaydı formatı: oyun başına tek bir 64 bit little-endian sayı
+#   bit 0-35 : hamleler, hamle başına 4 bit hücre index'i (row * 3 + col)
+#   bit 36-39: hamle sayısı
+#   bit 40-41: sonuç (RESULT_CODES)
+RECORD_SIZE = 8
+RESULT_CODES = {"tie": 0, "X": 1, "O": 2, None: 3}
+RESULTS = {code: result for result, code in RESULT_CODES.items()}
+
+
+def encode_game(moves, winner):
+    """
+    Oyunu tek bir 64 bit sayıya çevir
+
+    Args:
+        moves (list): Hücre index'leri, oynanma sırasıyla (GameBoard.move_stack)
+        winner (str): "X", "O", "tie" veya None (yarıda kaldı)
+
+    Returns:
+        int: Kayıt
+    """
+    record = 0
+    for ply, cell in enumerate(moves):
+        record |= cell << (4 * ply)
+    record |= len(moves) << 36
+    record |= RESULT_CODES.get(winner, 3) << 40
+    return record
+
+
+def decode_game(record):
+    """
+    Kaydı (hamleler, sonuç) çiftine çevir
+
+    Returns:
+        tuple: (list of cell index, winner)
+    """
+    count = (record >> 36) & 0xF
+    moves = [(record >> (4 * ply)) & 0xF for ply in range(count)]
+    return moves, RESULTS[(record >> 40) & 0x3]
+
+
+class GameLogWriter:
+    """
+    Biten oyunları append-only binary log'a yazar
+
+    Kayıtlar bellekte biriktirilir ve flush_every kayıtta bir tek write ile
+    dosyaya eklenir. Dosya sadece büyür; indexer kaldığı offset'ten devam eder.
+    """
+
+    def __init__(self, path, flush_every=256):
+        self.path = path
+        self.flush_every = flush_every
+        self.buffer = array("Q")
+        self.written = 0
+        self._file = open(path, "ab")
+
+    def append(self, moves, winner):
+        """
+        Oyunu log'a ekle
+        """
+        self.buffer.append(encode_game(moves, winner))
+        if len(self.buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """
+        Biriken kayıtları tek write ile dosyaya yaz
+        """
+        if not self.buffer:
+            return
+        if sys.byteorder != "little":
+            self.buffer.byteswap()
+        self._file.write(self.buffer.tobytes())
+        self._file.flush()
+        self.written += len(self.buffer)
+        self.buffer = array("Q")
+
+    def close(self):
+        self.flush()
+        self._file.close()
+
+
+def read_records(path, start=0, chunk_records=1 << 20):
+    """
+    Log'daki kayıtları parça parça oku
+
+    Args:
+        path (str): Log dosyası
+        start (int): Başlanacak kayıt index'i (artımlı indeksleme için)
+        chunk_records (int): Parça başına kayıt sayısı
+
+    Yields:
+        array: 'Q' tipinde kayıt dizisi
+    """
+    size = os.path.getsize(path)
+    total = size // RECORD_SIZE  # Yarım yazılmış son kayıt atlanır
+    with open(path, "rb") as f:
+        f.seek(start * RECORD_SIZE)
+        position = start
+        while position < total:
+            count = min(chunk_records, total - position)
+            chunk = array("Q")
+            chunk.frombytes(f.read(count * RECORD_SIZE))
+            if sys.byteorder != "little":
+                chunk.byteswap()
+            position += count
+            yield chunk
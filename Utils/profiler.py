@@ -0,0 +1,158 @@
+import cProfile
+import os
+import signal
+import sys
+import threading
+import time
+
+
+def frame_label(code):
+    """
+    Collapsed-stack satırındaki tek frame: "fonksiyon (dosya.py:satır)"
+    """
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """
+    Event loop thread'inin stack'ini sabit aralıkla örnekleyen profiler
+
+    Hedef thread main thread ise (server.py) örnekleme SIGPROF ile yapılır:
+    setitimer(ITIMER_PROF) process CPU zamanında her `interval` saniyede bir
+    sinyal üretir, handler kesilen frame'i kaydeder. Örnekler CPU harcanan
+    kod üzerinde eşit dağılır; boşta (select'te) geçen süre örneklenmez.
+
+    Diğer thread'ler için ayrı bir daemon thread sys._current_frames() ile
+    örnekler. Bu mod GIL'e bağlıdır: örnekleyici GIL'i çoğunlukla hedef
+    thread sistem çağrısındayken (select, send) alır, CPU harcayan Python
+    kodu az görünür.
+
+    Her iki modda hedef thread durdurulmaz; maliyet örnek başına bir stack
+    yürüyüşüdür. Çıktı flamegraph araçlarının (flamegraph.pl, speedscope,
+    inferno) okuduğu collapsed-stack formatıdır: satır başına
+    "frame1;frame2;... örnek_sayısı".
+    """
+
+    def __init__(self, thread_id=None, interval=0.005):
+        self.thread_id = threading.get_ident() if thread_id is None else thread_id
+        self.interval = interval  # Örnekleme aralığı (saniye)
+        self.use_signal = (hasattr(signal, "setitimer") and self.thread_id == threading.main_thread().ident
+                           and threading.get_ident() == self.thread_id)
+        self.stacks = {}  # {(label, ...) : örnek sayısı}
+        self.samples = 0
+        self._labels = {}  # {code : label} her code objesi için label bir kez üretilir
+        self._stop = threading.Event()
+        self._thread = None
+        self._old_handler = None
+
+    def start(self, duration=None):
+        """
+        Örneklemeyi başlat (sinyal modunda hedef thread'den çağrılmalı)
+
+        Args:
+            duration (float, optional): Thread modunda bu kadar saniye sonra kendiliğinden durur
+        """
+        if self.use_signal:
+            self._old_handler = signal.signal(signal.SIGPROF, self._on_signal)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(duration,), name="sampling-profiler",
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Örneklemeyi durdur (thread modunda thread'in bitmesi beklenir)
+        """
+        if self.use_signal:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, self._old_handler or signal.SIG_DFL)
+            return
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _on_signal(self, signum, frame):
+        self.record(frame)
+
+    def _run(self, duration):
+        deadline = None if duration is None else time.monotonic() + duration
+        while not self._stop.is_set():
+            self.record(sys._current_frames().get(self.thread_id))
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            self._stop.wait(self.interval)
+
+    def record(self, frame):
+        """
+        Frame zincirini (yapraktan köke) bir örnek olarak say
+        """
+        if frame is None:
+            return
+        labels = self._labels
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            label = labels.get(code)
+            if label is None:
+                label = labels[code] = frame_label(code)
+            stack.append(label)
+            frame = frame.f_back
+        stack.reverse()
+        key = tuple(stack)
+        self.stacks[key] = self.stacks.get(key, 0) + 1
+        self.samples += 1
+
+    def collapsed(self):
+        """
+        Collapsed-stack satırları, en çok örneklenenden başlayarak
+
+        Returns:
+            list: ["frame1;frame2;... sayı", ...]
+        """
+        return [";".join(stack) + f" {count}"
+                for stack, count in sorted(self.stacks.items(), key=lambda item: -item[1])]
+
+    def write_collapsed(self, path):
+        """
+        Collapsed-stack çıktısını dosyaya yaz
+
+        Returns:
+            int: Yazılan satır sayısı
+        """
+        lines = self.collapsed()
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + ("\n" if lines else ""))
+        return len(lines)
+
+
+class DeterministicProfiler:
+    """
+    cProfile sarmalayıcısı: enable()/disable() profillenen thread'de (event loop
+    thread'i) çağrılmalıdır; sonuç pstats dosyası olarak yazılır
+    (python -m pstats, snakeviz, flameprof ile açılır)
+
+    Her fonksiyon çağrısını ölçtüğü için SamplingProfiler'dan pahalıdır; loop
+    durmaz ama kayıt süresince yavaşlar.
+    """
+
+    def __init__(self):
+        self.profile = cProfile.Profile()
+
+    def start(self):
+        self.profile.enable()
+
+    def stop(self):
+        self.profile.disable()
+
+    def write_pstats(self, path):
+        """
+        pstats dump'ını dosyaya yaz
+
+        Returns:
+            int: Ölçülen fonksiyon sayısı
+        """
+        self.profile.dump_stats(path)
+        return len(self.profile.getstats())
@@ -15,6 +15,21 @@ class MessageType(Enum):
     CHAT = "chat"
     WELCOME = "welcome"
     WAITING = "waiting"
+    SPECTATE = "spectate"
+    ADMIN_SUBSCRIBE = "admin_subscribe"
+    SERVER_SUMMARY = "server_summary"
+    BOOK_QUERY = "book_query"
+    BOOK_REPLY = "book_reply"
+    LEADERBOARD_QUERY = "leaderboard_query"
+    LEADERBOARD = "leaderboard"
+    HISTORY_QUERY = "history_query"
+    HISTORY = "history"
+    TOURNAMENT_CREATE = "tournament_create"
+    TOURNAMENT_JOIN = "tournament_join"
+    TOURNAMENT_START = "tournament_start"
+    TOURNAMENT_UPDATE = "tournament_update"
+    SESSION_CLOSE = "session_close"
+
 class GameProtocol:
     """
     Network communication protocol for Tic-Tac-Toe
@@ -79,13 +94,15 @@ class GameProtocol:
         return json.dumps(message)
     
     @staticmethod
-    def serialize_player_join(player, room_id=None):
+    def serialize_player_join(player, room_id=None, opponent=None, resume_token=None):
         """
         Oyuncu katılma mesajını serialize et
         
         Args:
             player (Player): Katılan oyuncu
             room_id (str, optional): Oyun odası ID'si
+            opponent (str, optional): "bot" ise server'daki MCTS botuyla oynanır
+            resume_token (str, optional): Yarım kalan oyuna dönerken waiting mesajındaki token
             
         Returns:
             str: JSON string formatında serialize edilmiş join mesajı
@@ -102,16 +119,265 @@ class GameProtocol:
                 "room_id": room_id
             }
         }
+        if opponent:
+            message["data"]["opponent"] = opponent
+        if resume_token:
+            message["data"]["resume_token"] = resume_token
         return json.dumps(message)
     
     @staticmethod
-    def serialize_error(error_message, error_code=None):
+    def serialize_spectate(room_id):
+        """
+        Room izleme (spectate) isteğini serialize et
+        
+        Args:
+            room_id (int): İzlenecek oyun odası ID'si
+            
+        Returns:
+            str: JSON string formatında serialize edilmiş spectate mesajı
+        """
+        message = {
+            "type": MessageType.SPECTATE.value,
+            "timestamp": time.time(),
+            "data": {
+                "room_id": room_id
+            }
+        }
+        return json.dumps(message)
+    
+    @staticmethod
+    def serialize_admin_subscribe(token=None):
+        """
+        Operatör admin kanalına abone olma isteğini serialize et
+        
+        Args:
+            token (str, optional): Server'da admin_token ayarlıysa gereken anahtar
+            
+        Returns:
+            str: JSON string formatında serialize edilmiş abonelik mesajı
+        """
+        message = {
+            "type": MessageType.ADMIN_SUBSCRIBE.value,
+            "timestamp": time.time(),
+            "data": {
+                "token": token
+            }
+        }
+        return json.dumps(message)
+    
+    @staticmethod
+    def serialize_server_summary(summary):
+        """
+        Server özetini (room sayıları, bağlantılar, throughput, board'lar) serialize et
+        
+        Args:
+            summary (dict): ServerStats.summary() çıktısı
+            
+        Returns:
+            str: JSON string formatında serialize edilmiş özet
+        """
+        message = {
+            "type": MessageType.SERVER_SUMMARY.value,
+            "timestamp": time.time(),
+            "data": summary
+        }
+        return json.dumps(message)
+    
+    @staticmethod
+    def serialize_book_query(board, limit=None):
+        """
+        Açılış kitabından pozisyonun popüler hamlelerini isteme mesajı
+        
+        Args:
+            board (list): 3x3 board matrix
+            limit (int, optional): En fazla hamle sayısı
+            
+        Returns:
+            str: JSON string formatında serialize edilmiş sorgu
+        """
+        message = {
+            "type": MessageType.BOOK_QUERY.value,
+            "timestamp": time.time(),
+            "data": {
+                "board": board,
+                "limit": limit
+            }
+        }
+        return json.dumps(message)
+    
+    @staticmethod
+    def serialize_book_reply(replies, games):
+        """
+        Açılış kitabı sorgusunun cevabını serialize et
+        
+        Args:
+            replies (list): OpeningBook.popular_replies() çıktısı
+            games (int): Kitaptaki toplam oyun sayısı
+            
+        Returns:
+            str: JSON string formatında serialize edilmiş cevap
+        """
+        message = {
+            "type": MessageType.BOOK_REPLY.value,
+            "timestamp": time.time(),
+            "data": {
+                "replies": replies,
+                "book_games": games
+            }
+        }
+        return json.dumps(message)
+    
+    @staticmethod
+    def serialize_leaderboard_query(limit=10, player_id=None):
+        """
+        Rating sıralaması isteme mesajı
+        
+        Args:
+            limit (int): İlk kaç oyuncu
+            player_id (str, optional): Sırası ayrıca istenen oyuncu
+            
+        Returns:
+            str: JSON string formatında serialize edilmiş sorgu
+        """
+        message = {
+            "type": MessageType.LEADERBOARD_QUERY.value,
+            "timestamp": time.time(),
+            "data": {
+                "limit": limit,
+                "player_id": player_id
+            }
+        }
+        return json.dumps(message)
+    
+    @staticmethod
+    def serialize_leaderboard(top, player=None, players=0):
+        """
+        Rating sıralamasını serialize et
+        
+        Args:
+            top (list): RatingSystem.top() çıktısı
+            player (dict, optional): İstenen oyuncunun RatingSystem.describe() çıktısı
+            players (int): Sıralamadaki toplam oyuncu sayısı
+            
+        Returns:
+            str: JSON string formatında serialize edilmiş sıralama
+        """
+        message = {
+            "type": MessageType.LEADERBOARD.value,
+            "timestamp": time.time(),
+            "data": {
+                "top": top,
+                "player": player,
+                "players": players
+            }
+        }
+        return json.dumps(message)
+    
+    @staticmethod
+    def serialize_history_query(player_id, limit=20):
+        """
+        Oyuncunun oyun geçmişini ve istatistiklerini isteme mesajı
+        
+        Args:
+            player_id (str): Oyuncu id'si
+            limit (int): En fazla kaç oyun
+            
+        Returns:
+            str: JSON string formatında serialize edilmiş sorgu
+        """
+        message = {
+            "type": MessageType.HISTORY_QUERY.value,
+            "timestamp": time.time(),
+            "data": {
+                "player_id": player_id,
+                "limit": limit
+            }
+        }
+        return json.dumps(message)
+    
+    @staticmethod
+    def serialize_history(player_id, games, stats):
+        """
+        Oyun geçmişini serialize et
+        
+        Args:
+            player_id (str): Oyuncu id'si
+            games (list): EventStore.player_history() çıktısı
+            stats (dict): EventStore.player_stats() çıktısı (oyuncu yoksa None)
+            
+        Returns:
+            str: JSON string formatında serialize edilmiş geçmiş
+        """
+        message = {
+            "type": MessageType.HISTORY.value,
+            "timestamp": time.time(),
+            "data": {
+                "player_id": player_id,
+                "games": games,
+                "stats": stats
+            }
+        }
+        return json.dumps(message)
+    
+    @staticmethod
+    def serialize_tournament_join(tournament_id, player):
+        """
+        Turnuvaya kayıt mesajı
+        
+        Args:
+            tournament_id (int): Turnuva id'si
+            player (Player): Kayıt olan oyuncu
+            
+        Returns:
+            str: JSON string formatında serialize edilmiş kayıt
+        """
+        message = {
+            "type": MessageType.TOURNAMENT_JOIN.value,
+            "timestamp": time.time(),
+            "data": {
+                "tournament_id": tournament_id,
+                "player": {
+                    "id": player.player_id,
+                    "symbol": player.symbol,
+                    "name": player.name
+                }
+            }
+        }
+        return json.dumps(message)
+    
+    @staticmethod
+    def serialize_tournament_update(tournament, standing=None, top=None):
+        """
+        Turnuva durumunu serialize et
+        
+        Args:
+            tournament (dict): {"tournament_id", "format", "status", "round", "rounds", "players"}
+            standing (dict, optional): Alıcı oyuncunun sırası ve puanı
+            top (list, optional): Sıralamanın ilk oyuncuları
+            
+        Returns:
+            str: JSON string formatında serialize edilmiş durum
+        """
+        message = {
+            "type": MessageType.TOURNAMENT_UPDATE.value,
+            "timestamp": time.time(),
+            "data": {
+                "tournament": tournament,
+                "standing": standing,
+                "top": top
+            }
+        }
+        return json.dumps(message)
+    
+    @staticmethod
+    def serialize_error(error_message, error_code=None, seq=None):
         """
         Hata mesajını serialize et
         
         Args:
             error_message (str): Hata mesajı
             error_code (str, optional): Hata kodu
+            seq (int, optional): Reddedilen hamlenin sıra numarası (client tahmini geri alır)
             
         Returns:
             str: JSON string formatında serialize edilmiş hata mesajı
@@ -124,6 +390,8 @@ class GameProtocol:
                 "code": error_code
             }
         }
+        if seq is not None:
+            message["data"]["seq"] = seq
         return json.dumps(message)
     
     @staticmethod
@@ -156,7 +424,7 @@ class GameProtocol:
         return json.dumps(message)
     
     @staticmethod
-    def serialize_game_end(winner, final_board, move_count):
+    def serialize_game_end(winner, final_board, move_count, reason=None):
         """
         Oyun bitiş mesajını serialize et
         
@@ -164,6 +432,7 @@ class GameProtocol:
             winner (str): Kazanan oyuncu symbolu veya "tie"
             final_board (list): Final board durumu
             move_count (int): Toplam hamle sayısı
+            reason (str, optional): Bitiş sebebi (örn. "timeout"), normal bitişte None
             
         Returns:
             str: JSON string formatında serialize edilmiş bitiş mesajı
@@ -175,7 +444,8 @@ class GameProtocol:
                 "winner": winner,
                 "final_board": final_board,
                 "move_count": move_count,
-                "game_completed": True
+                "game_completed": True,
+                "reason": reason
             }
         }
         return json.dumps(message)
@@ -295,16 +565,50 @@ class GameProtocol:
         return True
     
     @staticmethod
-    def create_heartbeat():
+    def create_heartbeat(echo=None, received=None):
         """
-        Heartbeat mesajı oluştur (connection canlılığı için)
+        Heartbeat mesajı oluştur (connection canlılığı ve saat senkronizasyonu için)
+        
+        NTP tarzı: "t0" gönderme anıdır. Önceki cevabın server damgası ("echo")
+        ve cevabın alındığı an ("t3") da eklenirse server aynı heartbeat'ten
+        kendi RTT ölçümünü yapar; ekstra mesaj gönderilmez.
         
+        Args:
+            echo (float, optional): Son heartbeat cevabındaki "t2"
+            received (float, optional): Son cevabın alındığı an
+            
         Returns:
             str: JSON heartbeat mesajı
         """
+        now = time.time()
+        data = {"t0": now}
+        if echo is not None and received is not None:
+            data["echo"] = echo
+            data["t3"] = received
         message = {
             "type": MessageType.HEARTBEAT.value,
-            "timestamp": time.time(),
-            "data": {}
+            "timestamp": now,
+            "data": data
+        }
+        return json.dumps(message)
+    
+    @staticmethod
+    def create_heartbeat_reply(t0, t1, t2=None):
+        """
+        Heartbeat cevabı: isteğin damgası ve server'ın alma/gönderme anları
+        
+        Args:
+            t0 (float): İstekteki client gönderme anı (None olabilir)
+            t1 (float): Server'ın isteği aldığı an
+            t2 (float, optional): Server'ın gönderme anı (varsayılan: şimdi)
+            
+        Returns:
+            str: JSON heartbeat mesajı
+        """
+        t2 = time.time() if t2 is None else t2
+        message = {
+            "type": MessageType.HEARTBEAT.value,
+            "timestamp": t2,
+            "data": {"t0": t0, "t1": t1, "t2": t2}
         }
         return json.dumps(message)
\ No newline at end of file
@@ -0,0 +1,54 @@
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter
+
+    Saniyede `rate` token dolar, en fazla `burst` token birikir.
+    Her mesaj bir token harcar; token yoksa mesaj limit dışıdır.
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = float(rate)
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated = now
+
+    def consume(self, tokens=1):
+        """
+        Token harcamayı dene
+
+        Args:
+            tokens (int): Harcanacak token sayısı
+
+        Returns:
+            bool: Yeterli token var mıydı?
+        """
+        self._refill()
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        return False
+
+    def time_until_available(self, tokens=1):
+        """
+        İstenen token sayısına ulaşmak için beklenecek süre
+
+        Args:
+            tokens (int): Gereken token sayısı
+
+        Returns:
+            float: Saniye cinsinden bekleme süresi (0 ise hemen kullanılabilir)
+        """
+        self._refill()
+        if self.tokens >= tokens:
+            return 0.0
+        return (tokens - self.tokens) / self.rate
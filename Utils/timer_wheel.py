@@ -0,0 +1,130 @@
+import math
+
+
+class Timer:
+    """
+    TimerWheel'e kurulmuş tek bir zamanlayıcı
+    cancel() O(1)'dir: timer slot'tan silinmez, sadece işaretlenir
+    """
+    __slots__ = ("expires", "callback", "args", "cancelled")
+
+    def __init__(self, expires, callback, args):
+        self.expires = expires  # Tick cinsinden
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class TimerWheel:
+    """
+    Hiyerarşik timer wheel (Linux kernel timer'ları gibi)
+
+    Her seviyede `slots` adet slot vardır. Seviye 0'ın her slot'u bir tick,
+    seviye 1'in her slot'u `slots` tick, ... kapsar. Yakın timer'lar alt
+    seviyeye, uzak timer'lar üst seviyeye konur ve zamanı yaklaştıkça
+    alt seviyelere indirilir (cascade).
+
+    - schedule / cancel: O(1)
+    - advance: tick başına O(1) + süresi dolan timer sayısı
+
+    Server başına tek bir wheel ve onu ilerleten tek bir task yeterlidir;
+    room başına asyncio task veya call_later handle'ı gerekmez.
+    """
+
+    def __init__(self, tick=0.1, slots=64, levels=4, now=0.0):
+        if slots & (slots - 1):
+            raise ValueError("Slot sayısı 2'nin kuvveti olmalı!")
+        self.tick = tick
+        self.slots = slots
+        self.levels = levels
+        self.bits = slots.bit_length() - 1
+        self.mask = slots - 1
+        self.max_ticks = slots ** levels
+        self.wheels = [[[] for _ in range(slots)] for _ in range(levels)]
+        self.start = now
+        self.current_tick = 0
+        self.pending = 0  # Kurulu (iptal edilmiş olanlar dahil) timer sayısı
+
+    def schedule(self, delay, callback, *args):
+        """
+        `delay` saniye sonra callback(*args) çağrılacak timer kur
+
+        Args:
+            delay (float): Saniye cinsinden gecikme
+            callback (callable): Süre dolunca çağrılacak fonksiyon
+
+        Returns:
+            Timer: cancel() ile iptal edilebilen timer
+        """
+        ticks = max(1, math.ceil(delay / self.tick))
+        if ticks >= self.max_ticks:
+            raise ValueError(f"Gecikme wheel kapsamını aşıyor: {delay}s")
+        timer = Timer(self.current_tick + ticks, callback, args)
+        self._insert(timer)
+        self.pending += 1
+        return timer
+
+    def _insert(self, timer):
+        delta = timer.expires - self.current_tick
+        level = 0
+        span = self.slots
+        while delta >= span and level < self.levels - 1:
+            level += 1
+            span <<= self.bits
+        index = (timer.expires >> (self.bits * level)) & self.mask
+        self.wheels[level][index].append(timer)
+
+    def _cascade(self, level):
+        """
+        Üst seviyedeki slot'un timer'larını alt seviyelere dağıt
+
+        Returns:
+            int: Cascade edilen slot'un index'i (0 ise bir üst seviye de cascade edilir)
+        """
+        index = (self.current_tick >> (self.bits * level)) & self.mask
+        bucket = self.wheels[level][index]
+        self.wheels[level][index] = []
+        for timer in bucket:
+            if timer.cancelled:
+                self.pending -= 1
+            else:
+                self._insert(timer)
+        return index
+
+    def advance(self, now):
+        """
+        Wheel'i `now` anına kadar ilerlet ve süresi dolan timer'ları çalıştır
+
+        Args:
+            now (float): Güncel zaman (wheel'i oluştururken verilen saatle aynı kaynak)
+
+        Returns:
+            int: Çalıştırılan timer sayısı
+        """
+        target = int((now - self.start) / self.tick)
+        fired = 0
+        level0 = self.wheels[0]
+        while self.current_tick < target:
+            self.current_tick += 1
+            index = self.current_tick & self.mask
+
+            # Seviye 0 tur attıysa üst seviyeleri indir
+            if index == 0:
+                level = 1
+                while level < self.levels and self._cascade(level) == 0:
+                    level += 1
+
+            bucket = level0[index]
+            if not bucket:
+                continue
+            level0[index] = []
+            for timer in bucket:
+                self.pending -= 1
+                if not timer.cancelled:
+                    timer.cancelled = True
+                    fired += 1
+                    timer.callback(*timer.args)
+        return fired
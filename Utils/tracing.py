@@ -0,0 +1,271 @@
+import json
+import random
+import time
+
+MAX_ID_LENGTH = 32
+
+
+def new_id(bits=64):
+    """
+    Rastgele hex id (trace: 128 bit, span: 64 bit)
+    """
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+class Span:
+    """
+    Tek bir işlem aralığı: aynı trace id'yi taşıyan span'lar bir hamlenin
+    client girdisinden broadcast'e kadar izini oluşturur
+
+    Context manager olarak kullanılır; çıkışta süresi hesaplanıp tracer'ın
+    exporter'ına verilir. Alt span'lar parent olarak bu nesneyi alır.
+    """
+    __slots__ = ("tracer", "trace_id", "span_id", "parent_id", "name", "attrs", "start", "started")
+
+    def __init__(self, tracer, trace_id, name, parent_id=None, span_id=None, started=None, attrs=None):
+        self.tracer = tracer
+        self.trace_id = trace_id
+        self.span_id = span_id or new_id()
+        self.parent_id = parent_id
+        self.name = name
+        self.attrs = attrs
+        self.started = time.perf_counter() if started is None else started  # Süre ölçümü (perf_counter)
+        # Duvar saati: farklı process'lerin span'ları aynı eksende sıralanabilsin
+        self.start = time.time() - (time.perf_counter() - self.started)
+
+    def context(self):
+        """
+        Frame'e eklenecek trace bağlamı
+
+        Returns:
+            dict: {"id": trace id, "span": bu span'ın id'si}
+        """
+        return {"id": self.trace_id, "span": self.span_id}
+
+    def child(self, name, started=None, **attrs):
+        """
+        Bu span'ın altında yeni span (henüz bitmemiş)
+        """
+        return Span(self.tracer, self.trace_id, name, self.span_id, started=started, attrs=attrs or None)
+
+    def record(self, name, started, ended=None, **attrs):
+        """
+        Zaten bitmiş bir aralığı alt span olarak kaydet (ör. trace id'si
+        bilinmeden önce yapılan deserialize)
+
+        Args:
+            started (float): Başlangıç (time.perf_counter)
+            ended (float, optional): Bitiş (varsayılan: şimdi)
+        """
+        self.child(name, started, **attrs).finish(ended)
+
+    def finish(self, ended=None):
+        """
+        Span'ı bitir ve export et
+        """
+        ended = time.perf_counter() if ended is None else ended
+        span = {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start": round(self.start, 6),
+            "duration_ms": round((ended - self.started) * 1000, 4)
+        }
+        if self.attrs:
+            span["attrs"] = self.attrs
+        self.tracer.export(span)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.attrs = dict(self.attrs or (), error=exc_type.__name__)
+        self.finish()
+        return False
+
+
+class _NullSpan:
+    """
+    Örneklenmeyen / trace'i olmayan işlemler için hiçbir şey yapmayan span
+    """
+    __slots__ = ()
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+def span(parent, name, **attrs):
+    """
+    parent varsa altında span aç, yoksa maliyetsiz boş span döndür
+
+        with span(trace, "server.validate"):
+            ...
+
+    Args:
+        parent (Span): Üst span veya None (trace yok)
+        name (str): Span adı
+
+    Returns:
+        Span veya NULL_SPAN (context manager)
+    """
+    if parent is None:
+        return NULL_SPAN
+    return parent.child(name, **attrs)
+
+
+class MemoryCollector:
+    """
+    Span'ları bellekte tutan exporter (test ve benchmark için)
+    """
+
+    def __init__(self):
+        self.spans = []
+
+    def export(self, span):
+        self.spans.append(span)
+
+    def traces(self):
+        """
+        Span'ları trace id'ye göre grupla
+
+        Returns:
+            dict: {trace_id : [span, ...]} başlangıç zamanına göre sıralı
+        """
+        traces = {}
+        for span in self.spans:
+            traces.setdefault(span["trace_id"], []).append(span)
+        for spans in traces.values():
+            spans.sort(key=lambda span: span["start"])
+        return traces
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class JsonlExporter:
+    """
+    Span'ları satır başına bir JSON olarak dosyaya ekleyen exporter
+
+    Span'lar bellekte biriktirilir ve flush_every span'da bir tek write ile
+    dosyaya yazılır (GameLogWriter gibi); hamle yolunda disk I/O beklenmez.
+    """
+
+    def __init__(self, path, flush_every=256):
+        self.path = path
+        self.flush_every = flush_every
+        self.buffer = []
+        self.written = 0
+        self._file = open(path, "a", encoding="utf-8")
+
+    def export(self, span):
+        self.buffer.append(json.dumps(span, separators=(",", ":")))
+        if len(self.buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """
+        Biriken span'ları tek write ile dosyaya yaz
+        """
+        if not self.buffer:
+            return
+        self._file.write("\n".join(self.buffer) + "\n")
+        self._file.flush()
+        self.written += len(self.buffer)
+        self.buffer = []
+
+    def close(self):
+        self.flush()
+        self._file.close()
+
+
+def read_spans(path):
+    """
+    JSONL trace dosyasındaki span'ları oku
+
+    Returns:
+        list: Span dict'leri
+    """
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class Tracer:
+    """
+    Örneklemeli (sampled) hafif tracer
+
+    - start(): yeni trace, sample_rate olasılıkla örneklenir (örneklenmezse None)
+    - join(): frame'deki trace bağlamını join_rate olasılıkla sürdürür
+      (varsayılan: sample_rate). Bağlamı karşı taraf seçtiği için her frame'i
+      izlemek, örnekleme oranını client'ın belirlemesi demek olurdu.
+    Tracer'ı olmayan veya örneklenmeyen işlemler sadece bir None kontrolü öder.
+    """
+
+    def __init__(self, sample_rate=1.0, exporter=None, join_rate=None):
+        self.sample_rate = sample_rate
+        self.join_rate = sample_rate if join_rate is None else join_rate
+        self.exporter = exporter if exporter is not None else MemoryCollector()
+        self.exported = 0
+
+    @staticmethod
+    def sampled(rate):
+        """
+        rate olasılıkla True
+        """
+        return rate >= 1 or (rate > 0 and random.random() < rate)
+
+    def start(self, name, started=None, **attrs):
+        """
+        Yeni trace'in kök span'ını başlat
+
+        Args:
+            name (str): Span adı
+            started (float, optional): Başlangıç (time.perf_counter)
+
+        Returns:
+            Span: Örneklendiyse kök span, değilse None
+        """
+        if not self.sampled(self.sample_rate):
+            return None
+        return Span(self, new_id(128), name, started=started, attrs=attrs or None)
+
+    def join(self, context, name, started=None, **attrs):
+        """
+        Frame'deki trace bağlamının altında span başlat
+
+        Args:
+            context (dict): {"id": trace id, "span": parent span id} (frame'in "trace" alanı)
+            name (str): Span adı
+            started (float, optional): Başlangıç (time.perf_counter)
+
+        Returns:
+            Span: Bağlam geçerli ve örneklendiyse span, değilse None
+        """
+        if not isinstance(context, dict) or not self.sampled(self.join_rate):
+            return None
+        trace_id, parent_id = context.get("id"), context.get("span")
+        if not (isinstance(trace_id, str) and 0 < len(trace_id) <= MAX_ID_LENGTH):
+            return None
+        if not (isinstance(parent_id, str) and len(parent_id) <= MAX_ID_LENGTH):
+            parent_id = None
+        return Span(self, trace_id, name, parent_id, started=started, attrs=attrs or None)
+
+    def export(self, span):
+        self.exported += 1
+        self.exporter.export(span)
+
+    def close(self):
+        """
+        Exporter'da bekleyen span'ları yaz ve kapat
+        """
+        self.exporter.close()
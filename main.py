@@ -1,9 +1,11 @@
 import asyncio
+import logging
 import sys
 import os
 from UI.terminal_ui import TerminalUI
 from Network.websocket_server import GameServer
 from Network.websocket_client import GameClient
+from Network.p2p_transport import create_host, create_client
 from Game.player import Player
 from Game.game_logic import Game
 from Utils.validator import GameValidator
@@ -63,6 +65,9 @@ class TicTacToeApp:
                 self.ui.show_error(f"Bağlantı hatası: {error}")
                 return
             
+            # Server loglarını terminale yaz
+            logging.basicConfig(level=logging.INFO, format="%(message)s")
+            
             # Server'ı başlat
             server = GameServer(host, port)
             self.ui.show_server_started(host, port)
@@ -108,9 +113,10 @@ class TicTacToeApp:
                 player_name = input("Adınızı girin: ").strip()
                 if not player_name:
                     player_name = "Oyuncu"
+                vs_bot = input("Bota karşı oynamak ister misiniz? (e/H): ").strip().lower() == "e"
                 
                 # Client oyun loop'unu başlat
-                await self.client_game_loop(client, player_name)
+                await self.client_game_loop(client, player_name, opponent="bot" if vs_bot else None)
                 
             else:
                 self.ui.show_connection_status("error")
@@ -123,21 +129,29 @@ class TicTacToeApp:
         except Exception as e:
             self.ui.show_error(f"Client hatası: {e}")
     
-    async def client_game_loop(self, client, player_name):
+    async def client_game_loop(self, client, player_name, opponent=None):
         """
         Client tarafında oyun döngüsü
         
         Args:
             client (GameClient): WebSocket client
             player_name (str): Oyuncu adı
+            opponent (str, optional): "bot" ise server'daki botla oynanır
         """
+        heartbeat_task = None
         try:
             # Oyuncu oluştur (symbol server tarafından atanacak)
-            player = Player(player_id=1, symbol="X", name=player_name)
-            await client.send_player_join(player)
+            # Rating'ler oyuncu id'sine bağlı: id olarak oyuncu adı kullanılır
+            player = Player(player_id=player_name, symbol="X", name=player_name)
+            await client.send_player_join(player, opponent)
             self.ui.show_info("join isteği gönderildi")
             self.ui.show_info("Oyuncu bekleniyor...")
             
+            # Heartbeat'ler bağlantıyı canlı tutar ve RTT / saat farkını ölçer; cevaplar
+            # ayrı receive task'ında geldiği an işlenir (hamle girilirken de)
+            client.start_receiver()
+            heartbeat_task = asyncio.create_task(client.heartbeat_loop())
+            
             # Game loop
             while True:
                 # Server'dan mesaj bekle
@@ -153,12 +167,20 @@ class TicTacToeApp:
                     continue
                 
                 message_type = parsed_message.get("type")
+                if message_type == "heartbeat":
+                    client.handle_heartbeat(parsed_message.get("data", {}))
+                    continue
+                
+                # Tahmin edilen board'u server'ın cevabıyla uzlaştır
+                rolled_back = client.reconcile(parsed_message)
                 
                 if message_type == "game_state":
                     # Game state güncellendi
                     game_data = GameProtocol.extract_game_state_data(parsed_message)
                     if game_data:
-                        self.handle_game_state_update(game_data, player, client)
+                        if rolled_back:
+                            self.ui.show_error("Hamleniz kabul edilmedi, geri alındı")
+                        await self.handle_game_state_update(game_data, player, client)
                 
                 elif message_type == "game_start":
                     # Oyun başladı
@@ -181,11 +203,18 @@ class TicTacToeApp:
                     # Hata mesajı
                     data = parsed_message.get("data", {})
                     self.ui.show_error(data.get("message", "Bilinmeyen hata"))
+                    # Reddedilen hamle geri alındı: board'u tekrar göster, sıra bizdeyse yeniden sor
+                    if rolled_back and client.last_state:
+                        await self.handle_game_state_update(client.last_state, player, client)
                 
         except Exception as e:
             self.ui.show_error(f"Oyun loop hatası: {e}")
+        finally:
+            if heartbeat_task:
+                heartbeat_task.cancel()
+            await client.disconnect()
     
-    def handle_game_state_update(self, game_data, player, client):
+    async def handle_game_state_update(self, game_data, player, client):
         """
         Game state güncellemelerini handle et
         
@@ -195,27 +224,147 @@ class TicTacToeApp:
             client (GameClient): WebSocket client
         """
         try:
-            # Board'u göster
-            board = game_data.get("board", [])
+            # Board'u göster (tahmin açıksa server'ın henüz işlemediği hamlemiz dahil)
+            board = client.board or game_data.get("board", [])
             self.ui.display_board(board)
             
             # Sıra bilgisini göster
             current_player = game_data.get("current_player")
             is_my_turn = player.is_turn(current_player)
             self.ui.show_turn_info(current_player, is_my_turn)
+            if client.clock_sync.srtt is not None:
+                self.ui.show_status(f"📶 Gecikme (RTT): {client.clock_sync.srtt * 1000:.0f} ms")
             
             # Eğer bizim sıramızsa hamle al
             if is_my_turn and not game_data.get("is_game_over", False):
-                move = self.ui.get_move_input()
+                # input() loop'u bloklamasın: heartbeat gönderimi ve receive task'ı sürsün
+                move = await asyncio.get_running_loop().run_in_executor(None, self.ui.get_move_input)
                 if move:
                     row, col = move
-                    # Hamleyi server'a gönder
-                    asyncio.create_task(client.send_move(player, row, col))
+                    # Hamleyi server'a gönder; tahmin local board'a hemen uygulanır
+                    if await client.send_move(player, row, col) and client.predictor:
+                        self.ui.display_board(client.board)
                     
         except Exception as e:
             self.ui.show_error(f"Game state update hatası: {e}")
     
     
+    def start_p2p_host(self):
+        """
+        P2P host modu: UDP portunu dinle, rakip doğrudan bağlanır (server yok)
+        Host X, bağlanan oyuncu O olur
+        """
+        try:
+            self.ui.show_info("P2P Host modunda başlatılıyor...")
+            host, port = self.ui.get_server_info()
+            valid, error = GameValidator.validate_connection_params(host, port)
+            if not valid:
+                self.ui.show_error(f"Bağlantı hatası: {error}")
+                return
+            player_name = input("Adınızı girin: ").strip() or "Oyuncu"
+            asyncio.run(self.p2p_game_loop(player_name, "X", host, port))
+        except KeyboardInterrupt:
+            self.ui.show_info("P2P oyun kapatılıyor...")
+        except Exception as e:
+            self.ui.show_error(f"P2P host hatası: {e}")
+
+    def start_p2p_client(self):
+        """
+        P2P client modu: host'un IP/portuna doğrudan UDP ile bağlan
+        """
+        try:
+            self.ui.show_info("P2P Client modunda başlatılıyor...")
+            host, port = self.ui.get_server_info()
+            valid, error = GameValidator.validate_connection_params(host, port)
+            if not valid:
+                self.ui.show_error(f"Bağlantı hatası: {error}")
+                return
+            player_name = input("Adınızı girin: ").strip() or "Oyuncu"
+            asyncio.run(self.p2p_game_loop(player_name, "O", host, port))
+        except KeyboardInterrupt:
+            self.ui.show_info("P2P oyun kapatılıyor...")
+        except Exception as e:
+            self.ui.show_error(f"P2P client hatası: {e}")
+
+    async def p2p_game_loop(self, player_name, symbol, host, port, connect_timeout=60.0):
+        """
+        P2P oyun döngüsü
+        Her iki taraf da kendi Game nesnesini tutar ve hamleleri aynı sırayla
+        uygular; ağ üzerinden sadece hamleler (1 byte) gider.
+
+        Args:
+            player_name (str): Oyuncu adı
+            symbol (str): "X" (host) veya "O" (client)
+            host (str): Host: dinlenecek adres, Client: host'un adresi
+            port (int): UDP portu
+        """
+        if symbol == "X":
+            peer = await create_host(player_name, host, port)
+            self.ui.show_server_started(host, port)
+        else:
+            peer = await create_client(player_name, host, port)
+            self.ui.show_connection_status("connecting")
+
+        try:
+            if not await peer.wait_connected(connect_timeout):
+                self.ui.show_connection_status("error")
+                self.ui.show_error("Rakip bağlanamadı!")
+                return
+            self.ui.show_connection_status("connected")
+
+            opponent_name = peer.peer_name
+            if symbol == "X":
+                local = Player(player_id=1, symbol="X", name=player_name)
+                remote = Player(player_id=2, symbol="O", name=opponent_name)
+                game = Game(local, remote)
+            else:
+                local = Player(player_id=2, symbol="O", name=player_name)
+                remote = Player(player_id=1, symbol="X", name=opponent_name)
+                game = Game(remote, local)
+            self.ui.show_game_info(local.symbol, remote.symbol)
+
+            loop = asyncio.get_running_loop()
+            winner = None
+            while game.game_status.name == "STARTED":
+                self.ui.display_board(game.game_board.board)
+                is_my_turn = local.is_turn(game.current_player)
+                self.ui.show_turn_info(game.current_player, is_my_turn)
+
+                if is_my_turn:
+                    # input() event loop'u bloklamasın: ACK/retransmit çalışmaya devam etmeli
+                    move = await loop.run_in_executor(None, self.ui.get_move_input)
+                    if move is None:
+                        peer.send_bye()
+                        break
+                    success, message, game_state = game.process_move(local, *move)
+                    if not success:
+                        self.ui.show_error(message)
+                        continue
+                    peer.send_move(*move)
+                else:
+                    event, move = await peer.receive()
+                    if event == "bye":
+                        self.ui.show_info(f"{opponent_name} oyundan ayrıldı.")
+                        break
+                    if event == "lost":
+                        self.ui.show_connection_status("disconnected")
+                        break
+                    success, message, game_state = game.process_move(remote, *move)
+                    if not success:
+                        self.ui.show_error(f"Rakipten geçersiz hamle: {message}")
+                        break
+
+                if game_state.get("is_game_over"):
+                    winner = game_state.get("winner")
+                    self.ui.display_board(game_state["board"])
+
+            # Son hamlenin/BYE'ın ACK'ini bekle, sonra kapat
+            await peer.flush()
+            if winner:
+                await loop.run_in_executor(None, self.ui.show_winner, winner)
+        finally:
+            peer.close()
+
     def start_local_game(self):
         """
         Local 2 player oyunu başlat (test için)
@@ -0,0 +1,289 @@
+"""
+Headless server entry point
+
+Menü ve UI modüllerini yüklemeden WebSocket server'ı başlatır.
+Kullanım:
+    python -m server --host 0.0.0.0 --port 8765 --log-level INFO
+
+Birden fazla worker aynı portu paylaşır; farklı worker'lara düşen oyuncular
+ancak ortak broker üzerinden eşleşebilir:
+    python -m Network.broker --port 8790
+    python -m server --host 0.0.0.0 --port 8765 --workers 4 --broker tcp://localhost:8790
+"""
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import signal
+import sys
+
+from Network.broker import broker_from_url
+from Utils.validator import GameValidator
+
+PROTOCOLS = ("websocket",)
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+
+
+def parse_args(argv=None):
+    """
+    Komut satırı argümanlarını parse et
+
+    Args:
+        argv (list, optional): Argüman listesi (None ise sys.argv)
+
+    Returns:
+        argparse.Namespace: Parse edilmiş argümanlar
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m server",
+        description="Tic-Tac-Toe multiplayer server (headless)"
+    )
+    parser.add_argument("--host", default="localhost", help="Dinlenecek adres (varsayılan: localhost)")
+    parser.add_argument("--port", type=int, default=8765, help="Dinlenecek port (varsayılan: 8765)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Aynı portu paylaşan worker process sayısı, 1'den fazlası --broker ister (varsayılan: 1)")
+    parser.add_argument("--protocol", choices=PROTOCOLS, default="websocket",
+                        help="Transport protokolü (varsayılan: websocket)")
+    parser.add_argument("--log-level", choices=LOG_LEVELS, default="INFO",
+                        help="Log seviyesi (varsayılan: INFO)")
+    parser.add_argument("--drain-timeout", type=float, default=30.0,
+                        help="SIGTERM sonrası aktif oyunlar için beklenecek süre, saniye (varsayılan: 30)")
+    parser.add_argument("--snapshot", default=None,
+                        help="Drain sonrası bitmeyen oyunların yazılacağı/başlangıçta yükleneceği dosya")
+    parser.add_argument("--reconnect-grace", type=float, default=60.0,
+                        help="Bağlantısı kopan oyuncunun koltuğunu geri alabileceği süre; dolunca oyun hakem "
+                             "kararıyla bitirilir, saniye (varsayılan: 60)")
+    parser.add_argument("--message-rate", type=float, default=20.0,
+                        help="Bağlantı başına saniyedeki mesaj limiti, 0 = limitsiz (varsayılan: 20)")
+    parser.add_argument("--message-burst", type=int, default=40,
+                        help="Bağlantı başına anlık mesaj patlaması limiti (varsayılan: 40)")
+    parser.add_argument("--connection-rate", type=float, default=500.0,
+                        help="Saniyedeki yeni bağlantı limiti, 0 = limitsiz (varsayılan: 500)")
+    parser.add_argument("--max-clients", type=int, default=None,
+                        help="Worker başına en fazla eşzamanlı bağlantı (varsayılan: limitsiz)")
+    parser.add_argument("--turn-time", type=float, default=None,
+                        help="Hamle başına süre limiti, saniye (varsayılan: limitsiz)")
+    parser.add_argument("--game-time", type=float, default=None,
+                        help="Oyuncu başına toplam süre, saniye (varsayılan: limitsiz)")
+    parser.add_argument("--increment", type=float, default=0.0,
+                        help="Her hamleden sonra toplam süreye eklenen Fischer bonusu, saniye (varsayılan: 0)")
+    parser.add_argument("--admin-token", default=None,
+                        help="Admin kanalı (dashboard) ve turnuva yönetimi anahtarı; verilmezse sadece "
+                             "localhost abone olabilir ve turnuva oluşturulamaz")
+    parser.add_argument("--game-log", default=None,
+                        help="Biten oyunların eklendiği binary log (açılış kitabı indexer'ı için)")
+    parser.add_argument("--opening-book", default=None,
+                        help="Popüler hamle sorguları için açılış kitabı dosyası")
+    parser.add_argument("--rating-db", default=None,
+                        help="Oyuncu rating'lerinin tutulduğu SQLite dosyası (verilmezse sadece bellekte)")
+    parser.add_argument("--rating-interval", type=float, default=1.0,
+                        help="Biten oyunların rating'e toplu uygulanma aralığı, saniye (varsayılan: 1)")
+    parser.add_argument("--event-db", default=None,
+                        help="Katılım ve oyun sonuçlarının kaydedildiği SQLite dosyası (worker'lar paylaşabilir)")
+    parser.add_argument("--max-sessions", type=int, default=256,
+                        help="Multiplexed bağlantı başına en fazla oyun oturumu (varsayılan: 256)")
+    parser.add_argument("--broker", default=None,
+                        help="Cluster broker adresi (örn. tcp://localhost:8790); worker'lar ve diğer "
+                             "server'lar tek cluster olarak eşleşir")
+    parser.add_argument("--bot-time", type=float, default=1.0,
+                        help="Bot hamlesi başına arama süresi, saniye (varsayılan: 1)")
+    parser.add_argument("--bot-workers", type=int, default=None,
+                        help="Bot araması için process sayısı, 0 = bot kapalı (varsayılan: CPU sayısı)")
+    parser.add_argument("--max-bot-games", type=int, default=None,
+                        help="Aynı anda en fazla bot oyunu, 0 = bot kapalı (varsayılan: 2 x bot process sayısı)")
+    parser.add_argument("--flush-delay", type=float, default=0.0,
+                        help="Giden frame'lerin en fazla bekletileceği süre, saniye; 0 = loop turu sonu (varsayılan: 0)")
+    parser.add_argument("--no-coalesce", action="store_true",
+                        help="Giden frame'leri toplamadan tek tek gönder")
+    parser.add_argument("--trace", default=None,
+                        help="Hamle trace span'larının yazılacağı JSONL dosyası; birden fazla worker'da .<pid> eki alır (varsayılan: kapalı)")
+    parser.add_argument("--trace-rate", type=float, default=0.01,
+                        help="Hamlelerin örneklenme oranı, 0-1; client'ın trace bağlamı taşıyan hamleler de "
+                             "bu oranla izlenir (varsayılan: 0.01)")
+    parser.add_argument("--profile-socket", default=None,
+                        help="Canlı profilleme komutları için Unix socket yolu (varsayılan: kapalı)")
+    parser.add_argument("--profile-dir", default=".",
+                        help="Profil çıktılarının yazılacağı klasör (varsayılan: .)")
+    parser.add_argument("--profile-seconds", type=float, default=10.0,
+                        help="SIGUSR1 ile başlatılan profilin süresi, saniye (varsayılan: 10)")
+    parser.add_argument("--tracemalloc", type=int, default=0, metavar="FRAMES",
+                        help="Başlangıçta tracemalloc'u bu stack derinliğiyle aç, 0 = kapalı (varsayılan: 0)")
+    parser.add_argument("--summary-interval", type=float, default=0.5,
+                        help="Dashboard özetlerinin gönderilme aralığı, saniye (varsayılan: 0.5)")
+    args = parser.parse_args(argv)
+
+    valid, error = GameValidator.validate_connection_params(args.host, args.port)
+    if not valid:
+        parser.error(error)
+    if args.workers < 1:
+        parser.error("Worker sayısı en az 1 olmalı!")
+    if args.workers > 1 and not args.broker:
+        # Her worker'ın kendi waiting room'u olur: farklı worker'lara düşen oyuncular hiç eşleşmez
+        parser.error("--workers 1'den fazlaysa --broker gerekli (örn. python -m Network.broker ile başlatılan "
+                     "tcp://localhost:8790)!")
+    if args.snapshot and args.workers > 1:
+        parser.error("--snapshot sadece tek worker ile kullanılabilir!")
+    if args.game_log and args.workers > 1:
+        parser.error("--game-log sadece tek worker ile kullanılabilir!")
+    if args.rating_db and args.workers > 1:
+        parser.error("--rating-db sadece tek worker ile kullanılabilir!")
+    if args.rating_interval <= 0:
+        parser.error("--rating-interval pozitif olmalı!")
+    if args.max_sessions < 0:
+        parser.error("--max-sessions negatif olamaz!")
+    if args.summary_interval <= 0:
+        parser.error("--summary-interval pozitif olmalı!")
+    if args.bot_time <= 0:
+        parser.error("--bot-time pozitif olmalı!")
+    if args.bot_workers is not None and args.bot_workers < 0:
+        parser.error("--bot-workers negatif olamaz!")
+    if args.reconnect_grace < 0:
+        parser.error("--reconnect-grace negatif olamaz!")
+    if args.max_bot_games is not None and args.max_bot_games < 0:
+        parser.error("--max-bot-games negatif olamaz!")
+    if args.flush_delay < 0:
+        parser.error("--flush-delay negatif olamaz!")
+    if not 0 <= args.trace_rate <= 1:
+        parser.error("--trace-rate 0 ile 1 arasında olmalı!")
+    if args.profile_socket and args.workers > 1:
+        parser.error("--profile-socket sadece tek worker ile kullanılabilir (worker'lar SIGUSR1 ile profillenebilir)!")
+    if not os.path.isdir(args.profile_dir):
+        parser.error("--profile-dir mevcut bir klasör olmalı!")
+    if not 0 < args.profile_seconds <= 300:
+        parser.error("--profile-seconds 0-300 arasında olmalı!")
+    if args.tracemalloc < 0:
+        parser.error("--tracemalloc negatif olamaz!")
+    if args.broker:
+        try:
+            broker_from_url(args.broker)
+        except ValueError as e:
+            parser.error(str(e))
+
+    return args
+
+
+async def run_server(args):
+    """
+    Tek bir server instance'ını çalıştır, SIGTERM/SIGINT'te drain et
+
+    Args:
+        args (argparse.Namespace): Server ayarları
+    """
+    # Server modülünü sadece burada import et (UI modülleri hiç yüklenmez)
+    from Network.websocket_server import GameServer
+    from Utils.tracing import Tracer, JsonlExporter
+    
+    # Birden fazla worker varsa her worker kendi dosyasına yazar (<trace>.<pid>)
+    tracer = None
+    if args.trace:
+        path = args.trace if args.workers == 1 else f"{args.trace}.{multiprocessing.current_process().pid}"
+        tracer = Tracer(args.trace_rate, JsonlExporter(path))
+
+    server = GameServer(
+        args.host,
+        args.port,
+        reuse_port=args.workers > 1,
+        drain_timeout=args.drain_timeout,
+        snapshot_path=args.snapshot,
+        reconnect_grace=args.reconnect_grace,
+        message_rate=args.message_rate or None,
+        message_burst=args.message_burst,
+        connection_rate=args.connection_rate or None,
+        max_clients=args.max_clients,
+        turn_time=args.turn_time,
+        game_time=args.game_time,
+        increment=args.increment,
+        admin_token=args.admin_token,
+        summary_interval=args.summary_interval,
+        game_log_path=args.game_log,
+        opening_book_path=args.opening_book,
+        rating_db_path=args.rating_db,
+        rating_interval=args.rating_interval,
+        event_db_path=args.event_db,
+        max_sessions=args.max_sessions,
+        broker=broker_from_url(args.broker) if args.broker else None,
+        bot_time=args.bot_time,
+        bot_workers=args.bot_workers,
+        max_bot_games=args.max_bot_games,
+        flush_delay=None if args.no_coalesce else args.flush_delay,
+        tracer=tracer,
+        profile_dir=args.profile_dir,
+        profile_socket=args.profile_socket
+    )
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, server.request_shutdown)
+        except NotImplementedError:
+            # Windows: signal handler desteklenmiyor, Ctrl+C KeyboardInterrupt olarak gelir
+            pass
+    # SIGUSR1: loop'u durdurmadan profile_seconds saniyelik collapsed-stack profili
+    # SIGUSR2: bellek raporu (profile-dir'e JSON)
+    if hasattr(signal, "SIGUSR1"):
+        loop.add_signal_handler(signal.SIGUSR1, server.profiler.trigger, args.profile_seconds)
+        loop.add_signal_handler(signal.SIGUSR2, server.profiler.trigger_memory)
+    if args.tracemalloc:
+        server.diagnostics.start_tracing(args.tracemalloc)
+
+    await server.start_server()
+
+
+def worker_main(args):
+    """
+    Worker process entry point'i
+
+    Args:
+        args (argparse.Namespace): Server ayarları
+    """
+    logging.basicConfig(
+        level=args.log_level,
+        format="%(asctime)s [%(process)d] %(levelname)s %(name)s: %(message)s"
+    )
+    try:
+        asyncio.run(run_server(args))
+    except KeyboardInterrupt:
+        pass
+
+
+def main(argv=None):
+    """
+    Headless server entry point'i
+
+    Args:
+        argv (list, optional): Argüman listesi
+
+    Returns:
+        int: Process çıkış kodu
+    """
+    args = parse_args(argv)
+
+    if args.workers == 1:
+        worker_main(args)
+        return 0
+
+    workers = [
+        multiprocessing.Process(target=worker_main, args=(args,), name=f"server-worker-{i}")
+        for i in range(args.workers)
+    ]
+    for worker in workers:
+        worker.start()
+
+    def forward_signal(signum, frame):
+        # Sinyali worker'lara ilet, her biri kendi oyunlarını drain etsin
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+
+    signal.signal(signal.SIGTERM, forward_signal)
+    signal.signal(signal.SIGINT, forward_signal)
+
+    for worker in workers:
+        worker.join()
+
+    return max((worker.exitcode or 0) for worker in workers)
+
+
+if __name__ == "__main__":
+    sys.exit(main())